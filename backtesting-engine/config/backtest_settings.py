@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import List
 
@@ -8,6 +8,8 @@ class BacktestConfig:
     end_date: datetime
     symbols: List[str]
     initial_capital: float = 100000.0
+    strategies: List[str] = field(default_factory=list)
+    db_path: str = "data/crypto_data.db"
     max_duration_years: float = 10.0
     min_capital: float = 1.0
 
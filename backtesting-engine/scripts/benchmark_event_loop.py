@@ -0,0 +1,86 @@
+"""
+Benchmark the event-driven simulation loop.
+
+Builds a temporary SQLite OHLCV database with synthetic hourly bars for several symbols over
+multiple years, runs a buy-and-hold backtest through BacktestEngine and reports events/sec.
+
+Usage:
+    python scripts/benchmark_event_loop.py --symbols 5 --years 3
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config.backtest_settings import BacktestConfig
+from src.core.backtest_engine import BacktestEngine
+
+
+def build_database(path: str, symbols, start: datetime, bars: int, step: timedelta) -> None:
+    rng = np.random.default_rng(42)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE crypto_ohlcv (symbol TEXT, timestamp INTEGER, open REAL, high REAL, low REAL, close REAL, volume REAL)")
+    conn.execute("CREATE INDEX idx_symbol_ts ON crypto_ohlcv(symbol, timestamp)")
+    base_ts = int(start.replace(tzinfo=timezone.utc).timestamp())
+    step_s = int(step.total_seconds())
+    for symbol in symbols:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.005, bars)))
+        open_ = np.concatenate(([close[0]], close[:-1]))
+        high = np.maximum(open_, close) * 1.002
+        low = np.minimum(open_, close) * 0.998
+        rows = [(symbol, base_ts + i * step_s, open_[i], high[i], low[i], close[i], 1000.0) for i in range(bars)]
+        conn.executemany("INSERT INTO crypto_ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BacktestEngine events/sec")
+    parser.add_argument("--symbols", type=int, default=5)
+    parser.add_argument("--years", type=float, default=3.0)
+    parser.add_argument("--chunk-days", type=int, default=90)
+    parser.add_argument("--replay-mode", choices=["events", "columnar"], default="events")
+    parser.add_argument("--trace-memory", action="store_true", help="report peak traced memory (slows the run)")
+    args = parser.parse_args()
+
+    start = datetime(2020, 1, 1)
+    step = timedelta(hours=1)
+    bars = int(args.years * 365 * 24)
+    symbols = [f"SYM{i}" for i in range(args.symbols)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        build_database(db_path, symbols, start, bars, step)
+
+        config = BacktestConfig(start_date=start, end_date=start + bars * step, symbols=symbols,
+                                strategies=["BuyHoldStrategy"], db_path=db_path)
+        engine = BacktestEngine(config, chunk_days=args.chunk_days, replay_mode=args.replay_mode)
+
+        if args.trace_memory:
+            tracemalloc.start()
+        wall = time.perf_counter()
+        result = engine.run_backtest()
+        wall = time.perf_counter() - wall
+        if args.trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"peak traced memory: {peak / 1e6:.1f} MB")
+
+    print(f"symbols={args.symbols} years={args.years} bars/symbol={bars}")
+    print(f"market events: {engine.stats['market_events']:,}  total events: {engine.stats['total_events']:,}")
+    print(f"loop: {engine.stats['elapsed_seconds']:.2f}s  wall: {wall:.2f}s  "
+          f"events/sec: {engine.stats['events_per_second']:,.0f}")
+    print(f"total return: {result.total_return:.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,32 @@
+import os
+import sys
 from typing import List, Optional, Dict
 from datetime import datetime
 import numpy as np
 from decimal import Decimal
 
+# The equity ledger lives in the repository-level `shared` package; append the repository
+# root so its `src` package does not shadow this engine's
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from shared.equity_ledger import EquityLedger
+
 class PerformanceCalculator:
     """
     Tracks portfolio value and returns over time, and calculates total return and risk metrics.
+
+    Values added through add_portfolio_value also feed an EquityLedger, whose running
+    aggregates answer the metrics in O(1). Explicit arguments, or lists that were replaced
+    or edited directly, are computed from the data instead.
     """
     def __init__(self):
         self.dates: List[datetime] = []
         self.portfolio_values: List[float] = []
         self.returns: List[float] = []
+        self.ledger = EquityLedger()
+        self._ledger_lists = (self.portfolio_values, self.returns)
 
     def add_portfolio_value(self, date: datetime, value: float) -> None:
         """
@@ -25,12 +41,21 @@ class PerformanceCalculator:
             self.returns.append(ret)
         self.dates.append(date)
         self.portfolio_values.append(value)
+        self.ledger.append(date, value)
+
+    def _ledger_current(self) -> bool:
+        """Whether the ledger still describes portfolio_values and returns."""
+        values, returns = self._ledger_lists
+        return (self.portfolio_values is values and self.returns is returns
+                and len(values) == self.ledger.count and len(returns) == max(self.ledger.count - 1, 0))
 
     def calculate_total_return(self) -> Optional[float]:
         """
         Calculate total return over the tracked period.
         Returns None if not enough data.
         """
+        if self._ledger_current():
+            return self.ledger.total_return()
         if not self.portfolio_values or len(self.portfolio_values) < 2:
             return None
         initial = self.portfolio_values[0]
@@ -49,13 +74,19 @@ class PerformanceCalculator:
         Returns:
             Sharpe ratio, or None if not enough data or invalid input
         """
-        rets = np.array(returns if returns is not None else self.returns, dtype=np.float64)
-        if len(rets) < 2:
-            return None
-        if np.any(np.isnan(rets)) or np.any(np.isinf(rets)):
-            return None
-        mean_ret = np.mean(rets)
-        std_ret = np.std(rets, ddof=1)
+        if returns is None and self._ledger_current():
+            stats = self.ledger.returns
+            if stats.count < 2 or self.ledger.nonfinite_returns:
+                return None
+            mean_ret, std_ret = stats.mean, stats.std(ddof=1)
+        else:
+            rets = np.array(returns if returns is not None else self.returns, dtype=np.float64)
+            if len(rets) < 2:
+                return None
+            if np.any(np.isnan(rets)) or np.any(np.isinf(rets)):
+                return None
+            mean_ret = np.mean(rets)
+            std_ret = np.std(rets, ddof=1)
         # Use a small epsilon to avoid near-zero volatility explosion
         EPSILON = 1e-8
         if std_ret < EPSILON:
@@ -76,6 +107,8 @@ class PerformanceCalculator:
         Returns:
             Dict with max_drawdown, peak, trough, and duration, or None if not enough data or invalid input
         """
+        if portfolio_values is None and self._ledger_current() and self.ledger.first > 0:
+            return self.ledger.drawdown()
         values = np.array(portfolio_values if portfolio_values is not None else self.portfolio_values, dtype=np.float64)
         if len(values) < 2:
             return None
@@ -1,8 +1,14 @@
-from typing import Optional, Any, Dict, Protocol, Union, List
+from typing import Optional, Any, Dict, Protocol, Union, List, Iterator
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
+from .event_manager import EventManager
+from .state_manager import StateManager
+from ..events.market_event import MarketEvent
+from ..events.signal_event import SignalEvent
 from ..events.order_event import OrderEvent
 from ..events.fill_event import FillEvent
+from ..analytics.performance_calculator import PerformanceCalculator
 from ..utils.exceptions import BacktestingError, DataError, StrategyError, ConfigurationError, ExecutionError
 from ..database.backtest_models import BacktestResult
 
@@ -30,13 +36,34 @@ class BacktestEngine:
     Handles configuration, data loading, strategy execution, and result generation.
     """
     
-    def __init__(self, config):
+    def __init__(self, config, data_provider: Optional[MarketDataProvider] = None,
+                 strategy: Optional[Strategy] = None,
+                 execution_handler: Optional[ExecutionHandler] = None,
+                 portfolio_manager: Optional[PortfolioManager] = None,
+                 position_size: float = 1.0, chunk_days: int = 90, replay_mode: str = "events"):
         """
         Initialize the backtest engine with the given configuration.
+        Collaborators default to the engine's own implementations when not injected:
+        a DataLoader-backed MarketDataProvider on config.db_path, the first named strategy
+        in config.strategies, ExecutionHandler and PortfolioManager.
+        position_size is the fraction of cash committed per BUY signal (scaled by signal strength);
+        chunk_days bounds how much history is loaded per symbol at a time.
+        replay_mode "events" builds a validated MarketEvent per bar; "columnar" validates each
+        loaded chunk once and replays NumPy-backed BarViews (see MarketDataProvider.generate_bars).
         Raises ConfigurationError if validation fails.
         """
         try:
             self.config = config
+            self.data_provider = data_provider
+            self.strategy = strategy
+            self.execution_handler = execution_handler
+            self.portfolio_manager = portfolio_manager
+            self.position_size = position_size
+            self.chunk_days = chunk_days
+            self.replay_mode = replay_mode
+            self.event_manager = EventManager()
+            self.state_manager = StateManager()
+            self.stats: Dict[str, float] = {}
             self._validate_config()
             logger.info(f"BacktestEngine initialized for strategy: {config.strategies}")
         except Exception as e:
@@ -58,6 +85,12 @@ class BacktestEngine:
             raise ConfigurationError("Start date must be before end date")
         if self.config.initial_capital <= 0:
             raise ConfigurationError("Initial capital must be positive")
+        if not 0 < self.position_size <= 1:
+            raise ConfigurationError("Position size must be in (0, 1]")
+        if self.chunk_days <= 0:
+            raise ConfigurationError("Chunk days must be positive")
+        if self.replay_mode not in ("events", "columnar"):
+            raise ConfigurationError("Replay mode must be 'events' or 'columnar'")
     
     def run_backtest(self) -> BacktestResult:
         """
@@ -85,28 +118,54 @@ class BacktestEngine:
             logger.error(f"Unexpected error during backtest: {e}")
             raise BacktestingError(f"Backtest failed: {e}")
     
-    def _load_market_data(self):
+    def _load_market_data(self) -> Dict[str, Iterator[MarketEvent]]:
         """
-        Load market data for the configured symbols and period.
-        Returns mock data for demonstration. Raises DataError on failure.
+        Create one lazy MarketEvent stream per configured symbol.
+        Streams load history chunk_days at a time, so no symbol's full history is held in memory.
+        Raises DataError on failure.
         """
         try:
             logger.info(f"Loading market data for {self.config.symbols}")
             if not self.config.symbols:
                 raise DataError("No symbols specified for data loading")
-            return {"data": "mock_market_data"}
+            if self.data_provider is None:
+                from ..data.data_loader import DataLoader
+                from ..data.market_data_provider import MarketDataProvider as DefaultMarketDataProvider
+                self.data_provider = DefaultMarketDataProvider(DataLoader(self.config.db_path))
+            return {symbol: self._symbol_event_stream(symbol) for symbol in self.config.symbols}
         except Exception as e:
             logger.error(f"Failed to load market data: {e}")
             raise DataError(f"Market data loading failed: {e}")
     
+    def _symbol_event_stream(self, symbol: str) -> Iterator[MarketEvent]:
+        """
+        Yield MarketEvents for one symbol in time order, querying the provider one chunk at a time.
+        Chunk windows are disjoint because the loader's time filter is inclusive on both ends.
+        """
+        generate = (self.data_provider.generate_bars if self.replay_mode == "columnar"
+                    else self.data_provider.generate_market_events)
+        chunk_start = self.config.start_date
+        while chunk_start < self.config.end_date:
+            next_start = min(chunk_start + timedelta(days=self.chunk_days), self.config.end_date)
+            chunk_end = self.config.end_date if next_start >= self.config.end_date else next_start - timedelta(seconds=1)
+            if chunk_start < chunk_end:
+                yield from generate(symbol, chunk_start, chunk_end)
+            chunk_start = next_start
+    
     def _initialize_portfolio(self):
         """
         Initialize the portfolio manager for the backtest.
-        Returns a mock portfolio for demonstration. Raises ExecutionError on failure.
+        Raises ExecutionError on failure.
         """
         try:
             logger.info(f"Initializing portfolio with capital: {self.config.initial_capital}")
-            return {"initial_capital": self.config.initial_capital}
+            if self.portfolio_manager is None:
+                from ..portfolio.portfolio_manager import PortfolioManager as DefaultPortfolioManager
+                self.portfolio_manager = DefaultPortfolioManager(self.config.initial_capital)
+            if self.execution_handler is None:
+                from ..execution.execution_handler import ExecutionHandler as DefaultExecutionHandler
+                self.execution_handler = DefaultExecutionHandler()
+            return self.portfolio_manager
         except Exception as e:
             logger.error(f"Failed to initialize portfolio: {e}")
             raise ExecutionError(f"Portfolio initialization failed: {e}")
@@ -114,40 +173,214 @@ class BacktestEngine:
     def _initialize_strategy(self):
         """
         Initialize the trading strategy for the backtest.
-        Returns a mock strategy for demonstration. Raises StrategyError on failure.
+        Uses the injected strategy, otherwise resolves config.strategies[0] by name.
+        Raises StrategyError on failure.
         """
         try:
+            if self.strategy is not None:
+                logger.info(f"Initializing strategy: {self.strategy.get_name()}")
+                return self.strategy
             strategy_name = self.config.strategies[0]
             logger.info(f"Initializing strategy: {strategy_name}")
-            if strategy_name == "InvalidStrategy":
+            factory = self._strategy_factories().get(strategy_name)
+            if factory is None:
                 raise StrategyError(f"Strategy '{strategy_name}' not found")
-            return {"name": strategy_name}
+            self.strategy = factory()
+            return self.strategy
         except Exception as e:
             logger.error(f"Failed to initialize strategy: {e}")
             raise StrategyError(f"Strategy initialization failed: {e}")
     
+    def _strategy_factories(self) -> Dict[str, Any]:
+        """Strategy constructors available by name in config.strategies."""
+        from ..strategies.buy_hold_strategy import BuyAndHoldStrategy
+        
+        def ripple():
+            from ..strategies.ripple_backtest_strategy import RippleBacktestStrategy
+            return RippleBacktestStrategy()
+        
+        def eth_tops_bottoms():
+            from ..strategies.eth_tops_bottoms_strategy import ETHTopBottomBacktestStrategy
+            return ETHTopBottomBacktestStrategy()
+        
+        return {
+            "BuyHoldStrategy": lambda: BuyAndHoldStrategy(self.config.symbols[0]),
+            "BuyAndHoldStrategy": lambda: BuyAndHoldStrategy(self.config.symbols[0]),
+            "RippleBacktestStrategy": ripple,
+            "ETHTopBottomBacktestStrategy": eth_tops_bottoms,
+        }
+    
     def _run_simulation(self, market_data, portfolio_manager, strategy):
         """
         Run the backtest simulation loop, processing events and generating results.
+        
+        Per-symbol MarketEvent streams are k-way merged through the EventManager heap: each
+        stream has at most one pending MarketEvent queued, and the next one is pulled only when
+        it is popped. Signal, order and fill events share the heap and are dispatched to the
+        strategy, execution handler and portfolio manager in timestamp order.
         Returns a BacktestResult object. Raises ExecutionError on failure.
         """
         try:
             logger.info("Running backtest simulation")
-            result = BacktestResult(
-                total_return=0.15,
-                sharpe_ratio=1.2,
-                max_drawdown=0.08,
-                trade_count=10,
-                portfolio_values=[100000.0, 115000.0],
-                trade_history=[
-                    {"date": "2023-01-01", "symbol": "bitcoin", "action": "BUY", "quantity": 1.0, "price": 50000.0}
-                ]
-            )
-            return result
+            started = time.perf_counter()
+            self.event_manager = EventManager()
+            self.state_manager.reset()
+            performance = PerformanceCalculator()
+            trade_history: List[Dict[str, Any]] = []
+            streams = {symbol.upper(): iter(stream) for symbol, stream in market_data.items()}
+            counts = {'MARKET': 0, 'SIGNAL': 0, 'ORDER': 0, 'FILL': 0}
+            
+            start_date = self.config.start_date
+            if start_date.tzinfo is None:
+                start_date = start_date.replace(tzinfo=timezone.utc)
+            performance.add_portfolio_value(start_date, float(self.config.initial_capital))
+            for symbol in list(streams):
+                self._queue_next_market_event(symbol, streams)
+            
+            bar_time = None
+            while True:
+                event = self.event_manager.get_next_event()
+                if event is None:
+                    break
+                # The heap is time ordered, so a later timestamp means the previous bar is complete
+                if bar_time is not None and event.timestamp > bar_time:
+                    performance.add_portfolio_value(bar_time, self._portfolio_value(portfolio_manager))
+                bar_time = event.timestamp
+                counts[event.event_type] = counts.get(event.event_type, 0) + 1
+                
+                if event.event_type == 'MARKET':
+                    self.state_manager.update_state(event)
+                    self._queue_next_market_event(event.symbol, streams)
+                    self._dispatch_market_event(event, strategy)
+                elif event.event_type == 'SIGNAL':
+                    self._dispatch_signal_event(event, portfolio_manager)
+                elif event.event_type == 'ORDER':
+                    self._dispatch_order_event(event)
+                elif event.event_type == 'FILL':
+                    self._dispatch_fill_event(event, portfolio_manager, trade_history)
+            
+            if bar_time is not None:
+                performance.add_portfolio_value(bar_time, self._portfolio_value(portfolio_manager))
+            
+            elapsed = time.perf_counter() - started
+            total_events = sum(counts.values())
+            self.stats = {
+                'market_events': counts['MARKET'],
+                'total_events': total_events,
+                'elapsed_seconds': elapsed,
+                'events_per_second': total_events / elapsed if elapsed > 0 else 0.0
+            }
+            logger.info(f"Processed {total_events} events ({counts['MARKET']} market) in {elapsed:.2f}s")
+            
+            return self._build_result(performance, trade_history)
+        except StrategyError:
+            raise
         except Exception as e:
             logger.error(f"Simulation failed: {e}")
             raise ExecutionError(f"Backtest simulation failed: {e}")
     
+    def _queue_next_market_event(self, symbol: str, streams: Dict[str, Iterator[MarketEvent]]) -> None:
+        """Pull the next MarketEvent for a symbol onto the event heap, dropping exhausted streams."""
+        stream = streams.get(symbol)
+        if stream is None:
+            return
+        event = next(stream, None)
+        if event is None:
+            del streams[symbol]
+            return
+        self.event_manager.add_event(event)
+    
+    def _dispatch_market_event(self, event: MarketEvent, strategy) -> None:
+        """Pass a bar to the strategy and queue the resulting signals."""
+        try:
+            signals = strategy.process_market_data(event)
+        except Exception as e:
+            raise StrategyError(f"Strategy failed on {event.symbol} at {event.timestamp}: {e}")
+        for signal in signals or []:
+            self.event_manager.add_event(signal)
+    
+    def _dispatch_signal_event(self, signal: SignalEvent, portfolio_manager) -> None:
+        """Size a signal into a market order at the latest price for its symbol."""
+        symbol = signal.symbol.upper()
+        price = self.state_manager.current_prices.get(symbol)
+        if not price or signal.signal_type == 'HOLD':
+            return
+        
+        if signal.signal_type == 'BUY':
+            slippage = getattr(self.execution_handler, 'slippage', 0.0)
+            commission_rate = getattr(self.execution_handler, 'commission_rate', 0.0)
+            budget = portfolio_manager.get_cash() * self.position_size * signal.strength
+            # Shave a rounding margin so an all-in buy never exceeds cash after slippage and commission
+            quantity = budget * (1 - 1e-9) / (price * (1 + slippage) * (1 + commission_rate))
+        else:
+            quantity = portfolio_manager.get_positions().get(symbol, 0.0)
+        
+        if quantity <= 0:
+            return
+        self.event_manager.add_event(
+            OrderEvent(timestamp=signal.timestamp, symbol=symbol, order_type='MARKET',
+                       quantity=quantity, direction=signal.signal_type)
+        )
+    
+    def _dispatch_order_event(self, order: OrderEvent) -> None:
+        """Execute an order at the latest price and queue the fill."""
+        price = self.state_manager.current_prices.get(order.symbol)
+        if not price:
+            return
+        fill = self.execution_handler.execute_order(
+            {'symbol': order.symbol, 'side': order.direction, 'quantity': order.quantity}, price
+        )
+        if fill is None:
+            logger.warning(f"Order for {order.symbol} was not filled")
+            return
+        self.event_manager.add_event(
+            FillEvent(timestamp=order.timestamp, symbol=order.symbol, quantity=order.quantity,
+                      fill_price=fill.price, commission=fill.commission, direction=order.direction)
+        )
+    
+    def _dispatch_fill_event(self, fill: FillEvent, portfolio_manager, trade_history: List[Dict[str, Any]]) -> None:
+        """Apply a fill to the portfolio and record it in the trade history."""
+        pnl = 0.0
+        if fill.direction == 'SELL':
+            position = portfolio_manager.positions.get(fill.symbol)
+            if position is not None:
+                pnl = (fill.fill_price - position.average_cost) * fill.quantity - fill.commission
+        try:
+            portfolio_manager.process_fill(fill.symbol, fill.net_quantity(), fill.fill_price, fill.commission)
+        except ValueError as e:
+            logger.warning(f"Rejected fill for {fill.symbol}: {e}")
+            return
+        trade_history.append({
+            'date': fill.timestamp.isoformat(),
+            'symbol': fill.symbol,
+            'action': fill.direction,
+            'price': fill.fill_price,
+            'quantity': fill.quantity,
+            'commission': fill.commission,
+            'pnl': pnl
+        })
+    
+    def _portfolio_value(self, portfolio_manager) -> float:
+        """Mark the portfolio to the latest known prices."""
+        return portfolio_manager.get_portfolio_value(self.state_manager.current_prices)
+    
+    def _build_result(self, performance: PerformanceCalculator, trade_history: List[Dict[str, Any]]) -> BacktestResult:
+        """Compute metrics from the recorded equity curve."""
+        periods_per_year = None
+        if len(performance.dates) > 2:
+            span = (performance.dates[-1] - performance.dates[1]).total_seconds()
+            if span > 0:
+                periods_per_year = max(1, round((len(performance.dates) - 2) * 365.25 * 86400 / span))
+        drawdown = performance.calculate_max_drawdown()
+        return BacktestResult(
+            total_return=performance.calculate_total_return() or 0.0,
+            sharpe_ratio=performance.calculate_sharpe_ratio(periods_per_year=periods_per_year) or 0.0,
+            max_drawdown=drawdown['max_drawdown'] if drawdown else 0.0,
+            trade_count=len(trade_history),
+            portfolio_values=performance.portfolio_values,
+            trade_history=trade_history
+        )
+    
     def cleanup(self):
         """
         Clean up resources after the backtest run. Does not raise on error.
@@ -16,13 +16,16 @@ class EventManager:
             raise ValueError("Event timestamp cannot be None")
         # Test actual comparability with different types
         try:
-            _ = timestamp < 0
+            _ = timestamp < timestamp
             _ = timestamp <= timestamp
             _ = timestamp == timestamp
         except TypeError:
             raise ValueError("Event timestamp must be comparable (numeric or datetime)")
         heapq.heappush(self._event_queue, (timestamp, next(self._counter), event))
 
+    def __len__(self):
+        return len(self._event_queue)
+
     def get_next_event(self):
         if not self._event_queue:
             return None
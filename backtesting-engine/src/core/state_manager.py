@@ -27,7 +27,7 @@ class StateManager:
         event_type = getattr(event, 'event_type', '')
         if isinstance(event_type, str) and event_type.upper() == 'MARKET':
             symbol = getattr(event, 'symbol', None)
-            price = getattr(event, 'close_price', None)
+            price = getattr(event, 'close_price', getattr(event, 'close', None))
             # Validate symbol
             if symbol is not None and str(symbol).strip():
                 # Validate price
@@ -0,0 +1,94 @@
+from datetime import datetime
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+
+class BarBatch:
+    """
+    Columnar block of validated OHLCV bars for one symbol, backed by NumPy arrays.
+    Strategies that opt in to batch processing read the arrays directly.
+    """
+    __slots__ = ("symbol", "timestamps", "open", "high", "low", "close", "volume")
+
+    def __init__(self, symbol: str, timestamps: List[datetime], open_: np.ndarray, high: np.ndarray,
+                 low: np.ndarray, close: np.ndarray, volume: np.ndarray):
+        self.symbol = symbol.upper()
+        self.timestamps = timestamps
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    @classmethod
+    def from_frame(cls, symbol: str, df: pd.DataFrame) -> "BarBatch":
+        """Build a batch from an OHLCV frame indexed by tz-aware timestamps."""
+        return cls(
+            symbol,
+            list(df.index.to_pydatetime()),
+            df["open"].to_numpy(dtype=np.float64),
+            df["high"].to_numpy(dtype=np.float64),
+            df["low"].to_numpy(dtype=np.float64),
+            df["close"].to_numpy(dtype=np.float64),
+            df["volume"].to_numpy(dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def bar(self, index: int) -> "BarView":
+        return BarView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.timestamps)):
+            yield BarView(self, index)
+
+class BarView:
+    """
+    Lightweight read-only view of one bar in a BarBatch.
+    Quacks like a MarketEvent (event_type, timestamp, symbol, OHLCV, price) without per-bar validation.
+    """
+    __slots__ = ("batch", "index", "timestamp")
+    event_type = "MARKET"
+
+    def __init__(self, batch: BarBatch, index: int):
+        self.batch = batch
+        self.index = index
+        self.timestamp = batch.timestamps[index]
+
+    @property
+    def symbol(self) -> str:
+        return self.batch.symbol
+
+    @property
+    def open(self) -> float:
+        return float(self.batch.open[self.index])
+
+    @property
+    def high(self) -> float:
+        return float(self.batch.high[self.index])
+
+    @property
+    def low(self) -> float:
+        return float(self.batch.low[self.index])
+
+    @property
+    def close(self) -> float:
+        return float(self.batch.close[self.index])
+
+    @property
+    def volume(self) -> float:
+        return float(self.batch.volume[self.index])
+
+    @property
+    def price(self) -> float:
+        return self.close
+
+    def window(self, field: str, length: Optional[int] = None) -> np.ndarray:
+        """Values of an OHLCV field up to and including this bar (no look-ahead), within this batch."""
+        values = getattr(self.batch, field)
+        start = 0 if length is None else max(0, self.index + 1 - length)
+        return values[start:self.index + 1]
+
+    def __repr__(self):
+        return f"BarView({self.symbol} @ {self.timestamp} close={self.close})"
@@ -1,7 +1,7 @@
 import sqlite3
 import threading
 from typing import Optional, List, Tuple, Any
-from datetime import datetime
+from datetime import datetime, timezone
 import pandas as pd
 
 class DataLoader:
@@ -85,9 +85,9 @@ class DataLoader:
 
         # Convert to UTC and Unix timestamps
         if start_date.tzinfo is None:
-            start_date = start_date.replace(tzinfo=pd.Timestamp.utc.tz)
+            start_date = start_date.replace(tzinfo=timezone.utc)
         if end_date.tzinfo is None:
-            end_date = end_date.replace(tzinfo=pd.Timestamp.utc.tz)
+            end_date = end_date.replace(tzinfo=timezone.utc)
         start_ts = int(start_date.timestamp())
         end_ts = int(end_date.timestamp())
 
@@ -105,7 +105,7 @@ class DataLoader:
                 empty_df["timestamp"] = pd.to_datetime(empty_df["timestamp"])
                 empty_df.set_index("timestamp", inplace=True)
                 return empty_df[["open", "high", "low", "close", "volume"]]
-            df = pd.DataFrame(rows)
+            df = pd.DataFrame([tuple(row) for row in rows], columns=["timestamp", "open", "high", "low", "close", "volume"])
             df["timestamp"] = pd.to_datetime(df["timestamp"], unit="s", utc=True)
             numeric_columns = ["open", "high", "low", "close", "volume"]
             for col in numeric_columns:
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 class DataValidator:
@@ -32,4 +33,26 @@ class DataValidator:
             raise ValueError("DataFrame index must be a DatetimeIndex for chronological validation")
         if not df.index.is_monotonic_increasing:
             raise ValueError("Timestamps are not in chronological order")
-        return True 
\ No newline at end of file
+        return True 
+
+    @staticmethod
+    def valid_ohlcv_mask(df: pd.DataFrame) -> pd.Series:
+        """
+        Row-wise validity of OHLCV data, vectorized: finite positive prices, open/close within
+        [low, high] and non-negative non-NaN volume. Mirrors the per-row MarketEvent checks.
+        """
+        price_cols = ["open", "high", "low", "close"]
+        prices = df[price_cols].to_numpy(dtype=np.float64)
+        volume = df["volume"].to_numpy(dtype=np.float64)
+        low, high = df["low"].to_numpy(dtype=np.float64), df["high"].to_numpy(dtype=np.float64)
+        open_, close = df["open"].to_numpy(dtype=np.float64), df["close"].to_numpy(dtype=np.float64)
+        with np.errstate(invalid="ignore"):
+            mask = (
+                np.isfinite(prices).all(axis=1)
+                & (prices > 1e-8).all(axis=1)
+                & (low <= open_) & (open_ <= high)
+                & (low <= close) & (close <= high)
+                & ~np.isnan(volume) & (volume >= 0)
+            )
+        return pd.Series(mask, index=df.index)
+
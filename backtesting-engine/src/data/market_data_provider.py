@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
-from typing import Iterator
+from typing import Iterator, Optional
 from .data_loader import DataLoader
+from .data_validator import DataValidator
+from .bar_replay import BarBatch, BarView
 from ..events.market_event import MarketEvent
 import math
 
@@ -46,6 +48,46 @@ class MarketDataProvider:
                 events_skipped += 1
         print(f"[MarketDataProvider] {events_generated} events generated, {events_skipped} rows skipped for {symbol}")
 
+    def generate_bar_batches(self, symbol: str, start_date: datetime, end_date: datetime,
+                             batch_size: Optional[int] = None) -> Iterator[BarBatch]:
+        """
+        Columnar replay: validate the whole OHLCV frame once and yield NumPy-backed BarBatches
+        of up to batch_size bars (one batch when batch_size is None). Invalid rows are dropped,
+        as in generate_market_events.
+        """
+        if not symbol or not isinstance(symbol, str):
+            raise ValueError("Symbol must be a non-empty string")
+        if not isinstance(start_date, datetime) or not isinstance(end_date, datetime):
+            raise ValueError("start_date and end_date must be datetime objects")
+        if start_date >= end_date:
+            raise ValueError("start_date must be before end_date")
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        df = self.data_loader.load_market_data(symbol, start_date, end_date)
+        if df.empty:
+            print(f"[MarketDataProvider] WARNING: No market data found for {symbol} between {start_date} and {end_date}")
+            return
+
+        mask = DataValidator.valid_ohlcv_mask(df)
+        events_skipped = int((~mask).sum())
+        if events_skipped:
+            df = df[mask.to_numpy()]
+        if df.index.tz is None:
+            df = df.tz_localize(timezone.utc)
+        DataValidator.validate_chronological(df)
+
+        step = batch_size or max(len(df), 1)
+        for offset in range(0, len(df), step):
+            yield BarBatch.from_frame(symbol, df.iloc[offset:offset + step])
+        print(f"[MarketDataProvider] {len(df)} bars replayed, {events_skipped} rows skipped for {symbol}")
+
+    def generate_bars(self, symbol: str, start_date: datetime, end_date: datetime,
+                      batch_size: Optional[int] = None) -> Iterator[BarView]:
+        """Columnar replay flattened to per-bar BarViews, a drop-in for generate_market_events."""
+        for batch in self.generate_bar_batches(symbol, start_date, end_date, batch_size):
+            yield from batch
+
     def _preserve_timezone(self, ts) -> datetime:
         # Ensure UTC timezone is preserved
         if hasattr(ts, 'tzinfo') and ts.tzinfo is not None:
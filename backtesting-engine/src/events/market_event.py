@@ -37,6 +37,11 @@ class MarketEvent(BaseEvent):
         self._validate_inputs(self.symbol, self.open, self.high, self.low, self.close, self.volume)
         return True
 
+    @property
+    def price(self) -> float:
+        """Close price, as read by strategies through the MarketEvent protocol."""
+        return self.close
+
     @staticmethod
     def get_event_type() -> str:
         return "MARKET"
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Protocol, Union
+from typing import Optional, List, Protocol, Union, Dict
 from datetime import datetime
 from ..events.signal_event import SignalEvent
 
@@ -28,6 +28,10 @@ class BacktestStrategy(ABC):
     This class defines the interface that all backtesting strategies
     must implement to work with the backtesting framework.
     """
+    # Strategies that set this to True implement generate_batch_signals and receive whole
+    # NumPy bar arrays once per batch when the engine replays in columnar mode.
+    supports_batches: bool = False
+
     def __init__(self, portfolio: Optional[Portfolio] = None) -> None:
         """
         Initialize the strategy with optional portfolio reference.
@@ -36,6 +40,8 @@ class BacktestStrategy(ABC):
             portfolio: Portfolio instance for position tracking
         """
         self.portfolio = portfolio
+        self._batch = None
+        self._batch_signals = {}
 
     @abstractmethod
     def generate_signals(self, market_event: MarketEvent) -> List[Signal]:
@@ -63,6 +69,32 @@ class BacktestStrategy(ABC):
         """
         pass
 
+    def generate_batch_signals(self, batch) -> Dict[int, List[Signal]]:
+        """
+        Compute signals for a whole BarBatch at once from its NumPy arrays.
+
+        Args:
+            batch: BarBatch with open/high/low/close/volume arrays and timestamps for one symbol
+        Returns:
+            Mapping of bar index within the batch to the signals emitted at that bar.
+            Signals at index i must only use data up to and including bar i.
+        Raises:
+            NotImplementedError: Must be implemented by subclasses that set supports_batches
+        """
+        raise NotImplementedError("Batch strategies must implement generate_batch_signals")
+
+    def _signals_for_event(self, market_event: MarketEvent) -> List[Signal]:
+        """Per-bar signals, served from the batch computation for batch-aware strategies on BarViews."""
+        batch = getattr(market_event, 'batch', None)
+        if not self.supports_batches or batch is None:
+            return self.generate_signals(market_event)
+        if batch is not getattr(self, '_batch', None):
+            self._batch = batch
+            self._batch_signals = self.generate_batch_signals(batch)
+            if not isinstance(self._batch_signals, dict):
+                raise TypeError("generate_batch_signals must return a dict")
+        return list(self._batch_signals.get(market_event.index, []))
+
     def process_market_data(self, market_event: MarketEvent) -> List[SignalEvent]:
         """
         Process market data and return a list of SignalEvent objects based on strategy logic.
@@ -79,7 +111,7 @@ class BacktestStrategy(ABC):
             raise ValueError("Market event cannot be None")
         if not hasattr(market_event, 'timestamp'):
             raise AttributeError("Market event must have 'timestamp' attribute")
-        signals = self.generate_signals(market_event)
+        signals = self._signals_for_event(market_event)
         if not isinstance(signals, list):
             raise TypeError("generate_signals must return a list")
         signal_events = []
@@ -2,55 +2,81 @@ import sys
 import os
 import pytest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from datetime import datetime, timedelta
 from src.core.backtest_engine import BacktestEngine
+from src.database.backtest_models import BacktestResult
+from src.utils.exceptions import ConfigurationError
+from config.backtest_settings import BacktestConfig
+
+START = datetime(2024, 1, 1)
 
 class DummyPortfolioManager:
     def update_portfolio(self, event):
         pass
-    def get_portfolio_value(self):
+    def get_portfolio_value(self, prices=None):
         return 100000.0
+    def process_fill(self, symbol, quantity, price, commission=0.0):
+        pass
 
 class DummyExecutionHandler:
-    def execute_order(self, order):
+    def execute_order(self, order, market_price):
         pass
     def get_fill_cost(self, order):
         return 0.0
 
+class DummyStrategy:
+    def process_market_data(self, event):
+        return []
+    def get_name(self):
+        return "Dummy"
+
+class EmptyDataProvider:
+    def generate_market_events(self, symbol, start_date, end_date):
+        return []
+
+def _config(**overrides):
+    values = dict(start_date=START, end_date=START + timedelta(days=30), symbols=["BTC"],
+                  initial_capital=100000.0, strategies=["Dummy"])
+    values.update(overrides)
+    return BacktestConfig(**values)
+
+def _engine(config=None, **kwargs):
+    return BacktestEngine(config or _config(), data_provider=EmptyDataProvider(), strategy=DummyStrategy(),
+                          portfolio_manager=DummyPortfolioManager(), execution_handler=DummyExecutionHandler(),
+                          **kwargs)
+
 def test_backtest_engine_init():
     pm = DummyPortfolioManager()
     eh = DummyExecutionHandler()
-    engine = BacktestEngine(portfolio_manager=pm, execution_handler=eh)
+    config = _config()
+    engine = BacktestEngine(config, portfolio_manager=pm, execution_handler=eh)
+    assert engine.config is config
     assert engine.event_manager is not None
     assert engine.state_manager is not None
     assert engine.portfolio_manager is pm
     assert engine.execution_handler is eh
-    assert engine.is_ready() is True
+    assert engine.replay_mode == "events"
 
-def test_type_validation():
-    class BadPortfolio:
-        pass
-    class BadExecution:
-        pass
-    with pytest.raises(TypeError):
-        BacktestEngine(portfolio_manager=BadPortfolio(), execution_handler=DummyExecutionHandler())
-    with pytest.raises(TypeError):
-        BacktestEngine(portfolio_manager=DummyPortfolioManager(), execution_handler=BadExecution())
-
-def test_run_backtest_param_validation():
-    engine = BacktestEngine(portfolio_manager=DummyPortfolioManager(), execution_handler=DummyExecutionHandler())
-    with pytest.raises(ValueError, match="data_source is required"):
-        engine.run_backtest(None, "strategy")
-    with pytest.raises(ValueError, match="strategy is required"):
-        engine.run_backtest("data", None)
-    with pytest.raises(ValueError, match="initial_capital must be positive"):
-        engine.run_backtest("data", "strategy", initial_capital=0)
-
-def test_run_backtest_success():
-    engine = BacktestEngine(portfolio_manager=DummyPortfolioManager(), execution_handler=DummyExecutionHandler())
-    result = engine.run_backtest("data", "strategy", initial_capital=100000.0)
-    assert result["status"] == "completed"
-    assert result["initial_capital"] == 100000.0
-    assert result["final_value"] == 100000.0
-    assert result["total_return"] == 0.0
-    assert isinstance(result["trades"], list)
-    assert isinstance(result["performance_metrics"], dict) 
\ No newline at end of file
+def test_engine_option_validation():
+    with pytest.raises(ConfigurationError, match="Position size"):
+        _engine(position_size=0)
+    with pytest.raises(ConfigurationError, match="Chunk days"):
+        _engine(chunk_days=0)
+    with pytest.raises(ConfigurationError, match="Replay mode"):
+        _engine(replay_mode="ticks")
+
+def test_config_validation():
+    with pytest.raises(ConfigurationError, match="Configuration cannot be None"):
+        BacktestEngine(None)
+    with pytest.raises(ConfigurationError, match="At least one strategy"):
+        _engine(_config(strategies=[]))
+
+def test_run_backtest_without_market_data():
+    engine = _engine()
+    result = engine.run_backtest()
+    assert isinstance(result, BacktestResult)
+    assert result.total_return == 0.0
+    assert result.trade_count == 0
+    assert result.portfolio_values == [100000.0]
+    assert isinstance(result.trade_history, list)
+    assert engine.stats["market_events"] == 0
@@ -0,0 +1,139 @@
+import pytest
+import sys
+import os
+import sqlite3
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pandas as pd
+from src.core.backtest_engine import BacktestEngine
+from src.data.data_loader import DataLoader
+from src.data.data_validator import DataValidator
+from src.data.market_data_provider import MarketDataProvider
+from src.strategies.backtest_strategy_base import BacktestStrategy
+from config.backtest_settings import BacktestConfig
+
+START = datetime(2023, 1, 1)
+
+class FrameLoader:
+    def __init__(self, df):
+        self.df = df
+    def load_market_data(self, symbol, start_date, end_date):
+        return self.df
+
+def _frame():
+    index = pd.date_range("2023-01-01", periods=8, freq="D", tz="UTC")
+    df = pd.DataFrame({
+        "open": [100.0, 101.0, np.nan, 103.0, 104.0, 105.0, 106.0, 0.0],
+        "high": [101.0, 102.0, 103.0, 104.0, 105.0, 104.0, 107.0, 1.0],
+        "low": [99.0, 100.0, 101.0, 102.0, 103.0, 104.5, 105.0, 0.0],
+        "close": [100.5, 101.5, 102.5, 103.5, 104.5, 104.8, 106.5, 0.5],
+        "volume": [10.0, 11.0, 12.0, -1.0, 14.0, 15.0, 16.0, 17.0],
+    }, index=index)
+    return df
+
+def test_valid_mask_matches_per_row_validation():
+    df = _frame()
+    provider = MarketDataProvider(FrameLoader(df))
+    expected = [provider._validate_row_data(row) for row in df.itertuples()]
+    assert DataValidator.valid_ohlcv_mask(df).tolist() == expected
+
+def test_generate_bars_matches_market_events():
+    provider = MarketDataProvider(FrameLoader(_frame()))
+    events = list(provider.generate_market_events("BTC", START, START + timedelta(days=10)))
+    bars = list(provider.generate_bars("BTC", START, START + timedelta(days=10), batch_size=2))
+    assert len(bars) == len(events) == 4
+    for event, bar in zip(events, bars):
+        assert bar.timestamp == event.timestamp
+        assert bar.symbol == event.symbol
+        assert (bar.open, bar.high, bar.low, bar.close, bar.volume) == (event.open, event.high, event.low, event.close, event.volume)
+        assert bar.price == event.price
+    assert len({id(bar.batch) for bar in bars}) == 2
+
+def test_bar_window_has_no_look_ahead():
+    provider = MarketDataProvider(FrameLoader(_frame()))
+    bars = list(provider.generate_bars("BTC", START, START + timedelta(days=10)))
+    assert bars[2].window("close").tolist() == [100.5, 101.5, 104.5]
+    assert bars[2].window("close", 2).tolist() == [101.5, 104.5]
+
+class CrossoverStrategy(BacktestStrategy):
+    """Buys when close crosses above its 3-bar mean and sells when it crosses below."""
+    supports_batches = True
+
+    def __init__(self):
+        super().__init__()
+        self.batch_calls = 0
+
+    def _signal(self, symbol, action):
+        return type("Sig", (), {"symbol": symbol, "action": action, "quantity": 0.0})()
+
+    def generate_batch_signals(self, batch):
+        self.batch_calls += 1
+        close = batch.close
+        mean = pd.Series(close).rolling(3).mean().to_numpy()
+        above = close > mean
+        signals = {}
+        for i in range(3, len(close)):
+            if above[i] and not above[i - 1]:
+                signals[i] = [self._signal(batch.symbol, "BUY")]
+            elif not above[i] and above[i - 1]:
+                signals[i] = [self._signal(batch.symbol, "SELL")]
+        return signals
+
+    def generate_signals(self, market_event):
+        raise AssertionError("per-bar path should not be used for batch strategies")
+
+    def get_name(self):
+        return "Crossover"
+
+class PerBarCrossover(BacktestStrategy):
+    def __init__(self):
+        super().__init__()
+        self.closes = []
+        self.above = []
+
+    def generate_signals(self, market_event):
+        self.closes.append(market_event.close)
+        i = len(self.closes) - 1
+        self.above.append(i >= 2 and market_event.close > np.mean(self.closes[-3:]))
+        if i >= 3 and self.above[i] and not self.above[i - 1]:
+            return [type("Sig", (), {"symbol": market_event.symbol, "action": "BUY"})()]
+        if i >= 3 and not self.above[i] and self.above[i - 1]:
+            return [type("Sig", (), {"symbol": market_event.symbol, "action": "SELL"})()]
+        return []
+
+    def get_name(self):
+        return "PerBarCrossover"
+
+def _create_db(path, closes):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE crypto_ohlcv (symbol TEXT, timestamp INTEGER, open REAL, high REAL, low REAL, close REAL, volume REAL)")
+    for i, close in enumerate(closes):
+        ts = int((START + timedelta(days=i)).replace(tzinfo=timezone.utc).timestamp())
+        conn.execute("INSERT INTO crypto_ohlcv VALUES ('BTC', ?, ?, ?, ?, ?, 1.0)", (ts, close, close * 1.01, close * 0.99, close))
+    conn.commit()
+    conn.close()
+
+def _run(db_path, strategy, replay_mode):
+    config = BacktestConfig(start_date=START, end_date=START + timedelta(days=40), symbols=["BTC"],
+                            initial_capital=10000.0, strategies=["Crossover"])
+    engine = BacktestEngine(config, data_provider=MarketDataProvider(DataLoader(str(db_path))),
+                            strategy=strategy, replay_mode=replay_mode, chunk_days=100)
+    return engine.run_backtest()
+
+def test_columnar_replay_matches_event_replay(tmp_path):
+    db_path = tmp_path / "ohlcv.db"
+    closes = [100, 98, 97, 99, 103, 104, 101, 97, 95, 99, 104, 108, 103, 100, 106, 110, 107, 104, 109, 112]
+    _create_db(db_path, [float(c) for c in closes])
+
+    events_result = _run(db_path, PerBarCrossover(), "events")
+    columnar_result = _run(db_path, PerBarCrossover(), "columnar")
+    batch_strategy = CrossoverStrategy()
+    batch_result = _run(db_path, batch_strategy, "columnar")
+
+    assert events_result.trade_count > 2
+    for result in (columnar_result, batch_result):
+        assert result.trade_history == events_result.trade_history
+        assert result.portfolio_values == pytest.approx(events_result.portfolio_values)
+        assert result.total_return == pytest.approx(events_result.total_return)
+    assert batch_strategy.batch_calls == 1
@@ -0,0 +1,113 @@
+import pytest
+import sys
+import os
+import sqlite3
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from datetime import datetime, timedelta, timezone
+from src.core.backtest_engine import BacktestEngine
+from src.data.data_loader import DataLoader
+from src.data.market_data_provider import MarketDataProvider
+from src.strategies.backtest_strategy_base import BacktestStrategy
+from config.backtest_settings import BacktestConfig
+
+START = datetime(2023, 1, 1)
+
+class Signal:
+    def __init__(self, symbol, action):
+        self.symbol = symbol
+        self.action = action
+        self.quantity = 0.0
+
+class RecordingStrategy(BacktestStrategy):
+    """Buys each symbol on its first bar, sells ETH on its fifth bar, and records what it sees."""
+    def __init__(self, engine_ref=None):
+        super().__init__()
+        self.engine_ref = engine_ref
+        self.seen = []
+        self.max_queue = 0
+        self.bars = {}
+
+    def generate_signals(self, market_event):
+        self.seen.append((market_event.timestamp, market_event.symbol))
+        if self.engine_ref is not None:
+            self.max_queue = max(self.max_queue, len(self.engine_ref.event_manager))
+        count = self.bars.get(market_event.symbol, 0) + 1
+        self.bars[market_event.symbol] = count
+        if count == 1:
+            return [Signal(market_event.symbol, "BUY")]
+        if market_event.symbol == "ETH" and count == 5:
+            return [Signal(market_event.symbol, "SELL")]
+        return []
+
+    def get_name(self):
+        return "Recording"
+
+def _create_db(path, closes_by_symbol, step=timedelta(days=1), offsets=None):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE crypto_ohlcv (symbol TEXT, timestamp INTEGER, open REAL, high REAL, low REAL, close REAL, volume REAL)")
+    for symbol, closes in closes_by_symbol.items():
+        offset = (offsets or {}).get(symbol, timedelta(0))
+        for i, close in enumerate(closes):
+            ts = int((START + offset + i * step).replace(tzinfo=timezone.utc).timestamp())
+            conn.execute("INSERT INTO crypto_ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)",
+                         (symbol, ts, close, close * 1.01, close * 0.99, close, 10.0))
+    conn.commit()
+    conn.close()
+
+def _engine(db_path, strategy, symbols, days=20, **kwargs):
+    config = BacktestConfig(start_date=START, end_date=START + timedelta(days=days),
+                            symbols=symbols, initial_capital=10000.0, strategies=["Recording"])
+    provider = MarketDataProvider(DataLoader(str(db_path)))
+    return BacktestEngine(config, data_provider=provider, strategy=strategy, **kwargs)
+
+def test_merges_symbol_streams_in_time_order_with_bounded_queue(tmp_path):
+    db_path = tmp_path / "ohlcv.db"
+    _create_db(db_path, {"BTC": [100.0 + i for i in range(15)], "ETH": [50.0 + i for i in range(15)]},
+               offsets={"ETH": timedelta(hours=12)})
+    strategy = RecordingStrategy()
+    engine = _engine(db_path, strategy, ["BTC", "ETH"], chunk_days=4)
+    strategy.engine_ref = engine
+
+    result = engine.run_backtest()
+
+    timestamps = [ts for ts, _ in strategy.seen]
+    assert timestamps == sorted(timestamps)
+    assert len(strategy.seen) == 30
+    assert [symbol for _, symbol in strategy.seen[:4]] == ["BTC", "ETH", "BTC", "ETH"]
+    # One pending bar per symbol at most (the popped bar's successor is queued before dispatch)
+    assert strategy.max_queue <= 2
+    assert engine.stats["market_events"] == 30
+    assert engine.stats["events_per_second"] > 0
+    assert [t["action"] for t in result.trade_history] == ["BUY", "BUY", "SELL"]
+    assert result.trade_count == 3
+
+def test_buy_and_hold_metrics_match_prices(tmp_path):
+    db_path = tmp_path / "ohlcv.db"
+    closes = [100.0, 110.0, 99.0, 120.0]
+    _create_db(db_path, {"BTC": closes})
+    config = BacktestConfig(start_date=START, end_date=START + timedelta(days=10), symbols=["BTC"],
+                            initial_capital=10000.0, strategies=["BuyHoldStrategy"], db_path=str(db_path))
+    engine = BacktestEngine(config)
+
+    result = engine.run_backtest()
+
+    fill = result.trade_history[0]
+    assert fill["action"] == "BUY"
+    assert fill["price"] == pytest.approx(100.0 * 1.0005)
+    cash = 10000.0 - fill["quantity"] * fill["price"] - fill["commission"]
+    assert cash >= 0
+    expected_final = cash + fill["quantity"] * closes[-1]
+    assert result.portfolio_values[0] == 10000.0
+    assert len(result.portfolio_values) == len(closes) + 1
+    assert result.portfolio_values[-1] == pytest.approx(expected_final)
+    assert result.total_return == pytest.approx(expected_final / 10000.0 - 1)
+    peak = cash + fill["quantity"] * 110.0
+    trough = cash + fill["quantity"] * 99.0
+    assert result.max_drawdown == pytest.approx((peak - trough) / peak)
+
+def test_unknown_strategy_name_raises(tmp_path):
+    from src.utils.exceptions import StrategyError
+    config = BacktestConfig(start_date=START, end_date=START + timedelta(days=10), symbols=["BTC"],
+                            strategies=["InvalidStrategy"], db_path=str(tmp_path / "missing.db"))
+    with pytest.raises(StrategyError, match="Strategy 'InvalidStrategy' not found"):
+        BacktestEngine(config).run_backtest()
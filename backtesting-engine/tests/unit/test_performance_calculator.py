@@ -63,4 +63,34 @@ def test_max_drawdown_not_enough_data():
     calc = PerformanceCalculator()
     assert calc.calculate_max_drawdown() is None
     calc.portfolio_values = [100]
-    assert calc.calculate_max_drawdown() is None 
\ No newline at end of file
+    assert calc.calculate_max_drawdown() is None 
+
+def test_ledger_metrics_match_list_recomputation():
+    rng = np.random.default_rng(4)
+    calc = PerformanceCalculator()
+    base = datetime(2024, 1, 1)
+    for i, value in enumerate(100 * np.exp(np.cumsum(rng.normal(0, 0.02, 500)))):
+        calc.add_portfolio_value(base + timedelta(hours=i), float(value))
+    assert calc._ledger_current()
+
+    reference = PerformanceCalculator()
+    reference.portfolio_values = list(calc.portfolio_values)
+    reference.returns = list(calc.returns)
+    assert not reference._ledger_current()
+
+    assert abs(calc.calculate_total_return() - reference.calculate_total_return()) < 1e-12
+    assert abs(calc.calculate_sharpe_ratio(periods_per_year=8760)
+               - reference.calculate_sharpe_ratio(periods_per_year=8760)) < 1e-9
+    mdd, expected = calc.calculate_max_drawdown(), reference.calculate_max_drawdown()
+    assert mdd.keys() == expected.keys()
+    assert abs(mdd['max_drawdown'] - expected['max_drawdown']) < 1e-12
+    assert (mdd['peak'], mdd['trough'], mdd['duration']) == (expected['peak'], expected['trough'], expected['duration'])
+
+def test_edited_lists_bypass_the_ledger():
+    calc = PerformanceCalculator()
+    base = datetime(2024, 1, 1)
+    for i, value in enumerate([100.0, 120.0, 110.0]):
+        calc.add_portfolio_value(base + timedelta(days=i), value)
+    calc.portfolio_values.append(90.0)  # Not recorded in the ledger
+    assert not calc._ledger_current()
+    assert abs(calc.calculate_max_drawdown()['max_drawdown'] - 0.25) < 1e-8
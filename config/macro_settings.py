@@ -4,6 +4,7 @@ FRED_API_CONFIG = {
     'api_key_env': 'FRED_API_KEY',  # Environment variable
     'timeout': 30,
     'max_retries': 3,
+    'rate_limit_per_minute': 120,  # FRED API limit per key
     'rate_limit_per_day': 120000,  # FRED API limit
     'rate_limit_per_hour': 1000
 }
@@ -28,6 +28,10 @@ class Config:
         self.REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '30'))
         self.MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
         self.RATE_LIMIT_REQUESTS_PER_MINUTE = int(os.getenv('RATE_LIMIT_REQUESTS_PER_MINUTE', '50'))
+        self.COINGECKO_PRO_RATE_LIMIT_RPM = int(os.getenv('COINGECKO_PRO_RATE_LIMIT_RPM', '500'))
+        self.COLLECTION_MAX_CONCURRENCY = int(os.getenv('COLLECTION_MAX_CONCURRENCY', '8'))
+        self.COLLECTION_RESULT_TIMEOUT = float(os.getenv('COLLECTION_RESULT_TIMEOUT', '600'))  # Seconds a collection cycle may take
+        self.SCHEDULER_DAILY_API_BUDGET = int(os.getenv('SCHEDULER_DAILY_API_BUDGET', '0'))  # 0 = 125% of expected usage
         
         # Database Configuration
         self.DATABASE_PATH = os.getenv('DATABASE_PATH', 'data/crypto_data.db')
@@ -43,6 +47,9 @@ class Config:
         self.STRATEGY_CONFIG_DIR = os.getenv('STRATEGY_CONFIG_DIR', 'config/strategies')
         self.ENABLED_STRATEGIES = self._parse_list(os.getenv('ENABLED_STRATEGIES', 'vix_correlation,mean_reversion,multi_bucket_portfolio,volatility'))
         self.STRATEGY_WEIGHTS = self._parse_strategy_weights()
+        self.STRATEGY_EXECUTION_MODE = os.getenv('STRATEGY_EXECUTION_MODE', 'thread')  # sequential, thread or process
+        self.STRATEGY_MAX_WORKERS = int(os.getenv('STRATEGY_MAX_WORKERS', '4'))
+        self.STRATEGY_TIMEOUT_SECONDS = float(os.getenv('STRATEGY_TIMEOUT_SECONDS', '120'))
         
         # API Server Configuration
         self.API_HOST = os.getenv('API_HOST', '0.0.0.0')
@@ -51,10 +58,17 @@ class Config:
         self.API_SECRET_KEY = os.getenv('API_SECRET_KEY', 'your-secret-key-change-in-production')
         self.API_ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv('API_ACCESS_TOKEN_EXPIRE_MINUTES', '1440'))
         
+        # Background Job Configuration (API backtests and signal generation)
+        self.JOB_DB_PATH = os.getenv('JOB_DB_PATH', 'data/jobs.db')
+        self.JOB_MAX_WORKERS = int(os.getenv('JOB_MAX_WORKERS', '2'))
+        self.JOB_MAX_PENDING = int(os.getenv('JOB_MAX_PENDING', '100'))
+        
         # Redis Configuration (for caching and message queue)
         self.REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
         self.REDIS_CACHE_TTL = int(os.getenv('REDIS_CACHE_TTL', '3600'))  # 1 hour
         self.REDIS_SIGNAL_TTL = int(os.getenv('REDIS_SIGNAL_TTL', '86400'))  # 24 hours
+        self.CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '1024'))  # In-process LRU in front of Redis
+        self.CACHE_STALE_SECONDS = int(os.getenv('CACHE_STALE_SECONDS', '300'))  # Served stale while refreshing
         
         # Real-Time Data Configuration
         self._setup_realtime_config()
@@ -84,6 +98,9 @@ class Config:
         self.DISCORD_MIN_CONFIDENCE = float(os.getenv('DISCORD_MIN_CONFIDENCE', '0.6'))
         self.DISCORD_MIN_STRENGTH = os.getenv('DISCORD_MIN_STRENGTH', 'WEAK')
         self.DISCORD_RATE_LIMIT_SECONDS = int(os.getenv('DISCORD_RATE_LIMIT_SECONDS', '60'))
+        self.DISCORD_DELIVERY_QUEUE_SIZE = int(os.getenv('DISCORD_DELIVERY_QUEUE_SIZE', '1000'))
+        self.DISCORD_WEBHOOK_RATE_PER_SECOND = float(os.getenv('DISCORD_WEBHOOK_RATE_PER_SECOND', '0.5'))
+        self.DISCORD_WEBHOOK_BURST = int(os.getenv('DISCORD_WEBHOOK_BURST', '5'))
         
         # Risk Management
         self.MAX_POSITION_SIZE = float(os.getenv('MAX_POSITION_SIZE', '0.10'))  # 10%
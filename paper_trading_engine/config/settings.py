@@ -17,6 +17,8 @@ class Config:
     
     # MTS Integration
     MTS_ALERT_PATH: str = "./data/alerts"  # Directory to monitor for MTS alerts
+    MTS_SIGNAL_JOURNAL: str = "./data/alerts/signal_journal.jsonl"  # Append-only alert journal written by MTS
+    SIGNAL_CURSOR_FILE: str = "./data/mts_consumer_cursor.json"  # Last consumed journal offset
     
     # Logging Settings
     LOG_LEVEL: str = "INFO"
@@ -35,6 +37,8 @@ class Config:
             INITIAL_CAPITAL=float(os.getenv('INITIAL_CAPITAL', '10000.0')),
             POSITION_SIZE_PCT=float(os.getenv('POSITION_SIZE_PCT', '0.02')),
             MTS_ALERT_PATH=os.getenv('MTS_ALERT_PATH', './data/alerts'),
+            MTS_SIGNAL_JOURNAL=os.getenv('MTS_SIGNAL_JOURNAL', './data/alerts/signal_journal.jsonl'),
+            SIGNAL_CURSOR_FILE=os.getenv('SIGNAL_CURSOR_FILE', './data/mts_consumer_cursor.json'),
             LOG_LEVEL=os.getenv('LOG_LEVEL', 'INFO'),
             LOG_FILE=os.getenv('LOG_FILE', './logs/trading_engine.log'),
             LOG_FORMAT=os.getenv('LOG_FORMAT', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
@@ -1,6 +1,7 @@
 # Analytics package for performance calculations and reporting
 
 from .performance_calculator import PerformanceCalculator, PerformanceMetrics
+from .performance_ledger import PerformanceLedger
 from .report_generator import ReportGenerator
 
-__all__ = ['PerformanceCalculator', 'PerformanceMetrics', 'ReportGenerator'] 
\ No newline at end of file
+__all__ = ['PerformanceCalculator', 'PerformanceMetrics', 'PerformanceLedger', 'ReportGenerator'] 
\ No newline at end of file
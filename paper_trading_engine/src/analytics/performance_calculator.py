@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 from ..core.models import Trade, PortfolioState
+from .performance_ledger import PerformanceLedger
 
 if TYPE_CHECKING:
     from ..portfolio.portfolio_manager import PortfolioManager
@@ -70,12 +71,16 @@ class PerformanceCalculator:
         """
         self.risk_free_rate = risk_free_rate
     
-    def calculate_metrics(self, portfolio_manager: "PortfolioManager") -> PerformanceMetrics:
+    def calculate_metrics(self, portfolio_manager: "PortfolioManager", recompute: bool = False) -> PerformanceMetrics:
         """
         Calculate comprehensive performance metrics
         
+        Metrics are read from the portfolio manager's PerformanceLedger when it has one; a
+        ledger that does not match the trade history is rebuilt from it first.
+        
         Args:
             portfolio_manager: Portfolio manager with trade history
+            recompute: Recalculate everything from the trade history, ignoring the ledger
             
         Returns:
             PerformanceMetrics object with all calculated metrics
@@ -95,6 +100,12 @@ class PerformanceCalculator:
         if not trade_history:
             return self._empty_metrics(portfolio_state)
         
+        ledger = getattr(portfolio_manager, 'performance_ledger', None)
+        if ledger is not None and not recompute:
+            if not ledger.is_current(trade_history):
+                ledger.rebuild(trade_history)
+            return self._metrics_from_ledger(ledger, trade_history, portfolio_state)
+        
         # Basic calculations
         total_pnl = portfolio_state.total_pnl
         realized_pnl = portfolio_state.realized_pnl
@@ -155,6 +166,95 @@ class PerformanceCalculator:
             consecutive_losses=consecutive_losses
         )
     
+    def _metrics_from_ledger(self, ledger: PerformanceLedger, trade_history: List[Trade],
+                             portfolio_state: PortfolioState) -> PerformanceMetrics:
+        """Build metrics from the ledger's running aggregates"""
+        total_return = (portfolio_state.total_value - portfolio_state.initial_capital) / portfolio_state.initial_capital
+        total_trades = ledger.completed_trades
+        
+        total_loss = abs(ledger.losing_pnl_total)
+        if total_loss > 0:
+            profit_factor = ledger.total_profit / total_loss
+        elif ledger.total_profit > 0:
+            profit_factor = 1000.0  # Large finite value instead of infinity
+        else:
+            profit_factor = 0.0
+        
+        if ledger.daily_in_order:
+            sharpe_ratio = self._sharpe_from_daily_stats(ledger) if total_trades >= 2 else 0.0
+            best_day_pnl, worst_day_pnl = ledger.daily_extremes()
+        else:
+            # Trades recorded out of date order: regroup the days from the trade history
+            completed_trades = [trade for trade in trade_history if trade.side.value == 'SELL']
+            sharpe_ratio = self._calculate_sharpe_ratio(completed_trades, total_return, portfolio_state.initial_capital)
+            best_day_pnl, worst_day_pnl = self._calculate_daily_extremes(completed_trades)
+        
+        max_drawdown, max_drawdown_percent = ledger.realized_drawdown()
+        trading_days = len(ledger.trading_dates)
+        
+        return PerformanceMetrics(
+            total_return=total_return,
+            total_pnl=portfolio_state.total_pnl,
+            realized_pnl=portfolio_state.realized_pnl,
+            unrealized_pnl=portfolio_state.unrealized_pnl,
+            total_trades=total_trades,
+            winning_trades=ledger.winning_trades,
+            losing_trades=ledger.losing_trades,
+            win_rate=ledger.winning_trades / total_trades if total_trades > 0 else 0.0,
+            sharpe_ratio=sharpe_ratio,
+            max_drawdown=max_drawdown,
+            max_drawdown_percent=max_drawdown_percent,
+            profit_factor=profit_factor,
+            average_win=ledger.total_profit / ledger.winning_trades if ledger.winning_trades else 0.0,
+            average_loss=total_loss / ledger.losing_trades if ledger.losing_trades else 0.0,
+            largest_win=ledger.largest_win if ledger.largest_win is not None else 0.0,
+            largest_loss=ledger.largest_loss if ledger.largest_loss is not None else 0.0,
+            volatility=ledger.pnl_volatility(),
+            avg_trade_pnl=ledger.pnl_total / total_trades if total_trades > 0 else 0.0,
+            trading_days=trading_days,
+            avg_trades_per_day=total_trades / trading_days if trading_days > 0 else 0.0,
+            best_day_pnl=best_day_pnl,
+            worst_day_pnl=worst_day_pnl,
+            consecutive_wins=ledger.consecutive_wins,
+            consecutive_losses=ledger.consecutive_losses
+        )
+    
+    def _sharpe_from_daily_stats(self, ledger: PerformanceLedger) -> float:
+        """Annualized Sharpe ratio from the ledger's running daily return statistics"""
+        daily_stats = ledger.daily_return_stats()
+        if daily_stats.count == 0:
+            return 0.0
+        
+        daily_std = daily_stats.std(ddof=1)
+        if daily_std == 0:
+            return 0.0
+        
+        # Annualize (assuming 252 trading days)
+        annualized_return = daily_stats.mean * 252
+        annualized_volatility = daily_std * math.sqrt(252)
+        
+        return (annualized_return - self.risk_free_rate) / annualized_volatility
+    
+    def calculate_equity_curve_metrics(self, portfolio_manager: "PortfolioManager") -> Dict:
+        """
+        Metrics of the mark-to-market equity snapshots recorded by the portfolio manager
+        
+        Args:
+            portfolio_manager: Portfolio manager with a performance ledger
+            
+        Returns:
+            Dictionary with snapshot count, total return, return volatility and drawdown
+        """
+        equity = portfolio_manager.performance_ledger.equity
+        drawdown = equity.drawdown()
+        return {
+            "snapshots": equity.count,
+            "total_return": equity.total_return() or 0.0,
+            "return_volatility": equity.returns.std(ddof=1) if equity.returns.count > 1 else 0.0,
+            "max_drawdown_percent": drawdown['max_drawdown'] * 100 if drawdown else 0.0,
+            "peak_value": equity.peak if equity.count else 0.0
+        }
+    
     def _empty_metrics(self, portfolio_state: PortfolioState) -> PerformanceMetrics:
         """Return empty metrics for portfolio with no trades"""
         return PerformanceMetrics(
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Incremental Performance Ledger
+
+Keeps the running aggregates behind PerformanceCalculator.calculate_metrics up to date as
+trades are recorded, so performance reports no longer rescan the trade history.
+"""
+
+from datetime import date, datetime
+from typing import Iterable, Optional, Set
+
+from shared.equity_ledger import EquityLedger, RunningStats
+
+from ..core.models import Trade
+
+
+class PerformanceLedger:
+    """
+    Running trade, daily and equity aggregates for one portfolio.
+
+    Completed (SELL) trades update win/loss counters, P&L statistics, the realized equity
+    curve used for drawdown, and per-day returns. Days are closed as trades for a later date
+    arrive; if a trade is recorded for an earlier day than the open one, daily_in_order is
+    cleared and daily metrics must be recomputed from the trade history.
+
+    Mark-to-market portfolio values are kept separately in the `equity` ledger.
+    """
+
+    def __init__(self, initial_capital: float):
+        """
+        Initialize performance ledger
+
+        Args:
+            initial_capital: Starting capital the realized equity curve begins from
+        """
+        self.initial_capital = initial_capital
+        self.equity = EquityLedger()
+        self._reset()
+
+    def _reset(self):
+        """Clear all trade aggregates"""
+        self.trade_count = 0
+        self.last_trade_id: Optional[str] = None
+        self.trading_dates: Set[date] = set()
+
+        # Completed trade aggregates
+        self.completed_trades = 0
+        self.winning_trades = 0
+        self.losing_trades = 0
+        self.pnl_total = 0.0
+        self.total_profit = 0.0
+        self.losing_pnl_total = 0.0
+        self.largest_win: Optional[float] = None
+        self.largest_loss: Optional[float] = None
+        self.pnl_stats = RunningStats()
+        self.consecutive_wins = 0
+        self.consecutive_losses = 0
+        self._current_wins = 0
+        self._current_losses = 0
+
+        # Realized equity curve: initial capital plus cumulative completed trade P&L
+        self.realized = EquityLedger()
+        self.realized.append(0.0, self.initial_capital)
+        self._cumulative_pnl = 0.0
+
+        # Daily returns; the latest day stays open until a trade for a later day arrives
+        self.daily_in_order = True
+        self.daily_returns = RunningStats()
+        self.best_closed_day: Optional[float] = None
+        self.worst_closed_day: Optional[float] = None
+        self.open_date: Optional[date] = None
+        self.open_day_pnl = 0.0
+        self._capital_before_open_day = self.initial_capital
+
+    def rebuild(self, trades: Iterable[Trade]):
+        """Recompute all trade aggregates from a trade history"""
+        self._reset()
+        for trade in trades:
+            self.record_trade(trade)
+
+    def record_equity(self, timestamp: datetime, total_value: float):
+        """Append a mark-to-market portfolio value snapshot"""
+        self.equity.append(timestamp, total_value)
+
+    def record_trade(self, trade: Trade):
+        """Update the aggregates with a newly recorded trade"""
+        self.trade_count += 1
+        self.last_trade_id = trade.id
+        trade_date = trade.timestamp.date()
+        self.trading_dates.add(trade_date)
+
+        if trade.side.value != 'SELL':
+            return
+
+        pnl = trade.pnl
+        self.completed_trades += 1
+        self.pnl_total += pnl
+        self.pnl_stats.add(pnl)
+
+        if pnl > 0:
+            self.winning_trades += 1
+            self.total_profit += pnl
+            self.largest_win = pnl if self.largest_win is None else max(self.largest_win, pnl)
+            self._current_wins += 1
+            self._current_losses = 0
+            self.consecutive_wins = max(self.consecutive_wins, self._current_wins)
+        elif pnl < 0:
+            self.losing_trades += 1
+            self.losing_pnl_total += pnl
+            self.largest_loss = pnl if self.largest_loss is None else min(self.largest_loss, pnl)
+            self._current_losses += 1
+            self._current_wins = 0
+            self.consecutive_losses = max(self.consecutive_losses, self._current_losses)
+        else:
+            self._current_wins = 0
+            self._current_losses = 0
+
+        self._cumulative_pnl += pnl
+        self.realized.append(trade.timestamp, self.initial_capital + self._cumulative_pnl)
+
+        self._record_daily_pnl(trade_date, pnl)
+
+    def _record_daily_pnl(self, trade_date: date, pnl: float):
+        """Add completed trade P&L to its day, closing the open day when a later one starts"""
+        if self.open_date is None:
+            self.open_date = trade_date
+            self.open_day_pnl = 0.0
+        elif trade_date > self.open_date:
+            return_value, self._capital_before_open_day = self._day_return(self.open_day_pnl)
+            self.daily_returns.add(return_value)
+            self.best_closed_day = self.open_day_pnl if self.best_closed_day is None else max(self.best_closed_day, self.open_day_pnl)
+            self.worst_closed_day = self.open_day_pnl if self.worst_closed_day is None else min(self.worst_closed_day, self.open_day_pnl)
+            self.open_date = trade_date
+            self.open_day_pnl = 0.0
+        elif trade_date < self.open_date:
+            self.daily_in_order = False
+            return
+
+        self.open_day_pnl += pnl
+
+    def _day_return(self, day_pnl: float):
+        """Return for a day's P&L and the running capital after it"""
+        capital = self._capital_before_open_day
+        # Protect against negative or zero capital
+        if capital <= 0:
+            return 0.0, max(0.01, capital + day_pnl)
+        return day_pnl / capital, capital + day_pnl
+
+    def daily_return_stats(self) -> RunningStats:
+        """Daily return statistics including the open day"""
+        if self.open_date is None:
+            return self.daily_returns
+        return self.daily_returns.with_value(self._day_return(self.open_day_pnl)[0])
+
+    def daily_extremes(self):
+        """Best and worst day P&L including the open day"""
+        if self.open_date is None:
+            return 0.0, 0.0
+        best = self.open_day_pnl if self.best_closed_day is None else max(self.best_closed_day, self.open_day_pnl)
+        worst = self.open_day_pnl if self.worst_closed_day is None else min(self.worst_closed_day, self.open_day_pnl)
+        return best, worst
+
+    def pnl_volatility(self) -> float:
+        """Sample standard deviation of completed trade P&L"""
+        if self.completed_trades < 2:
+            return 0.0
+        return self.pnl_stats.std(ddof=1)
+
+    def realized_drawdown(self):
+        """Maximum drawdown of the realized equity curve, in USD and as a percent of its peak"""
+        max_drawdown = self.realized.max_drawdown_amount
+        peak = self.realized.peak
+        max_drawdown_percent = (max_drawdown / peak) * 100 if peak > 0 else 0.0
+        return max_drawdown, max_drawdown_percent
+
+    def is_current(self, trade_history) -> bool:
+        """Whether the ledger has recorded exactly this trade history"""
+        if self.trade_count != len(trade_history):
+            return False
+        return not trade_history or trade_history[-1].id == self.last_trade_id
@@ -18,6 +18,7 @@ from ..portfolio.portfolio_manager import PortfolioManager
 from ..execution.execution_engine import ExecutionEngine
 from ..services.market_data_service import MarketDataService
 from ..analytics.report_generator import ReportGenerator
+from ..signal_consumer.signal_intake import SignalIntake
 from ..core.enums import SignalType  # Moved to top level
 
 
@@ -31,9 +32,20 @@ class MainExecutionLoop:
                  poll_interval: float = 1.0,
                  error_retry_interval: float = 5.0,
                  report_directory: str = "data/reports",
-                 health_check_interval: float = 30.0):
+                 health_check_interval: float = 30.0,
+                 signal_journal: Optional[str] = None,
+                 cursor_file: str = "data/signal_intake_cursor.json",
+                 max_batch_size: int = 100,
+                 dead_letter_file: str = "data/signal_intake_dead_letter.jsonl",
+                 max_signal_failures: int = 3):
         self.signal_directory = Path(signal_directory)
         self.signal_directory.mkdir(parents=True, exist_ok=True)
+        self.intake = SignalIntake(
+            journal_path=signal_journal or str(self.signal_directory / "signal_journal.jsonl"),
+            cursor_path=cursor_file,
+            max_batch_size=max_batch_size,
+            dead_letter_path=dead_letter_file
+        )
         self.portfolio_manager = portfolio_manager or PortfolioManager(initial_capital=10000.0)
         self.execution_engine = execution_engine or ExecutionEngine(self.portfolio_manager)
         self.market_data = MarketDataService(use_real_time=True)
@@ -45,12 +57,16 @@ class MainExecutionLoop:
         
         self.logger = logging.getLogger(__name__)
         self.running = False
-        self.processed_files = set()
         self.last_status_print = None  # Track last status print time
         self.last_health_check = None
         self.poll_interval = poll_interval
         self.error_retry_interval = error_retry_interval
         self.health_check_interval = health_check_interval
+        # Consecutive execution failures at one cursor position; the signal there is
+        # dead-lettered once they reach max_signal_failures
+        self.max_signal_failures = max_signal_failures
+        self._failure_position = None
+        self._failure_count = 0
         self.stats = {
             'signals_processed': 0, 'trades_executed': 0, 'errors': 0,
             'start_time': None, 'last_signal_time': None
@@ -102,12 +118,15 @@ class MainExecutionLoop:
         """Start the main execution loop"""
         
         self.logger.info("Starting main execution loop...")
-        self.logger.info(f"Monitoring directory: {self.signal_directory}")
+        self.logger.info(f"Monitoring signal journal: {self.intake.journal_path}")
         self.logger.info(f"Initial portfolio value: ${self.portfolio_manager.get_total_value():.2f}")
         
         # Initialize portfolio
         self.portfolio_manager.initialize()
         
+        # Wake the loop as soon as new signals are journaled
+        self.intake.start()
+        
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -133,6 +152,7 @@ class MainExecutionLoop:
         """Stop the main execution loop"""
         
         self.running = False
+        self.intake.stop()
         self.logger.info("Stopping main execution loop...")
         
         # Print final statistics
@@ -146,7 +166,7 @@ class MainExecutionLoop:
                 self._check_system_health()
                 
                 # Process signals
-                self._process_signal_files()
+                self._process_signals()
                 
                 # Update position prices
                 self._update_position_prices()
@@ -154,7 +174,8 @@ class MainExecutionLoop:
                 # Print status
                 self._print_status()
                 
-                time.sleep(self.poll_interval)
+                # Sleep until new signals arrive, at most poll_interval
+                self.intake.wait(self.poll_interval)
                 
             except Exception as e:
                 self.logger.error(f"Error in main loop: {e}")
@@ -195,92 +216,105 @@ class MainExecutionLoop:
                 self.error_handler.handle_error(e, context={"type": "health_check"}, 
                                              severity=ErrorSeverity.MEDIUM)
     
-    def _process_signal_files(self):
-        """Process new signal files in the monitored directory"""
+    def _process_signals(self):
+        """
+        Process all signals journaled since the committed intake cursor, batch by batch.
         
-        try:
-            # Look for JSON files in the signal directory
-            for file_path in self.signal_directory.glob("*.json"):
-                if file_path.name not in self.processed_files:
-                    try:
-                        self._process_signal_file(file_path)
-                    except Exception as e:
-                        self.logger.error(f"Error processing signal file {file_path}: {e}")
-                        self.stats['errors'] += 1
-                        self.error_handler.handle_error(e, context={"file_path": str(file_path)}, 
-                                                     severity=ErrorSeverity.MEDIUM)
-                    
-        except Exception as e:
-            self.logger.error(f"Error processing signal files: {e}")
-            self.stats['errors'] += 1
-            self.error_handler.handle_error(e, context={"type": "signal_directory_scan"}, 
-                                         severity=ErrorSeverity.MEDIUM)
+        The cursor is committed after each executed signal, so a failure part way through a
+        batch only replays the signals that had not been executed yet.
+        """
         
-        # Memory management: limit processed_files set size
-        if len(self.processed_files) > 1000:
-            self.logger.info(f"Clearing processed files cache (size: {len(self.processed_files)})")
-            self.processed_files.clear()
-    
-    def _process_signal_file(self, file_path: Path):
-        """Process a single signal file with enhanced error handling"""
-        try:
-            # Check if file is still being written (race condition protection)
-            initial_size = file_path.stat().st_size
-            time.sleep(0.1)  # Wait a bit
-            if file_path.stat().st_size != initial_size:
-                self.logger.debug(f"File {file_path.name} still being written, skipping")
+        while True:
+            try:
+                entries, inode, offset = self.intake.read_entries()
+            except Exception as e:
+                self.logger.error(f"Error reading signal journal: {e}")
+                self.stats['errors'] += 1
+                self.error_handler.handle_error(e, context={"type": "signal_journal_read"}, 
+                                             severity=ErrorSeverity.MEDIUM)
                 return
             
-            self.logger.info(f"Processing signal file: {file_path.name}")
-            signal_obj = self._parse_signal_file(file_path)
-            
-            if signal_obj:
-                try:
-                    result = self.execution_engine.process_signal(signal_obj)
-                    if result and result.success:
-                        self.logger.info(f"Signal processed successfully: {signal_obj.asset} {signal_obj.signal_type}")
-                        self.stats['signals_processed'] += 1
-                        self.stats['trades_executed'] += 1
-                        self.stats['last_signal_time'] = datetime.now()
-                    else:
-                        self.logger.warning(f"Signal processing failed: {signal_obj.asset}")
-                        self.stats['signals_processed'] += 1
-                        self.error_handler.handle_error(
-                            Exception(f"Signal processing failed for {signal_obj.asset}"),
-                            context={"signal": signal_obj.__dict__, "file_path": str(file_path)},
-                            severity=ErrorSeverity.MEDIUM
-                        )
-                except Exception as e:
-                    self.logger.error(f"Error executing signal {signal_obj.asset}: {e}")
-                    self.error_handler.handle_error(e, context={"signal": signal_obj.__dict__, "file_path": str(file_path)}, 
-                                                 severity=ErrorSeverity.MEDIUM)
-                    self.stats['errors'] += 1
-            else:
-                self.logger.warning(f"Failed to parse signal file: {file_path.name}")
-                self.error_handler.handle_error(
-                    Exception(f"Failed to parse signal file: {file_path.name}"),
-                    context={"file_path": str(file_path)},
-                    severity=ErrorSeverity.LOW
-                )
-                # Don't mark as processed if parsing failed
+            if not entries:
+                if (inode, offset) != self.intake.position:
+                    self.intake.commit(inode, offset)  # Skipped blank or invalid lines
                 return
             
-            # Only mark as processed if we successfully processed or attempted to process
-            self.processed_files.add(file_path.name)
+            parsed = []  # (alert, signal, offset just past its journal line)
+            for data, end in entries:
+                signal_obj = self._parse_signal_data(data)
+                if signal_obj:
+                    parsed.append((data, signal_obj, end))
+                else:
+                    self.error_handler.handle_error(
+                        Exception("Failed to parse journaled signal"),
+                        context={"alert": data},
+                        severity=ErrorSeverity.LOW
+                    )
             
-        except Exception as e:
-            self.logger.error(f"Error processing file {file_path.name}: {e}")
-            self.stats['errors'] += 1
-            self.error_handler.handle_error(e, context={"file_path": str(file_path)}, 
-                                         severity=ErrorSeverity.MEDIUM)
-            # Don't mark as processed if there was an error
+            ends = iter([end for _, _, end in parsed])
+            
+            def on_result(signal_obj, result):
+                self.intake.commit(inode, next(ends))
+                self._record_result(signal_obj, result)
+            
+            try:
+                self.execution_engine.process_signals([signal_obj for _, signal_obj, _ in parsed],
+                                                      on_result=on_result)
+            except Exception as e:
+                # Executed signals are committed; the rest of the batch is retried on the next pass
+                self._handle_execution_failure(e, parsed, inode)
+                return
+            
+            self._failure_position, self._failure_count = None, 0
+            if (inode, offset) != self.intake.position:
+                self.intake.commit(inode, offset)
+            self.logger.info(f"Processed batch of {len(parsed)} signals")
     
-    def _parse_signal_file(self, file_path: Path) -> Optional[TradingSignal]:
-        """Parse a signal file and return a TradingSignal"""
+    def _handle_execution_failure(self, error: Exception, parsed: List, inode: Optional[int]):
+        """Count a failure at the cursor and dead-letter the signal there once it keeps failing"""
+        self.logger.error(f"Error executing signal batch: {error}")
+        self.stats['errors'] += 1
+        self.error_handler.handle_error(error, context={"batch_size": len(parsed)}, 
+                                     severity=ErrorSeverity.MEDIUM)
+        
+        position = self.intake.position
+        if position == self._failure_position:
+            self._failure_count += 1
+        else:
+            self._failure_position, self._failure_count = position, 1
+        if self._failure_count < self.max_signal_failures:
+            return
+        
+        # The first signal past the cursor is the one that failed
+        committed_inode, committed_offset = position
+        pending = [(data, end) for data, _, end in parsed if committed_inode != inode or end > committed_offset]
+        if not pending:
+            return
+        data, end = pending[0]
+        self.intake.dead_letter(data, reason=f"{self._failure_count} execution failures: {error}")
+        self.intake.commit(inode, end)
+        self._failure_position, self._failure_count = None, 0
+        self.logger.error(f"Moved signal to dead-letter file {self.intake.dead_letter_path} "
+                          f"after {self.max_signal_failures} failures: {data.get('asset')}")
+    
+    def _record_result(self, signal_obj: TradingSignal, result):
+        """Update statistics for one executed signal"""
+        self.stats['signals_processed'] += 1
+        if result and result.success:
+            self.logger.info(f"Signal processed successfully: {signal_obj.asset} {signal_obj.signal_type}")
+            self.stats['trades_executed'] += 1
+            self.stats['last_signal_time'] = datetime.now()
+        else:
+            self.logger.warning(f"Signal processing failed: {signal_obj.asset}")
+            self.error_handler.handle_error(
+                Exception(f"Signal processing failed for {signal_obj.asset}"),
+                context={"signal": signal_obj.__dict__},
+                severity=ErrorSeverity.MEDIUM
+            )
+    
+    def _parse_signal_data(self, data: Dict[str, Any]) -> Optional[TradingSignal]:
+        """Parse a journaled alert and return a TradingSignal"""
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
             signal_type_map = {'LONG': SignalType.LONG, 'SHORT': SignalType.SHORT, 'EXIT': SignalType.EXIT}
             timestamp_str = data.get('timestamp', datetime.now().isoformat())
             timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00')) if isinstance(timestamp_str, str) else datetime.now()
@@ -291,14 +325,11 @@ class MainExecutionLoop:
                 price=data.get('price', 50000.0), 
                 confidence=data.get('confidence', 0.8),
                 timestamp=timestamp, 
-                source=file_path.name, 
+                source=data.get('alert_file') or self.intake.journal_name, 
                 metadata=data
             )
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Error parsing signal file {file_path.name}: {e}")
-            return None
         except Exception as e:
-            self.logger.error(f"Unexpected error parsing signal file {file_path.name}: {e}")
+            self.logger.error(f"Unexpected error parsing journaled signal: {e}")
             return None
     
     def _update_position_prices(self):
@@ -393,7 +424,7 @@ class MainExecutionLoop:
                 "cash": portfolio_state.cash,
                 "positions_count": len(portfolio_state.positions)
             },
-            "processed_files_count": len(self.processed_files)
+            "intake": self.intake.get_status()
         }
         
         if self.stats['start_time']:
@@ -441,7 +472,7 @@ class MainExecutionLoop:
 
 
 def create_sample_signal_file(directory: str = "data/alerts"):
-    """Create a sample signal file for testing"""
+    """Create a sample signal file for testing and append it to the signal journal"""
     
     import json
     from pathlib import Path
@@ -463,5 +494,8 @@ def create_sample_signal_file(directory: str = "data/alerts"):
     with open(file_path, 'w') as f:
         json.dump(sample_signal, f, indent=2)
     
+    with open(signal_dir / "signal_journal.jsonl", 'a') as f:
+        f.write(json.dumps({**sample_signal, "alert_file": file_path.name}) + "\n")
+    
     print(f"Created sample signal file: {file_path}")
-    return file_path 
\ No newline at end of file
+    return file_path
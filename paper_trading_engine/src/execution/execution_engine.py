@@ -5,7 +5,7 @@ Execution engine for processing trading signals
 import logging
 import time
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Dict, List, Optional
 
 from ..core.models import TradingSignal, ExecutionResult
 from ..core.enums import SignalType
@@ -40,7 +40,43 @@ class ExecutionEngine:
             'avg_execution_time': 0.0
         }
     
-    def process_signal(self, signal: TradingSignal) -> Optional[ExecutionResult]:
+    def process_signals(self, signals: List[TradingSignal],
+                        on_result: Optional[Callable[[TradingSignal, Optional[ExecutionResult]], None]] = None
+                        ) -> List[Optional[ExecutionResult]]:
+        """
+        Process a batch of trading signals in order.
+        
+        With real-time market data, prices for all assets in the batch are fetched with a
+        single request and shared by the signals of the batch.
+        
+        Args:
+            signals: Signals to process
+            on_result: Called with each signal and its result as soon as it is processed,
+                before the next signal starts
+        
+        Returns:
+            One result per signal (None where the signal was rejected or failed)
+        """
+        if not signals:
+            return []
+        
+        prices: Dict[str, float] = {}
+        if getattr(self.market_data, 'use_real_time', False):
+            try:
+                assets = list(dict.fromkeys(signal.asset for signal in signals))
+                prices = self.market_data.get_current_prices(assets)
+            except Exception as e:
+                self.logger.warning(f"Batch price lookup failed, pricing signals individually: {e}")
+        
+        results = []
+        for signal in signals:
+            result = self.process_signal(signal, market_price=prices.get(signal.asset))
+            if on_result:
+                on_result(signal, result)
+            results.append(result)
+        return results
+    
+    def process_signal(self, signal: TradingSignal, market_price: Optional[float] = None) -> Optional[ExecutionResult]:
         """Process a trading signal through the execution pipeline"""
         
         start_time = time.time()
@@ -65,7 +101,7 @@ class ExecutionEngine:
                 return None
             
             # Get current market price for execution
-            current_market_price = self.market_data.get_current_price(signal.asset, signal.timestamp)
+            current_market_price = market_price or self.market_data.get_current_price(signal.asset, signal.timestamp)
             
             # Execute the order
             execution_result = self.trade_executor.execute_order(order, current_market_price)
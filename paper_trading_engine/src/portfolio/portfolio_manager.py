@@ -10,6 +10,7 @@ from decimal import Decimal, ROUND_HALF_UP
 from ..core.models import ExecutionResult, Trade, PortfolioState, Position
 from ..core.enums import OrderSide
 from ..analytics.performance_calculator import PerformanceCalculator, PerformanceMetrics
+from ..analytics.performance_ledger import PerformanceLedger
 
 
 class InsufficientFundsError(Exception):
@@ -40,8 +41,9 @@ class PortfolioManager:
         self.win_count = 0
         self.loss_count = 0
         
-        # Performance calculator
+        # Performance calculator and its running aggregates
         self.performance_calculator = PerformanceCalculator()
+        self.performance_ledger = PerformanceLedger(initial_capital)
     
     def initialize(self):
         """Initialize portfolio with initial capital"""
@@ -71,6 +73,7 @@ class PortfolioManager:
             # Record trade with old values for correct PnL calculation
             trade = self._create_trade_record(execution, old_quantity, old_avg_price)
             self.trade_history.append(trade)
+            self.performance_ledger.record_trade(trade)
             
             # Update P&L tracking
             self._update_pnl_tracking(trade)
@@ -309,6 +312,7 @@ class PortfolioManager:
     def _save_portfolio_snapshot(self):
         """Save current portfolio state to history"""
         state = self.get_state()
+        self.performance_ledger.record_equity(state.timestamp, state.total_value)
         self.portfolio_history.append({
             'timestamp': state.timestamp.isoformat(),
             'total_value': state.total_value,
@@ -324,6 +328,10 @@ class PortfolioManager:
         """Get comprehensive performance metrics"""
         return self.performance_calculator.calculate_metrics(self)
     
+    def get_equity_curve_metrics(self) -> Dict:
+        """Get metrics of the mark-to-market equity snapshots"""
+        return self.performance_calculator.calculate_equity_curve_metrics(self)
+    
     def get_performance_summary(self) -> Dict:
         """Get performance summary report"""
         metrics = self.get_performance_metrics()
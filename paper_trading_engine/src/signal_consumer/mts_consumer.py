@@ -7,102 +7,31 @@ import os
 import time
 import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, Set
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from typing import Dict, Any, Optional
 
 from config.settings import Config
 from src.core.models import TradingSignal
 from src.signal_consumer.signal_processor import SignalProcessor
 from src.signal_consumer.filters import SignalFilters
+from src.signal_consumer.signal_intake import SignalIntake
 from src.utils.logger import get_logger
 
 logger = get_logger('signal_consumer.mts')
 
 
-class MTSAlertHandler(FileSystemEventHandler):
-    """File system event handler for MTS alert files"""
-    
-    def __init__(self, consumer: 'MTSSignalConsumer'):
-        self.consumer = consumer
-        self.processed_files: Set[str] = set()
-        self._lock = threading.Lock()  # Thread safety for processed_files
-    
-    def _wait_for_file_complete(self, file_path: str, max_wait: int = 5) -> bool:
-        """Wait until file is completely written"""
-        last_size = -1
-        wait_time = 0
-        while wait_time < max_wait:
-            try:
-                if not os.path.exists(file_path):
-                    time.sleep(0.1)
-                    wait_time += 0.1
-                    continue
-                    
-                current_size = os.path.getsize(file_path)
-                if current_size == last_size and current_size > 0:
-                    return True  # File stable
-                last_size = current_size
-                time.sleep(0.1)
-                wait_time += 0.1
-            except OSError:
-                time.sleep(0.1)
-                wait_time += 0.1
-        logger.warning(f"File {file_path} did not stabilize within {max_wait}s")
-        return False
-    
-    def _should_process_file(self, file_path: str) -> bool:
-        """Check if file should be processed (not already processed)"""
-        with self._lock:
-            if file_path in self.processed_files:
-                return False
-            # Additional checks could be added here (file age, size, etc.)
-            return True
-    
-    def _mark_file_processed(self, file_path: str):
-        """Mark file as processed (thread-safe)"""
-        with self._lock:
-            self.processed_files.add(file_path)
-    
-    def on_created(self, event):
-        """Handle new file creation"""
-        if not event.is_directory and event.src_path.endswith('.json'):
-            logger.info(f"New alert file detected: {event.src_path}")
-            
-            # Wait for file to be completely written
-            if self._wait_for_file_complete(event.src_path):
-                if self._should_process_file(event.src_path):
-                    self.consumer.process_alert_file(event.src_path)
-                    self._mark_file_processed(event.src_path)
-                else:
-                    logger.debug(f"File already processed: {event.src_path}")
-            else:
-                logger.warning(f"File not ready for processing: {event.src_path}")
-    
-    def on_modified(self, event):
-        """Handle file modification (in case file is written slowly)"""
-        if (not event.is_directory and 
-            event.src_path.endswith('.json') and 
-            self._should_process_file(event.src_path)):
-            logger.debug(f"Alert file modified: {event.src_path}")
-            
-            # Wait for file to be completely written
-            if self._wait_for_file_complete(event.src_path):
-                self.consumer.process_alert_file(event.src_path)
-                self._mark_file_processed(event.src_path)
-            else:
-                logger.warning(f"Modified file not ready for processing: {event.src_path}")
-
-
 class MTSSignalConsumer:
-    """Main MTS signal consumer that monitors alert directory"""
+    """Main MTS signal consumer that follows the MTS signal journal"""
     
     def __init__(self, config: Config):
         self.config = config
         self.alert_path = Path(config.MTS_ALERT_PATH)
         self.processor = SignalProcessor()
         self.filters = SignalFilters()
-        self.observer = None
+        self.intake = SignalIntake(
+            journal_path=getattr(config, 'MTS_SIGNAL_JOURNAL', str(self.alert_path / 'signal_journal.jsonl')),
+            cursor_path=getattr(config, 'SIGNAL_CURSOR_FILE', './data/mts_consumer_cursor.json')
+        )
+        self._consumer_thread = None
         self.is_running = False
         self.processed_signals = []
         self._signals_lock = threading.Lock()  # Thread safety for processed_signals
@@ -122,48 +51,70 @@ class MTSSignalConsumer:
         
         # Ensure alert directory exists
         self.alert_path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"MTS Consumer initialized - monitoring: {self.alert_path}")
+        logger.info(f"MTS Consumer initialized - following: {self.intake.journal_path}")
     
     def start_monitoring(self):
-        """Start monitoring the MTS alert directory"""
+        """Start consuming the MTS signal journal"""
         try:
             if self.is_running:
                 logger.warning("Consumer already running")
                 return
             
-            # Process any existing files first
-            self._process_existing_files()
-            
-            # Set up file system watcher
-            self.observer = Observer()
-            event_handler = MTSAlertHandler(self)
-            self.observer.schedule(event_handler, str(self.alert_path), recursive=False)
-            
-            # Start monitoring
-            self.observer.start()
+            # Alerts journaled while stopped are read first, from the committed cursor
             self.is_running = True
+            self.intake.start()
+            self._consumer_thread = threading.Thread(target=self._consume_loop, name="mts-signal-intake", daemon=True)
+            self._consumer_thread.start()
             
-            logger.info(f"Started monitoring MTS alerts at: {self.alert_path}")
+            logger.info(f"Started consuming MTS signal journal: {self.intake.journal_path}")
             
         except Exception as e:
             logger.error(f"Failed to start MTS consumer: {e}")
             self.is_running = False
     
     def stop_monitoring(self):
-        """Stop monitoring the alert directory"""
+        """Stop consuming the signal journal"""
         try:
-            if self.observer and self.is_running:
-                self.observer.stop()
-                if not self.observer.join(timeout=5):
-                    logger.warning("Observer thread did not stop within timeout")
-                    # Force cleanup if needed
-                self.observer = None
+            if self.is_running:
                 self.is_running = False
+                self.intake.stop()
+                if self._consumer_thread:
+                    self._consumer_thread.join(timeout=5)
+                    if self._consumer_thread.is_alive():
+                        logger.warning("Consumer thread did not stop within timeout")
+                self._consumer_thread = None
                 logger.info("Stopped MTS alert monitoring")
         except Exception as e:
             logger.error(f"Error stopping MTS consumer: {e}")
             self.is_running = False
     
+    def _consume_loop(self, poll_interval: float = 1.0):
+        """Process journaled alerts as they arrive; watchdog events cut the wait short"""
+        while self.is_running:
+            try:
+                self.process_pending_alerts()
+            except Exception as e:
+                logger.error(f"Error consuming signal journal: {e}")
+            self.intake.wait(poll_interval)
+    
+    def process_pending_alerts(self) -> int:
+        """
+        Process every alert journaled after the committed cursor
+        
+        Returns:
+            Number of signals created
+        """
+        created = 0
+        while True:
+            alerts, inode, offset = self.intake.read_batch()
+            for alert_data in alerts:
+                if self.process_alert(alert_data, source=alert_data.get('alert_file') or self.intake.journal_name):
+                    created += 1
+            if (inode, offset) != self.intake.position:
+                self.intake.commit(inode, offset)
+            if not alerts:
+                return created
+    
     def process_alert_file(self, file_path: str) -> Optional[TradingSignal]:
         """
         Process a single MTS alert file
@@ -171,38 +122,45 @@ class MTSSignalConsumer:
         Args:
             file_path: Path to the alert JSON file
             
+        Returns:
+            TradingSignal object if successfully processed, None otherwise
+        """
+        logger.debug(f"Processing alert file: {file_path}")
+        
+        # Validate file path and size
+        if not self._validate_file_path(file_path):
+            return None
+        
+        # Read and parse JSON
+        alert_data = self._read_alert_file(file_path)
+        if not alert_data:
+            self.metrics['files_failed'] += 1
+            return None
+        
+        return self.process_alert(alert_data, source=file_path)
+    
+    def process_alert(self, alert_data: Dict[str, Any], source: str) -> Optional[TradingSignal]:
+        """
+        Validate, filter and convert one MTS alert
+        
+        Args:
+            alert_data: Parsed alert
+            source: Alert origin used in log messages (file or journal name)
+            
         Returns:
             TradingSignal object if successfully processed, None otherwise
         """
         start_time = time.time()
         try:
-            logger.debug(f"Processing alert file: {file_path}")
-            
-            # Check if file was already processed (thread-safe)
-            with self._signals_lock:
-                if file_path in getattr(self, '_processed_files', set()):
-                    logger.debug(f"File already processed: {file_path}")
-                    return None
-            
-            # Validate file path and size
-            if not self._validate_file_path(file_path):
-                return None
-            
-            # Read and parse JSON
-            alert_data = self._read_alert_file(file_path)
-            if not alert_data:
-                self.metrics['files_failed'] += 1
-                return None
-            
             # Validate alert structure and content
             if not self.filters.validate_signal(alert_data):
-                logger.warning(f"Alert validation failed: {file_path}")
+                logger.warning(f"Alert validation failed: {source}")
                 self.metrics['files_failed'] += 1
                 return None
             
             # Check if signal should be processed
             if not self.filters.should_process_signal(alert_data):
-                logger.debug(f"Signal filtered out: {file_path}")
+                logger.debug(f"Signal filtered out: {source}")
                 return None
             
             # Process alert into TradingSignal
@@ -210,11 +168,6 @@ class MTSSignalConsumer:
             
             if signal:
                 self._add_processed_signal(signal)
-                # Mark file as processed
-                if not hasattr(self, '_processed_files'):
-                    self._processed_files = set()
-                self._processed_files.add(file_path)
-                
                 self.metrics['files_processed'] += 1
                 self.metrics['signals_created'] += 1
                 self.metrics['last_activity'] = time.time()
@@ -223,13 +176,13 @@ class MTSSignalConsumer:
                 logger.info(f"Successfully processed signal: {signal.asset} {signal.signal_type.value} in {processing_time:.3f}s")
                 return signal
             else:
-                logger.warning(f"Failed to convert alert to signal: {file_path}")
+                logger.warning(f"Failed to convert alert to signal: {source}")
                 self.metrics['files_failed'] += 1
                 return None
                 
         except Exception as e:
             processing_time = time.time() - start_time
-            logger.error(f"Error processing alert file {file_path} after {processing_time:.3f}s: {e}")
+            logger.error(f"Error processing alert {source} after {processing_time:.3f}s: {e}")
             self.metrics['files_failed'] += 1
             return None
     
@@ -257,18 +210,6 @@ class MTSSignalConsumer:
             logger.error(f"Error reading alert file {file_path}: {e}")
             return None
     
-    def _process_existing_files(self):
-        """Process any existing alert files in the directory"""
-        try:
-            json_files = list(self.alert_path.glob('*.json'))
-            logger.info(f"Found {len(json_files)} existing alert files")
-            
-            for file_path in json_files:
-                self.process_alert_file(str(file_path))
-                
-        except Exception as e:
-            logger.error(f"Error processing existing files: {e}")
-    
     def _add_processed_signal(self, signal: TradingSignal):
         """Add signal to processed list with memory management"""
         with self._signals_lock:
@@ -333,7 +274,8 @@ class MTSSignalConsumer:
                     'alert_path': str(self.alert_path),
                     'processed_count': len(self.processed_signals),
                     'last_signal': last_signal,
-                    'metrics': self.metrics.copy()
+                    'metrics': self.metrics.copy(),
+                    'intake': self.intake.get_status()
                 }
         except Exception as e:
             logger.error(f"Error getting status: {e}")
@@ -350,7 +292,8 @@ class MTSSignalConsumer:
         try:
             return {
                 'status': 'healthy' if self.is_running else 'stopped',
-                'observer_alive': self.observer.is_alive() if self.observer else False,
+                'observer_alive': self.intake.get_status()['watching'],
+                'consumer_alive': self._consumer_thread.is_alive() if self._consumer_thread else False,
                 'directory_accessible': self.alert_path.exists() and os.access(self.alert_path, os.R_OK),
                 'last_activity': self.metrics.get('last_activity'),
                 'uptime': time.time() - self.metrics['start_time'],
@@ -0,0 +1,230 @@
+"""
+Event-driven signal intake from the MTS signal journal
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Fall back to timed polling of the journal
+    FileSystemEventHandler = object
+    Observer = None
+
+
+class _JournalEventHandler(FileSystemEventHandler):
+    """Wakes the intake whenever the journal file is written or replaced"""
+
+    def __init__(self, intake: 'SignalIntake'):
+        self.intake = intake
+
+    def on_any_event(self, event):
+        paths = {getattr(event, 'src_path', None), getattr(event, 'dest_path', None)}
+        if self.intake.journal_name in {os.path.basename(p) for p in paths if p}:
+            self.intake.notify()
+
+
+class SignalIntake:
+    """
+    Reads MTS alerts appended to the signal journal (one JSON object per line).
+
+    A watchdog observer on the journal directory wakes waiting consumers within milliseconds
+    of a write. Only the unread tail of the journal is read, and the position of the last
+    consumed line is kept in a durable cursor file (journal inode and byte offset), so signals
+    are neither missed nor reprocessed across restarts.
+
+    When the writer rotates the journal (renames it to <journal>.1 and starts a new file), the
+    rotated file is read to its end from the cursor before the new journal is read from the
+    start. A journal that was otherwise replaced (unknown inode) or truncated is read again
+    from the start.
+    """
+
+    def __init__(self, journal_path: str = "data/alerts/signal_journal.jsonl",
+                 cursor_path: str = "data/signal_intake_cursor.json",
+                 max_batch_size: int = 100,
+                 dead_letter_path: str = "data/signal_intake_dead_letter.jsonl"):
+        self.journal_path = Path(journal_path)
+        self.journal_name = self.journal_path.name
+        self.rotated_path = self.journal_path.with_name(self.journal_name + ".1")
+        self.cursor_path = Path(cursor_path)
+        self.dead_letter_path = Path(dead_letter_path)
+        self.max_batch_size = max_batch_size
+        self.logger = logging.getLogger(__name__)
+
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cursor_path.parent.mkdir(parents=True, exist_ok=True)
+        self._inode, self._offset = self._load_cursor()
+        self._wakeup = threading.Event()
+        self._observer = None
+        self.stats = {'signals_read': 0, 'invalid_lines': 0, 'batches': 0, 'dead_lettered': 0}
+
+    def _load_cursor(self) -> Tuple[Optional[int], int]:
+        try:
+            with open(self.cursor_path, 'r') as f:
+                cursor = json.load(f)
+            return cursor.get('inode'), int(cursor.get('offset', 0))
+        except FileNotFoundError:
+            return None, 0
+        except Exception as e:
+            self.logger.error(f"Unreadable intake cursor {self.cursor_path}, starting from journal start: {e}")
+            return None, 0
+
+    @property
+    def position(self) -> Tuple[Optional[int], int]:
+        """Committed (journal inode, offset)"""
+        return self._inode, self._offset
+
+    def commit(self, inode: Optional[int], offset: int):
+        """Durably record that everything before offset in the journal has been consumed"""
+        tmp_fd, tmp_path = tempfile.mkstemp(prefix="cursor_", dir=str(self.cursor_path.parent))
+        try:
+            with os.fdopen(tmp_fd, 'w') as f:
+                json.dump({'inode': inode, 'offset': offset}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.cursor_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self._inode, self._offset = inode, offset
+
+    def start(self):
+        """Start watching the journal directory (no-op without watchdog)"""
+        if Observer is None or self._observer is not None:
+            return
+        self._observer = Observer()
+        self._observer.schedule(_JournalEventHandler(self), str(self.journal_path.parent), recursive=False)
+        self._observer.start()
+        self.logger.info(f"Watching signal journal: {self.journal_path}")
+
+    def stop(self):
+        """Stop watching the journal directory"""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+        self.notify()
+
+    def notify(self):
+        """Wake a consumer blocked in wait()"""
+        self._wakeup.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the journal changes or timeout elapses; True if woken by a change"""
+        woken = self._wakeup.wait(timeout)
+        self._wakeup.clear()
+        return woken
+
+    def read_batch(self) -> Tuple[List[Dict[str, Any]], Optional[int], int]:
+        """
+        Read up to max_batch_size complete alerts after the cursor.
+
+        The cursor is not advanced; pass the returned inode and offset to commit() once the
+        batch has been handed to execution.
+
+        Returns:
+            (alerts, journal inode, offset just past the last returned line)
+        """
+        entries, inode, offset = self.read_entries()
+        return [alert for alert, _ in entries], inode, offset
+
+    def read_entries(self) -> Tuple[List[Tuple[Dict[str, Any], int]], Optional[int], int]:
+        """
+        Like read_batch(), with the offset just past each alert's line so that consumers can
+        commit alert by alert.
+
+        Returns:
+            ([(alert, end offset)], journal inode, offset just past the last returned line)
+        """
+        if self._inode is not None and self._inode_of(self.journal_path) != self._inode:
+            # Finish the rotated journal before starting on its successor
+            rotated = self._read(self.rotated_path, rotated=True)
+            if rotated is not None and rotated[0]:
+                return rotated
+        return self._read(self.journal_path) or ([], self._inode, self._offset)
+
+    def _read(self, path: Path, rotated: bool = False):
+        """Read the next complete lines of one journal file after the cursor"""
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+
+        with f:
+            stat = os.fstat(f.fileno())
+            if rotated and stat.st_ino != self._inode:
+                return None
+            offset = self._offset
+            if stat.st_ino != self._inode or stat.st_size < offset:
+                if self._inode is not None:
+                    self.logger.info("Signal journal was rotated or replaced, reading it from the start")
+                offset = 0
+            f.seek(offset)
+
+            entries = []
+            while len(entries) < self.max_batch_size:
+                line = f.readline()
+                if not line.endswith(b'\n'):
+                    break  # End of journal or a line still being written
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    entries.append((json.loads(line), offset))
+                except json.JSONDecodeError as e:
+                    self.stats['invalid_lines'] += 1
+                    self.logger.error(f"Skipping invalid signal journal line at offset {offset - len(line)}: {e}")
+
+        if entries:
+            self.stats['signals_read'] += len(entries)
+            self.stats['batches'] += 1
+        return entries, stat.st_ino, offset
+
+    @staticmethod
+    def _inode_of(path: Path) -> Optional[int]:
+        try:
+            return os.stat(path).st_ino
+        except FileNotFoundError:
+            return None
+
+    def dead_letter(self, alert: Dict[str, Any], reason: str):
+        """Durably set aside an alert that repeatedly failed to process"""
+        entry = {'failed_at': datetime.now().isoformat(), 'reason': reason,
+                 'journal_position': list(self.position), 'alert': alert}
+        self.dead_letter_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.dead_letter_path, 'a') as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.stats['dead_lettered'] += 1
+
+    def pending_bytes(self) -> int:
+        """Unread bytes in the journal and a rotated journal still being read"""
+        pending = 0
+        for path in (self.rotated_path, self.journal_path):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if stat.st_ino == self._inode:
+                pending += max(0, stat.st_size - self._offset)
+            elif path == self.journal_path:
+                pending += stat.st_size
+        return pending
+
+    def get_status(self) -> Dict[str, Any]:
+        """Cursor position and intake counters"""
+        return {
+            'journal': str(self.journal_path),
+            'watching': self._observer is not None and self._observer.is_alive(),
+            'cursor_offset': self._offset,
+            'pending_bytes': self.pending_bytes(),
+            **self.stats
+        }
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark multi-year, multi-symbol OHLCV loads from the CSVStorage tree against the columnar
+archive on synthetic hourly data.
+
+Usage:
+    python scripts/benchmark_archive_load.py --symbols 10 --years 3
+"""
+
+import argparse
+import csv
+import glob
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data.columnar_archive import OHLCV_COLUMNS, ColumnarArchive
+from src.data.models import OHLCVData
+
+
+def write_csv_tree(csv_dir: str, symbols: int, years: int, seed: int = 0) -> int:
+    """CSVStorage-format files, one per symbol per year; returns total rows."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2021-01-01', periods=years * 365 * 24, freq='h', tz='UTC')
+    total = 0
+    for n in range(symbols):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))
+        frame = pd.DataFrame({
+            'timestamp': index.as_unit('ms').asi8,
+            'open': close * (1 + rng.normal(0, 0.001, len(index))),
+            'high': close * 1.01,
+            'low': close * 0.99,
+            'close': close,
+            'volume': rng.lognormal(10, 1, len(index)),
+        })
+        for year, rows in frame.groupby(index.year):
+            rows.to_csv(os.path.join(csv_dir, f"asset{n}_{year}.csv"), index=False)
+        total += len(frame)
+    return total
+
+
+def load_csv_rows(csv_dir: str):
+    """Row-by-row parse into OHLCVData, as CSVStorage.load_ohlcv_data does."""
+    records = []
+    for path in sorted(glob.glob(os.path.join(csv_dir, '*.csv'))):
+        with open(path, newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for row in reader:
+                records.append(OHLCVData(int(row[0]), float(row[1]), float(row[2]), float(row[3]),
+                                         float(row[4]), float(row[5])))
+    return records
+
+
+def load_csv_pandas(csv_dir: str):
+    return [pd.read_csv(path, usecols=list(OHLCV_COLUMNS)) for path in glob.glob(os.path.join(csv_dir, '*.csv'))]
+
+
+def timed(label: str, load, baseline: float = None) -> float:
+    """Time load(), which returns the number of rows it loaded."""
+    start = time.perf_counter()
+    rows = load()
+    elapsed = time.perf_counter() - start
+    speedup = f" ({baseline / elapsed:,.0f}x)" if baseline else ""
+    print(f"  {label:<36} {elapsed:8.3f}s  {rows:>10,} rows{speedup}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CSV vs columnar archive OHLCV loads")
+    parser.add_argument("--symbols", type=int, default=10, help="number of synthetic symbols")
+    parser.add_argument("--years", type=int, default=3, help="years of hourly bars per symbol")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_dir = os.path.join(tmp, 'raw')
+        os.makedirs(csv_dir)
+        total = write_csv_tree(csv_dir, args.symbols, args.years)
+
+        archive = ColumnarArchive(os.path.join(tmp, 'archive'))
+        start = time.perf_counter()
+        for path in sorted(glob.glob(os.path.join(csv_dir, '*.csv'))):
+            symbol = os.path.basename(path).rsplit('_', 1)[0]
+            archive.write(symbol, pd.read_csv(path))
+        print(f"{args.symbols} symbols x {args.years} years hourly = {total:,} rows "
+              f"(conversion {time.perf_counter() - start:.2f}s)")
+
+        symbols = archive.symbols()
+        last_month = pd.Timestamp('2021-01-01') + pd.DateOffset(years=args.years, months=-1)
+        month_range = (last_month.to_pydatetime(), (last_month + pd.DateOffset(months=1)).to_pydatetime())
+
+        baseline = timed("CSV, row-by-row (CSVStorage)", lambda: len(load_csv_rows(csv_dir)))
+        timed("CSV, pandas.read_csv", lambda: sum(map(len, load_csv_pandas(csv_dir))), baseline)
+        timed("archive, all years", lambda: sum(map(len, archive.read_many(symbols).values())), baseline)
+        timed("archive, last month only",
+              lambda: sum(map(len, archive.read_many(symbols, *month_range).values())), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark BulkLoader against CryptoDatabase.insert_crypto_data on synthetic hourly OHLCV rows
+loaded into a fresh database.
+
+The insert_crypto_data baseline runs on a sample of --baseline-rows rows (in batches of
+--baseline-batch, the size the fetch scripts insert) and is extrapolated to the full load.
+
+Usage:
+    python scripts/benchmark_bulk_load.py --rows 10000000 --symbols 50
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data.bulk_loader import BulkLoader
+from src.data.sqlite_helper import CryptoDatabase
+
+
+def synthetic_chunks(rows: int, symbols: int, chunk_rows: int, seed: int = 0):
+    """Hourly OHLCV DataFrames for `symbols` series totalling `rows` rows."""
+    rng = np.random.default_rng(seed)
+    per_symbol = -(-rows // symbols)
+    start = pd.Timestamp('2015-01-01', tz='UTC').value // 1_000_000
+    emitted = 0
+    for n in range(symbols):
+        count = min(per_symbol, rows - emitted)
+        for offset in range(0, count, chunk_rows):
+            size = min(chunk_rows, count - offset)
+            timestamps = start + (offset + np.arange(size, dtype=np.int64)) * 3_600_000
+            close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size)))
+            yield pd.DataFrame({
+                'cryptocurrency': f"asset{n}",
+                'timestamp': timestamps,
+                'open': close,
+                'high': close * 1.01,
+                'low': close * 0.99,
+                'close': close,
+                'volume': rng.lognormal(10, 1, size),
+            })
+        emitted += count
+
+
+def records(frame: pd.DataFrame):
+    frame = frame.assign(date_str=pd.to_datetime(frame['timestamp'], unit='ms', utc=True).dt.strftime('%Y-%m-%d'))
+    return frame.to_dict('records')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark BulkLoader vs insert_crypto_data")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="rows to bulk load")
+    parser.add_argument("--symbols", type=int, default=50, help="number of synthetic series")
+    parser.add_argument("--chunk-rows", type=int, default=100_000, help="rows per staged chunk")
+    parser.add_argument("--baseline-rows", type=int, default=50_000, help="rows for the insert_crypto_data sample")
+    parser.add_argument("--baseline-batch", type=int, default=90, help="rows per insert_crypto_data call")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_db = CryptoDatabase(os.path.join(tmp, 'baseline.db'))
+        sample = records(next(synthetic_chunks(args.baseline_rows, 1, args.baseline_rows)))
+        start = time.perf_counter()
+        for i in range(0, len(sample), args.baseline_batch):
+            baseline_db.insert_crypto_data(sample[i:i + args.baseline_batch])
+        baseline_rate = len(sample) / (time.perf_counter() - start)
+        print(f"insert_crypto_data: {baseline_rate:>10,.0f} rows/s on {len(sample):,} rows "
+              f"-> {args.rows / baseline_rate / 60:,.1f} min for {args.rows:,}")
+
+        db = CryptoDatabase(os.path.join(tmp, 'bulk.db'))
+        loader = BulkLoader(db.db_path, on_progress=lambda rows, rate: print(
+            f"  staged {rows:>12,} rows  {rate:>10,.0f} rows/s"))
+        result = loader.load_crypto(synthetic_chunks(args.rows, args.symbols, args.chunk_rows))
+        print(f"BulkLoader:         {result['rows_per_sec']:>10,.0f} rows/s on {result['staged']:,} rows "
+              f"-> {result['seconds'] / 60:,.1f} min ({result['inserted']:,} inserted, "
+              f"indexes {'rebuilt' if result['rebuilt_indexes'] else 'maintained'})")
+
+        stats = db.rebuild_series_stats()
+        print(f"series_stats after load: {stats['series']} series, {stats['corrected']} corrected by rebuild")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized ETHTopBottomStrategy pattern scan against the bar-by-bar checks
+on synthetic minute data.
+
+Usage:
+    python scripts/benchmark_eth_pattern_scan.py --days 7
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import src.signals.strategies.eth_tops_bottoms_strategy as eth_module
+from src.signals.strategies.eth_tops_bottoms_strategy import ETHTopBottomStrategy
+
+
+def build_frame(strategy: ETHTopBottomStrategy, bars: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    t = np.arange(bars)
+    close = 2000 + 150 * np.sin(t / 240) + np.cumsum(rng.normal(0, 2, bars))
+    df = pd.DataFrame({
+        'open': close + rng.normal(0, 1, bars),
+        'high': close + np.abs(rng.normal(0, 3, bars)),
+        'low': close - np.abs(rng.normal(0, 3, bars)),
+        'close': close,
+        'volume': rng.lognormal(3, 0.5, bars),
+    }, index=pd.date_range('2024-01-01', periods=bars, freq='min'))
+    df = strategy.calculate_technical_indicators(df)
+    return strategy.calculate_volatility_metrics(df)
+
+
+def per_bar_scan(strategy: ETHTopBottomStrategy, df: pd.DataFrame) -> int:
+    """The bar-by-bar scan identify_patterns used to run; returns the number of hits."""
+    hits = 0
+    for i in range(50, len(df) - 10):
+        if strategy._is_potential_top(df, i):
+            strategy._calculate_top_confidence(df, i)
+            hits += 1
+        if strategy._is_potential_bottom(df, i):
+            strategy._calculate_bottom_confidence(df, i)
+            hits += 1
+        hits += int(strategy._is_rsi_divergence(df, i)) + int(strategy._is_macd_divergence(df, i))
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ETH pattern scan")
+    parser.add_argument("--days", type=float, default=7.0, help="days of minute bars for the comparison")
+    parser.add_argument("--full-days", type=float, default=365.0, help="days of minute bars for the vectorized-only run")
+    args = parser.parse_args()
+
+    # The scan does not touch the database
+    eth_module.CryptoDatabase = lambda *a, **k: None
+    strategy = ETHTopBottomStrategy('config/strategies/eth_tops_bottoms.json')
+
+    df = build_frame(strategy, int(args.days * 1440))
+    start = time.perf_counter()
+    patterns = strategy.identify_patterns(df)
+    vectorized = time.perf_counter() - start
+    start = time.perf_counter()
+    hits = per_bar_scan(strategy, df)
+    per_bar = time.perf_counter() - start
+
+    found = sum(len(v) for v in patterns.values())
+    print(f"{len(df):,} bars: vectorized {vectorized:.3f}s, per-bar {per_bar:.2f}s "
+          f"({per_bar / vectorized:.0f}x), hits {found} / {hits}")
+
+    full = build_frame(strategy, int(args.full_days * 1440))
+    start = time.perf_counter()
+    patterns = strategy.identify_patterns(full)
+    print(f"{len(full):,} bars: vectorized {time.perf_counter() - start:.2f}s, "
+          f"{len(patterns['tops'])} tops, {len(patterns['bottoms'])} bottoms, "
+          f"{len(patterns['divergences'])} divergences")
+
+
+if __name__ == "__main__":
+    main()
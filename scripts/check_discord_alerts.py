@@ -23,13 +23,25 @@ def check_alert_dedupe_state():
     print("=" * 50)
     
     dedupe_file = Path("data/alert_dedupe_state.json")
-    if not dedupe_file.exists():
+    # Marks since the last compaction live in the append-only journal
+    journal_file = dedupe_file.with_suffix('.journal')
+    if not dedupe_file.exists() and not journal_file.exists():
         print("❌ No deduplication state file found")
         return
     
     try:
-        with open(dedupe_file, 'r') as f:
-            state = json.load(f)
+        state = {}
+        if dedupe_file.exists():
+            with open(dedupe_file, 'r') as f:
+                state = json.load(f)
+        
+        if journal_file.exists():
+            for line in journal_file.read_text().splitlines():
+                try:
+                    key, timestamp = json.loads(line)
+                    state[key] = max(timestamp, state.get(key, timestamp))
+                except ValueError:
+                    continue
         
         if not state:
             print("✅ No alerts in deduplication cache")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+CSV to Columnar Archive Conversion Script
+Converts the per-year OHLCV CSV files written by CSVStorage ({crypto}_{year}.csv) into the
+per-month columnar archive read by ColumnarArchive.
+
+Conversion is idempotent: rows whose timestamps are already archived are skipped.
+
+Usage:
+    python scripts/convert_csv_to_archive.py [--csv-dir data/raw] [--archive-dir data/archive] [--symbols bitcoin ethereum]
+"""
+
+import argparse
+import glob
+import logging
+import os
+import sys
+from collections import defaultdict
+
+import pandas as pd
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data.columnar_archive import OHLCV_COLUMNS, ColumnarArchive
+
+
+def find_csv_files(csv_dir: str):
+    """Map symbol -> its {symbol}_{year}.csv files (macro CSVs live in a subdirectory and are skipped)."""
+    files = defaultdict(list)
+    for path in sorted(glob.glob(os.path.join(csv_dir, '*_*.csv'))):
+        symbol, year = os.path.splitext(os.path.basename(path))[0].rsplit('_', 1)
+        if year.isdigit():
+            files[symbol].append(path)
+    return files
+
+
+def read_ohlcv_csv(path: str) -> pd.DataFrame:
+    """OHLCV rows of a CSVStorage file, dropping malformed rows as CSVStorage does."""
+    raw = pd.read_csv(path, usecols=list(OHLCV_COLUMNS))
+    frame = raw.apply(pd.to_numeric, errors='coerce').dropna()
+    dropped = len(raw) - len(frame)
+    if dropped:
+        logging.warning(f"{path}: skipped {dropped} malformed rows")
+    return frame
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Convert CSVStorage OHLCV files into the columnar archive")
+    parser.add_argument('--csv-dir', default='data/raw', help='Directory of {crypto}_{year}.csv files')
+    parser.add_argument('--archive-dir', default='data/archive', help='Archive root directory')
+    parser.add_argument('--symbols', nargs='*', help='Only convert these symbols')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    archive = ColumnarArchive(args.archive_dir)
+    files = find_csv_files(args.csv_dir)
+    if args.symbols:
+        files = {symbol: paths for symbol, paths in files.items() if symbol in args.symbols}
+    if not files:
+        print(f"No OHLCV CSV files found in {args.csv_dir}")
+        return 1
+
+    for symbol, paths in files.items():
+        rows = sum(archive.write(symbol, read_ohlcv_csv(path)) for path in paths)
+        months = archive.months(symbol)
+        print(f"  {symbol:<20} {len(paths):>3} CSV files -> {rows:>9} new rows, "
+              f"{len(months)} months ({months[0]} .. {months[-1]})" if months else
+              f"  {symbol:<20} {len(paths):>3} CSV files -> no rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
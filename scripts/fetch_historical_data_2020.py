@@ -24,6 +24,7 @@ from api.coingecko_client import CoinGeckoClient
 from api.binance_client import BinanceClient
 from api.bybit_client import BybitClient
 from api.fred_client import FREDClient
+from data.bulk_loader import BulkLoader
 from data.sqlite_helper import CryptoDatabase
 from data.realtime_storage import RealtimeStorage
 from data.realtime_models import OrderBookLevel
@@ -78,7 +79,7 @@ def fetch_crypto_ohlcv_data():
     cg = CoinGeckoClient(api_key=COINGECKO_API_KEY)
     start_ts, end_ts = get_date_range_unix()
     
-    total_inserted = 0
+    chunks = []
     
     for asset in ASSETS:
         try:
@@ -87,7 +88,7 @@ def fetch_crypto_ohlcv_data():
             # CoinGecko API has rate limits, so we'll fetch in chunks
             chunk_size = 90  # days per chunk
             current_start = start_ts
-            asset_inserted = 0
+            asset_fetched = 0
             
             while current_start < end_ts:
                 current_end = min(current_start + (chunk_size * 24 * 3600), end_ts)
@@ -119,19 +120,20 @@ def fetch_crypto_ohlcv_data():
                         }
                 
                 if ohlcv_daily:
-                    inserted = db.insert_crypto_data(list(ohlcv_daily.values()))
-                    asset_inserted += inserted
-                    logger.info(f"    Inserted {inserted} records for {asset}")
+                    chunks.append(list(ohlcv_daily.values()))
+                    asset_fetched += len(ohlcv_daily)
+                    logger.info(f"    Fetched {len(ohlcv_daily)} records for {asset}")
                 
                 current_start = current_end
                 time.sleep(1)  # Rate limiting
             
-            total_inserted += asset_inserted
-            logger.info(f"✅ Completed {asset}: {asset_inserted} total records")
+            logger.info(f"✅ Completed {asset}: {asset_fetched} total records fetched")
             
         except Exception as e:
-            logger.error(f"❌ Failed to fetch/insert OHLCV for {asset}: {e}")
+            logger.error(f"❌ Failed to fetch OHLCV for {asset}: {e}")
     
+    # Everything fetched, including chunks of assets that failed part-way, lands in one bulk load
+    total_inserted = BulkLoader(db.db_path).load_crypto(chunks)['inserted']
     logger.info(f"CRYPTO OHLCV COMPLETE: {total_inserted} total records inserted")
     return total_inserted
 
@@ -144,7 +146,7 @@ def fetch_macro_indicator_data():
     db = CryptoDatabase(DB_PATH)
     fred = FREDClient()
     
-    total_inserted = 0
+    chunks = []
     
     for indicator in MACRO_INDICATORS:
         try:
@@ -153,7 +155,7 @@ def fetch_macro_indicator_data():
             # FRED API can handle longer date ranges, but let's be conservative
             chunk_size = 365  # days per chunk
             current_start = START_DATE
-            indicator_inserted = 0
+            indicator_fetched = 0
             
             while current_start < END_DATE:
                 current_end = min(current_start + timedelta(days=chunk_size), END_DATE)
@@ -171,19 +173,19 @@ def fetch_macro_indicator_data():
                     record['indicator'] = indicator
                 
                 if macro_data:
-                    inserted = db.insert_macro_data(macro_data)
-                    indicator_inserted += inserted
-                    logger.info(f"    Inserted {inserted} records for {indicator}")
+                    chunks.append(macro_data)
+                    indicator_fetched += len(macro_data)
+                    logger.info(f"    Fetched {len(macro_data)} records for {indicator}")
                 
                 current_start = current_end
                 time.sleep(0.5)  # Rate limiting
             
-            total_inserted += indicator_inserted
-            logger.info(f"✅ Completed {indicator}: {indicator_inserted} total records")
+            logger.info(f"✅ Completed {indicator}: {indicator_fetched} total records fetched")
             
         except Exception as e:
-            logger.error(f"❌ Failed to fetch/insert macro for {indicator}: {e}")
+            logger.error(f"❌ Failed to fetch macro for {indicator}: {e}")
     
+    total_inserted = BulkLoader(db.db_path).load_macro(chunks)['inserted']
     logger.info(f"MACRO INDICATORS COMPLETE: {total_inserted} total records inserted")
     return total_inserted
 
@@ -13,11 +13,12 @@ import time
 from datetime import datetime
 from pathlib import Path
 import glob
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Tuple, Any, Iterator
 
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+from src.data.bulk_loader import BulkLoader
 from src.data.sqlite_helper import CryptoDatabase
 
 
@@ -111,13 +112,133 @@ def extract_indicator_name(filename: str) -> str:
     return indicator_name.upper()
 
 
-def process_csv_file(csv_path: str, db: CryptoDatabase) -> int:
+CSV_CHUNK_ROWS = 100_000
+
+
+def read_csv_chunks(csv_path: str, chunksize: int = CSV_CHUNK_ROWS, label: str = "CSV file") -> Iterator[pd.DataFrame]:
+    """
+    Stream a CSV file in chunks, mapping read errors to ValueError.
+    
+    Args:
+        csv_path: Path to the CSV file
+        chunksize: Rows per chunk
+        label: File description used in error messages
+        
+    Yields:
+        pd.DataFrame: Consecutive chunks of the file
+    """
+    try:
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+            yield chunk
+    except pd.errors.EmptyDataError:
+        raise ValueError(f"{label} is empty or corrupted")
+    except UnicodeDecodeError:
+        raise ValueError(f"{label} encoding issue")
+    except pd.errors.ParserError as e:
+        raise ValueError(f"Failed to read {label.lower()}: {e}")
+
+
+def require_columns(chunk: pd.DataFrame, required_columns: List[str]) -> None:
+    """Raise ValueError if any required column is missing from a chunk."""
+    missing_columns = [col for col in required_columns if col not in chunk.columns]
+    if missing_columns:
+        raise ValueError(f"Missing required columns: {missing_columns}")
+
+
+def prepare_crypto_chunk(chunk: pd.DataFrame, cryptocurrency: str) -> Tuple[pd.DataFrame, int]:
+    """
+    Convert a chunk of a crypto CSV file into crypto_ohlcv records.
+    
+    Vectorized form of the per-record rules: missing or non-numeric OHLCV values default
+    to 0.0 (as safe_float_conversion), a missing timestamp becomes 0, and rows with a
+    malformed timestamp or failing validate_ohlcv_record are skipped.
+    
+    Args:
+        chunk: Raw CSV chunk with timestamp, open, high, low, close, volume columns
+        cryptocurrency: Cryptocurrency name for every record
+        
+    Returns:
+        Tuple[pd.DataFrame, int]: Records to load and number of skipped rows
+    """
+    logger = logging.getLogger(__name__)
+    require_columns(chunk, ['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+    
+    values = chunk[['open', 'high', 'low', 'close', 'volume']].apply(pd.to_numeric, errors='coerce')
+    defaulted = int(values.isna().sum().sum())
+    if defaulted:
+        logger.warning(f"{defaulted} missing or invalid OHLCV values, using default 0.0")
+    values = values.fillna(0.0)
+    
+    timestamps = pd.to_numeric(chunk['timestamp'], errors='coerce')
+    malformed = timestamps.isna() & chunk['timestamp'].notna()
+    valid = (
+        ~malformed
+        & (values['volume'] >= 0)
+        & (values['low'] <= values['open']) & (values['open'] <= values['high'])
+        & (values['low'] <= values['close']) & (values['close'] <= values['high'])
+    )
+    skipped = int((~valid).sum())
+    if skipped:
+        logger.warning(f"Skipping {skipped} invalid records at rows {list(chunk.index[~valid][:10])}")
+    
+    records = values[valid]
+    timestamps = timestamps[valid].fillna(0).astype('int64')
+    records.insert(0, 'date_str', timestamps.map(convert_timestamp_to_date_str))
+    records.insert(0, 'timestamp', timestamps)
+    records.insert(0, 'cryptocurrency', cryptocurrency)
+    return records, skipped
+
+
+def prepare_macro_chunk(chunk: pd.DataFrame, indicator: str) -> Tuple[pd.DataFrame, int]:
+    """
+    Convert a chunk of a macro CSV file into macro_indicators records.
+    
+    Rows with an empty value or date are skipped; non-numeric values default to 0.0 and the
+    optional is_interpolated / is_forward_filled flags accept true, 1 or yes.
+    
+    Args:
+        chunk: Raw CSV chunk with date and value columns
+        indicator: Indicator name for every record
+        
+    Returns:
+        Tuple[pd.DataFrame, int]: Records to load and number of skipped rows
+    """
+    logger = logging.getLogger(__name__)
+    require_columns(chunk, ['date', 'value'])
+    
+    dates = chunk['date'].astype(str).str.strip()
+    keep = chunk['value'].notna() & (chunk['value'].astype(str) != '') & (dates != '')
+    skipped = int((~keep).sum())
+    
+    values = pd.to_numeric(chunk.loc[keep, 'value'], errors='coerce')
+    defaulted = int(values.isna().sum())
+    if defaulted:
+        logger.warning(f"{defaulted} invalid {indicator} values, using default 0.0")
+    values = values.fillna(0.0)
+    negative = int((values < 0).sum())
+    if negative:
+        logger.warning(f"{negative} negative values for {indicator}")
+    
+    records = pd.DataFrame({'indicator': indicator, 'date': dates[keep], 'value': values})
+    for flag in ('is_interpolated', 'is_forward_filled'):
+        if flag in chunk.columns:
+            records[flag] = chunk.loc[keep, flag].astype(str).str.lower().isin(['true', '1', 'yes'])
+        else:
+            records[flag] = False
+    return records, skipped
+
+
+def process_csv_file(csv_path: str, db: CryptoDatabase, chunksize: int = CSV_CHUNK_ROWS) -> int:
     """
     Process a single CSV file and migrate data to SQLite.
     
+    The file is streamed in chunks into a BulkLoader, so it is loaded in one transaction
+    without holding the whole file in memory.
+    
     Args:
         csv_path: Path to the CSV file
         db: CryptoDatabase instance
+        chunksize: Rows read per chunk
         
     Returns:
         int: Number of records inserted
@@ -133,81 +254,37 @@ def process_csv_file(csv_path: str, db: CryptoDatabase) -> int:
     
     logger.info(f"Processing {filename} for cryptocurrency: {cryptocurrency}")
     
-    # Read CSV file with error handling
-    try:
-        df = pd.read_csv(csv_path)
-        if df.empty:
-            logger.warning(f"CSV file {csv_path} is empty, skipping")
-            return 0
-    except pd.errors.EmptyDataError:
-        raise ValueError("CSV file is empty or corrupted")
-    except UnicodeDecodeError:
-        raise ValueError("CSV file encoding issue")
-    except Exception as e:
-        raise ValueError(f"Failed to read CSV file: {e}")
-    
-    logger.info(f"Loaded {len(df)} records from CSV")
-    
-    # Validate required columns
-    required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    if missing_columns:
-        raise ValueError(f"Missing required columns: {missing_columns}")
-    
-    # Convert to the format expected by database
-    crypto_records = []
     skipped_records = 0
     
-    for idx, row in df.iterrows():
-        try:
-            # Safe conversion of OHLCV data
-            open_val = safe_float_conversion(row['open'], 'open')
-            high_val = safe_float_conversion(row['high'], 'high')
-            low_val = safe_float_conversion(row['low'], 'low')
-            close_val = safe_float_conversion(row['close'], 'close')
-            volume_val = safe_float_conversion(row['volume'], 'volume')
-            
-            # Validate OHLCV data
-            validate_ohlcv_record(open_val, high_val, low_val, close_val, volume_val)
-            
-            # Handle timestamp conversion
-            timestamp = int(row['timestamp']) if pd.notna(row['timestamp']) else 0
-            date_str = convert_timestamp_to_date_str(timestamp)
-            
-            record = {
-                'cryptocurrency': cryptocurrency,
-                'timestamp': timestamp,
-                'date_str': date_str,
-                'open': open_val,
-                'high': high_val,
-                'low': low_val,
-                'close': close_val,
-                'volume': volume_val
-            }
-            crypto_records.append(record)
-            
-        except ValueError as e:
-            logger.warning(f"Skipping invalid record at row {idx}: {e}")
-            skipped_records += 1
-            continue
+    def records():
+        nonlocal skipped_records
+        for chunk in read_csv_chunks(csv_path, chunksize, "CSV file"):
+            prepared, skipped = prepare_crypto_chunk(chunk, cryptocurrency)
+            skipped_records += skipped
+            yield prepared
     
-    if skipped_records > 0:
-        logger.info(f"Skipped {skipped_records} invalid records out of {len(df)} total")
+    result = BulkLoader(db.db_path).load_crypto(records())
+    if result['staged'] == 0 and skipped_records == 0:
+        logger.warning(f"CSV file {csv_path} is empty, skipping")
+        return 0
     
-    # Insert into database
-    inserted_count = db.insert_crypto_data(crypto_records)
+    if skipped_records > 0:
+        logger.info(f"Skipped {skipped_records} invalid records out of {result['staged'] + skipped_records} total")
     
-    logger.info(f"Migration complete: {inserted_count} records inserted for {cryptocurrency} ({skipped_records} skipped)")
+    inserted_count = result['inserted']
+    logger.info(f"Migration complete: {inserted_count} records inserted for {cryptocurrency} ({skipped_records} skipped, "
+                f"{result['rows_per_sec']:,.0f} rows/s)")
     return inserted_count
 
 
-def process_macro_csv_file(csv_path: str, db: CryptoDatabase) -> int:
+def process_macro_csv_file(csv_path: str, db: CryptoDatabase, chunksize: int = CSV_CHUNK_ROWS) -> int:
     """
     Process a single macro CSV file and migrate data to SQLite.
     
     Args:
         csv_path: Path to the macro CSV file
         db: CryptoDatabase instance
+        chunksize: Rows read per chunk
         
     Returns:
         int: Number of records inserted
@@ -223,83 +300,24 @@ def process_macro_csv_file(csv_path: str, db: CryptoDatabase) -> int:
     
     logger.info(f"Processing {filename} for indicator: {indicator}")
     
-    # Read CSV file with error handling
-    try:
-        df = pd.read_csv(csv_path)
-        if df.empty:
-            logger.warning(f"Macro CSV file {csv_path} is empty, skipping")
-            return 0
-    except pd.errors.EmptyDataError:
-        raise ValueError("Macro CSV file is empty or corrupted")
-    except UnicodeDecodeError:
-        raise ValueError("Macro CSV file encoding issue")
-    except Exception as e:
-        raise ValueError(f"Failed to read macro CSV file: {e}")
-    
-    logger.info(f"Loaded {len(df)} records from macro CSV")
-    
-    # Validate required columns for macro data
-    required_columns = ['date', 'value']
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    if missing_columns:
-        raise ValueError(f"Missing required columns: {missing_columns}")
-    
-    # Convert to the format expected by database
-    macro_records = []
     skipped_records = 0
     
-    for idx, row in df.iterrows():
-        try:
-            # Skip records with empty values
-            if pd.isna(row['value']) or row['value'] == '':
-                logger.debug(f"Skipping record at row {idx}: empty value")
-                skipped_records += 1
-                continue
-            
-            # Safe conversion of value
-            value = safe_float_conversion(row['value'], 'value')
-            
-            # Validate value is reasonable (not negative for most indicators)
-            if value < 0:
-                logger.warning(f"Negative value {value} for {indicator} at row {idx}")
-            
-            # Handle date (should already be in YYYY-MM-DD format)
-            date_str = str(row['date']).strip()
-            if not date_str:
-                logger.warning(f"Skipping record at row {idx}: empty date")
-                skipped_records += 1
-                continue
-            
-            # Handle boolean fields with safe conversion
-            is_interpolated = False
-            is_forward_filled = False
-            
-            if 'is_interpolated' in df.columns:
-                is_interpolated = str(row['is_interpolated']).lower() in ['true', '1', 'yes']
-            
-            if 'is_forward_filled' in df.columns:
-                is_forward_filled = str(row['is_forward_filled']).lower() in ['true', '1', 'yes']
-            
-            record = {
-                'indicator': indicator,
-                'date': date_str,
-                'value': value,
-                'is_interpolated': is_interpolated,
-                'is_forward_filled': is_forward_filled
-            }
-            macro_records.append(record)
-            
-        except ValueError as e:
-            logger.warning(f"Skipping invalid macro record at row {idx}: {e}")
-            skipped_records += 1
-            continue
+    def records():
+        nonlocal skipped_records
+        for chunk in read_csv_chunks(csv_path, chunksize, "Macro CSV file"):
+            prepared, skipped = prepare_macro_chunk(chunk, indicator)
+            skipped_records += skipped
+            yield prepared
     
-    if skipped_records > 0:
-        logger.info(f"Skipped {skipped_records} invalid records out of {len(df)} total")
+    result = BulkLoader(db.db_path).load_macro(records())
+    if result['staged'] == 0 and skipped_records == 0:
+        logger.warning(f"Macro CSV file {csv_path} is empty, skipping")
+        return 0
     
-    # Insert into database
-    inserted_count = db.insert_macro_data(macro_records)
+    if skipped_records > 0:
+        logger.info(f"Skipped {skipped_records} invalid records out of {result['staged'] + skipped_records} total")
     
+    inserted_count = result['inserted']
     logger.info(f"Macro migration complete: {inserted_count} records inserted for {indicator} ({skipped_records} skipped)")
     return inserted_count
 
@@ -2,6 +2,8 @@
 """
 Parameter sweep optimizer for the Enhanced VIX Correlation Strategy (BTC, ETH).
 Searches over thresholds and filters using last 6 months and selects best config.
+Runs are spread across CPU cores with ParameterSweep; a correlation-surface pre-scan ranks
+hundreds of window/lag combinations first and adds the strongest windows to the grid.
 Saves summary and best config to backtest_results/.
 """
 
@@ -11,10 +13,14 @@ import json
 import itertools
 from datetime import datetime, timedelta
 
+import numpy as np
+import pandas as pd
+
 sys.path.append('.')
 
 from src.signals.strategies.vix_correlation_strategy import VIXCorrelationStrategy
-from src.signals.backtest_interface import BacktestInterface
+from src.signals.parameter_sweep import ParameterSweep
+from src.analytics.correlation_surface import CorrelationSurface
 
 
 def set_strategy_params(strategy: VIXCorrelationStrategy, params: dict) -> None:
@@ -43,14 +49,67 @@ def set_strategy_params(strategy: VIXCorrelationStrategy, params: dict) -> None:
     strategy.lag_range = params['lags']
 
 
+def scan_correlation_surface(historical_data: dict, windows: list, lags: list) -> pd.DataFrame:
+    """
+    Strength of the mean rolling VIX-return correlation for every (window, lag), averaged over assets.
+
+    Ranks by |mean correlation| rather than mean |correlation|, which short noisy windows inflate.
+
+    Uses the same daily price/VIX return alignment as the strategy; each asset's full
+    surface comes from one cumulative-sum pass, so hundreds of combinations take milliseconds.
+    """
+    vix = pd.DataFrame(historical_data.get('vix_data') or [])
+    if vix.empty:
+        return pd.DataFrame()
+    vix = vix.dropna(subset=['vix_value']).drop_duplicates('date', keep='last')
+
+    scores = []
+    for asset, asset_data in (historical_data.get('crypto_data') or {}).items():
+        prices = pd.DataFrame(asset_data.get('price_data') or [])
+        if prices.empty:
+            continue
+        merged = prices.merge(vix[['date', 'vix_value']], on='date').dropna(subset=['close', 'vix_value'])
+        surface = CorrelationSurface(merged['close'].pct_change(), merged['vix_value'].pct_change(), lags)
+        for window in windows:
+            for lag in lags:
+                series = surface.series(window, lag)
+                if np.isnan(series).all():
+                    continue
+                scores.append({'asset': asset, 'window': window, 'lag': lag,
+                               'strength': abs(float(np.nanmean(series)))})
+
+    if not scores:
+        return pd.DataFrame()
+    return (pd.DataFrame(scores).groupby(['window', 'lag'], as_index=False)['strength'].mean()
+            .sort_values('strength', ascending=False))
+
+
 def main():
     end_date = (datetime.now().date() - timedelta(days=1)).strftime('%Y-%m-%d')
     start_date = (datetime.strptime(end_date, '%Y-%m-%d').date() - timedelta(days=180)).strftime('%Y-%m-%d')
 
+    sweep = ParameterSweep(
+        VIXCorrelationStrategy, 'config/strategies/vix_correlation.json',
+        start_date, end_date,
+        initial_capital=100000.0, transaction_cost=0.001,
+        checkpoint_path=f'backtest_results/vix_corr_opt_checkpoint_{start_date}_{end_date}.jsonl',
+        param_setter=set_strategy_params
+    )
+    historical_data = sweep._load_historical_data()
+
     # Parameter grid (kept modest to run quickly)
     negs = [-0.2, -0.3, -0.4, -0.5]
     poss = [0.2, 0.3, 0.4, 0.5]
     windows_list = [[7, 14, 21], [14, 21, 30]]
+
+    # Pre-scan the correlation surface over a wide window/lag grid and add the strongest windows
+    surface = scan_correlation_surface(historical_data, list(range(5, 61)), list(range(-5, 6)))
+    if not surface.empty:
+        print(f"Correlation surface: {len(surface)} window/lag combinations scanned")
+        print(surface.head(10).to_string(index=False))
+        top_windows = sorted(int(w) for w in surface['window'].drop_duplicates().head(3))
+        if top_windows not in windows_list:
+            windows_list.append(top_windows)
     agrees = [1, 2]
     dynamics = [False]
     min_vix_longs = [10.0, 12.0, 15.0]
@@ -71,28 +130,33 @@ def main():
     MAX_COMBOS = 60
     combos = combos[:MAX_COMBOS]
 
-    backtester = BacktestInterface(initial_capital=100000.0, transaction_cost=0.001)
-    base_strategy = VIXCorrelationStrategy('config/strategies/vix_correlation.json')
-
-    results = []
-    best = None
-
-    for idx, c in enumerate(combos, 1):
-        params = {
+    param_sets = [
+        {
             'neg': c[0], 'pos': c[1], 'windows': c[2], 'agree': c[3], 'dynamic': c[4],
             'min_vix_long': c[5], 'min_vix_short': c[6],
             'rsi_enabled': c[7], 'long_max_rsi': c[8], 'short_min_rsi': c[9],
             'min_dd_long': c[10], 'min_du_short': c[11], 'lags': c[12]
         }
+        for c in combos
+    ]
 
-        # Clone by re-instantiation to avoid state carryover
-        strategy = VIXCorrelationStrategy('config/strategies/vix_correlation.json')
-        set_strategy_params(strategy, params)
+    # Each run re-instantiates the strategy in a worker to avoid state carryover; historical
+    # data is loaded once and shared with workers. Rerunning resumes from the checkpoint.
+    os.makedirs('backtest_results', exist_ok=True)
+    for idx, row in enumerate(sweep.iter_run(param_sets, historical_data), 1):
+        print(f"[{idx}] sharpe={row.get('sharpe_ratio', 0.0):.3f} win={row.get('win_rate', 0.0):.2%} "
+              f"trades={row.get('total_trades', 0)}")
 
-        result = backtester.backtest_strategy(strategy, start_date, end_date)
-        rd = result.to_dict()
-        perf = rd.get('performance_metrics', {})
-        stats = rd.get('trading_statistics', {})
+    results = []
+    best = None
+    perf_keys = ['total_return', 'annualized_return', 'sharpe_ratio', 'max_drawdown', 'win_rate',
+                 'volatility', 'var_95', 'calmar_ratio']
+    stats_keys = ['total_trades', 'profitable_trades', 'losing_trades', 'win_rate',
+                  'average_trade_return', 'average_winning_trade', 'average_losing_trade']
+
+    for row in sweep.results:
+        perf = {k: row[k] for k in perf_keys if k in row}
+        stats = {k: row[k] for k in stats_keys if k in row}
 
         sharpe = perf.get('sharpe_ratio', 0.0)
         win_rate = perf.get('win_rate', 0.0)
@@ -100,7 +164,7 @@ def main():
 
         score = sharpe + (win_rate or 0) * 0.2 + (0.0 if total_trades < 5 else min(total_trades, 30) / 300.0)
         entry = {
-            'params': params,
+            'params': row['params'],
             'performance': perf,
             'stats': stats,
             'score': score
@@ -112,10 +176,7 @@ def main():
         if (best is None and total_trades >= min_trades) or (total_trades >= min_trades and score > best['score']):
             best = entry
 
-        print(f"[{idx}/{len(combos)}] sharpe={sharpe:.3f} win={win_rate:.2%} trades={total_trades} score={score:.3f}")
-
     ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-    os.makedirs('backtest_results', exist_ok=True)
     out_path = f'backtest_results/vix_corr_opt_results_{ts}.json'
     with open(out_path, 'w') as f:
         json.dump({'start': start_date, 'end': end_date, 'results': results, 'best': best}, f, indent=2)
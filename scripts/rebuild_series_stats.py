@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Series Stats Rebuild Script
+Recomputes the series_stats table from crypto_ohlcv and macro_indicators.
+
+Insert and delete triggers keep series_stats current; run this after direct UPDATEs to the
+data tables or if health checks report counts that disagree with the data.
+
+Usage:
+    python scripts/rebuild_series_stats.py [--db data/crypto_data.db]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data.sqlite_helper import CryptoDatabase
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild the series_stats table from the data tables")
+    parser.add_argument('--db', default=None, help='SQLite database path (default: data/crypto_data.db)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    database = CryptoDatabase(args.db)
+    result = database.rebuild_series_stats()
+
+    print(f"Rebuilt stats for {result['series']} series, {result['corrected']} corrected")
+    for stats in database.get_series_stats():
+        print(f"  {stats['source']:<6} {stats['series']:<20} {stats['row_count']:>8} rows  "
+              f"{stats['first_date']} .. {stats['latest_date']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,6 +24,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from api.coingecko_client import CoinGeckoClient
 from api.fred_client import FREDClient
+from data.bulk_loader import BulkLoader
 from data.sqlite_helper import CryptoDatabase
 
 # Configure logging
@@ -63,7 +64,7 @@ def fetch_crypto_data(start_date: datetime, end_date: datetime, assets: List[str
     start_ts = int(start_date.replace(tzinfo=timezone.utc).timestamp())
     end_ts = int(end_date.replace(tzinfo=timezone.utc).timestamp())
     
-    total_inserted = 0
+    chunks = []
     
     for asset in assets:
         try:
@@ -72,7 +73,7 @@ def fetch_crypto_data(start_date: datetime, end_date: datetime, assets: List[str
             # Fetch in chunks to respect rate limits
             chunk_size = 90  # days per chunk
             current_start = start_ts
-            asset_inserted = 0
+            asset_fetched = 0
             
             while current_start < end_ts:
                 current_end = min(current_start + (chunk_size * 24 * 3600), end_ts)
@@ -104,19 +105,20 @@ def fetch_crypto_data(start_date: datetime, end_date: datetime, assets: List[str
                         }
                 
                 if ohlcv_daily:
-                    inserted = db.insert_crypto_data(list(ohlcv_daily.values()))
-                    asset_inserted += inserted
-                    logger.info(f"    Inserted {inserted} records for {asset}")
+                    chunks.append(list(ohlcv_daily.values()))
+                    asset_fetched += len(ohlcv_daily)
+                    logger.info(f"    Fetched {len(ohlcv_daily)} records for {asset}")
                 
                 current_start = current_end
                 time.sleep(1)  # Rate limiting
             
-            total_inserted += asset_inserted
-            logger.info(f"✅ Completed {asset}: {asset_inserted} total records")
+            logger.info(f"✅ Completed {asset}: {asset_fetched} total records fetched")
             
         except Exception as e:
-            logger.error(f"❌ Failed to fetch/insert OHLCV for {asset}: {e}")
+            logger.error(f"❌ Failed to fetch OHLCV for {asset}: {e}")
     
+    # Everything fetched, including chunks of assets that failed part-way, lands in one bulk load
+    total_inserted = BulkLoader(db.db_path).load_crypto(chunks)['inserted']
     logger.info(f"CRYPTO OHLCV COMPLETE: {total_inserted} total records inserted")
     return total_inserted
 
@@ -129,7 +131,7 @@ def fetch_macro_data(start_date: datetime, end_date: datetime, macro_indicators:
     db = CryptoDatabase('data/crypto_data.db')
     fred = FREDClient()
     
-    total_inserted = 0
+    chunks = []
     
     for indicator in macro_indicators:
         try:
@@ -138,7 +140,7 @@ def fetch_macro_data(start_date: datetime, end_date: datetime, macro_indicators:
             # Fetch in chunks
             chunk_size = 365  # days per chunk
             current_start = start_date
-            indicator_inserted = 0
+            indicator_fetched = 0
             
             while current_start < end_date:
                 current_end = min(current_start + timedelta(days=chunk_size), end_date)
@@ -156,19 +158,19 @@ def fetch_macro_data(start_date: datetime, end_date: datetime, macro_indicators:
                     record['indicator'] = indicator
                 
                 if macro_data:
-                    inserted = db.insert_macro_data(macro_data)
-                    indicator_inserted += inserted
-                    logger.info(f"    Inserted {inserted} records for {indicator}")
+                    chunks.append(macro_data)
+                    indicator_fetched += len(macro_data)
+                    logger.info(f"    Fetched {len(macro_data)} records for {indicator}")
                 
                 current_start = current_end
                 time.sleep(0.5)  # Rate limiting
             
-            total_inserted += indicator_inserted
-            logger.info(f"✅ Completed {indicator}: {indicator_inserted} total records")
+            logger.info(f"✅ Completed {indicator}: {indicator_fetched} total records fetched")
             
         except Exception as e:
-            logger.error(f"❌ Failed to fetch/insert macro for {indicator}: {e}")
+            logger.error(f"❌ Failed to fetch macro for {indicator}: {e}")
     
+    total_inserted = BulkLoader(db.db_path).load_macro(chunks)['inserted']
     logger.info(f"MACRO INDICATORS COMPLETE: {total_inserted} total records inserted")
     return total_inserted
 
@@ -0,0 +1,5 @@
+# Modules shared by the backtesting and paper trading engines
+
+from .equity_ledger import EquityLedger, RunningStats
+
+__all__ = ['EquityLedger', 'RunningStats']
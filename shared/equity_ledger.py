@@ -0,0 +1,173 @@
+"""
+Incremental equity-curve ledger.
+
+Mark-to-market equity snapshots are appended to growable numpy arrays while running
+aggregates (Welford mean/variance of period returns, running peak and maximum drawdown)
+are updated in O(1), so total return, Sharpe and drawdown reports never rescan the curve.
+recompute() derives the same aggregates from the stored arrays for verification.
+
+This module only depends on numpy and the standard library, so the backtesting and paper
+trading engines can both import it as `shared.equity_ledger`.
+"""
+
+import math
+from datetime import datetime
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+
+class RunningStats:
+    """Welford's online mean and variance."""
+
+    __slots__ = ('count', 'mean', '_m2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def with_value(self, value: float) -> "RunningStats":
+        """A copy of these stats with one more value added."""
+        stats = RunningStats()
+        stats.count, stats.mean, stats._m2 = self.count, self.mean, self._m2
+        stats.add(value)
+        return stats
+
+    def variance(self, ddof: int = 1) -> float:
+        """Variance with the given delta degrees of freedom; NaN without enough values."""
+        if self.count - ddof <= 0:
+            return math.nan
+        return max(self._m2, 0.0) / (self.count - ddof)
+
+    def std(self, ddof: int = 1) -> float:
+        return math.sqrt(self.variance(ddof))
+
+
+class EquityLedger:
+    """
+    Append-only store of equity snapshots with running return and drawdown aggregates.
+
+    Period returns follow the backtesting PerformanceCalculator convention: the change over
+    the previous value, or 0.0 when the previous value is not positive.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._values = np.empty(capacity, dtype=np.float64)
+        self.count = 0
+        self.returns = RunningStats()
+        self.nonfinite_returns = 0
+        self.invalid_values = 0
+        self.peak = math.nan
+        self.peak_index = 0
+        self.max_drawdown = 0.0
+        self.max_drawdown_amount = 0.0
+        self.drawdown_peak_index = 0
+        self.trough_index = 0
+
+    def append(self, timestamp: Union[datetime, float], value: float) -> None:
+        """Record an equity snapshot; timestamps are stored as POSIX seconds."""
+        if self.count == len(self._values):
+            self._grow()
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.timestamp()
+        value = float(value)
+        index = self.count
+        self._timestamps[index] = timestamp
+        self._values[index] = value
+        self.count += 1
+
+        if not math.isfinite(value) or value < 0:
+            self.invalid_values += 1
+        if index == 0:
+            self.peak = value
+            return
+
+        previous = self._values[index - 1]
+        period_return = (value - previous) / previous if previous > 0 else 0.0
+        if math.isfinite(period_return):
+            self.returns.add(period_return)
+        else:
+            self.nonfinite_returns += 1
+
+        if value > self.peak:
+            self.peak, self.peak_index = value, index
+        if self.peak - value > self.max_drawdown_amount:
+            self.max_drawdown_amount = self.peak - value
+        if self.peak > 0:
+            drawdown = (self.peak - value) / self.peak
+            if drawdown > self.max_drawdown:
+                self.max_drawdown = drawdown
+                self.drawdown_peak_index, self.trough_index = self.peak_index, index
+
+    def _grow(self) -> None:
+        capacity = max(2 * len(self._values), 16)
+        for name in ('_timestamps', '_values'):
+            grown = np.empty(capacity, dtype=np.float64)
+            grown[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, grown)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Recorded equity values (a read-only view)."""
+        view = self._values[:self.count]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Recorded snapshot times in POSIX seconds (a read-only view)."""
+        view = self._timestamps[:self.count]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def first(self) -> float:
+        return float(self._values[0]) if self.count else math.nan
+
+    @property
+    def last(self) -> float:
+        return float(self._values[self.count - 1]) if self.count else math.nan
+
+    def total_return(self) -> Optional[float]:
+        """Return from the first to the last snapshot, or None without two snapshots."""
+        if self.count < 2 or self.first == 0:
+            return None
+        return (self.last - self.first) / self.first
+
+    def drawdown(self) -> Optional[Dict[str, float]]:
+        """Maximum drawdown with its peak, trough and duration in snapshots."""
+        if self.count < 2 or self.invalid_values:
+            return None
+        return {
+            "max_drawdown": self.max_drawdown,
+            "peak": float(self._values[self.drawdown_peak_index]),
+            "trough": float(self._values[self.trough_index]),
+            "duration": self.trough_index - self.drawdown_peak_index,
+        }
+
+    def recompute(self) -> Dict[str, float]:
+        """Full recomputation of the running aggregates from the stored snapshots."""
+        values = self._values[:self.count]
+        previous = values[:-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = np.where(previous > 0, np.diff(values) / np.where(previous > 0, previous, 1.0), 0.0)
+        finite = returns[np.isfinite(returns)]
+        running_max = np.maximum.accumulate(values) if self.count else values
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drawdowns = np.where(running_max > 0, (running_max - values) / np.where(running_max > 0, running_max, 1.0), 0.0)
+        return {
+            "count": self.count,
+            "return_mean": float(np.mean(finite)) if len(finite) else 0.0,
+            "return_std": float(np.std(finite, ddof=1)) if len(finite) > 1 else math.nan,
+            "peak": float(running_max[-1]) if self.count else math.nan,
+            "max_drawdown": float(np.max(drawdowns)) if self.count else 0.0,
+            "max_drawdown_amount": float(np.max(running_max - values)) if self.count else 0.0,
+        }
@@ -0,0 +1,189 @@
+"""
+Correlation Surface
+Rolling Pearson correlations of one return series against lagged copies of another, for many
+window lengths and lags at once. Window sums come from cumulative sums, so the latest value of
+every (window, lag) cell costs O(1) after an O(n * lags) setup, and full rolling series are only
+materialized for the cells that need them.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class CorrelationSurface:
+    """
+    Rolling correlations of x against y.shift(lag) for a set of lags.
+
+    Matches pandas Series.rolling(window).corr(other): a value exists only when every pair in
+    the window is present; windows where either side has no variance are NaN.
+    """
+
+    def __init__(self, x: Sequence[float], y: Sequence[float], lags: Sequence[int]):
+        """
+        Args:
+            x: Base series (e.g. asset returns)
+            y: Series to lag (e.g. VIX returns); y.shift(lag) pairs x[t] with y[t - lag]
+            lags: Lags to evaluate
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if x.shape != y.shape:
+            raise ValueError("x and y must have the same length")
+        self.n = len(x)
+        self.lags = list(lags)
+
+        shifted = np.full((len(self.lags), self.n), np.nan)
+        for row, lag in enumerate(self.lags):
+            if 0 <= lag < self.n:
+                shifted[row, lag:] = y[:self.n - lag]
+            elif -self.n < lag < 0:
+                shifted[row, :self.n + lag] = y[-lag:]
+
+        valid = ~np.isnan(shifted) & ~np.isnan(x)[None, :]
+        xs = np.where(valid, x[None, :], 0.0)
+        ys = np.where(valid, shifted, 0.0)
+
+        def prefix(values: np.ndarray) -> np.ndarray:
+            out = np.zeros((values.shape[0], self.n + 1))
+            np.cumsum(values, axis=1, out=out[:, 1:])
+            return out
+
+        self._count = prefix(valid.astype(np.float64))
+        self._sx = prefix(xs)
+        self._sy = prefix(ys)
+        self._sxx = prefix(xs * xs)
+        self._syy = prefix(ys * ys)
+        self._sxy = prefix(xs * ys)
+
+    def _correlation(self, end: np.ndarray, start: np.ndarray, window: np.ndarray) -> np.ndarray:
+        """Correlation over prefix-sum ranges [start, end) for every lag; NaN unless complete."""
+        count = self._count[:, end] - self._count[:, start]
+        sx = self._sx[:, end] - self._sx[:, start]
+        sy = self._sy[:, end] - self._sy[:, start]
+        sxx = self._sxx[:, end] - self._sxx[:, start]
+        syy = self._syy[:, end] - self._syy[:, start]
+        sxy = self._sxy[:, end] - self._sxy[:, start]
+
+        var_x = window * sxx - sx * sx
+        var_y = window * syy - sy * sy
+        cov = window * sxy - sx * sy
+        # Cancellation leaves tiny non-zero variances for flat windows; treat those as flat
+        flat = (var_x <= 1e-12 * window * sxx) | (var_y <= 1e-12 * window * syy)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = cov / np.sqrt(var_x * var_y)
+        corr = np.clip(corr, -1.0, 1.0)
+        corr[(count < window) | flat] = np.nan
+        return corr
+
+    def latest(self, windows: Sequence[int]) -> np.ndarray:
+        """
+        Correlation at the last observation for each (window, lag).
+
+        Returns:
+            Array of shape (len(windows), len(lags)); NaN where the window is incomplete
+        """
+        windows = np.asarray(windows, dtype=int)
+        out = np.full((len(windows), len(self.lags)), np.nan)
+        fits = (windows >= 2) & (windows <= self.n)
+        if fits.any():
+            w = windows[fits]
+            end = np.full(len(w), self.n)
+            out[fits] = self._correlation(end, end - w, w.astype(np.float64)).T
+        return out
+
+    def series(self, window: int, lag: int) -> np.ndarray:
+        """Full rolling correlation series for one (window, lag), aligned with x."""
+        row = self.lags.index(lag)
+        out = np.full(self.n, np.nan)
+        if window < 2 or window > self.n:
+            return out
+        end = np.arange(window, self.n + 1)
+        out[window - 1:] = self._correlation(end, end - window, np.float64(window))[row]
+        return out
+
+
+class RollingQuantileCache:
+    """
+    LRU cache of rolling-correlation quantiles keyed by data version, window, lag and quantiles.
+
+    Consecutive ticks and parameter sweeps re-analyze identical return histories; caching the
+    quantiles of each full rolling series avoids rebuilding it.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple, Tuple[int, float, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def data_version(*arrays: np.ndarray) -> str:
+        """Digest identifying the contents of the input series."""
+        digest = hashlib.blake2b(digest_size=16)
+        for array in arrays:
+            digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+            digest.update(b'|')
+        return digest.hexdigest()
+
+    def get(self, key: Tuple) -> Optional[Tuple[int, float, float]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple, value: Tuple[int, float, float]) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_quantile_cache = RollingQuantileCache()
+
+
+def rolling_correlation_quantiles(surface: CorrelationSurface, version: str, window: int, lag: int,
+                                  quantiles: Tuple[float, float]) -> Tuple[int, float, float]:
+    """
+    Number of valid rolling correlations and the requested (low, high) quantiles of the series.
+
+    Args:
+        surface: Surface built from the data identified by version
+        version: Data version (see RollingQuantileCache.data_version)
+        window: Rolling window
+        lag: Lag
+        quantiles: (low, high) quantile levels
+
+    Returns:
+        Tuple of (valid count, low quantile, high quantile); quantiles are NaN when count is 0
+    """
+    key = (version, window, lag, quantiles)
+    cached = _quantile_cache.get(key)
+    if cached is not None:
+        return cached
+    series = surface.series(window, lag)
+    values = series[~np.isnan(series)]
+    if len(values):
+        low, high = np.quantile(values, quantiles)
+        result = (len(values), float(low), float(high))
+    else:
+        result = (0, float('nan'), float('nan'))
+    _quantile_cache.put(key, result)
+    return result
+
+
+def correlation_surface(x: Sequence[float], y: Sequence[float], windows: Sequence[int],
+                        lags: Sequence[int]) -> Dict[Tuple[int, int], float]:
+    """Latest correlation for every (window, lag) with a complete window."""
+    surface = CorrelationSurface(x, y, lags)
+    latest = surface.latest(windows)
+    return {
+        (int(window), int(lag)): float(latest[i, j])
+        for i, window in enumerate(windows)
+        for j, lag in enumerate(lags)
+        if not np.isnan(latest[i, j])
+    }
@@ -0,0 +1,250 @@
+"""
+Technical Indicators
+Shared NumPy implementations of the technical indicators used by the signal strategies, plus an
+IndicatorEngine that memoizes each (indicator, params) result per version of the input series so
+strategies and the database analytics reading the same prices compute it only once.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+ArrayLike = Union[pd.Series, np.ndarray]
+
+
+def _as_float_array(values: ArrayLike) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def rolling_mean(values: ArrayLike, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    Trailing rolling mean matching pandas Series.rolling(window, min_periods).mean().
+
+    Computed in one pass from running sums of values and of non-NaN counts.
+    """
+    x = _as_float_array(values)
+    min_periods = window if min_periods is None else min_periods
+    valid = ~np.isnan(x)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(valid, x, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(valid)))
+
+    ends = np.arange(1, len(x) + 1)
+    starts = np.maximum(ends - window, 0)
+    window_counts = counts[ends] - counts[starts]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = (sums[ends] - sums[starts]) / window_counts
+    means[window_counts < max(min_periods, 1)] = np.nan
+    return means
+
+
+def rolling_std(values: ArrayLike, window: int, ddof: int = 1) -> np.ndarray:
+    """Trailing rolling standard deviation matching pandas Series.rolling(window).std()."""
+    x = _as_float_array(values)
+    out = np.full(len(x), np.nan)
+    if window <= ddof or len(x) < window:
+        return out
+    windows = np.lib.stride_tricks.sliding_window_view(x, window)
+    # Windows containing NaN stay NaN, as pandas requires a full window of observations
+    out[window - 1:] = windows.std(axis=1, ddof=ddof)
+    return out
+
+
+def ema(values: ArrayLike, span: Optional[float] = None, alpha: Optional[float] = None,
+        adjust: bool = True) -> np.ndarray:
+    """
+    Exponential moving average matching pandas Series.ewm(span=..., adjust=...).mean().
+
+    Evaluated as a first-order linear recurrence; series containing NaN fall back to pandas,
+    whose NaN weighting rules the recurrence does not reproduce.
+    """
+    x = _as_float_array(values)
+    if alpha is None:
+        if span is None:
+            raise ValueError("Either span or alpha must be provided")
+        alpha = 2.0 / (span + 1.0)
+    if len(x) == 0:
+        return x.copy()
+    if np.isnan(x).any():
+        return pd.Series(x).ewm(alpha=alpha, adjust=adjust).mean().to_numpy()
+
+    decay = 1.0 - alpha
+    if adjust:
+        weighted_sum = lfilter([1.0], [1.0, -decay], x)
+        weights = lfilter([1.0], [1.0, -decay], np.ones_like(x))
+        return weighted_sum / weights
+    # y[0] = x[0]; y[t] = decay * y[t-1] + alpha * x[t]
+    out, _ = lfilter([alpha], [1.0, -decay], x[1:], zi=[decay * x[0]])
+    return np.concatenate(([x[0]], out))
+
+
+def _wilder_smooth(changes: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's smoothing: seeded with the mean of the first period changes, then alpha = 1/period."""
+    out = np.full(len(changes), np.nan)
+    if len(changes) <= period:
+        return out
+    out[period] = changes[1:period + 1].mean()
+    if len(changes) > period + 1:
+        decay = 1.0 - 1.0 / period
+        out[period + 1:], _ = lfilter([1.0 / period], [1.0, -decay], changes[period + 1:],
+                                      zi=[decay * out[period]])
+    return out
+
+
+def rsi(values: ArrayLike, period: int = 14, min_periods: Optional[int] = None,
+        method: str = 'sma') -> np.ndarray:
+    """
+    Relative Strength Index.
+
+    Args:
+        values: Price series
+        period: Lookback period
+        min_periods: Minimum observations for the 'sma' averages (defaults to period)
+        method: 'sma' averages gains/losses with a rolling mean (the strategies' historical
+                definition); 'wilder' uses Wilder's smoothing (EMA with alpha = 1/period)
+
+    Returns:
+        RSI values; NaN where undefined (insufficient history or no movement)
+    """
+    x = _as_float_array(values)
+    delta = np.diff(x, prepend=np.nan)
+    gains = np.where(delta > 0, delta, 0.0)
+    losses = np.where(delta < 0, -delta, 0.0)
+
+    if method == 'sma':
+        avg_gain = rolling_mean(gains, period, min_periods)
+        avg_loss = rolling_mean(losses, period, min_periods)
+    elif method == 'wilder':
+        avg_gain = _wilder_smooth(gains, period)
+        avg_loss = _wilder_smooth(losses, period)
+    else:
+        raise ValueError(f"Unknown RSI method: {method}")
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rs = avg_gain / avg_loss
+        return 100.0 - 100.0 / (1.0 + rs)
+
+
+def macd(values: ArrayLike, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
+    """MACD line, signal line and histogram from adjusted EMAs."""
+    macd_line = ema(values, span=fast) - ema(values, span=slow)
+    signal_line = ema(macd_line, span=signal)
+    return {'macd': macd_line, 'signal': signal_line, 'histogram': macd_line - signal_line}
+
+
+def bollinger_bands(values: ArrayLike, period: int = 20, std_dev: float = 2) -> Dict[str, np.ndarray]:
+    """Bollinger Bands around a rolling mean."""
+    middle = rolling_mean(values, period)
+    std = rolling_std(values, period)
+    return {'upper': middle + std * std_dev, 'middle': middle, 'lower': middle - std * std_dev}
+
+
+class IndicatorEngine:
+    """
+    Memoizing front end for the indicator functions.
+
+    Results are keyed by (indicator, params, data version), where the data version is a digest of
+    the input values, so repeated requests for the same indicator on unchanged prices are served
+    from cache and any new or revised bar produces a new entry. Series inputs return Series on the
+    same index.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        """
+        Initialize the engine.
+
+        Args:
+            max_entries: Number of cached results kept (least recently used are evicted)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_entries = max_entries
+        self._cache: 'OrderedDict[Tuple, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def data_version(values: ArrayLike) -> str:
+        """Digest identifying the contents of a series."""
+        x = np.ascontiguousarray(_as_float_array(values))
+        return hashlib.blake2b(x.tobytes(), digest_size=16).hexdigest()
+
+    def _get(self, name: str, values: ArrayLike, params: Tuple,
+             compute: Callable[[np.ndarray], Any]) -> Any:
+        x = _as_float_array(values)
+        key = (name, params, len(x), self.data_version(x))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+        result = compute(x)
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = result
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _wrap(result: np.ndarray, values: ArrayLike, name: Optional[str] = None) -> ArrayLike:
+        # Return a copy so callers cannot mutate the cached array
+        if isinstance(values, pd.Series):
+            return pd.Series(result.copy(), index=values.index, name=name)
+        return result.copy()
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._cache.clear()
+
+    def sma(self, values: ArrayLike, window: int, min_periods: Optional[int] = None) -> ArrayLike:
+        """Simple moving average."""
+        result = self._get('sma', values, (window, min_periods), lambda x: rolling_mean(x, window, min_periods))
+        return self._wrap(result, values)
+
+    def ema(self, values: ArrayLike, span: float, adjust: bool = True) -> ArrayLike:
+        """Exponential moving average."""
+        result = self._get('ema', values, (span, adjust), lambda x: ema(x, span=span, adjust=adjust))
+        return self._wrap(result, values)
+
+    def std(self, values: ArrayLike, window: int) -> ArrayLike:
+        """Rolling sample standard deviation."""
+        result = self._get('std', values, (window,), lambda x: rolling_std(x, window))
+        return self._wrap(result, values)
+
+    def rsi(self, values: ArrayLike, period: int = 14, min_periods: Optional[int] = None,
+            method: str = 'sma') -> ArrayLike:
+        """Relative Strength Index (see rsi())."""
+        result = self._get('rsi', values, (period, min_periods, method),
+                           lambda x: rsi(x, period, min_periods, method))
+        return self._wrap(result, values)
+
+    def macd(self, values: ArrayLike, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, ArrayLike]:
+        """MACD line, signal line and histogram."""
+        result = self._get('macd', values, (fast, slow, signal), lambda x: macd(x, fast, slow, signal))
+        return {k: self._wrap(v, values) for k, v in result.items()}
+
+    def bollinger_bands(self, values: ArrayLike, period: int = 20, std_dev: float = 2) -> Dict[str, ArrayLike]:
+        """Upper, middle and lower Bollinger Bands."""
+        result = self._get('bollinger', values, (period, std_dev), lambda x: bollinger_bands(x, period, std_dev))
+        return {k: self._wrap(v, values) for k, v in result.items()}
+
+
+_shared_engine: Optional[IndicatorEngine] = None
+_shared_engine_lock = threading.Lock()
+
+
+def get_indicator_engine() -> IndicatorEngine:
+    """Process-wide IndicatorEngine shared by all strategies."""
+    global _shared_engine
+    with _shared_engine_lock:
+        if _shared_engine is None:
+            _shared_engine = IndicatorEngine()
+        return _shared_engine
@@ -0,0 +1,96 @@
+"""
+Percentile Rank
+Percentile-rank queries answered by binary search over sorted values: a PercentileRanker sorts a
+sample once for any number of rank and percentile queries, and rolling_percentile_rank keeps an
+incrementally updated sorted window instead of re-ranking every window from scratch.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+ArrayLike = Union[pd.Series, np.ndarray, Sequence[float]]
+
+
+class PercentileRanker:
+    """
+    Sorted snapshot of a sample for repeated percentile and percentile-rank queries.
+
+    Ranks follow pandas Series.rank(pct=True): ties share the average of their ranks, so a
+    value that is part of the sample gets the same rank pandas would assign it.
+    """
+
+    def __init__(self, values: ArrayLike):
+        """
+        Args:
+            values: Sample; NaN values are ignored
+        """
+        x = np.asarray(values, dtype=np.float64)
+        self.sorted_values = np.sort(x[~np.isnan(x)])
+
+    def __len__(self) -> int:
+        return len(self.sorted_values)
+
+    def rank(self, value: float) -> float:
+        """
+        Percentile rank (0-100) of value within the sample.
+
+        Values outside the sample rank as if tied for the first or last slot (capped at 100)
+        rather than failing; NaN is returned for a NaN value or an empty sample.
+        """
+        n = len(self.sorted_values)
+        if n == 0 or np.isnan(value):
+            return float('nan')
+        less = np.searchsorted(self.sorted_values, value, side='left')
+        less_equal = np.searchsorted(self.sorted_values, value, side='right')
+        return float(min((less + less_equal + 1) / 2.0 / n, 1.0) * 100.0)
+
+    def percentile(self, q: Union[float, Sequence[float]]) -> Union[float, np.ndarray]:
+        """Percentile(s) of the sample with linear interpolation, as np.percentile."""
+        n = len(self.sorted_values)
+        if n == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else float('nan')
+        # The sample is already sorted, so only the interpolation between neighbours remains
+        position = np.asarray(q, dtype=np.float64) / 100.0 * (n - 1)
+        lower = np.floor(position).astype(int)
+        upper = np.minimum(lower + 1, n - 1)
+        low_values = self.sorted_values[lower]
+        result = low_values + (self.sorted_values[upper] - low_values) * (position - lower)
+        return float(result) if np.ndim(q) == 0 else result
+
+
+def percentile_rank(values: ArrayLike, value: float) -> float:
+    """Percentile rank (0-100) of value within values (see PercentileRanker.rank)."""
+    return PercentileRanker(values).rank(value)
+
+
+def rolling_percentile_rank(values: ArrayLike, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    Trailing rolling percentile rank matching pandas Series.rolling(window, min_periods).rank(pct=True).
+
+    Each step inserts the new observation into a sorted window, drops the one leaving it and
+    ranks the newest value with two binary searches.
+
+    Returns:
+        Ranks as fractions in (0, 1]; NaN where the value is NaN or fewer than min_periods
+        observations are in the window
+    """
+    x = np.asarray(values, dtype=np.float64)
+    min_periods = window if min_periods is None else min_periods
+    out = np.full(len(x), np.nan)
+    ordered = []
+
+    for i, value in enumerate(x):
+        if not np.isnan(value):
+            insort(ordered, value)
+        if i >= window:
+            leaving = x[i - window]
+            if not np.isnan(leaving):
+                del ordered[bisect_left(ordered, leaving)]
+        count = len(ordered)
+        if count >= max(min_periods, 1) and not np.isnan(value):
+            rank = (bisect_left(ordered, value) + bisect_right(ordered, value) + 1) / 2.0
+            out[i] = rank / count
+    return out
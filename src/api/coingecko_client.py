@@ -1,7 +1,9 @@
 import requests
+from typing import Optional
 from config.settings import Config
 from src.utils.retry import retry_with_backoff
 from src.utils.exceptions import APIError, APIRateLimitError, APIConnectionError, APITimeoutError
+from src.services.collection_engine import CollectionEngine, ProviderSpec, get_collection_engine
 import os
 
 
@@ -13,7 +15,8 @@ class CoinGeckoClient:
         self.api_key = api_key or getattr(self.config, 'COINGECKO_API_KEY', None) or os.getenv('COINGECKO_API_KEY')
         
         # Use Pro API endpoint if we have a Pro API key
-        if self.api_key and self.api_key.startswith('CG-'):
+        self.pro_api = bool(self.api_key and self.api_key.startswith('CG-'))
+        if self.pro_api:
             self.base_url = 'https://pro-api.coingecko.com/api/v3'
             self.fallback_url = self.config.COINGECKO_BASE_URL  # Fallback to free API
         else:
@@ -24,6 +27,29 @@ class CoinGeckoClient:
         self.headers = {}
         if self.api_key:
             self.headers['x-cg-pro-api-key'] = self.api_key
+        
+        # Keep-alive connection pool shared by all synchronous requests
+        self.session = requests.Session()
+    
+    def provider_spec(self) -> ProviderSpec:
+        """Provider description for the async collection engine, quota matched to the API tier."""
+        fallback = None
+        if self.fallback_url and self.fallback_url != self.base_url:
+            fallback = ProviderSpec(
+                name='coingecko',
+                base_url=self.fallback_url,
+                rate_per_minute=self.config.RATE_LIMIT_REQUESTS_PER_MINUTE
+            )
+        return ProviderSpec(
+            name='coingecko-pro' if self.pro_api else 'coingecko',
+            base_url=self.base_url,
+            rate_per_minute=(self.config.COINGECKO_PRO_RATE_LIMIT_RPM if self.pro_api
+                             else self.config.RATE_LIMIT_REQUESTS_PER_MINUTE),
+            burst=5 if self.pro_api else 1,
+            api_key=self.api_key,
+            headers=dict(self.headers),
+            fallback=fallback
+        )
     
     def _make_request_with_fallback(self, endpoint, params=None):
         """Make API request with fallback to free API if Pro API fails."""
@@ -38,7 +64,7 @@ class CoinGeckoClient:
                 url = f"{url_base}{endpoint}"
                 headers = self.headers if url_base == self.base_url else {}  # Only use API key for Pro API
                 
-                response = requests.get(url, params=params, timeout=self.timeout, headers=headers)
+                response = self.session.get(url, params=params, timeout=self.timeout, headers=headers)
                 
                 # Handle specific HTTP status codes
                 if response.status_code == 429:
@@ -129,4 +155,25 @@ class CoinGeckoClient:
             'from': int(from_timestamp),
             'to': int(to_timestamp)
         }
-        return self._make_request_with_fallback(f"/coins/{coin_id}/market_chart/range", params) 
\ No newline at end of file
+        return self._make_request_with_fallback(f"/coins/{coin_id}/market_chart/range", params)
+
+    async def get_market_chart_data_async(self, coin_id, days, engine: Optional[CollectionEngine] = None):
+        """
+        Fetch market chart data through the async collection engine.
+        
+        Must be awaited on the engine's event loop (schedule it with engine.run()).
+        
+        Args:
+            coin_id: Cryptocurrency ID (e.g., 'bitcoin')
+            days: Number of days of data
+            engine: Collection engine (default: process-wide engine)
+            
+        Returns:
+            Dict containing prices and total_volumes arrays
+        """
+        engine = engine or get_collection_engine()
+        params = {
+            'vs_currency': 'usd',
+            'days': days
+        }
+        return await engine.get_json(self.provider_spec(), f"/coins/{coin_id}/market_chart", params)
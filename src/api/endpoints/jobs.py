@@ -0,0 +1,143 @@
+"""
+Job API Endpoints
+
+FastAPI router for submitting long-running work (backtests, signal generation) as background
+jobs and polling their status and results. The application installs its JobQueue with
+set_job_queue() during startup.
+"""
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
+from typing import Optional, List, Dict, Any
+import logging
+import threading
+
+from ...services.job_queue import JobQueue, JobQueueFullError, JobStatus, UnknownJobKindError
+
+# Create router
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+# Logger
+logger = logging.getLogger(__name__)
+
+# Thread-safe queue instance management
+_queue_lock = threading.Lock()
+_job_queue: Optional[JobQueue] = None
+
+
+# Response Models
+class JobResponse(BaseModel):
+    job_id: str
+    kind: str
+    status: str
+    params: Dict[str, Any]
+    error: Optional[str] = None
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    deduplicated: bool = False
+
+
+class JobSummary(BaseModel):
+    job_id: str
+    kind: str
+    status: str
+    error: Optional[str] = None
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+
+class JobResultResponse(BaseModel):
+    job_id: str
+    kind: str
+    status: str
+    result: Any = None
+
+
+def set_job_queue(queue: Optional[JobQueue]) -> None:
+    """Install the queue the endpoints submit to (None to uninstall)."""
+    global _job_queue
+    with _queue_lock:
+        _job_queue = queue
+
+
+def get_job_queue() -> JobQueue:
+    """Dependency returning the installed job queue."""
+    with _queue_lock:
+        queue = _job_queue
+    if queue is None:
+        raise HTTPException(status_code=503, detail="Job queue is not running")
+    return queue
+
+
+def _get_job_or_404(queue: JobQueue, job_id: str, include_result: bool = False) -> Dict[str, Any]:
+    job = queue.get(job_id, include_result=include_result)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+def submit_job(queue: JobQueue, kind: str, params: Dict[str, Any]) -> JobResponse:
+    """Submit a job and map queue errors to HTTP errors."""
+    try:
+        job, deduplicated = queue.submit(kind, params)
+    except UnknownJobKindError:
+        raise HTTPException(status_code=404, detail=f"Unknown job kind '{kind}'. Available: {queue.kinds}")
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=f"Job queue is full: {e}")
+    return JobResponse(**job, deduplicated=deduplicated)
+
+
+@router.get("", response_model=List[JobSummary])
+async def list_jobs(
+    status: Optional[JobStatus] = Query(None, description="Filter by job status"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of jobs"),
+    queue: JobQueue = Depends(get_job_queue)
+):
+    """List recent jobs, newest first."""
+    return [JobSummary(**job) for job in queue.list_jobs(status, limit)]
+
+
+@router.post("/{kind}", response_model=JobResponse, status_code=202)
+async def create_job(
+    kind: str,
+    params: Dict[str, Any] = Body(default_factory=dict),
+    queue: JobQueue = Depends(get_job_queue)
+):
+    """Submit a job; identical requests already in flight return the existing job."""
+    return submit_job(queue, kind, params)
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, queue: JobQueue = Depends(get_job_queue)):
+    """Get a job's status."""
+    return JobResponse(**_get_job_or_404(queue, job_id))
+
+
+@router.get("/{job_id}/result", response_model=JobResultResponse)
+async def get_job_result(job_id: str, queue: JobQueue = Depends(get_job_queue)):
+    """Get a finished job's result (409 while the job is still pending or running)."""
+    job = _get_job_or_404(queue, job_id, include_result=True)
+    status = JobStatus(job['status'])
+    if status in (JobStatus.PENDING, JobStatus.RUNNING):
+        return JSONResponse(status_code=409, content={"detail": f"Job {job_id} is {status.value}",
+                                                      "status": status.value})
+    if status == JobStatus.FAILED:
+        raise HTTPException(status_code=500, detail=f"Job {job_id} failed: {job['error']}")
+    if status == JobStatus.CANCELLED:
+        raise HTTPException(status_code=410, detail=f"Job {job_id} was cancelled")
+    return JobResultResponse(job_id=job_id, kind=job['kind'], status=status.value, result=job['result'])
+
+
+@router.delete("/{job_id}", response_model=JobResponse)
+async def cancel_job(job_id: str, queue: JobQueue = Depends(get_job_queue)):
+    """Cancel a pending or running job."""
+    job = queue.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    logger.info(f"Cancel requested for job {job_id}: {job['status']}")
+    return JobResponse(**job)
@@ -1,8 +1,10 @@
 import os
 import requests
 from typing import Dict, Optional
-from src.utils.exceptions import FREDAPIError, APIConnectionError, APITimeoutError
+from src.utils.exceptions import APIError, FREDAPIError, APIConnectionError, APITimeoutError
 from src.utils.retry import retry_with_backoff
+from src.services.collection_engine import CollectionEngine, ProviderSpec, get_collection_engine
+from config.macro_settings import FRED_API_CONFIG
 
 class FREDClient:
     """St Louis Federal Reserve Economic Data API client"""
@@ -22,6 +24,17 @@ class FREDClient:
         self.session = requests.Session()
         self.timeout = 30
     
+    def provider_spec(self) -> ProviderSpec:
+        """Provider description for the async collection engine, limited to the per-key FRED quota."""
+        return ProviderSpec(
+            name='fred',
+            base_url=f"{self.base_url}/",
+            rate_per_minute=FRED_API_CONFIG['rate_limit_per_minute'],
+            burst=5,
+            api_key=self.api_key,
+            params={'api_key': self.api_key, 'file_type': 'json'}
+        )
+    
     @retry_with_backoff(max_retries=3, base_delay=1.0, backoff_factor=2.0)
     def _make_request(self, endpoint: str, params: Dict) -> Dict:
         """
@@ -102,38 +115,88 @@ class FREDClient:
         
         try:
             response_data = self._make_request('series/observations', params)
-            
-            # Extract observations from response
-            if 'observations' not in response_data:
-                raise FREDAPIError(f"No observations found in FRED response for series {series_id}")
-            
-            observations = response_data['observations']
-            
-            # Parse and format data
-            parsed_data = []
-            for obs in observations:
-                # Handle missing values (various formats)
-                value = None
-                raw_value = obs.get('value')
-                
-                # Check for missing data indicators
-                if raw_value is not None and raw_value not in ['.', '', 'NA', 'N/A', '#N/A']:
-                    try:
-                        value = float(raw_value)
-                    except (ValueError, TypeError):
-                        # If can't convert to float, treat as missing
-                        value = None
-                
-                parsed_data.append({
-                    'date': obs['date'],
-                    'value': value,
-                    'series_id': series_id
-                })
-            
-            return parsed_data
+            return self._parse_observations(response_data, series_id)
             
         except FREDAPIError:
             # Re-raise FRED API errors
             raise
         except Exception as e:
-            raise FREDAPIError(f"Failed to parse FRED series data for {series_id}: {str(e)}", series_id=series_id) 
\ No newline at end of file
+            raise FREDAPIError(f"Failed to parse FRED series data for {series_id}: {str(e)}", series_id=series_id)
+    
+    async def get_series_data_async(self, series_id: str, start_date: str, end_date: str,
+                                    engine: Optional[CollectionEngine] = None) -> list:
+        """
+        Fetch time series data through the async collection engine.
+        
+        Must be awaited on the engine's event loop (schedule it with engine.run()).
+        
+        Args:
+            series_id: FRED series identifier (e.g., 'VIXCLS')
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            engine: Collection engine (default: process-wide engine)
+            
+        Returns:
+            List of dictionaries containing date and value data
+            
+        Raises:
+            FREDAPIError: If API request fails or series not found
+        """
+        engine = engine or get_collection_engine()
+        params = {
+            'series_id': series_id,
+            'observation_start': start_date,
+            'observation_end': end_date
+        }
+        
+        try:
+            response_data = await engine.get_json(self.provider_spec(), 'series/observations', params)
+            
+            # Check for FRED API errors in response
+            if 'error_code' in response_data:
+                raise FREDAPIError(
+                    f"FRED API error: {response_data.get('error_message', 'Unknown error')}",
+                    status_code=response_data.get('error_code')
+                )
+            
+            return self._parse_observations(response_data, series_id)
+            
+        except FREDAPIError:
+            raise
+        except (APIConnectionError, APITimeoutError):
+            raise
+        except APIError as e:
+            raise FREDAPIError(f"FRED API request failed for {series_id}: {e}", status_code=e.status_code)
+        except Exception as e:
+            raise FREDAPIError(f"Failed to parse FRED series data for {series_id}: {str(e)}")
+    
+    def _parse_observations(self, response_data: Dict, series_id: str) -> list:
+        """Convert a series/observations response into date/value dictionaries."""
+        # Extract observations from response
+        if 'observations' not in response_data:
+            raise FREDAPIError(f"No observations found in FRED response for series {series_id}")
+        
+        observations = response_data['observations']
+        
+        # Parse and format data
+        parsed_data = []
+        for obs in observations:
+            # Handle missing values (various formats)
+            value = None
+            raw_value = obs.get('value')
+            
+            # Check for missing data indicators
+            if raw_value is not None and raw_value not in ['.', '', 'NA', 'N/A', '#N/A']:
+                try:
+                    value = float(raw_value)
+                except (ValueError, TypeError):
+                    # If can't convert to float, treat as missing
+                    value = None
+            
+            parsed_data.append({
+                'date': obs['date'],
+                'value': value,
+                'series_id': series_id
+            })
+        
+        return parsed_data
@@ -4,6 +4,7 @@ Production-ready FastAPI application for MTS Signal Generation API.
 Provides endpoints for:
 - Signal generation and retrieval
 - Strategy backtesting
+- Background jobs for backtests and signal generation
 - System health monitoring
 - Configuration management
 """
@@ -20,11 +21,11 @@ from contextlib import asynccontextmanager
 # Setup path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Query
+from fastapi import FastAPI, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
-import redis
+import redis.asyncio as aioredis
 import structlog
 
 from config.settings import Config
@@ -34,20 +35,30 @@ from src.services.multi_strategy_generator import MultiStrategyGenerator
 from src.signals.backtest_interface import BacktestInterface, BacktestResult, BacktestStatus
 from src.data.signal_models import TradingSignal, SignalType, SignalStrength
 from src.services.monitor import HealthChecker
+from src.services.job_queue import JobQueue, JobStore, JobStatus
+from src.services.response_cache import LayeredCache
+from src.api.endpoints.jobs import router as jobs_router, set_job_queue, submit_job
 from src.utils.exceptions import CryptoDataPipelineError
 
 # Initialize configuration and logging
 config = Config()
 logger = structlog.get_logger(__name__)
 
-# Redis connection for caching
-try:
-    redis_client = redis.from_url(config.REDIS_URL, decode_responses=True)
-    redis_client.ping()
-    logger.info("Redis connection established")
-except Exception as e:
-    logger.warning(f"Redis connection failed: {e}")
-    redis_client = None
+# Response cache: in-process LRU, backed by Redis once connected during startup
+response_cache = LayeredCache(max_entries=config.CACHE_MAX_ENTRIES, stale_seconds=config.CACHE_STALE_SECONDS)
+
+
+async def connect_redis(url: str) -> Optional[aioredis.Redis]:
+    """Async Redis client for the shared cache tier, or None if Redis is unreachable"""
+    client = aioredis.from_url(url, decode_responses=True)
+    try:
+        await client.ping()
+        logger.info("Redis connection established")
+        return client
+    except Exception as e:
+        logger.warning(f"Redis connection failed, caching in memory only: {e}")
+        await client.close()
+        return None
 
 
 # Pydantic Models for API
@@ -121,46 +132,132 @@ signal_aggregator: Optional[SignalAggregator] = None
 multi_strategy_generator: Optional[MultiStrategyGenerator] = None
 backtest_interface: Optional[BacktestInterface] = None
 health_checker: Optional[HealthChecker] = None
+job_queue: Optional[JobQueue] = None
 app_start_time: datetime = None
 
 
+def _init_signal_services() -> None:
+    """Create the strategy registry, backtest interface and multi-strategy generator"""
+    global strategy_registry, multi_strategy_generator, backtest_interface
+    
+    # Initialize strategy registry
+    strategy_registry = StrategyRegistry()
+    strategy_registry.load_strategies_from_directory("src/signals/strategies")
+    
+    # Initialize backtest interface
+    backtest_interface = BacktestInterface()
+    
+    # Create multi-strategy generator with default configuration
+    strategy_configs = {}
+    for strategy_name in config.ENABLED_STRATEGIES:
+        strategy_configs[strategy_name] = {
+            'config_path': f"{config.STRATEGY_CONFIG_DIR}/{strategy_name}.json"
+        }
+    
+    aggregator_config = {
+        'strategy_weights': config.STRATEGY_WEIGHTS,
+        'aggregation_config': {
+            'max_position_size': config.MAX_POSITION_SIZE,
+            'conflict_resolution': 'weighted_average'
+        }
+    }
+    
+    execution_config = {
+        'mode': config.STRATEGY_EXECUTION_MODE,
+        'max_workers': config.STRATEGY_MAX_WORKERS,
+        'timeout_seconds': config.STRATEGY_TIMEOUT_SECONDS
+    }
+    
+    multi_strategy_generator = MultiStrategyGenerator(strategy_configs, aggregator_config, execution_config)
+
+
+# Job handlers: run in the job queue's worker processes, each of which builds its own
+# services once through _init_signal_services.
+
+def run_backtest_job(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a backtest described by BacktestRequest fields; returns BacktestResponse fields"""
+    if params['use_aggregated']:
+        # Use multi-strategy generator
+        result = backtest_interface.backtest_aggregated_strategies(
+            multi_strategy_generator, params['start_date'], params['end_date']
+        )
+    else:
+        # Load single strategy
+        config_path = f"{config.STRATEGY_CONFIG_DIR}/{params['strategy_name']}.json"
+        strategy = strategy_registry.get_strategy(params['strategy_name'], config_path)
+        result = backtest_interface.backtest_strategy(strategy, params['start_date'], params['end_date'])
+    
+    response_data = {
+        'strategy_name': result.strategy_name,
+        'start_date': result.start_date,
+        'end_date': result.end_date,
+        'status': result.status.value,
+        'total_return': result.total_return,
+        'annualized_return': result.annualized_return,
+        'sharpe_ratio': result.sharpe_ratio,
+        'max_drawdown': result.max_drawdown,
+        'win_rate': result.win_rate,
+        'total_trades': result.total_trades,
+        'execution_time': result.execution_time
+    }
+    
+    # Include detailed results for successful backtests
+    if result.status == BacktestStatus.SUCCESS:
+        response_data.update({
+            'daily_returns': result.daily_returns,
+            'equity_curve': result.equity_curve,
+            'trade_log': result.trade_log
+        })
+    
+    return response_data
+
+
+def generate_signals_job(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Generate aggregated signals for SignalGenerationRequest fields; returns signal dicts"""
+    signals = multi_strategy_generator.generate_aggregated_signals(params['days'])
+    return [signal.to_dict() for signal in signals]
+
+
+async def run_job(kind: str, params: Dict[str, Any]) -> Any:
+    """Submit a job (or join an identical in-flight one) and wait for its result"""
+    job = submit_job(job_queue, kind, params)
+    future = job_queue.future(job.job_id)
+    if future is not None:
+        await asyncio.wrap_future(future)
+    
+    finished = job_queue.get(job.job_id, include_result=True)
+    if finished['status'] != JobStatus.SUCCEEDED.value:
+        raise RuntimeError(f"{kind} job {job.job_id} {finished['status']}: {finished['error']}")
+    return finished['result']
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup application services"""
-    global strategy_registry, signal_aggregator, multi_strategy_generator
-    global backtest_interface, health_checker, app_start_time
+    global health_checker, job_queue, app_start_time
     
     # Startup
     logger.info("Starting MTS Signal API...")
     app_start_time = datetime.now()
     
     try:
-        # Initialize strategy registry
-        strategy_registry = StrategyRegistry()
-        strategy_registry.load_strategies_from_directory("src/signals/strategies")
+        _init_signal_services()
         
-        # Initialize backtest interface
-        backtest_interface = BacktestInterface()
+        response_cache.remote = await connect_redis(config.REDIS_URL)
         
         # Initialize health checker
         health_checker = HealthChecker()
         
-        # Create multi-strategy generator with default configuration
-        strategy_configs = {}
-        for strategy_name in config.ENABLED_STRATEGIES:
-            strategy_configs[strategy_name] = {
-                'config_path': f"{config.STRATEGY_CONFIG_DIR}/{strategy_name}.json"
-            }
-        
-        aggregator_config = {
-            'strategy_weights': config.STRATEGY_WEIGHTS,
-            'aggregation_config': {
-                'max_position_size': config.MAX_POSITION_SIZE,
-                'conflict_resolution': 'weighted_average'
-            }
-        }
-        
-        multi_strategy_generator = MultiStrategyGenerator(strategy_configs, aggregator_config)
+        # Backtests and signal generation run on a bounded worker process pool
+        job_queue = JobQueue(
+            JobStore(config.JOB_DB_PATH),
+            max_workers=config.JOB_MAX_WORKERS,
+            max_pending=config.JOB_MAX_PENDING,
+            initializer=_init_signal_services
+        )
+        job_queue.register('backtest', run_backtest_job, BacktestRequest)
+        job_queue.register('signals', generate_signals_job, SignalGenerationRequest)
+        set_job_queue(job_queue)
         
         logger.info("All services initialized successfully")
         
@@ -172,8 +269,12 @@ async def lifespan(app: FastAPI):
     
     # Cleanup
     logger.info("Shutting down MTS Signal API...")
-    if redis_client:
-        redis_client.close()
+    set_job_queue(None)
+    if job_queue:
+        job_queue.shutdown(wait=False)
+    if multi_strategy_generator:
+        multi_strategy_generator.close()
+    await response_cache.close()
 
 
 # Create FastAPI application
@@ -193,6 +294,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Job submission, status, result and cancellation endpoints
+app.include_router(jobs_router)
+
 
 # Dependency for caching
 def get_cache_key(prefix: str, *args) -> str:
@@ -200,27 +304,13 @@ def get_cache_key(prefix: str, *args) -> str:
     return f"{prefix}:{':'.join(map(str, args))}"
 
 
-def cache_get(key: str) -> Optional[str]:
-    """Get value from cache"""
-    if redis_client:
-        try:
-            return redis_client.get(key)
-        except Exception as e:
-            logger.warning(f"Cache get failed: {e}")
-    return None
-
-
-def cache_set(key: str, value: str, ttl: int = None) -> bool:
-    """Set value in cache"""
-    if redis_client:
-        try:
-            if ttl:
-                return redis_client.setex(key, ttl, value)
-            else:
-                return redis_client.set(key, value)
-        except Exception as e:
-            logger.warning(f"Cache set failed: {e}")
-    return False
+async def cached_signals(request: SignalGenerationRequest) -> List[Dict[str, Any]]:
+    """Latest aggregated signals for request.days, computed at most once per key at a time"""
+    return await response_cache.get_or_compute(
+        get_cache_key("signals", "latest", request.days),
+        lambda: run_job('signals', request.dict()),
+        ttl=config.REDIS_SIGNAL_TTL
+    )
 
 
 # API Endpoints
@@ -261,45 +351,22 @@ async def health_check():
 
 
 @app.post("/signals/generate", response_model=List[SignalResponse])
-async def generate_signals(
-    request: SignalGenerationRequest,
-    background_tasks: BackgroundTasks
-):
+async def generate_signals(request: SignalGenerationRequest):
     """Generate new trading signals"""
     try:
-        # Check cache first (unless force refresh)
-        cache_key = get_cache_key("signals", "latest", request.days)
-        
-        if not request.force_refresh:
-            cached_signals = cache_get(cache_key)
-            if cached_signals:
-                logger.info("Returning cached signals")
-                signals_data = json.loads(cached_signals)
-                return [SignalResponse(**signal) for signal in signals_data]
-        
-        # Generate signals using multi-strategy generator
-        signals = await asyncio.get_event_loop().run_in_executor(
-            None, multi_strategy_generator.generate_aggregated_signals, request.days
-        )
-        
-        # Convert to response format
-        signal_responses = []
-        for signal in signals:
-            signal_data = signal.to_dict()
-            signal_responses.append(SignalResponse(**signal_data))
-        
-        # Cache results
-        cache_data = [signal.dict() for signal in signal_responses]
-        background_tasks.add_task(
-            cache_set, 
-            cache_key, 
-            json.dumps(cache_data), 
-            config.REDIS_SIGNAL_TTL
-        )
+        if request.force_refresh:
+            # Generate signals on the job queue and replace the cached ones
+            signals = await run_job('signals', request.dict())
+            await response_cache.set(get_cache_key("signals", "latest", request.days), signals,
+                                     config.REDIS_SIGNAL_TTL)
+        else:
+            signals = await cached_signals(request)
         
-        logger.info(f"Generated {len(signal_responses)} signals")
-        return signal_responses
+        logger.info(f"Returning {len(signals)} signals")
+        return signals
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Signal generation failed: {e}")
         raise HTTPException(status_code=500, detail=f"Signal generation failed: {str(e)}")
@@ -313,24 +380,15 @@ async def get_latest_signals(
 ):
     """Get latest generated signals with optional filtering"""
     try:
-        # Try to get from cache first
-        cache_key = get_cache_key("signals", "latest", 30)
-        cached_signals = cache_get(cache_key)
-        
-        if not cached_signals:
-            # Generate fresh signals if none cached
-            request = SignalGenerationRequest()
-            return await generate_signals(request, BackgroundTasks())
-        
-        signals_data = json.loads(cached_signals)
-        signals = [SignalResponse(**signal) for signal in signals_data]
+        # Served from the in-process cache; generated on the first request
+        signals = await cached_signals(SignalGenerationRequest())
         
         # Apply filters
         if asset:
-            signals = [s for s in signals if s.asset.lower() == asset.lower()]
+            signals = [s for s in signals if s['asset'].lower() == asset.lower()]
         
         if strategy:
-            signals = [s for s in signals if strategy.lower() in s.strategy_name.lower()]
+            signals = [s for s in signals if strategy.lower() in s['strategy_name'].lower()]
         
         # Apply limit
         signals = signals[:limit]
@@ -338,6 +396,8 @@ async def get_latest_signals(
         logger.info(f"Returning {len(signals)} filtered signals")
         return signals
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get latest signals: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get signals: {str(e)}")
@@ -345,9 +405,8 @@ async def get_latest_signals(
 
 @app.post("/backtest", response_model=BacktestResponse)
 async def run_backtest(request: BacktestRequest):
-    """Run strategy backtest"""
+    """Run strategy backtest and wait for the result (see POST /jobs/backtest to poll instead)"""
     try:
-        # Check cache first
         cache_key = get_cache_key(
             "backtest", 
             request.strategy_name, 
@@ -356,66 +415,19 @@ async def run_backtest(request: BacktestRequest):
             request.use_aggregated
         )
         
-        cached_result = cache_get(cache_key)
-        if cached_result:
-            logger.info("Returning cached backtest result")
-            return BacktestResponse(**json.loads(cached_result))
-        
-        # Run backtest
-        if request.use_aggregated:
-            # Use multi-strategy generator
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                backtest_interface.backtest_aggregated_strategies,
-                multi_strategy_generator,
-                request.start_date,
-                request.end_date
-            )
-        else:
-            # Load single strategy
-            config_path = f"{config.STRATEGY_CONFIG_DIR}/{request.strategy_name}.json"
-            strategy = strategy_registry.get_strategy(request.strategy_name, config_path)
-            
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                backtest_interface.backtest_strategy,
-                strategy,
-                request.start_date,
-                request.end_date
-            )
-        
-        # Convert to response format
-        response_data = {
-            'strategy_name': result.strategy_name,
-            'start_date': result.start_date,
-            'end_date': result.end_date,
-            'status': result.status.value,
-            'total_return': result.total_return,
-            'annualized_return': result.annualized_return,
-            'sharpe_ratio': result.sharpe_ratio,
-            'max_drawdown': result.max_drawdown,
-            'win_rate': result.win_rate,
-            'total_trades': result.total_trades,
-            'execution_time': result.execution_time
-        }
-        
-        # Include detailed results for successful backtests
-        if result.status == BacktestStatus.SUCCESS:
-            response_data.update({
-                'daily_returns': result.daily_returns,
-                'equity_curve': result.equity_curve,
-                'trade_log': result.trade_log
-            })
-        
-        response = BacktestResponse(**response_data)
-        
-        # Cache successful results
-        if result.status == BacktestStatus.SUCCESS:
-            cache_set(cache_key, response.json(), 3600)  # Cache for 1 hour
+        # Run backtest on the job queue; only successful results are cached (for 1 hour)
+        result = await response_cache.get_or_compute(
+            cache_key,
+            lambda: run_job('backtest', request.dict()),
+            ttl=3600,
+            should_cache=lambda data: data['status'] == BacktestStatus.SUCCESS.value
+        )
         
         logger.info(f"Backtest completed: {request.strategy_name}")
-        return response
+        return result
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Backtest failed: {e}")
         raise HTTPException(status_code=500, detail=f"Backtest failed: {str(e)}")
@@ -425,13 +437,21 @@ async def run_backtest(request: BacktestRequest):
 async def list_strategies():
     """List available strategies"""
     try:
-        strategies = list(strategy_registry.list_strategies().keys())
-        return strategies
+        async def load_strategies():
+            return list(strategy_registry.list_strategies().keys())
+        
+        return await response_cache.get_or_compute("strategies", load_strategies, ttl=config.REDIS_CACHE_TTL)
     except Exception as e:
         logger.error(f"Failed to list strategies: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to list strategies: {str(e)}")
 
 
+@app.get("/cache/stats", response_model=Dict[str, Any])
+async def get_cache_stats():
+    """Response cache hit/miss counters and tier sizes"""
+    return response_cache.stats()
+
+
 @app.get("/config", response_model=Dict[str, Any])
 async def get_configuration():
     """Get current system configuration (public settings only)"""
@@ -445,7 +465,8 @@ async def get_configuration():
             'max_daily_trades': config.MAX_DAILY_TRADES,
             'api_version': "1.0.0",
             'features': {
-                'caching_enabled': redis_client is not None,
+                'caching_enabled': True,
+                'redis_cache_enabled': response_cache.remote is not None,
                 'monitoring_enabled': config.ENABLE_METRICS,
                 'alerts_enabled': config.ENABLE_ALERTS
             }
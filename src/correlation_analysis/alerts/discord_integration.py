@@ -73,14 +73,17 @@ class CorrelationDiscordIntegration:
                 source='correlation', strategy='mosaic', symbol='mosaic', signal_type=None,
                 price=float(hash(json.dumps(mosaic_data, sort_keys=True)) & 0xFFFFFFFF)
             )
-            if not self._deduper.should_send(key):
+            if not self._deduper.try_mark(key):
                 self.logger.info("Skipping duplicate mosaic alert (deduped)")
                 return False
 
-            # Send to Discord
-            success = self.discord.send_embed(embed)
-            if success:
-                self._deduper.mark_sent(key)
+            # Send to Discord, releasing the dedupe claim if it does not go out
+            success = False
+            try:
+                success = self.discord.send_embed(embed)
+            finally:
+                if not success:
+                    self._deduper.unmark(key)
             
             if success:
                 self.logger.info("✅ Mosaic alert sent to Discord successfully")
@@ -116,14 +119,17 @@ class CorrelationDiscordIntegration:
                 source='correlation', strategy='breakdown', symbol=pair.lower(), signal_type=None,
                 price=float(hash(json.dumps(correlation_data, sort_keys=True)) & 0xFFFFFFFF)
             )
-            if not self._deduper.should_send(key):
+            if not self._deduper.try_mark(key):
                 self.logger.info("Skipping duplicate correlation breakdown alert (deduped)")
                 return False
 
-            # Send to Discord
-            success = self.discord.send_embed(embed)
-            if success:
-                self._deduper.mark_sent(key)
+            # Send to Discord, releasing the dedupe claim if it does not go out
+            success = False
+            try:
+                success = self.discord.send_embed(embed)
+            finally:
+                if not success:
+                    self._deduper.unmark(key)
             
             if success:
                 self.logger.info(f"✅ Correlation breakdown alert sent to Discord for {pair}")
@@ -158,14 +164,17 @@ class CorrelationDiscordIntegration:
                 source='correlation', strategy='daily_summary', symbol='summary', signal_type=None,
                 price=float(hash(json.dumps(summary_data, sort_keys=True)) & 0xFFFFFFFF)
             )
-            if not self._deduper.should_send(key):
+            if not self._deduper.try_mark(key):
                 self.logger.info("Skipping duplicate daily summary alert (deduped)")
                 return False
 
-            # Send to Discord
-            success = self.discord.send_embed(embed)
-            if success:
-                self._deduper.mark_sent(key)
+            # Send to Discord, releasing the dedupe claim if it does not go out
+            success = False
+            try:
+                success = self.discord.send_embed(embed)
+            finally:
+                if not success:
+                    self._deduper.unmark(key)
             
             if success:
                 self.logger.info("✅ Daily correlation summary sent to Discord")
@@ -0,0 +1,270 @@
+"""
+Streaming bulk loader for crypto_ohlcv and macro_indicators.
+
+Rows arrive in chunks (DataFrames, or lists of the record dicts taken by
+CryptoDatabase.insert_crypto_data / insert_macro_data) and are staged into a TEMP table with
+executemany. A single INSERT ... SELECT ... ON CONFLICT DO NOTHING then merges the staged
+rows, so a load is one transaction that lands completely or not at all, and rows already in
+the table (or repeated within the load) keep their first stored values.
+
+The per-row AFTER INSERT triggers that maintain crypto_assets, series_stats and
+table_versions are suspended during the merge and their effect is applied set-wise from the
+newly inserted rows. Loads of at least ``index_rebuild_rows`` rows also drop the target
+table's secondary indexes and rebuild them after the merge, which is much cheaper than
+maintaining them row by row. Triggers and indexes are recreated from their stored SQL inside
+the same transaction, so other connections never observe them missing.
+"""
+
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from .db_connection import DatabaseConnection
+
+
+DEFAULT_INDEX_REBUILD_ROWS = 1_000_000
+DEFAULT_PROGRESS_EVERY = 500_000
+
+Chunk = Union[pd.DataFrame, Sequence[Dict]]
+ProgressCallback = Callable[[int, float], None]
+
+_STAGING_TABLE = 'bulk_staging'
+
+
+@dataclass(frozen=True)
+class _Target:
+    """A table the loader can merge into"""
+    table: str
+    columns: Tuple[str, ...]
+    key: Tuple[str, ...]
+    insert_triggers: Tuple[str, ...]
+    defaults: Dict[str, object] = field(default_factory=dict)
+
+
+CRYPTO_TARGET = _Target(
+    table='crypto_ohlcv',
+    columns=('cryptocurrency', 'timestamp', 'date_str', 'open', 'high', 'low', 'close', 'volume'),
+    key=('cryptocurrency', 'timestamp'),
+    insert_triggers=('trg_crypto_ohlcv_assets', 'trg_crypto_ohlcv_series_stats_insert'),
+)
+
+MACRO_TARGET = _Target(
+    table='macro_indicators',
+    columns=('indicator', 'date', 'value', 'is_interpolated', 'is_forward_filled'),
+    key=('indicator', 'date'),
+    insert_triggers=('trg_macro_indicators_version_insert', 'trg_macro_indicators_series_stats_insert'),
+    defaults={'is_interpolated': False, 'is_forward_filled': False},
+)
+
+
+class BulkLoader:
+    """Chunked, single-transaction loads into crypto_ohlcv and macro_indicators."""
+
+    def __init__(self, db_path: Optional[str] = None,
+                 index_rebuild_rows: Optional[int] = DEFAULT_INDEX_REBUILD_ROWS,
+                 progress_every: int = DEFAULT_PROGRESS_EVERY,
+                 on_progress: Optional[ProgressCallback] = None):
+        """
+        Args:
+            db_path: SQLite database path; the schema must already be initialized
+                (e.g. by constructing CryptoDatabase once). Uses the default path if None.
+            index_rebuild_rows: Drop and rebuild secondary indexes for loads of at least
+                this many rows; None never rebuilds
+            progress_every: Report staging progress every this many rows
+            on_progress: Called with (rows staged, rows/sec) at each progress report
+        """
+        self.db_path = (DatabaseConnection(db_path) if db_path else DatabaseConnection()).db_path
+        self.index_rebuild_rows = index_rebuild_rows
+        self.progress_every = progress_every
+        self.on_progress = on_progress
+        self.logger = logging.getLogger(__name__)
+
+    def load_crypto(self, chunks: Iterable[Chunk], cryptocurrency: Optional[str] = None) -> Dict:
+        """
+        Bulk-load OHLCV rows into crypto_ohlcv.
+
+        Args:
+            chunks: DataFrames or lists of dicts with cryptocurrency, timestamp, date_str,
+                open, high, low, close, volume. A DataFrame may omit date_str (derived from
+                the millisecond timestamp as a UTC date) and cryptocurrency (taken from the
+                cryptocurrency argument).
+            cryptocurrency: Value for chunks that have no cryptocurrency column
+
+        Returns:
+            Dict: load summary (see _load)
+        """
+        fill = {'cryptocurrency': cryptocurrency} if cryptocurrency else {}
+        return self._load(CRYPTO_TARGET, chunks, fill)
+
+    def load_macro(self, chunks: Iterable[Chunk], indicator: Optional[str] = None) -> Dict:
+        """
+        Bulk-load indicator values into macro_indicators.
+
+        Args:
+            chunks: DataFrames or lists of dicts with indicator, date, value and optionally
+                is_interpolated, is_forward_filled (default False)
+            indicator: Value for chunks that have no indicator column
+
+        Returns:
+            Dict: load summary (see _load)
+        """
+        fill = {'indicator': indicator} if indicator else {}
+        return self._load(MACRO_TARGET, chunks, fill)
+
+    @staticmethod
+    def _chunk_rows(target: _Target, chunk: Chunk, fill: Dict[str, object]) -> List[tuple]:
+        """Parameter tuples in target.columns order for one chunk."""
+        defaults = {**target.defaults, **fill}
+        if isinstance(chunk, pd.DataFrame):
+            frame = chunk.assign(**{c: v for c, v in defaults.items() if c not in chunk.columns})
+            if target is CRYPTO_TARGET and 'date_str' not in frame.columns and 'timestamp' in frame.columns:
+                days = frame['timestamp'].to_numpy(dtype='int64').astype('datetime64[ms]').astype('datetime64[D]')
+                frame['date_str'] = days.astype(str)
+            missing = [c for c in target.columns if c not in frame.columns]
+            if missing:
+                raise ValueError(f"Missing required field(s): {missing}")
+            # tolist() converts numpy scalars to Python values, which sqlite3 binds directly
+            return list(zip(*(frame[c].tolist() for c in target.columns)))
+
+        try:
+            return [tuple(record[c] if c not in defaults else record.get(c, defaults[c])
+                          for c in target.columns) for record in chunk]
+        except KeyError as e:
+            raise ValueError(f"Missing required field: {e}") from e
+
+    @staticmethod
+    def _saved_sql(conn: sqlite3.Connection, kind: str, table: str,
+                   names: Optional[Sequence[str]] = None) -> List[Tuple[str, str]]:
+        """(name, CREATE statement) of a table's triggers or explicit indexes."""
+        rows = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = ? AND tbl_name = ? AND sql IS NOT NULL",
+            (kind, table)
+        ).fetchall()
+        return [(name, sql) for name, sql in rows if names is None or name in names]
+
+    def _apply_trigger_effects(self, conn: sqlite3.Connection, target: _Target, first_id: int) -> None:
+        """Set-wise equivalent of the suspended insert triggers for rows with id > first_id."""
+        if target is CRYPTO_TARGET:
+            conn.execute("""
+                INSERT OR IGNORE INTO crypto_assets (cryptocurrency)
+                SELECT DISTINCT cryptocurrency FROM crypto_ohlcv WHERE id > ?
+            """, (first_id,))
+            conn.execute("""
+                INSERT INTO series_stats
+                    (source, series, row_count, min_timestamp, max_timestamp, first_date, latest_date, last_ingest)
+                SELECT 'crypto', cryptocurrency, COUNT(*), MIN(timestamp), MAX(timestamp),
+                       MIN(date_str), MAX(date_str), CURRENT_TIMESTAMP
+                FROM crypto_ohlcv WHERE id > ?
+                GROUP BY cryptocurrency
+                ON CONFLICT (source, series) DO UPDATE SET
+                    row_count = row_count + excluded.row_count,
+                    min_timestamp = MIN(COALESCE(min_timestamp, excluded.min_timestamp), excluded.min_timestamp),
+                    max_timestamp = MAX(COALESCE(max_timestamp, excluded.max_timestamp), excluded.max_timestamp),
+                    first_date = MIN(COALESCE(first_date, excluded.first_date), excluded.first_date),
+                    latest_date = MAX(COALESCE(latest_date, excluded.latest_date), excluded.latest_date),
+                    last_ingest = excluded.last_ingest
+            """, (first_id,))
+        else:
+            conn.execute("""
+                UPDATE table_versions SET version = version + (SELECT COUNT(*) FROM macro_indicators WHERE id > ?)
+                WHERE table_name = 'macro_indicators'
+            """, (first_id,))
+            conn.execute("""
+                INSERT INTO series_stats (source, series, row_count, first_date, latest_date, last_ingest)
+                SELECT 'macro', indicator, COUNT(*), MIN(date), MAX(date), CURRENT_TIMESTAMP
+                FROM macro_indicators WHERE id > ?
+                GROUP BY indicator
+                ON CONFLICT (source, series) DO UPDATE SET
+                    row_count = row_count + excluded.row_count,
+                    first_date = MIN(COALESCE(first_date, excluded.first_date), excluded.first_date),
+                    latest_date = MAX(COALESCE(latest_date, excluded.latest_date), excluded.latest_date),
+                    last_ingest = excluded.last_ingest
+            """, (first_id,))
+
+    def _report(self, staged: int, started: float) -> None:
+        rate = staged / max(time.perf_counter() - started, 1e-9)
+        self.logger.info(f"Staged {staged:,} rows ({rate:,.0f} rows/s)")
+        if self.on_progress:
+            self.on_progress(staged, rate)
+
+    def _load(self, target: _Target, chunks: Iterable[Chunk], fill: Dict[str, object]) -> Dict:
+        """
+        Stage all chunks and merge them into target.table in one transaction.
+
+        Returns:
+            Dict: 'staged' rows read, 'inserted' new rows, 'duplicates' skipped,
+                'rebuilt_indexes' flag, 'seconds' elapsed and overall 'rows_per_sec'
+
+        Raises:
+            ValueError: If a chunk lacks a required column
+            sqlite3.Error: If a database operation fails; nothing is written
+        """
+        columns = ', '.join(target.columns)
+        placeholders = ', '.join('?' for _ in target.columns)
+        started = time.perf_counter()
+        staged = 0
+        next_report = self.progress_every
+
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            conn.execute("PRAGMA cache_size = -131072")  # 128 MiB for the merge and index builds
+            conn.execute(f"CREATE TEMP TABLE {_STAGING_TABLE} ({columns})")
+            conn.execute("BEGIN")
+
+            insert_staging = f"INSERT INTO temp.{_STAGING_TABLE} ({columns}) VALUES ({placeholders})"
+            for chunk in chunks:
+                rows = self._chunk_rows(target, chunk, fill)
+                conn.executemany(insert_staging, rows)
+                staged += len(rows)
+                if staged >= next_report:
+                    self._report(staged, started)
+                    next_report = (staged // self.progress_every + 1) * self.progress_every
+
+            rebuild_indexes = self.index_rebuild_rows is not None and staged >= self.index_rebuild_rows
+            suspended = self._saved_sql(conn, 'trigger', target.table, target.insert_triggers)
+            if rebuild_indexes:
+                suspended += self._saved_sql(conn, 'index', target.table)
+            for name, _ in suspended:
+                kind = 'TRIGGER' if name in target.insert_triggers else 'INDEX'
+                conn.execute(f"DROP {kind} {name}")
+
+            first_id = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {target.table}").fetchone()[0]
+            # Key order keeps unique-index inserts local; rowid makes the first staged duplicate win.
+            # WHERE true disambiguates ON CONFLICT from a join constraint.
+            inserted = conn.execute(f"""
+                INSERT INTO {target.table} ({columns})
+                SELECT {columns} FROM temp.{_STAGING_TABLE} WHERE true
+                ORDER BY {', '.join(target.key)}, rowid
+                ON CONFLICT ({', '.join(target.key)}) DO NOTHING
+            """).rowcount
+            if inserted:
+                self._apply_trigger_effects(conn, target, first_id)
+
+            for _, sql in suspended:
+                conn.execute(sql)
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        seconds = time.perf_counter() - started
+        result = {
+            'staged': staged,
+            'inserted': inserted,
+            'duplicates': staged - inserted,
+            'rebuilt_indexes': rebuild_indexes,
+            'seconds': seconds,
+            'rows_per_sec': staged / seconds if seconds else 0.0,
+        }
+        self.logger.info(
+            f"Bulk loaded {target.table}: {inserted:,} new of {staged:,} staged rows in {seconds:.1f}s "
+            f"({result['rows_per_sec']:,.0f} rows/s{', indexes rebuilt' if rebuild_indexes else ''})"
+        )
+        return result
@@ -0,0 +1,182 @@
+"""
+Columnar OHLCV archive with memory-mapped reads.
+
+Layout: one file per symbol per month, ``{root}/{symbol}/{YYYY-MM}.npy``. Each file holds a
+column-major float64 array of (timestamp, open, high, low, close, volume) rows, sorted by
+timestamp with duplicate timestamps removed on write. Column-major .npy files are
+memory-mapped by numpy without parsing, so a read touches only the months overlapping the
+requested range and, within them, only the rows located by binary search on the timestamp
+column.
+
+Timestamps are Unix epoch milliseconds, stored exactly in float64 (below 2**53).
+"""
+
+import logging
+import os
+import re
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .models import OHLCVData
+
+
+OHLCV_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+_MONTH_FILE = re.compile(r'^(\d{4})-(\d{2})\.npy$')
+
+TimeBound = Union[datetime, int, None]
+
+
+def _to_millis(bound: TimeBound) -> Optional[int]:
+    """Epoch milliseconds for a datetime (naive values are UTC) or pass through an int."""
+    if bound is None or isinstance(bound, (int, np.integer)):
+        return bound
+    if bound.tzinfo is None:
+        bound = bound.replace(tzinfo=timezone.utc)
+    return int(bound.timestamp() * 1000)
+
+
+def _month_key(millis: np.ndarray) -> np.ndarray:
+    """Months since 1970-01 for each epoch-millisecond timestamp (UTC)."""
+    return millis.astype('datetime64[ms]').astype('datetime64[M]').astype(np.int64)
+
+
+def _month_name(month: int) -> str:
+    year, index = divmod(int(month), 12)
+    return f"{1970 + year:04d}-{index + 1:02d}"
+
+
+class ColumnarArchive:
+    """Per-symbol, per-month columnar OHLCV files."""
+
+    def __init__(self, root: str = "data/archive"):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+
+    def _symbol_dir(self, symbol: str) -> Path:
+        return self.root / symbol
+
+    def symbols(self) -> List[str]:
+        """Symbols with at least one archived month."""
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir() and any(p.glob('*.npy')))
+
+    def months(self, symbol: str) -> List[str]:
+        """Archived months of a symbol as sorted 'YYYY-MM' strings."""
+        directory = self._symbol_dir(symbol)
+        if not directory.is_dir():
+            return []
+        return sorted(m.group(1) + '-' + m.group(2) for m in map(_MONTH_FILE.match, os.listdir(directory)) if m)
+
+    @staticmethod
+    def _rows(data: Union[pd.DataFrame, Sequence[OHLCVData]]) -> np.ndarray:
+        """(n, 6) float64 rows from a DataFrame with OHLCV columns or OHLCVData records."""
+        if isinstance(data, pd.DataFrame):
+            return data.loc[:, list(OHLCV_COLUMNS)].to_numpy(dtype=np.float64)
+        return np.array([[d.timestamp, d.open, d.high, d.low, d.close, d.volume] for d in data],
+                        dtype=np.float64).reshape(-1, len(OHLCV_COLUMNS))
+
+    def _load_month(self, path: Path) -> np.ndarray:
+        return np.load(path, mmap_mode='r')
+
+    def _write_month(self, path: Path, rows: np.ndarray) -> None:
+        """Atomically replace a month file with rows stored column-major."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, np.asfortranarray(rows))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def write(self, symbol: str, data: Union[pd.DataFrame, Sequence[OHLCVData]]) -> int:
+        """
+        Merge OHLCV rows into the symbol's month files.
+
+        Rows are sorted by timestamp; a timestamp already in the archive (or repeated within
+        data) keeps its first stored row, matching CSVStorage and the SQLite loaders.
+
+        Args:
+            symbol: Symbol or cryptocurrency id (e.g. "bitcoin")
+            data: DataFrame with OHLCV_COLUMNS or a sequence of OHLCVData
+
+        Returns:
+            Number of new rows written
+        """
+        rows = self._rows(data)
+        if not len(rows):
+            return 0
+
+        months = _month_key(rows[:, 0].astype(np.int64))
+        written = 0
+        for month in np.unique(months):
+            path = self._symbol_dir(symbol) / f"{_month_name(month)}.npy"
+            incoming = rows[months == month]
+            existing = np.asarray(self._load_month(path)) if path.exists() else np.empty((0, len(OHLCV_COLUMNS)))
+            merged = np.concatenate([existing, incoming])
+            # Stable sort keeps existing rows ahead of incoming ones with the same timestamp
+            merged = merged[np.argsort(merged[:, 0], kind='stable')]
+            keep = np.ones(len(merged), dtype=bool)
+            keep[1:] = merged[1:, 0] != merged[:-1, 0]
+            merged = merged[keep]
+            added = len(merged) - len(existing)
+            if added:
+                self._write_month(path, merged)
+                written += added
+        self.logger.debug(f"Archived {written} new rows for {symbol}")
+        return written
+
+    def read_array(self, symbol: str, start: TimeBound = None, end: TimeBound = None) -> np.ndarray:
+        """
+        OHLCV rows of a symbol within [start, end] as an (n, 6) float64 array.
+
+        Only month files overlapping the range are opened, and each is memory-mapped and
+        sliced by binary search, so rows outside the range are never read.
+
+        Args:
+            symbol: Symbol or cryptocurrency id
+            start: Inclusive lower bound (datetime, naive = UTC, or epoch milliseconds)
+            end: Inclusive upper bound (datetime, naive = UTC, or epoch milliseconds)
+        """
+        start_ms, end_ms = _to_millis(start), _to_millis(end)
+        first = _month_key(np.array([start_ms]))[0] if start_ms is not None else None
+        last = _month_key(np.array([end_ms]))[0] if end_ms is not None else None
+
+        parts = []
+        for name in self.months(symbol):
+            year, month = map(int, name.split('-'))
+            key = (year - 1970) * 12 + month - 1
+            if (first is not None and key < first) or (last is not None and key > last):
+                continue
+            mapped = self._load_month(self._symbol_dir(symbol) / f"{name}.npy")
+            timestamps = mapped[:, 0]
+            lo = np.searchsorted(timestamps, start_ms, side='left') if start_ms is not None else 0
+            hi = np.searchsorted(timestamps, end_ms, side='right') if end_ms is not None else len(timestamps)
+            if hi > lo:
+                parts.append(mapped[lo:hi])
+        if not parts:
+            return np.empty((0, len(OHLCV_COLUMNS)))
+        return np.concatenate(parts)
+
+    def read(self, symbol: str, start: TimeBound = None, end: TimeBound = None) -> pd.DataFrame:
+        """OHLCV rows of a symbol within [start, end] as a DataFrame (int64 timestamps)."""
+        rows = self.read_array(symbol, start, end)
+        frame = pd.DataFrame(rows, columns=list(OHLCV_COLUMNS))
+        frame['timestamp'] = frame['timestamp'].astype(np.int64)
+        return frame
+
+    def read_many(self, symbols: Iterable[str], start: TimeBound = None,
+                  end: TimeBound = None) -> Dict[str, pd.DataFrame]:
+        """read() for several symbols."""
+        return {symbol: self.read(symbol, start, end) for symbol in symbols}
+
+    def load_ohlcv_data(self, symbol: str, start: TimeBound = None, end: TimeBound = None) -> List[OHLCVData]:
+        """OHLCVData records within [start, end], for callers of CSVStorage.load_ohlcv_data."""
+        return [OHLCVData(int(row[0]), *map(float, row[1:])) for row in self.read_array(symbol, start, end)]
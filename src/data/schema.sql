@@ -41,4 +41,152 @@ CREATE INDEX IF NOT EXISTS idx_crypto_ohlcv_date_str ON crypto_ohlcv(date_str);
 
 -- Indexes for macro_indicators table
 CREATE INDEX IF NOT EXISTS idx_macro_indicators_indicator ON macro_indicators(indicator);
-CREATE INDEX IF NOT EXISTS idx_macro_indicators_date ON macro_indicators(date); 
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_macro_indicators_date ON macro_indicators(date); 
+
+-- Change counters for tables whose derived data is cached by readers
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO table_versions (table_name, version) VALUES ('macro_indicators', 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_macro_indicators_version_insert AFTER INSERT ON macro_indicators
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'macro_indicators';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_macro_indicators_version_update AFTER UPDATE ON macro_indicators
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'macro_indicators';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_macro_indicators_version_delete AFTER DELETE ON macro_indicators
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'macro_indicators';
+END;
+
+-- Materialized list of cryptocurrencies present in crypto_ohlcv, maintained on insert
+CREATE TABLE IF NOT EXISTS crypto_assets (
+    cryptocurrency TEXT PRIMARY KEY,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- One-off backfill for databases created before crypto_assets existed
+INSERT OR IGNORE INTO crypto_assets (cryptocurrency)
+SELECT DISTINCT cryptocurrency FROM crypto_ohlcv
+WHERE NOT EXISTS (SELECT 1 FROM crypto_assets);
+
+CREATE TRIGGER IF NOT EXISTS trg_crypto_ohlcv_assets AFTER INSERT ON crypto_ohlcv
+BEGIN
+    INSERT OR IGNORE INTO crypto_assets (cryptocurrency) VALUES (NEW.cryptocurrency);
+END;
+
+-- Per-series row counts and date ranges, maintained by triggers so health and freshness
+-- checks read one row per series instead of aggregating crypto_ohlcv / macro_indicators.
+-- source is 'crypto' (series = cryptocurrency) or 'macro' (series = indicator); timestamps are
+-- only tracked for crypto. Rebuild with scripts/rebuild_series_stats.py if it ever drifts.
+CREATE TABLE IF NOT EXISTS series_stats (
+    source TEXT NOT NULL,
+    series TEXT NOT NULL,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    min_timestamp INTEGER,
+    max_timestamp INTEGER,
+    first_date TEXT,
+    latest_date TEXT,
+    last_ingest TIMESTAMP,
+    PRIMARY KEY (source, series)
+);
+
+-- One-off backfill for databases created before series_stats existed
+INSERT OR IGNORE INTO series_stats
+    (source, series, row_count, min_timestamp, max_timestamp, first_date, latest_date, last_ingest)
+SELECT 'crypto', cryptocurrency, COUNT(*), MIN(timestamp), MAX(timestamp), MIN(date_str), MAX(date_str), MAX(created_at)
+FROM crypto_ohlcv
+WHERE NOT EXISTS (SELECT 1 FROM series_stats WHERE source = 'crypto')
+GROUP BY cryptocurrency;
+
+INSERT OR IGNORE INTO series_stats
+    (source, series, row_count, min_timestamp, max_timestamp, first_date, latest_date, last_ingest)
+SELECT 'macro', indicator, COUNT(*), NULL, NULL, MIN(date), MAX(date), MAX(created_at)
+FROM macro_indicators
+WHERE NOT EXISTS (SELECT 1 FROM series_stats WHERE source = 'macro')
+GROUP BY indicator;
+
+CREATE TRIGGER IF NOT EXISTS trg_crypto_ohlcv_series_stats_insert AFTER INSERT ON crypto_ohlcv
+BEGIN
+    INSERT INTO series_stats
+        (source, series, row_count, min_timestamp, max_timestamp, first_date, latest_date, last_ingest)
+    VALUES ('crypto', NEW.cryptocurrency, 1, NEW.timestamp, NEW.timestamp, NEW.date_str, NEW.date_str, CURRENT_TIMESTAMP)
+    ON CONFLICT (source, series) DO UPDATE SET
+        row_count = row_count + 1,
+        min_timestamp = MIN(COALESCE(min_timestamp, excluded.min_timestamp), excluded.min_timestamp),
+        max_timestamp = MAX(COALESCE(max_timestamp, excluded.max_timestamp), excluded.max_timestamp),
+        first_date = MIN(COALESCE(first_date, excluded.first_date), excluded.first_date),
+        latest_date = MAX(COALESCE(latest_date, excluded.latest_date), excluded.latest_date),
+        last_ingest = excluded.last_ingest;
+END;
+
+-- Deleting a row that holds a bound re-reads that bound from the series' remaining rows
+CREATE TRIGGER IF NOT EXISTS trg_crypto_ohlcv_series_stats_delete AFTER DELETE ON crypto_ohlcv
+BEGIN
+    UPDATE series_stats SET
+        row_count = row_count - 1,
+        min_timestamp = CASE WHEN OLD.timestamp <= min_timestamp
+            THEN (SELECT MIN(timestamp) FROM crypto_ohlcv WHERE cryptocurrency = OLD.cryptocurrency)
+            ELSE min_timestamp END,
+        max_timestamp = CASE WHEN OLD.timestamp >= max_timestamp
+            THEN (SELECT MAX(timestamp) FROM crypto_ohlcv WHERE cryptocurrency = OLD.cryptocurrency)
+            ELSE max_timestamp END,
+        first_date = CASE WHEN OLD.date_str <= first_date
+            THEN (SELECT MIN(date_str) FROM crypto_ohlcv WHERE cryptocurrency = OLD.cryptocurrency)
+            ELSE first_date END,
+        latest_date = CASE WHEN OLD.date_str >= latest_date
+            THEN (SELECT MAX(date_str) FROM crypto_ohlcv WHERE cryptocurrency = OLD.cryptocurrency)
+            ELSE latest_date END
+    WHERE source = 'crypto' AND series = OLD.cryptocurrency;
+
+    DELETE FROM series_stats WHERE source = 'crypto' AND series = OLD.cryptocurrency AND row_count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_macro_indicators_series_stats_insert AFTER INSERT ON macro_indicators
+BEGIN
+    INSERT INTO series_stats (source, series, row_count, first_date, latest_date, last_ingest)
+    VALUES ('macro', NEW.indicator, 1, NEW.date, NEW.date, CURRENT_TIMESTAMP)
+    ON CONFLICT (source, series) DO UPDATE SET
+        row_count = row_count + 1,
+        first_date = MIN(COALESCE(first_date, excluded.first_date), excluded.first_date),
+        latest_date = MAX(COALESCE(latest_date, excluded.latest_date), excluded.latest_date),
+        last_ingest = excluded.last_ingest;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_macro_indicators_series_stats_delete AFTER DELETE ON macro_indicators
+BEGIN
+    UPDATE series_stats SET
+        row_count = row_count - 1,
+        first_date = CASE WHEN OLD.date <= first_date
+            THEN (SELECT MIN(date) FROM macro_indicators WHERE indicator = OLD.indicator)
+            ELSE first_date END,
+        latest_date = CASE WHEN OLD.date >= latest_date
+            THEN (SELECT MAX(date) FROM macro_indicators WHERE indicator = OLD.indicator)
+            ELSE latest_date END
+    WHERE source = 'macro' AND series = OLD.indicator;
+
+    DELETE FROM series_stats WHERE source = 'macro' AND series = OLD.indicator AND row_count <= 0;
+END;
+
+-- Per-asset layer scores logged by the multi-factor strategy
+CREATE TABLE IF NOT EXISTS multi_factor_signals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp INTEGER NOT NULL,
+    asset TEXT NOT NULL,
+    macro_score REAL,
+    trend_score REAL,
+    reversion_score REAL,
+    composite_score REAL,
+    signal_direction TEXT,
+    confirmation_gate_passed INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_multi_factor_signals_asset_timestamp ON multi_factor_signals(asset, timestamp);
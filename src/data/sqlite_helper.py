@@ -9,6 +9,8 @@ from typing import Optional, List, Dict, Tuple
 
 import pandas as pd
 
+from src.analytics.indicators import get_indicator_engine
+from src.analytics.percentile_rank import rolling_percentile_rank
 from .db_connection import DatabaseConnection
 from .db_init import initialize_database
 
@@ -70,6 +72,8 @@ class CryptoDatabase:
             
         Raises:
             sqlite3.Error: If database operation fails
+            
+        For backfills and migrations of many rows use src.data.bulk_loader.BulkLoader.
         """
         if not crypto_data:
             self.logger.debug("No crypto data provided for insertion")
@@ -85,13 +89,9 @@ class CryptoDatabase:
             with self.db_connection.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Get initial row count
-                cursor.execute("SELECT COUNT(*) FROM crypto_ohlcv")
-                initial_count = cursor.fetchone()[0]
-                
-                # Insert data
-                for record in crypto_data:
-                    cursor.execute(insert_sql, (
+                # executemany's rowcount sums inserted rows; ignored duplicates and trigger writes count 0
+                cursor.executemany(insert_sql, [
+                    (
                         record['cryptocurrency'],
                         record['timestamp'],
                         record['date_str'],
@@ -100,15 +100,13 @@ class CryptoDatabase:
                         record['low'],
                         record['close'],
                         record['volume']
-                    ))
-                
-                # Get final row count
-                cursor.execute("SELECT COUNT(*) FROM crypto_ohlcv")
-                final_count = cursor.fetchone()[0]
+                    )
+                    for record in crypto_data
+                ])
+                inserted_count = cursor.rowcount
                 
                 conn.commit()
                 
-                inserted_count = final_count - initial_count
                 self.logger.debug(f"Inserted {inserted_count} crypto records out of {len(crypto_data)} provided")
                 
                 return inserted_count
@@ -152,27 +150,21 @@ class CryptoDatabase:
             with self.db_connection.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Get initial row count
-                cursor.execute("SELECT COUNT(*) FROM macro_indicators")
-                initial_count = cursor.fetchone()[0]
-                
-                # Insert data
-                for record in macro_data:
-                    cursor.execute(insert_sql, (
+                # executemany's rowcount sums inserted rows; ignored duplicates and trigger writes count 0
+                cursor.executemany(insert_sql, [
+                    (
                         record['indicator'],
                         record['date'],
                         record['value'],
                         record.get('is_interpolated', False),
                         record.get('is_forward_filled', False)
-                    ))
-                
-                # Get final row count
-                cursor.execute("SELECT COUNT(*) FROM macro_indicators")
-                final_count = cursor.fetchone()[0]
+                    )
+                    for record in macro_data
+                ])
+                inserted_count = cursor.rowcount
                 
                 conn.commit()
                 
-                inserted_count = final_count - initial_count
                 self.logger.debug(f"Inserted {inserted_count} macro records out of {len(macro_data)} provided")
                 
                 return inserted_count
@@ -262,7 +254,134 @@ class CryptoDatabase:
         except Exception as e:
             self.logger.error(f"Unexpected error getting latest macro date: {e}")
             raise
-    
+
+    def get_table_version(self, table_name: str) -> int:
+        """
+        Get the change counter of a table tracked in table_versions.
+        The counter is bumped by triggers on every insert, update and delete.
+
+        Args:
+            table_name: Tracked table name (e.g., 'macro_indicators')
+
+        Returns:
+            int: Current version, 0 if the table is not tracked
+
+        Raises:
+            sqlite3.Error: If database query fails
+        """
+        try:
+            with self.db_connection.get_connection() as conn:
+                row = conn.execute(
+                    "SELECT version FROM table_versions WHERE table_name = ?", (table_name,)
+                ).fetchone()
+                return int(row[0]) if row else 0
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to get version of {table_name}: {e}")
+            raise
+
+    def get_tracked_assets(self) -> List[str]:
+        """
+        Get every cryptocurrency that has OHLCV data.
+        Reads the crypto_assets table maintained on insert instead of scanning crypto_ohlcv.
+
+        Returns:
+            List[str]: Cryptocurrency names in alphabetical order
+
+        Raises:
+            sqlite3.Error: If database query fails
+        """
+        try:
+            with self.db_connection.get_connection() as conn:
+                rows = conn.execute("SELECT cryptocurrency FROM crypto_assets ORDER BY cryptocurrency").fetchall()
+                return [row[0] for row in rows]
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to get tracked assets: {e}")
+            raise
+
+    def get_series_stats(self, source: Optional[str] = None) -> List[Dict]:
+        """
+        Get the per-series statistics maintained in series_stats.
+        Each row holds row_count, min/max timestamp (crypto only), first/latest date and
+        last_ingest for one cryptocurrency or macro indicator.
+
+        Args:
+            source: 'crypto' or 'macro' to restrict the result, None for both
+
+        Returns:
+            List[Dict]: One dict per series ordered by source and series name
+
+        Raises:
+            sqlite3.Error: If database query fails
+        """
+        query_sql = """
+            SELECT source, series, row_count, min_timestamp, max_timestamp,
+                   first_date, latest_date, last_ingest
+            FROM series_stats
+        """
+        params: Tuple = ()
+        if source is not None:
+            query_sql += " WHERE source = ?"
+            params = (source,)
+        query_sql += " ORDER BY source, series"
+
+        try:
+            with self.db_connection.get_connection() as conn:
+                cursor = conn.execute(query_sql, params)
+                columns = [column[0] for column in cursor.description]
+                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to get series stats: {e}")
+            raise
+
+    def rebuild_series_stats(self) -> Dict[str, int]:
+        """
+        Recompute series_stats from crypto_ohlcv and macro_indicators in one transaction.
+        The triggers keep the table current on insert and delete; this repairs drift from
+        direct updates or data written while the triggers did not exist.
+
+        Returns:
+            Dict[str, int]: 'series' rebuilt and 'corrected' series whose stats had drifted
+
+        Raises:
+            sqlite3.Error: If database operation fails
+        """
+        stats_columns = "source, series, row_count, min_timestamp, max_timestamp, first_date, latest_date"
+
+        try:
+            with self.db_connection.get_connection() as conn:
+                before = set(conn.execute(f"SELECT {stats_columns} FROM series_stats").fetchall())
+
+                conn.execute("DELETE FROM series_stats")
+                conn.execute("""
+                    INSERT INTO series_stats
+                        (source, series, row_count, min_timestamp, max_timestamp, first_date, latest_date, last_ingest)
+                    SELECT 'crypto', cryptocurrency, COUNT(*), MIN(timestamp), MAX(timestamp),
+                           MIN(date_str), MAX(date_str), MAX(created_at)
+                    FROM crypto_ohlcv
+                    GROUP BY cryptocurrency
+                """)
+                conn.execute("""
+                    INSERT INTO series_stats
+                        (source, series, row_count, min_timestamp, max_timestamp, first_date, latest_date, last_ingest)
+                    SELECT 'macro', indicator, COUNT(*), NULL, NULL, MIN(date), MAX(date), MAX(created_at)
+                    FROM macro_indicators
+                    GROUP BY indicator
+                """)
+                after = set(conn.execute(f"SELECT {stats_columns} FROM series_stats").fetchall())
+                conn.commit()
+
+            # Series added, removed or changed by the rebuild
+            corrected = len({row[:2] for row in before ^ after})
+            self.logger.info(f"Rebuilt series stats for {len(after)} series ({corrected} corrected)")
+            return {'series': len(after), 'corrected': corrected}
+
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to rebuild series stats: {e}")
+            raise
+
     def query_to_dataframe(self, sql: str, params: Tuple = ()) -> pd.DataFrame:
         """
         Execute a SQL query and return the results as a pandas DataFrame.
@@ -345,11 +464,13 @@ class CryptoDatabase:
     def get_health_status(self) -> Dict:
         """
         Get database health status and metrics for operational visibility.
+        Reads the series_stats table, so the cost grows with the number of series
+        rather than the number of rows.
         
         Returns:
             Dict: Health status containing crypto_data and macro_data arrays
-                 with latest_date, total_records for each symbol/indicator,
-                 plus database_path and database_size_mb
+                 with latest_date, first_date, total_records and last_ingest for each
+                 symbol/indicator, plus database_path and database_size_mb
         """
         import os
         
@@ -366,47 +487,22 @@ class CryptoDatabase:
                 size_bytes = os.path.getsize(self.db_path)
                 health_status['database_size_mb'] = round(size_bytes / (1024 * 1024), 2)
             
-            with self.db_connection.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Get crypto data health status
-                crypto_query = """
-                    SELECT 
-                        cryptocurrency,
-                        COUNT(*) as total_records,
-                        MAX(date_str) as latest_date
-                    FROM crypto_ohlcv 
-                    GROUP BY cryptocurrency
-                    ORDER BY cryptocurrency
-                """
-                cursor.execute(crypto_query)
-                crypto_results = cursor.fetchall()
-                
-                for row in crypto_results:
+            for stats in self.get_series_stats():
+                if stats['source'] == 'crypto':
                     health_status['crypto_data'].append({
-                        'symbol': row[0],
-                        'total_records': row[1],
-                        'latest_date': row[2]
+                        'symbol': stats['series'],
+                        'total_records': stats['row_count'],
+                        'latest_date': stats['latest_date'],
+                        'first_date': stats['first_date'],
+                        'last_ingest': stats['last_ingest']
                     })
-                
-                # Get macro data health status  
-                macro_query = """
-                    SELECT 
-                        indicator,
-                        COUNT(*) as total_records,
-                        MAX(date) as latest_date
-                    FROM macro_indicators 
-                    GROUP BY indicator
-                    ORDER BY indicator
-                """
-                cursor.execute(macro_query)
-                macro_results = cursor.fetchall()
-                
-                for row in macro_results:
+                else:
                     health_status['macro_data'].append({
-                        'indicator': row[0],
-                        'total_records': row[1],
-                        'latest_date': row[2]
+                        'indicator': stats['series'],
+                        'total_records': stats['row_count'],
+                        'latest_date': stats['latest_date'],
+                        'first_date': stats['first_date'],
+                        'last_ingest': stats['last_ingest']
                     })
             
             self.logger.debug(f"Health status retrieved: {len(health_status['crypto_data'])} cryptos, {len(health_status['macro_data'])} indicators")
@@ -503,6 +599,60 @@ class CryptoDatabase:
             self.logger.error(f"Failed to get combined analysis data for {cryptocurrency}: {e}")
             raise
 
+    def get_macro_window(self, indicators: List[str], days: int) -> pd.DataFrame:
+        """
+        Get the trailing observations of several macro indicators with a single query.
+
+        Each indicator's window is anchored at its own latest non-null observation and reaches
+        back to the last observation on or before `days` days earlier, so an as-of lookup at any
+        date inside the window matches a per-date "on or before" query. Every step is answered
+        from the (indicator, date) unique index.
+
+        Args:
+            indicators: Indicator names (e.g., ['VIXCLS', 'DGS10'])
+            days: Calendar days of history behind each indicator's latest observation
+
+        Returns:
+            pd.DataFrame: Values pivoted to one column per indicator with a sorted DatetimeIndex
+                         of dates (NaN where an indicator has no observation on a date)
+
+        Raises:
+            sqlite3.Error: If database query fails
+        """
+        if not indicators:
+            return pd.DataFrame(index=pd.DatetimeIndex([], name='date'))
+
+        placeholders = ", ".join("?" * len(indicators))
+        query_sql = f"""
+            WITH latest AS (
+                SELECT indicator, MAX(date) AS latest_date
+                FROM macro_indicators
+                WHERE indicator IN ({placeholders}) AND value IS NOT NULL
+                GROUP BY indicator
+            ),
+            bounds AS (
+                SELECT indicator, COALESCE(
+                    (SELECT MAX(m.date) FROM macro_indicators m
+                     WHERE m.indicator = latest.indicator AND m.value IS NOT NULL
+                       AND m.date <= DATE(latest.latest_date, ?)),
+                    DATE(latest.latest_date, ?)
+                ) AS start_date
+                FROM latest
+            )
+            SELECT m.indicator, m.date, m.value
+            FROM macro_indicators m
+            JOIN bounds b ON m.indicator = b.indicator
+            WHERE m.date >= b.start_date AND m.value IS NOT NULL
+        """
+        offset = f"-{int(days)} days"
+        df = self.query_to_dataframe(query_sql, (*indicators, offset, offset))
+
+        if df.empty:
+            return pd.DataFrame(index=pd.DatetimeIndex([], name='date'))
+
+        df['date'] = pd.to_datetime(df['date'])
+        return df.pivot(index='date', columns='indicator', values='value').sort_index().astype(float)
+
     def get_strategy_market_data(self, assets: List[str], days: int = 60) -> Dict[str, pd.DataFrame]:
         """
         Get comprehensive market data for strategy analysis across multiple assets.
@@ -563,7 +713,7 @@ class CryptoDatabase:
             
             if not vix_df.empty:
                 # Add VIX analysis columns
-                vix_df['vix_percentile'] = vix_df['vix_value'].rolling(window=min(30, len(vix_df))).rank(pct=True) * 100
+                vix_df['vix_percentile'] = rolling_percentile_rank(vix_df['vix_value'], min(30, len(vix_df))) * 100
                 vix_df['vix_ma_10'] = vix_df['vix_value'].rolling(window=10, min_periods=1).mean()
                 vix_df['vix_ma_20'] = vix_df['vix_value'].rolling(window=20, min_periods=1).mean()
                 vix_df['vix_spike'] = vix_df['vix_value'] > 25  # Common spike threshold
@@ -691,9 +841,10 @@ class CryptoDatabase:
         df['recovery_from_30d_low'] = (df['close'] - df['rolling_low_30d']) / df['rolling_low_30d']
         
         # Calculate moving averages
-        df['ma_7'] = df['close'].rolling(window=7, min_periods=1).mean()
-        df['ma_14'] = df['close'].rolling(window=14, min_periods=1).mean()
-        df['ma_30'] = df['close'].rolling(window=30, min_periods=1).mean()
+        indicators = get_indicator_engine()
+        df['ma_7'] = indicators.sma(df['close'], 7, min_periods=1)
+        df['ma_14'] = indicators.sma(df['close'], 14, min_periods=1)
+        df['ma_30'] = indicators.sma(df['close'], 30, min_periods=1)
         
         # Calculate volatility (rolling standard deviation of returns)
         df['volatility_7d'] = df['daily_return'].rolling(window=7, min_periods=1).std()
@@ -727,20 +878,7 @@ class CryptoDatabase:
         if len(price_series) < period + 1:
             return pd.Series([50.0] * len(price_series), index=price_series.index)
         
-        # Calculate price changes
-        delta = price_series.diff()
-        
-        # Separate gains and losses
-        gains = delta.where(delta > 0, 0)
-        losses = -delta.where(delta < 0, 0)
-        
-        # Calculate average gains and losses
-        avg_gains = gains.rolling(window=period, min_periods=1).mean()
-        avg_losses = losses.rolling(window=period, min_periods=1).mean()
-        
-        # Calculate RSI
-        rs = avg_gains / avg_losses
-        rsi = 100 - (100 / (1 + rs))
+        rsi = get_indicator_engine().rsi(price_series, period, min_periods=1)
         
         # Handle division by zero
         rsi = rsi.fillna(50.0)
@@ -849,7 +987,7 @@ class CryptoDatabase:
             
             if not vix_df.empty:
                 # Add VIX analysis columns
-                vix_df['vix_percentile'] = vix_df['vix_value'].rolling(window=min(30, len(vix_df))).rank(pct=True) * 100
+                vix_df['vix_percentile'] = rolling_percentile_rank(vix_df['vix_value'], min(30, len(vix_df))) * 100
                 vix_df['vix_ma_10'] = vix_df['vix_value'].rolling(window=10, min_periods=1).mean()
                 vix_df['vix_ma_20'] = vix_df['vix_value'].rolling(window=20, min_periods=1).mean()
                 vix_df['vix_spike'] = vix_df['vix_value'] > 25  # Common spike threshold
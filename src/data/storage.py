@@ -1,16 +1,25 @@
 import csv
 import os
 from datetime import datetime
-from typing import List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 from .models import OHLCVData
 from .macro_models import MacroIndicatorRecord
+from .columnar_archive import ColumnarArchive
 
 
 class CSVStorage:
     """CSV storage handler for OHLCV data."""
     
-    def __init__(self, data_dir: str = "data/raw"):
+    def __init__(self, data_dir: str = "data/raw", archive: Optional[ColumnarArchive] = None):
+        """
+        Args:
+            data_dir: Directory for the per-year CSV files
+            archive: Optional columnar archive that every saved OHLCV batch is also written to
+        """
         self.data_dir = data_dir
+        self.archive = archive
+        # filepath -> ((size, mtime_ns) after our last write, timestamps in the file)
+        self._timestamp_cache: Dict[str, Tuple[Tuple[int, int], Set[int]]] = {}
         # Ensure data directory exists
         os.makedirs(self.data_dir, exist_ok=True)
     
@@ -25,13 +34,16 @@ class CSVStorage:
         if not ohlcv_data:
             return
         
+        if self.archive is not None:
+            self.archive.write(crypto_id, ohlcv_data)
+        
         # Get current year for filename
         current_year = datetime.now().year
         filename = f"{crypto_id}_{current_year}.csv"
         filepath = os.path.join(self.data_dir, filename)
         
         # Get existing timestamps to check for duplicates
-        existing_timestamps = self._get_existing_timestamps(filepath)
+        existing_timestamps = self._cached_timestamps(filepath)
         
         # Filter out duplicates
         new_data = [data for data in ohlcv_data if not self._record_exists(data.timestamp, existing_timestamps)]
@@ -60,6 +72,24 @@ class CSVStorage:
                     data.close,
                     data.volume
                 ])
+        
+        existing_timestamps.update(data.timestamp for data in new_data)
+        self._timestamp_cache[filepath] = (self._file_signature(filepath), existing_timestamps)
+    
+    @staticmethod
+    def _file_signature(filepath: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+    
+    def _cached_timestamps(self, filepath: str) -> Set[int]:
+        """Existing timestamps of filepath, reread only if the file changed since our last write."""
+        cached = self._timestamp_cache.get(filepath)
+        if cached is not None and cached[0] == self._file_signature(filepath):
+            return cached[1]
+        return self._get_existing_timestamps(filepath)
     
     def _record_exists(self, timestamp: int, existing_timestamps: Set[int]) -> bool:
         """Check if a record with the given timestamp already exists."""
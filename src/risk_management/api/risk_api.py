@@ -44,6 +44,27 @@ def parse_signal_type(signal_type_str):
         valid_types = [e.value for e in SignalType]
         raise ValueError(f"Invalid signal_type: {signal_type_str}. Valid types: {valid_types}")
 
+def parse_signal(signal_data):
+    """Build a TradingSignal from request JSON with validation."""
+    return TradingSignal(
+        signal_id=signal_data.get('signal_id', 'unknown'),
+        asset=signal_data.get('asset', 'unknown'),
+        signal_type=parse_signal_type(signal_data.get('signal_type')),
+        price=safe_float(signal_data.get('price'), 'price'),
+        confidence=safe_float(signal_data.get('confidence', 0.5), 'confidence'),
+        timestamp=parse_timestamp(signal_data.get('timestamp'))
+    )
+
+def parse_portfolio_state(portfolio_data):
+    """Build a PortfolioState from request JSON with validation."""
+    return PortfolioState(
+        total_equity=safe_float(portfolio_data.get('total_equity'), 'total_equity'),
+        current_drawdown=safe_float(portfolio_data.get('current_drawdown'), 'current_drawdown'),
+        daily_pnl=safe_float(portfolio_data.get('daily_pnl'), 'daily_pnl'),
+        positions=portfolio_data.get('positions', {}),
+        cash=safe_float(portfolio_data.get('cash'), 'cash')
+    )
+
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -102,79 +123,18 @@ def assess_risk():
                 'status': 'error'
             }), 400
         
-        # Parse signal data with validation
-        signal_data = data['signal']
-        signal = TradingSignal(
-            signal_id=signal_data.get('signal_id', 'unknown'),
-            asset=signal_data.get('asset', 'unknown'),
-            signal_type=parse_signal_type(signal_data.get('signal_type')),
-            price=safe_float(signal_data.get('price'), 'price'),
-            confidence=safe_float(signal_data.get('confidence', 0.5), 'confidence'),
-            timestamp=parse_timestamp(signal_data.get('timestamp'))
-        )
-        
-        # Parse portfolio state data with validation
-        portfolio_data = data['portfolio_state']
-        portfolio_state = PortfolioState(
-            total_equity=safe_float(portfolio_data.get('total_equity'), 'total_equity'),
-            current_drawdown=safe_float(portfolio_data.get('current_drawdown'), 'current_drawdown'),
-            daily_pnl=safe_float(portfolio_data.get('daily_pnl'), 'daily_pnl'),
-            positions=portfolio_data.get('positions', {}),
-            cash=safe_float(portfolio_data.get('cash'), 'cash')
-        )
+        # Parse signal and portfolio state data with validation
+        signal = parse_signal(data['signal'])
+        portfolio_state = parse_portfolio_state(data['portfolio_state'])
         
         # Perform risk assessment
         assessment = risk_orchestrator.assess_trade_risk(signal, portfolio_state)
         
-        # Convert assessment to JSON-serializable format
-        assessment_dict = {
-            'signal_id': assessment.signal_id,
-            'asset': assessment.asset,
-            'signal_type': assessment.signal_type.value if hasattr(assessment.signal_type, 'value') else str(assessment.signal_type),
-            'signal_price': assessment.signal_price,
-            'signal_confidence': assessment.signal_confidence,
-            'timestamp': assessment.timestamp.isoformat() if assessment.timestamp else None,
-            
-            # Position sizing
-            'recommended_position_size': assessment.recommended_position_size,
-            'position_size_method': assessment.position_size_method,
-            
-            # Risk management
-            'stop_loss_price': assessment.stop_loss_price,
-            'take_profit_price': assessment.take_profit_price,
-            
-            # Risk metrics
-            'risk_reward_ratio': assessment.risk_reward_ratio,
-            'position_risk_percent': assessment.position_risk_percent,
-            'portfolio_heat': assessment.portfolio_heat,
-            'risk_level': assessment.risk_level.value if hasattr(assessment.risk_level, 'value') else str(assessment.risk_level),
-            
-            # Validation results
-            'is_approved': assessment.is_approved,
-            'rejection_reason': assessment.rejection_reason,
-            'risk_warnings': assessment.risk_warnings or [],
-            
-            # Market conditions
-            'market_volatility': assessment.market_volatility,
-            'correlation_risk': assessment.correlation_risk,
-            
-            # Portfolio impact
-            'portfolio_impact': assessment.portfolio_impact or {},
-            'current_drawdown': assessment.current_drawdown,
-            'daily_pnl_impact': assessment.daily_pnl_impact,
-            
-            # Configuration used
-            'risk_config_snapshot': assessment.risk_config_snapshot or {},
-            
-            # Processing metadata
-            'processing_time_ms': assessment.processing_time_ms
-        }
-        
         logger.info(f"Risk assessment completed for {signal.asset} {signal.signal_type}")
         
         return jsonify({
             'status': 'success',
-            'assessment': assessment_dict
+            'assessment': assessment_to_dict(assessment)
         }), 200
         
     except ValueError as e:
@@ -192,6 +152,115 @@ def assess_risk():
         }), 500
 
 
+@app.route('/assess-risk/batch', methods=['POST'])
+def assess_risk_batch():
+    """
+    Assess risk for a list of trading signals against one portfolio snapshot.
+    
+    Signals are assessed in order and each approval books its stop-loss risk against the
+    snapshot, so later signals see the exposure of earlier approvals.
+    
+    Expected JSON payload:
+    {
+        "signals": [{"signal_id": "a", "asset": "BTC", "signal_type": "LONG", "price": 50000.0, ...}, ...],
+        "portfolio_state": {"total_equity": 10000.0, "current_drawdown": 0.05, "daily_pnl": 100.0}
+    }
+    """
+    try:
+        if not request.is_json:
+            return jsonify({
+                'error': 'Request must be JSON',
+                'status': 'error'
+            }), 400
+        
+        data = request.get_json()
+        
+        if not isinstance(data.get('signals'), list):
+            return jsonify({
+                'error': 'Missing signals list',
+                'status': 'error'
+            }), 400
+        
+        if 'portfolio_state' not in data:
+            return jsonify({
+                'error': 'Missing portfolio state data',
+                'status': 'error'
+            }), 400
+        
+        signals = [parse_signal(signal_data) for signal_data in data['signals']]
+        portfolio_state = parse_portfolio_state(data['portfolio_state'])
+        
+        assessments = risk_orchestrator.assess_trade_risk_batch(signals, portfolio_state)
+        
+        logger.info(f"Batch risk assessment completed for {len(signals)} signals")
+        
+        return jsonify({
+            'status': 'success',
+            'approved': sum(assessment.is_approved for assessment in assessments),
+            'assessments': [assessment_to_dict(assessment) for assessment in assessments]
+        }), 200
+        
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        return jsonify({
+            'error': f'Validation error: {str(e)}',
+            'status': 'error'
+        }), 400
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in batch risk assessment: {e}")
+        return jsonify({
+            'error': 'Internal server error',
+            'status': 'error'
+        }), 500
+
+
+def assessment_to_dict(assessment) -> Dict[str, Any]:
+    """Convert a risk assessment to a JSON-serializable dict."""
+    return {
+        'signal_id': assessment.signal_id,
+        'asset': assessment.asset,
+        'signal_type': assessment.signal_type.value if hasattr(assessment.signal_type, 'value') else str(assessment.signal_type),
+        'signal_price': assessment.signal_price,
+        'signal_confidence': assessment.signal_confidence,
+        'timestamp': assessment.timestamp.isoformat() if assessment.timestamp else None,
+        
+        # Position sizing
+        'recommended_position_size': assessment.recommended_position_size,
+        'position_size_method': assessment.position_size_method,
+        
+        # Risk management
+        'stop_loss_price': assessment.stop_loss_price,
+        'take_profit_price': assessment.take_profit_price,
+        
+        # Risk metrics
+        'risk_reward_ratio': assessment.risk_reward_ratio,
+        'position_risk_percent': assessment.position_risk_percent,
+        'portfolio_heat': assessment.portfolio_heat,
+        'risk_level': assessment.risk_level.value if hasattr(assessment.risk_level, 'value') else str(assessment.risk_level),
+        
+        # Validation results
+        'is_approved': assessment.is_approved,
+        'rejection_reason': assessment.rejection_reason,
+        'risk_warnings': assessment.risk_warnings or [],
+        
+        # Market conditions
+        'market_volatility': assessment.market_volatility,
+        'correlation_risk': assessment.correlation_risk,
+        
+        # Portfolio impact
+        'portfolio_impact': assessment.portfolio_impact or {},
+        'current_drawdown': assessment.current_drawdown,
+        'daily_pnl_impact': assessment.daily_pnl_impact,
+        
+        # Configuration used
+        'risk_config_snapshot': assessment.risk_config_snapshot or {},
+        
+        # Processing metadata
+        'processing_time_ms': assessment.processing_time_ms
+    }
+
+
 @app.route('/config', methods=['GET'])
 def get_config():
     """Get current risk management configuration."""
@@ -4,6 +4,9 @@ Basic position size calculator.
 
 import logging
 from typing import Optional
+
+import numpy as np
+
 from ..models.risk_models import TradingSignal, PortfolioState
 
 logger = logging.getLogger(__name__)
@@ -160,6 +163,27 @@ class PositionCalculator:
         
         return position_size
     
+    def calculate_position_sizes(self, account_equity: float, confidences: np.ndarray) -> np.ndarray:
+        """
+        Position sizes for many signals against one account, as calculate_position_size
+        computes them one at a time.
+        
+        Args:
+            account_equity: Total account equity in USD
+            confidences: Signal confidences (0.0 to 1.0)
+            
+        Returns:
+            Position sizes in USD, 0.0 where below the minimum or if equity is not positive
+        """
+        confidences = np.asarray(confidences, dtype=float)
+        if account_equity <= 0:
+            return np.zeros_like(confidences)
+        
+        base_position_size = account_equity * self.base_position_percent
+        position_sizes = np.minimum(base_position_size * confidences, account_equity * self.max_position_percent)
+        position_sizes[position_sizes < self.min_position_usd] = 0.0
+        return position_sizes
+    
     def get_max_position_size(self, account_equity: float) -> float:
         """Get maximum allowed position size for given equity."""
         if account_equity <= 0:
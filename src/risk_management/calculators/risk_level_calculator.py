@@ -5,6 +5,9 @@ Risk level calculation components.
 import logging
 import math
 from typing import Dict, Any, List
+
+import numpy as np
+
 from ..models.risk_models import RiskLevel, RiskAssessment
 
 logger = logging.getLogger(__name__)
@@ -234,6 +237,65 @@ class RiskLevelCalculator:
             logger.error(f"Error getting risk factors: {e}")
             return ["Error calculating risk factors"]
     
+    def calculate_risk_levels(self, position_risk: np.ndarray, portfolio_heat: np.ndarray,
+                              current_drawdown: np.ndarray, market_volatility: np.ndarray,
+                              correlation_risk: np.ndarray) -> List[RiskLevel]:
+        """
+        Risk levels for many assessments from arrays of their metrics.
+        
+        Matches calculate_risk_level for finite metrics: each metric is clipped to [0, 1],
+        weighted as in _calculate_composite_risk_score and bucketed by the same thresholds.
+        
+        Returns:
+            Risk level per assessment; HIGH where any metric is not finite
+        """
+        metrics = [np.asarray(m, dtype=float) for m in
+                   (position_risk, portfolio_heat, current_drawdown, market_volatility, correlation_risk)]
+        finite = np.logical_and.reduce([np.isfinite(m) for m in metrics])
+        position_risk, portfolio_heat, drawdown_risk, volatility_risk, correlation_risk = (
+            np.clip(np.nan_to_num(m), 0.0, 1.0) for m in metrics
+        )
+        
+        composite_score = (
+            position_risk * 0.30 +
+            portfolio_heat * 0.25 +
+            drawdown_risk * 0.25 +
+            volatility_risk * 0.10 +
+            correlation_risk * 0.10
+        )
+        composite_score = np.clip(composite_score, 0.0, 1.0)
+        
+        levels = np.select(
+            [~finite, composite_score <= self.low_risk_threshold,
+             composite_score <= self.medium_risk_threshold, composite_score <= self.high_risk_threshold],
+            [RiskLevel.HIGH, RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH],
+            default=RiskLevel.CRITICAL
+        )
+        return levels.tolist()
+    
+    def get_risk_factors_batch(self, position_risk: np.ndarray, portfolio_heat: np.ndarray,
+                               current_drawdown: np.ndarray, market_volatility: np.ndarray,
+                               correlation_risk: np.ndarray, risk_reward_ratio: np.ndarray) -> List[List[str]]:
+        """
+        get_risk_factors for many assessments from arrays of their metrics.
+        
+        Returns:
+            Risk factor descriptions per assessment, in get_risk_factors order
+        """
+        rules = [
+            (np.asarray(position_risk) > 0.05, position_risk, "High position risk: {:.1%}"),
+            (np.asarray(portfolio_heat) > 0.10, portfolio_heat, "High portfolio heat: {:.1%}"),
+            (np.asarray(current_drawdown) > 0.10, current_drawdown, "High drawdown: {:.1%}"),
+            (np.asarray(market_volatility) > 0.05, market_volatility, "High volatility: {:.1%}"),
+            (np.asarray(correlation_risk) > 0.70, correlation_risk, "High correlation risk: {:.1%}"),
+            (np.asarray(risk_reward_ratio) < 1.5, risk_reward_ratio, "Poor risk/reward ratio: {:.2f}"),
+        ]
+        risk_factors = [[] for _ in range(len(risk_reward_ratio))]
+        for mask, values, template in rules:
+            for i in np.flatnonzero(mask):
+                risk_factors[i].append(template.format(float(values[i])))
+        return risk_factors
+    
     def _validate_and_normalize_metric(self, value: Any, metric_name: str, default: float = 0.0) -> float:
         """
         Validate and normalize a risk metric value.
@@ -4,9 +4,14 @@ Main risk management coordinator.
 
 import json
 import logging
+import math
 import time
-from typing import Dict, Any, Optional, Union
+from dataclasses import replace
+from typing import Dict, Any, List, Optional, Sequence, Union
 from pathlib import Path
+
+import numpy as np
+
 from ..calculators.position_calculator import PositionCalculator
 from ..calculators.risk_level_calculator import RiskLevelCalculator
 from ..models.risk_models import RiskAssessment, TradingSignal, PortfolioState
@@ -595,6 +600,180 @@ class RiskOrchestrator:
             # Return comprehensive error assessment
             return create_error_assessment(signal, portfolio_state, e, ErrorType.SYSTEM_ERROR)
     
+    def assess_trade_risk_batch(self, signals: Sequence['TradingSignal'],
+                                portfolio_state: 'PortfolioState') -> List['RiskAssessment']:
+        """
+        Assess a burst of signals against one portfolio snapshot.
+        
+        Signals are assessed in order with sequential exposure accounting: each approved
+        signal books its stop-loss amount (position size x per-trade stop loss) against the
+        snapshot's drawdown and daily P&L before the next signal is validated, so later
+        signals are checked against the risk budget left by earlier approvals. Assessment i
+        is therefore what assess_trade_risk returns for signals[i] and the snapshot with
+        approvals 0..i-1 booked (processing_time_ms is the batch time split evenly).
+        
+        Position sizes, stop/target levels, risk/reward ratios and risk levels are computed
+        as arrays over the batch. Signals outside that fast path (invalid inputs, unknown
+        signal types, or an unusable portfolio snapshot) go through assess_trade_risk one by
+        one, still in sequence.
+        
+        Args:
+            signals: Trading signals to assess, in priority order
+            portfolio_state: Portfolio snapshot shared by the batch
+            
+        Returns:
+            One risk assessment per signal, in input order
+        """
+        start_time = time.time()
+        signals = list(signals)
+        if not signals:
+            return []
+        
+        if self._is_batchable_portfolio(portfolio_state):
+            batch_index = [i for i, signal in enumerate(signals) if self._is_batchable_signal(signal)]
+        else:
+            batch_index = []
+        batch = [signals[i] for i in batch_index]
+        
+        levels = {}
+        if batch:
+            total_equity = portfolio_state.total_equity
+            price = np.array([signal.price for signal in batch], dtype=float)
+            is_long = np.array([str(signal.signal_type.value).upper() == 'LONG' for signal in batch])
+            take_profit = np.array([np.nan if signal.take_profit_price is None else signal.take_profit_price
+                                    for signal in batch], dtype=float)
+            
+            position_sizes = PositionCalculator().calculate_position_sizes(
+                total_equity, np.array([signal.confidence for signal in batch], dtype=float)
+            )
+            stop_loss, risk_reward, take_profit = self._calculate_levels_batch(price, is_long, take_profit, position_sizes)
+            position_risk = position_sizes / total_equity
+            
+            levels = dict(zip(batch_index, zip(
+                position_sizes.tolist(), stop_loss.tolist(), take_profit.tolist(),
+                risk_reward.tolist(), position_risk.tolist()
+            )))
+        
+        # Sequential pass: validate against the running snapshot and book each approval
+        per_trade_stop_loss = self.trade_validator.per_trade_stop_loss
+        current_drawdown = getattr(portfolio_state, 'current_drawdown', 0.0)
+        daily_pnl = getattr(portfolio_state, 'daily_pnl', 0.0)
+        assessments: List[Optional[RiskAssessment]] = [None] * len(signals)
+        validations, drawdowns = {}, {}
+        approvals_booked = False
+        
+        for i, signal in enumerate(signals):
+            if i in levels:
+                position_size = levels[i][0]
+                validation = self.trade_validator.validate_position(
+                    position_size, portfolio_state.total_equity, current_drawdown, daily_pnl
+                )
+                validations[i], drawdowns[i] = validation, current_drawdown
+                approved_size = position_size if validation.is_valid else 0.0
+            else:
+                snapshot = portfolio_state
+                if approvals_booked:
+                    snapshot = replace(portfolio_state, current_drawdown=current_drawdown, daily_pnl=daily_pnl)
+                assessments[i] = self.assess_trade_risk(signal, snapshot)
+                approved_size = assessments[i].recommended_position_size if assessments[i].is_approved else 0.0
+            
+            if approved_size > 0:
+                approvals_booked = True
+                potential_loss = approved_size * per_trade_stop_loss
+                current_drawdown += potential_loss / portfolio_state.total_equity
+                daily_pnl -= potential_loss
+        
+        if batch:
+            processing_time_ms = (time.time() - start_time) * 1000 / len(signals)
+            for i in batch_index:
+                position_size, stop_loss_price, take_profit_price, risk_reward_ratio, position_risk_percent = levels[i]
+                snapshot = replace(portfolio_state, current_drawdown=drawdowns[i])
+                assessments[i] = self._create_assessment_safely(
+                    signals[i], snapshot, position_size, stop_loss_price, take_profit_price,
+                    risk_reward_ratio, position_risk_percent, position_risk_percent,
+                    validations[i], processing_time_ms
+                )
+            
+            metrics = [np.array([getattr(assessments[i], attr) for i in batch_index], dtype=float) for attr in
+                       ('position_risk_percent', 'portfolio_heat', 'current_drawdown', 'market_volatility',
+                        'correlation_risk')]
+            risk_levels = self.risk_level_calculator.calculate_risk_levels(*metrics)
+            risk_factors = self.risk_level_calculator.get_risk_factors_batch(
+                *metrics, np.array([assessments[i].risk_reward_ratio for i in batch_index])
+            )
+            for i, risk_level, factors in zip(batch_index, risk_levels, risk_factors):
+                assessments[i].risk_level = risk_level
+                assessments[i].risk_warnings.extend(factors)
+        
+        approved = sum(assessment.is_approved for assessment in assessments)
+        logger.info(f"Batch risk assessment: {approved}/{len(signals)} approved "
+                    f"({len(batch)} vectorized) in {(time.time() - start_time) * 1000:.2f}ms")
+        return assessments
+    
+    def _calculate_levels_batch(self, price: np.ndarray, is_long: np.ndarray, take_profit: np.ndarray,
+                                position_sizes: np.ndarray):
+        """
+        Stop loss, risk/reward and take profit arrays, with the same formulas and fallbacks
+        as the single-signal _calculate_*_safely methods.
+        
+        Args:
+            price: Signal prices (positive)
+            is_long: True for LONG, False for SHORT signals
+            take_profit: Signal take profit prices, NaN where not given
+            position_sizes: Position sizes in USD
+            
+        Returns:
+            Tuple of (stop_loss, risk_reward_ratio, take_profit) arrays
+        """
+        sized = position_sizes > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Loss budget per unit: (position x stop loss %) / units held
+            stop_distance = (position_sizes * self.per_trade_stop_loss) / (position_sizes / price)
+            stop_loss = np.where(is_long, price - stop_distance, price + stop_distance)
+            stop_loss = np.where(stop_loss < 0, 0.01, stop_loss)
+            # Unsized positions fall back to a fixed 2% stop
+            stop_loss = np.where(sized, stop_loss, np.where(is_long, price * 0.98, price * 1.02))
+            
+            risk_per_unit = np.where(is_long, price - stop_loss, stop_loss - price)
+            has_target = take_profit > 0  # False for NaN
+            reward_per_unit = np.where(has_target, np.where(is_long, take_profit - price, price - take_profit),
+                                       risk_per_unit * 2)
+            valid = (stop_loss > 0) & (risk_per_unit > 0) & (reward_per_unit > 0)
+            risk_reward = np.where(valid, reward_per_unit / risk_per_unit, self.default_risk_reward_ratio)
+        
+        take_profit = np.where(
+            np.isnan(take_profit),
+            np.where(is_long, price + (price - stop_loss) * risk_reward, price - (stop_loss - price) * risk_reward),
+            take_profit
+        )
+        return stop_loss, risk_reward, take_profit
+    
+    @staticmethod
+    def _is_batchable_portfolio(portfolio_state: 'PortfolioState') -> bool:
+        """Whether the snapshot passes input validation with positive equity and finite limits inputs."""
+        try:
+            return (isinstance(portfolio_state.total_equity, float) and math.isfinite(portfolio_state.total_equity)
+                    and portfolio_state.total_equity > 0
+                    and all(isinstance(getattr(portfolio_state, attr), (int, float))
+                            and math.isfinite(getattr(portfolio_state, attr))
+                            for attr in ('current_drawdown', 'daily_pnl')))
+        except AttributeError:
+            return False
+    
+    @staticmethod
+    def _is_batchable_signal(signal: 'TradingSignal') -> bool:
+        """Whether a signal passes input validation with a positive price and a LONG/SHORT type."""
+        try:
+            take_profit = getattr(signal, 'take_profit_price', None)
+            return (all(hasattr(signal, attr) for attr in ('signal_id', 'asset', 'timestamp'))
+                    and isinstance(signal.price, float) and math.isfinite(signal.price) and signal.price > 0
+                    and isinstance(signal.confidence, float) and 0.0 <= signal.confidence <= 1.0
+                    and str(signal.signal_type.value).upper() in ('LONG', 'SHORT')
+                    and (take_profit is None or (isinstance(take_profit, (int, float))
+                                                 and math.isfinite(take_profit))))
+        except AttributeError:
+            return False
+    
     def _validate_assessment_inputs(self, signal: 'TradingSignal', portfolio_state: 'PortfolioState') -> None:
         """Validate assessment inputs with comprehensive error handling."""
         try:
@@ -112,34 +112,7 @@ class TradeValidator:
             if portfolio_state.total_equity <= 0:
                 return ValidationResult(False, f"Invalid portfolio equity: {portfolio_state.total_equity}")
             
-            # Calculate potential loss as percentage of equity
-            potential_loss_amount = position_size * self.per_trade_stop_loss
-            potential_loss_pct = potential_loss_amount / portfolio_state.total_equity
-            
-            # Calculate potential new drawdown (both as percentages)
-            current_drawdown = portfolio_state.current_drawdown
-            potential_new_drawdown = current_drawdown + potential_loss_pct
-            
-            # Check if this would exceed the limit
-            if potential_new_drawdown > self.max_drawdown_limit:
-                rejection_reason = (
-                    f"Trade would exceed maximum drawdown limit. "
-                    f"Current: {current_drawdown:.1%}, "
-                    f"Potential: {potential_new_drawdown:.1%}, "
-                    f"Limit: {self.max_drawdown_limit:.1%}"
-                )
-                return ValidationResult(False, rejection_reason)
-            
-            # Check if approaching the limit (warning)
-            warning_threshold = self.max_drawdown_limit * 0.8  # 80% of limit
-            if potential_new_drawdown > warning_threshold:
-                warnings = [
-                    f"Approaching drawdown limit: {potential_new_drawdown:.1%} "
-                    f"(limit: {self.max_drawdown_limit:.1%})"
-                ]
-                return ValidationResult(True, warnings=warnings)
-            
-            return ValidationResult(True)
+            return self._check_drawdown(position_size, portfolio_state.total_equity, portfolio_state.current_drawdown)
             
         except Exception as e:
             logger.error(f"Error in drawdown validation: {e}")
@@ -167,40 +140,104 @@ class TradeValidator:
             if portfolio_state.total_equity <= 0:
                 return ValidationResult(False, f"Invalid portfolio equity: {portfolio_state.total_equity}")
             
-            # Calculate potential loss from this trade
-            potential_loss = position_size * self.per_trade_stop_loss
-            
-            # Get current daily P&L (negative values are losses)
-            current_daily_pnl = portfolio_state.daily_pnl
-            current_daily_loss = abs(min(0, current_daily_pnl))  # Only count losses
-            
-            # Calculate potential new daily loss
-            potential_new_daily_loss = current_daily_loss + potential_loss
-            
-            # Calculate daily loss limit in absolute terms
-            daily_loss_limit_amount = portfolio_state.total_equity * self.daily_loss_limit
-            
-            # Check if this would exceed the limit
-            if potential_new_daily_loss > daily_loss_limit_amount:
-                rejection_reason = (
-                    f"Trade would exceed daily loss limit. "
-                    f"Current daily loss: ${current_daily_loss:.2f}, "
-                    f"Potential new loss: ${potential_new_daily_loss:.2f}, "
-                    f"Limit: ${daily_loss_limit_amount:.2f}"
-                )
-                return ValidationResult(False, rejection_reason)
-            
-            # Check if approaching the limit (warning)
-            warning_threshold = daily_loss_limit_amount * 0.8  # 80% of limit
-            if potential_new_daily_loss > warning_threshold:
-                warnings = [
-                    f"Approaching daily loss limit: ${potential_new_daily_loss:.2f} "
-                    f"(limit: ${daily_loss_limit_amount:.2f})"
-                ]
-                return ValidationResult(True, warnings=warnings)
-            
-            return ValidationResult(True)
+            return self._check_daily_loss(position_size, portfolio_state.total_equity, portfolio_state.daily_pnl)
             
         except Exception as e:
             logger.error(f"Error in daily loss validation: {e}")
-            return ValidationResult(False, f"Daily loss validation failed: {str(e)}") 
\ No newline at end of file
+            return ValidationResult(False, f"Daily loss validation failed: {str(e)}")
+    
+    def validate_position(self, position_size: float, total_equity: float,
+                          current_drawdown: float, daily_pnl: float) -> ValidationResult:
+        """
+        Validate a position size against the drawdown and daily loss limits from plain numbers.
+        
+        Same checks, order and messages as validate_trade for a well-formed signal and
+        portfolio; batch assessment calls this with the portfolio figures after earlier
+        approvals in the batch.
+        
+        Args:
+            position_size: Proposed position size in USD
+            total_equity: Portfolio equity (must be positive)
+            current_drawdown: Current drawdown as a fraction of equity
+            daily_pnl: Current daily P&L (negative values are losses)
+            
+        Returns:
+            Validation result with approval/rejection decision
+        """
+        if position_size <= 0:
+            return ValidationResult(False, f"Position size must be positive, got {position_size}")
+        
+        drawdown_result = self._check_drawdown(position_size, total_equity, current_drawdown)
+        if not drawdown_result.is_valid:
+            return drawdown_result
+        
+        daily_loss_result = self._check_daily_loss(position_size, total_equity, daily_pnl)
+        if not daily_loss_result.is_valid:
+            return daily_loss_result
+        
+        return ValidationResult(True, warnings=drawdown_result.warnings + daily_loss_result.warnings)
+    
+    def _check_drawdown(self, position_size: float, total_equity: float, current_drawdown: float) -> ValidationResult:
+        """Drawdown limit check for validated inputs."""
+        # Calculate potential loss as percentage of equity
+        potential_loss_amount = position_size * self.per_trade_stop_loss
+        potential_loss_pct = potential_loss_amount / total_equity
+        
+        # Calculate potential new drawdown (both as percentages)
+        potential_new_drawdown = current_drawdown + potential_loss_pct
+        
+        # Check if this would exceed the limit
+        if potential_new_drawdown > self.max_drawdown_limit:
+            rejection_reason = (
+                f"Trade would exceed maximum drawdown limit. "
+                f"Current: {current_drawdown:.1%}, "
+                f"Potential: {potential_new_drawdown:.1%}, "
+                f"Limit: {self.max_drawdown_limit:.1%}"
+            )
+            return ValidationResult(False, rejection_reason)
+        
+        # Check if approaching the limit (warning)
+        warning_threshold = self.max_drawdown_limit * 0.8  # 80% of limit
+        if potential_new_drawdown > warning_threshold:
+            warnings = [
+                f"Approaching drawdown limit: {potential_new_drawdown:.1%} "
+                f"(limit: {self.max_drawdown_limit:.1%})"
+            ]
+            return ValidationResult(True, warnings=warnings)
+        
+        return ValidationResult(True)
+    
+    def _check_daily_loss(self, position_size: float, total_equity: float, daily_pnl: float) -> ValidationResult:
+        """Daily loss limit check for validated inputs."""
+        # Calculate potential loss from this trade
+        potential_loss = position_size * self.per_trade_stop_loss
+        
+        # Get current daily P&L (negative values are losses)
+        current_daily_loss = abs(min(0, daily_pnl))  # Only count losses
+        
+        # Calculate potential new daily loss
+        potential_new_daily_loss = current_daily_loss + potential_loss
+        
+        # Calculate daily loss limit in absolute terms
+        daily_loss_limit_amount = total_equity * self.daily_loss_limit
+        
+        # Check if this would exceed the limit
+        if potential_new_daily_loss > daily_loss_limit_amount:
+            rejection_reason = (
+                f"Trade would exceed daily loss limit. "
+                f"Current daily loss: ${current_daily_loss:.2f}, "
+                f"Potential new loss: ${potential_new_daily_loss:.2f}, "
+                f"Limit: ${daily_loss_limit_amount:.2f}"
+            )
+            return ValidationResult(False, rejection_reason)
+        
+        # Check if approaching the limit (warning)
+        warning_threshold = daily_loss_limit_amount * 0.8  # 80% of limit
+        if potential_new_daily_loss > warning_threshold:
+            warnings = [
+                f"Approaching daily loss limit: ${potential_new_daily_loss:.2f} "
+                f"(limit: ${daily_loss_limit_amount:.2f})"
+            ]
+            return ValidationResult(True, warnings=warnings)
+        
+        return ValidationResult(True) 
\ No newline at end of file
@@ -0,0 +1,273 @@
+"""
+Collection Engine
+Concurrent asyncio HTTP collection for the crypto and macro data collectors.
+
+One background event loop owns a keep-alive HTTP session per provider, a token bucket per
+provider API key sized to the provider's published quota and a concurrency limit per provider.
+Connection errors, timeouts, 429 and 5xx responses are retried with exponential backoff and
+full jitter inside the failing request's own task, so a slow or failing asset never holds up
+the others.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, Optional, Tuple
+
+import aiohttp
+
+from config.settings import Config
+from src.utils.exceptions import APIError, APIRateLimitError, APIConnectionError, APITimeoutError
+from src.utils.rate_limiter import TokenBucket
+
+
+@dataclass
+class ProviderSpec:
+    """
+    One HTTP data provider and the quota of the API key used against it.
+
+    Attributes:
+        name: Provider name; requests to the same name share one keep-alive session
+        base_url: URL prefix for endpoints
+        rate_per_minute: Sustained requests per minute allowed for api_key
+        burst: Requests that may be sent back to back before the rate applies
+        api_key: Key the quota belongs to (None for keyless access)
+        headers: Headers sent with every request
+        params: Query parameters added to every request
+        fallback: Provider tried when this one cannot be reached after all retries
+    """
+    name: str
+    base_url: str
+    rate_per_minute: float
+    burst: int = 1
+    api_key: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    params: Dict[str, Any] = field(default_factory=dict)
+    fallback: Optional['ProviderSpec'] = None
+
+
+class CollectionEngine:
+    """
+    Shared asyncio HTTP engine on a dedicated event loop thread.
+
+    Collectors schedule coroutines with run() and await get_json() inside them; sessions,
+    rate limiters and concurrency limits persist across collection cycles.
+    """
+
+    def __init__(self, max_concurrency: int = 8, request_timeout: float = 30.0,
+                 max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                 result_timeout: float = 600.0):
+        """
+        Initialize the collection engine.
+
+        Args:
+            max_concurrency: Maximum in-flight requests per provider
+            request_timeout: Total timeout of a single HTTP request
+            max_retries: Retries per request after the first attempt
+            base_delay: Backoff ceiling for the first retry, doubled per retry
+            max_delay: Upper bound of the backoff ceiling
+            result_timeout: Default seconds wait() blocks on a scheduled coroutine
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_concurrency = max(1, max_concurrency)
+        self.request_timeout = request_timeout
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.result_timeout = result_timeout
+
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+        self.stats = defaultdict(int)
+        self._closed = False
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="collection-engine", daemon=True)
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def run(self, coro: Awaitable) -> Future:
+        """Schedule a coroutine on the engine loop; returns its concurrent Future."""
+        if self._closed:
+            raise RuntimeError("Collection engine is closed")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def wait(self, future: Future, timeout: Optional[float] = None) -> Any:
+        """
+        Block the calling thread on a Future from run().
+
+        Args:
+            future: Future returned by run()
+            timeout: Seconds to wait (defaults to result_timeout)
+
+        Returns:
+            The future's result
+
+        Raises:
+            RuntimeError: If called on the engine loop thread, where it would deadlock
+            concurrent.futures.TimeoutError: If the result is not ready in time; the coroutine is cancelled
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("CollectionEngine.wait() called on the engine loop thread; await the coroutine instead")
+        timeout = self.result_timeout if timeout is None else timeout
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self.stats['wait_timeouts'] += 1
+            self.logger.warning(f"Timed out after {timeout:.1f}s waiting for collection; cancelled it")
+            raise
+
+    def _session(self, spec: ProviderSpec) -> aiohttp.ClientSession:
+        """Keep-alive session for the provider, created on first use."""
+        session = self._sessions.get(spec.name)
+        if session is None or session.closed:
+            session = self._sessions[spec.name] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            )
+            self._semaphores[spec.name] = asyncio.Semaphore(self.max_concurrency)
+        return session
+
+    def _bucket(self, spec: ProviderSpec) -> TokenBucket:
+        """Token bucket for the provider's API key, created on first use."""
+        key = (spec.name, spec.api_key)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(spec.rate_per_minute / 60.0, max(1, spec.burst))
+        return bucket
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def get_json(self, spec: ProviderSpec, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET a provider endpoint and decode the JSON body.
+
+        Falls back to spec.fallback when the provider cannot be reached after all retries.
+
+        Args:
+            spec: Provider to query
+            endpoint: Path appended to the provider base URL
+            params: Query parameters for this request
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            APIRateLimitError: If the provider kept rate limiting after all retries
+            APIConnectionError: If no provider could be reached
+            APITimeoutError: If requests kept timing out
+            APIError: On other HTTP errors or an invalid JSON body
+        """
+        try:
+            return await self._request(spec, endpoint, params)
+        except (APIConnectionError, APITimeoutError) as e:
+            if spec.fallback is None:
+                raise
+            self.logger.warning(f"{spec.name} unavailable ({e}), falling back to {spec.fallback.name}")
+            self.stats['fallbacks'] += 1
+            return await self.get_json(spec.fallback, endpoint, params)
+
+    async def _request(self, spec: ProviderSpec, endpoint: str, params: Optional[Dict[str, Any]]) -> Any:
+        session = self._session(spec)
+        semaphore = self._semaphores[spec.name]
+        bucket = self._bucket(spec)
+        url = f"{spec.base_url}{endpoint}"
+        request_params = {**spec.params, **(params or {})}
+
+        for attempt in range(self.max_retries + 1):
+            await bucket.acquire()
+            try:
+                async with semaphore:
+                    self.stats['requests'] += 1
+                    async with session.get(url, params=request_params, headers=spec.headers) as response:
+                        if response.status == 429:
+                            retry_after = _seconds(response.headers.get('Retry-After'))
+                            bucket.pause(retry_after if retry_after is not None else self.backoff(attempt))
+                            self.stats['rate_limited'] += 1
+                            error = APIRateLimitError(
+                                f"{spec.name} rate limit exceeded",
+                                retry_after=int(retry_after) if retry_after is not None else None
+                            )
+                        elif response.status >= 500:
+                            error = APIError(f"{spec.name} returned HTTP {response.status}",
+                                             status_code=response.status)
+                        elif response.status >= 400:
+                            raise APIError(f"{spec.name} returned HTTP {response.status} for {endpoint}",
+                                           status_code=response.status, response_text=await response.text())
+                        else:
+                            try:
+                                return await response.json(content_type=None)
+                            except ValueError as e:
+                                raise APIError(f"Invalid JSON response from {spec.name}: {e}")
+            except aiohttp.ClientError as e:
+                error = APIConnectionError(f"Failed to connect to {spec.name}: {e}")
+            except asyncio.TimeoutError:
+                error = APITimeoutError(f"{spec.name} request timed out", timeout=self.request_timeout)
+
+            if attempt < self.max_retries:
+                delay = self.backoff(attempt)
+                self.stats['retries'] += 1
+                self.logger.warning(f"{spec.name}{endpoint} attempt {attempt + 1} failed ({error}), "
+                                    f"retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+        raise error
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Close provider sessions and stop the event loop."""
+        if self._closed:
+            return
+        self._closed = True
+
+        async def shutdown():
+            for session in self._sessions.values():
+                await session.close()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout)
+        except Exception as e:
+            self.logger.error(f"Error shutting down collection engine: {e}")
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+
+
+def _seconds(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+_engine: Optional[CollectionEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_collection_engine() -> CollectionEngine:
+    """Process-wide collection engine, started on first use."""
+    global _engine
+    with _engine_lock:
+        if _engine is None or _engine.closed:
+            config = Config()
+            _engine = CollectionEngine(
+                max_concurrency=config.COLLECTION_MAX_CONCURRENCY,
+                request_timeout=config.REQUEST_TIMEOUT,
+                max_retries=config.MAX_RETRIES,
+                result_timeout=config.COLLECTION_RESULT_TIMEOUT
+            )
+        return _engine
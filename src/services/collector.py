@@ -1,10 +1,12 @@
 """Data collection service with enhanced error recovery."""
 
+import asyncio
 import logging
 import json
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from src.api.coingecko_client import CoinGeckoClient
+from src.services.collection_engine import CollectionEngine, get_collection_engine
 from src.data.models import Cryptocurrency, OHLCVData
 from src.data.validator import DataValidator
 from src.data.sqlite_helper import CryptoDatabase
@@ -73,7 +75,8 @@ class DataCollector:
     def __init__(self, 
                  api_client: Optional[CoinGeckoClient] = None,
                  validator: Optional[DataValidator] = None,
-                 database: Optional[CryptoDatabase] = None):
+                 database: Optional[CryptoDatabase] = None,
+                 engine: Optional[CollectionEngine] = None):
         """
         Initialize the data collector with dependencies.
         
@@ -81,10 +84,19 @@ class DataCollector:
             api_client: CoinGecko API client instance
             validator: Data validator instance  
             database: SQLite database instance
+            engine: Async collection engine for batch collection (default: process-wide engine)
         """
         self.api_client = api_client or CoinGeckoClient()
         self.validator = validator or DataValidator()
         self.database = database or CryptoDatabase()
+        self._engine = engine
+
+    @property
+    def engine(self) -> CollectionEngine:
+        """Collection engine used by collect_all_data, resolved on first use."""
+        if self._engine is None or self._engine.closed:
+            self._engine = get_collection_engine()
+        return self._engine
 
     def _log_structured_metrics(self, event_type: str, data: Dict[str, Any]):
         """
@@ -289,13 +301,16 @@ class DataCollector:
         else:
             return "unknown"
 
-    def collect_crypto_data(self, crypto_id: str, days: int = 1) -> Dict[str, Any]:
+    def collect_crypto_data(self, crypto_id: str, days: int = 1,
+                            market_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Collect and store OHLCV data for a specific cryptocurrency.
         
         Args:
             crypto_id: Cryptocurrency identifier (e.g., "bitcoin")
             days: Number of days of data to collect (default: 1)
+            market_data: Market chart response already fetched for crypto_id; fetched
+                from the API when omitted
             
         Returns:
             Dict with collection results including success status and record count
@@ -318,7 +333,8 @@ class DataCollector:
         
         try:
             # Get market chart data from API (includes volume)
-            market_data = self.api_client.get_market_chart_data(crypto_id, days)
+            if market_data is None:
+                market_data = self.api_client.get_market_chart_data(crypto_id, days)
             
             if not market_data:
                 logger.warning(f"No market data received for {crypto_id}")
@@ -413,6 +429,37 @@ class DataCollector:
             logger.error(f"Failed to collect data for {crypto_id}: {e}")
             raise
 
+    async def collect_crypto_data_async(self, crypto_id: str, days: int = 1) -> Dict[str, Any]:
+        """
+        Fetch market data through the collection engine, then process and store it.
+        
+        Runs on the engine loop; other assets keep fetching while this one waits on the
+        network, its rate limit or its retry backoff. Validation and the SQLite writes run
+        in a worker thread so they do not stall the loop.
+        
+        Args:
+            crypto_id: Cryptocurrency identifier (e.g., "bitcoin")
+            days: Number of days of data to collect (default: 1)
+            
+        Returns:
+            Dict with collection results including success status and record count
+        """
+        try:
+            market_data = await self.api_client.get_market_chart_data_async(crypto_id, days, engine=self.engine)
+        except Exception as e:
+            self._log_structured_metrics('crypto_collection_failed', {
+                'crypto_id': crypto_id,
+                'success': False,
+                'error': str(e),
+                'error_stage': 'fetch',
+                'days_requested': days
+            })
+            logger.error(f"Failed to fetch market data for {crypto_id}: {e}")
+            raise
+        
+        # An empty response still goes through processing so it is reported as missing data
+        return await asyncio.to_thread(self.collect_crypto_data, crypto_id, days, market_data=market_data or {})
+
     def collect_crypto_data_range(self, crypto_id: str, start_timestamp: int, end_timestamp: int) -> Dict[str, Any]:
         """
         Collect and store OHLCV data for a specific cryptocurrency within a date range.
@@ -545,9 +592,94 @@ class DataCollector:
             logger.error(f"Failed to collect data for {crypto_id} in range {start_date} to {end_date}: {e}")
             raise
 
+    async def _collect_cryptos_async(self, cryptos: List[Cryptocurrency], days: int,
+                                     max_retries_per_crypto: int) -> List[Tuple[Dict[str, Any], int]]:
+        """Collect every cryptocurrency concurrently; results keep the input order."""
+        return await asyncio.gather(*(
+            self._collect_with_retries(crypto, days, max_retries_per_crypto) for crypto in cryptos
+        ))
+
+    async def _collect_with_retries(self, crypto: Cryptocurrency, days: int,
+                                    max_retries_per_crypto: int) -> Tuple[Dict[str, Any], int]:
+        """
+        Collect one cryptocurrency with its own retry loop.
+        
+        Returns:
+            (per-crypto result detail, retries used)
+        """
+        crypto_start_time = datetime.now()
+        crypto_result = {
+            'crypto_id': crypto.id,
+            'crypto_name': crypto.name,
+            'crypto_symbol': crypto.symbol,
+            'success': False,
+            'error': None,
+            'error_details': None,
+            'attempts': 0,
+            'duration_seconds': None
+        }
+        retries_used = 0
+        
+        # Retry loop for individual crypto
+        for attempt in range(max_retries_per_crypto + 1):
+            crypto_result['attempts'] = attempt + 1
+            if attempt > 0:
+                # Jittered backoff only delays this crypto, the others keep collecting
+                await asyncio.sleep(self.engine.backoff(attempt - 1))
+            
+            try:
+                logger.info(f"Collecting data for {crypto.name} ({crypto.id}) - attempt {attempt + 1}")
+                
+                # Attempt to collect data for this crypto
+                collection_result = await self.collect_crypto_data_async(crypto.id, days)
+                
+                if collection_result['success']:
+                    crypto_result['success'] = True
+                    crypto_result['duration_seconds'] = collection_result['duration_seconds']
+                    crypto_result['records_collected'] = collection_result['records_collected']
+                    logger.info(f"Successfully collected data for {crypto.name}")
+                    break  # Success, exit retry loop
+                else:
+                    # Collection returned error result
+                    error_msg = collection_result.get('error', 'Collection failed')
+                    if attempt < max_retries_per_crypto:
+                        logger.warning(f"Attempt {attempt + 1} failed for {crypto.name}: {error_msg}, retrying...")
+                        retries_used += 1
+                        continue
+                    else:
+                        crypto_result['error'] = error_msg
+                        crypto_result['error_details'] = {
+                            'category': 'data_unavailable',
+                            'recoverable': True,
+                            'retry_recommended': True
+                        }
+            
+            except Exception as e:
+                # Handle individual crypto failure
+                error_details = self._categorize_error(e)
+                
+                if attempt < max_retries_per_crypto and error_details == 'rate_limit':
+                    logger.warning(f"Attempt {attempt + 1} failed for {crypto.name}: {e}, retrying...")
+                    retries_used += 1
+                    continue
+                else:
+                    crypto_result['error'] = str(e)
+                    crypto_result['error_details'] = {
+                        'category': error_details,
+                        'recoverable': error_details != 'validation' and error_details != 'storage',
+                        'retry_recommended': error_details != 'validation' and error_details != 'storage'
+                    }
+                    logger.error(f"Failed to collect data for {crypto.name} ({crypto.id}) after {attempt + 1} attempts: {e}")
+                    break  # Max retries reached or non-recoverable error
+        
+        if not crypto_result['success']:
+            crypto_result['duration_seconds'] = (datetime.now() - crypto_start_time).total_seconds()
+        
+        return crypto_result, retries_used
+
     def collect_all_data(self, days: int = 1, max_retries_per_crypto: int = 1) -> Dict[str, Any]:
         """
-        Collect OHLCV data for all top 3 cryptocurrencies with enhanced error recovery.
+        Collect OHLCV data for all top 3 cryptocurrencies concurrently with enhanced error recovery.
         
         Args:
             days: Number of days of data to collect for each crypto (default: 1)
@@ -595,77 +727,20 @@ class DataCollector:
             results['total_attempted'] = len(top_cryptos)
             logger.info(f"Found {len(top_cryptos)} cryptocurrencies to collect: {[crypto.id for crypto in top_cryptos]}")
             
-            # Collect data for each cryptocurrency with retry logic
-            for crypto in top_cryptos:
-                crypto_start_time = datetime.now()
-                crypto_result = {
-                    'crypto_id': crypto.id,
-                    'crypto_name': crypto.name,
-                    'crypto_symbol': crypto.symbol,
-                    'success': False,
-                    'error': None,
-                    'error_details': None,
-                    'attempts': 0,
-                    'duration_seconds': None
-                }
-                
-                # Retry loop for individual crypto
-                for attempt in range(max_retries_per_crypto + 1):
-                    crypto_result['attempts'] = attempt + 1
-                    
-                    try:
-                        logger.info(f"Collecting data for {crypto.name} ({crypto.id}) - attempt {attempt + 1}")
-                        
-                        # Attempt to collect data for this crypto
-                        collection_result = self.collect_crypto_data(crypto.id, days)
-                        
-                        if collection_result['success']:
-                            crypto_result['success'] = True
-                            crypto_result['duration_seconds'] = collection_result['duration_seconds']
-                            crypto_result['records_collected'] = collection_result['records_collected']
-                            results['successful'] += 1
-                            results['successful_cryptos'].append(crypto.id)
-                            results['total_records_collected'] += collection_result['records_collected']
-                            logger.info(f"Successfully collected data for {crypto.name}")
-                            break  # Success, exit retry loop
-                        else:
-                            # Collection returned error result
-                            error_msg = collection_result.get('error', 'Collection failed')
-                            if attempt < max_retries_per_crypto:
-                                logger.warning(f"Attempt {attempt + 1} failed for {crypto.name}: {error_msg}, retrying...")
-                                results['retries_used'] += 1
-                                continue
-                            else:
-                                crypto_result['error'] = error_msg
-                                crypto_result['error_details'] = {
-                                    'category': 'data_unavailable',
-                                    'recoverable': True,
-                                    'retry_recommended': True
-                                }
-                    
-                    except Exception as e:
-                        # Handle individual crypto failure
-                        error_details = self._categorize_error(e)
-                        
-                        if attempt < max_retries_per_crypto and error_details == 'rate_limit':
-                            logger.warning(f"Attempt {attempt + 1} failed for {crypto.name}: {e}, retrying...")
-                            results['retries_used'] += 1
-                            continue
-                        else:
-                            crypto_result['error'] = str(e)
-                            crypto_result['error_details'] = {
-                                'category': error_details,
-                                'recoverable': error_details != 'validation' and error_details != 'storage',
-                                'retry_recommended': error_details != 'validation' and error_details != 'storage'
-                            }
-                            logger.error(f"Failed to collect data for {crypto.name} ({crypto.id}) after {attempt + 1} attempts: {e}")
-                            break  # Max retries reached or non-recoverable error
-                
-                # Update results based on final outcome
-                if not crypto_result['success']:
-                    crypto_result['duration_seconds'] = (datetime.now() - crypto_start_time).total_seconds()
+            # Collect all cryptocurrencies concurrently; each one retries on its own
+            outcomes = self.engine.wait(self.engine.run(
+                self._collect_cryptos_async(top_cryptos, days, max_retries_per_crypto)
+            ))
+            
+            for crypto_result, retries_used in outcomes:
+                results['retries_used'] += retries_used
+                if crypto_result['success']:
+                    results['successful'] += 1
+                    results['successful_cryptos'].append(crypto_result['crypto_id'])
+                    results['total_records_collected'] += crypto_result['records_collected']
+                else:
                     results['failed'] += 1
-                    results['failed_cryptos'].append(crypto.id)
+                    results['failed_cryptos'].append(crypto_result['crypto_id'])
                     
                     # Track error categories for reporting
                     if crypto_result['error_details']:
@@ -6,15 +6,21 @@ Generates a daily report with:
 - Bond yields yield curve with 7/14/30-day % change
 
 Output: JSON file at data/daily_reports/{date}.json
+
+The full report is built from one read: the trailing window of every reported series is
+loaded in a single indexed query and all point-in-time lookups are binary searches into it.
 """
 
 import json
 import logging
 import os
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 from ..data.sqlite_helper import CryptoDatabase
 from config.macro_settings import MACRO_INDICATORS
 
@@ -61,6 +67,51 @@ INDICATOR_NAMES = {
     'DGS30': '30-Year Treasury Yield',
 }
 
+# Lookback periods (days) reported as % change
+CHANGE_PERIODS = (7, 14, 30)
+
+BOND_MATURITIES = {
+    'DGS1': '1Y',
+    'DGS2': '2Y',
+    'DGS5': '5Y',
+    'DGS10': '10Y',
+    'DGS20': '20Y',
+    'DGS30': '30Y',
+}
+
+
+class IndicatorWindow:
+    """
+    Trailing observations of several indicators, as returned by CryptoDatabase.get_macro_window.
+
+    Each indicator's observed dates and values are kept as sorted arrays, so latest values
+    and on-or-before lookups are O(log n) searches without touching the database.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        """
+        Args:
+            frame: Values pivoted to one column per indicator with a sorted DatetimeIndex
+        """
+        self.frame = frame
+        self._series = {}
+        for indicator in frame.columns:
+            column = frame[indicator].dropna()
+            self._series[indicator] = (column.index.values, column.to_numpy(dtype=float))
+
+    def latest(self, indicator: str) -> Optional[Dict]:
+        """Latest observation of an indicator as {'date', 'value'}, or None if it has none."""
+        dates, values = self._series.get(indicator, ((), ()))
+        if not len(dates):
+            return None
+        return {'date': pd.Timestamp(dates[-1]).strftime('%Y-%m-%d'), 'value': float(values[-1])}
+
+    def value_on_or_before(self, indicator: str, target_date: str) -> Optional[float]:
+        """Value of the last observation on or before target_date (YYYY-MM-DD), or None."""
+        dates, values = self._series.get(indicator, ((), ()))
+        position = np.searchsorted(dates, np.datetime64(target_date), side='right') - 1 if len(dates) else -1
+        return float(values[position]) if position >= 0 else None
+
 
 class DailyReportGenerator:
     """Generates daily macro and bond yield reports."""
@@ -133,126 +184,80 @@ class DailyReportGenerator:
             return None
         return ((current_value - past_value) / past_value) * 100
     
-    def get_indicator_report(self, indicator: str) -> Optional[Dict]:
+    def load_window(self, indicators: Sequence[str]) -> IndicatorWindow:
+        """Load the observations every report lookup needs for these indicators in one query."""
+        return IndicatorWindow(self.db.get_macro_window(list(indicators), max(CHANGE_PERIODS)))
+    
+    def _changes(self, window: IndicatorWindow, indicator: str, latest: Dict) -> Dict:
+        """change_{n}d_pct of the latest value against the value n days before it."""
+        current_date = datetime.strptime(latest['date'], '%Y-%m-%d')
+        changes = {}
+        for days in CHANGE_PERIODS:
+            past_date = (current_date - timedelta(days=days)).strftime('%Y-%m-%d')
+            change = self.calculate_percentage_change(latest['value'], window.value_on_or_before(indicator, past_date))
+            changes[f'change_{days}d_pct'] = round(change, 2) if change is not None else None
+        return changes
+    
+    def get_indicator_report(self, indicator: str, window: Optional[IndicatorWindow] = None) -> Optional[Dict]:
         """Generate report for a single macro indicator with all timeframes."""
-        # Get latest value
-        latest = self.get_latest_value(indicator)
+        window = window or self.load_window([indicator])
+        latest = window.latest(indicator)
         if not latest:
             return None
         
-        current_value = latest['value']
-        current_date = latest['date']
-        
-        # Calculate past dates
-        date_7d = (datetime.strptime(current_date, '%Y-%m-%d') - timedelta(days=7)).strftime('%Y-%m-%d')
-        date_14d = (datetime.strptime(current_date, '%Y-%m-%d') - timedelta(days=14)).strftime('%Y-%m-%d')
-        date_30d = (datetime.strptime(current_date, '%Y-%m-%d') - timedelta(days=30)).strftime('%Y-%m-%d')
-        
-        # Get values at each timeframe
-        value_7d = self.get_value_on_or_before(indicator, date_7d)
-        value_14d = self.get_value_on_or_before(indicator, date_14d)
-        value_30d = self.get_value_on_or_before(indicator, date_30d)
-        
-        # Calculate percentage changes
-        change_7d = self.calculate_percentage_change(current_value, value_7d)
-        change_14d = self.calculate_percentage_change(current_value, value_14d)
-        change_30d = self.calculate_percentage_change(current_value, value_30d)
-        
         return {
             'indicator': indicator,
             'name': INDICATOR_NAMES.get(indicator, indicator),
-            'value': round(current_value, 4),
-            'date': current_date,
-            'change_7d_pct': round(change_7d, 2) if change_7d is not None else None,
-            'change_14d_pct': round(change_14d, 2) if change_14d is not None else None,
-            'change_30d_pct': round(change_30d, 2) if change_30d is not None else None,
+            'value': round(latest['value'], 4),
+            'date': latest['date'],
+            **self._changes(window, indicator, latest),
         }
     
-    def generate_macro_report(self) -> List[Dict]:
+    def generate_macro_report(self, window: Optional[IndicatorWindow] = None) -> List[Dict]:
         """Generate report for all macro indicators."""
+        window = window or self.load_window(MACRO_INDICATOR_LIST)
         report = []
         for indicator in MACRO_INDICATOR_LIST:
-            indicator_report = self.get_indicator_report(indicator)
+            indicator_report = self.get_indicator_report(indicator, window)
             if indicator_report:
                 report.append(indicator_report)
         return report
     
-    def generate_bond_yields_report(self) -> List[Dict]:
+    def generate_bond_yields_report(self, window: Optional[IndicatorWindow] = None) -> List[Dict]:
         """Generate report for bond yields (yield curve)."""
+        window = window or self.load_window(BOND_YIELD_SERIES)
         report = []
         
-        # Get latest date across all bond yields
-        latest_date = None
-        for series in BOND_YIELD_SERIES:
-            latest = self.get_latest_value(series)
-            if latest:
-                if latest_date is None or latest['date'] > latest_date:
-                    latest_date = latest['date']
-        
-        if not latest_date:
-            return report
-        
-        current_value = None
-        
         for series in BOND_YIELD_SERIES:
-            # Get current value
-            latest = self.get_latest_value(series)
+            latest = window.latest(series)
             if not latest:
                 continue
             
-            if current_value is None:
-                current_value = latest['value']
-                current_date = latest['date']
-            
-            # Calculate past dates
-            date_7d = (datetime.strptime(current_date, '%Y-%m-%d') - timedelta(days=7)).strftime('%Y-%m-%d')
-            date_14d = (datetime.strptime(current_date, '%Y-%m-%d') - timedelta(days=14)).strftime('%Y-%m-%d')
-            date_30d = (datetime.strptime(current_date, '%Y-%m-%d') - timedelta(days=30)).strftime('%Y-%m-%d')
-            
-            value_7d = self.get_value_on_or_before(series, date_7d)
-            value_14d = self.get_value_on_or_before(series, date_14d)
-            value_30d = self.get_value_on_or_before(series, date_30d)
-            
-            change_7d = self.calculate_percentage_change(latest['value'], value_7d)
-            change_14d = self.calculate_percentage_change(latest['value'], value_14d)
-            change_30d = self.calculate_percentage_change(latest['value'], value_30d)
-            
-            # Maturity mapping
-            maturity_map = {
-                'DGS1': '1Y',
-                'DGS2': '2Y',
-                'DGS5': '5Y',
-                'DGS10': '10Y',
-                'DGS20': '20Y',
-                'DGS30': '30Y',
-            }
-            
             report.append({
-                'maturity': maturity_map.get(series, series),
+                'maturity': BOND_MATURITIES.get(series, series),
                 'indicator': series,
                 'yield': round(latest['value'], 4),
                 'date': latest['date'],
-                'change_7d_pct': round(change_7d, 2) if change_7d is not None else None,
-                'change_14d_pct': round(change_14d, 2) if change_14d is not None else None,
-                'change_30d_pct': round(change_30d, 2) if change_30d is not None else None,
+                **self._changes(window, series, latest),
             })
         
         return report
     
     def generate_report(self) -> Dict:
-        """Generate the complete daily report."""
+        """Generate the complete daily report from a single database read."""
         # Get current time in HKT (UTC+8)
         now_utc = datetime.now(timezone.utc)
         # HKT is UTC+8
         hkt_offset = timezone(timedelta(hours=8))
         now_hkt = now_utc.astimezone(hkt_offset)
         
+        window = self.load_window(MACRO_INDICATOR_LIST + BOND_YIELD_SERIES)
         report = {
             'generated_at': now_hkt.isoformat(),
             'generated_utc': now_utc.isoformat(),
             'report_date': now_hkt.strftime('%Y-%m-%d'),
-            'macro_indicators': self.generate_macro_report(),
-            'bond_yields': self.generate_bond_yields_report(),
+            'macro_indicators': self.generate_macro_report(window),
+            'bond_yields': self.generate_bond_yields_report(window),
         }
         
         return report
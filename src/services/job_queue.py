@@ -0,0 +1,329 @@
+"""
+Background job queue for long-running API work (backtests, signal generation).
+
+- JobStore: SQLite job table holding each job's parameters, status and JSON result, so
+  results outlive the request that submitted them and survive API restarts
+- JobQueue: runs registered handlers on a bounded worker process pool; identical requests
+  submitted while a job is in flight share that job instead of computing it again
+
+Handlers run in worker processes, so they must be picklable module-level functions that
+take the job's parameters as a dict and return a JSON-serializable result. The worker marks
+a job running in the store when it picks the job up.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import uuid
+from concurrent.futures import CancelledError, Executor, Future, ProcessPoolExecutor
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+
+class JobStatus(Enum):
+    """Job lifecycle status."""
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+ACTIVE_STATUSES = (JobStatus.PENDING, JobStatus.RUNNING)
+
+
+class UnknownJobKindError(KeyError):
+    """Raised when a job is submitted for a kind with no registered handler."""
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when the number of in-flight jobs has reached the queue's limit."""
+
+
+class JobStore:
+    """SQLite table of submitted jobs and their results."""
+
+    def __init__(self, db_path: str = 'data/jobs.db'):
+        self.db_path = db_path
+        self.logger = logging.getLogger(__name__)
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_schema(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    request_key TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_request_key ON jobs(request_key, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
+
+    def create(self, job_id: str, kind: str, request_key: str, params: Dict[str, Any]) -> None:
+        """Insert a new pending job."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (job_id, kind, request_key, params, status, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, request_key, json.dumps(params, sort_keys=True),
+                 JobStatus.PENDING.value, datetime.now().isoformat())
+            )
+
+    def mark_running(self, job_id: str) -> bool:
+        """Move a pending job to running; returns False if it was no longer pending."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ? WHERE job_id = ? AND status = ?",
+                (JobStatus.RUNNING.value, datetime.now().isoformat(), job_id, JobStatus.PENDING.value)
+            )
+            return cursor.rowcount > 0
+
+    def finish(self, job_id: str, status: JobStatus, result: Any = None, error: Optional[str] = None) -> bool:
+        """
+        Record a job's outcome.
+
+        Only active jobs are updated, so a job cancelled while running keeps its cancelled
+        status when its worker eventually returns.
+
+        Returns:
+            True if the job was still active and has been updated
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"""
+                UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?
+                WHERE job_id = ? AND status IN ({','.join('?' * len(ACTIVE_STATUSES))})
+                """,
+                (status.value, json.dumps(result, default=str) if result is not None else None, error,
+                 datetime.now().isoformat(), job_id, *(s.value for s in ACTIVE_STATUSES))
+            )
+            return cursor.rowcount > 0
+
+    def get(self, job_id: str, include_result: bool = False) -> Optional[Dict[str, Any]]:
+        """Fetch a job record, optionally with its decoded result."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job['params'] = json.loads(job['params'])
+        result = job.pop('result')
+        if include_result:
+            job['result'] = json.loads(result) if result is not None else None
+        return job
+
+    def list_jobs(self, status: Optional[JobStatus] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent jobs first, without results."""
+        query = "SELECT job_id, kind, status, error, created_at, started_at, finished_at FROM jobs"
+        params: Tuple = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status.value,)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        with self._connect() as conn:
+            return [dict(row) for row in conn.execute(query, params + (limit,)).fetchall()]
+
+    def fail_interrupted(self) -> int:
+        """Mark jobs left active by a previous process as failed; returns how many."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"""
+                UPDATE jobs SET status = ?, error = ?, finished_at = ?
+                WHERE status IN ({','.join('?' * len(ACTIVE_STATUSES))})
+                """,
+                (JobStatus.FAILED.value, 'Interrupted by service restart', datetime.now().isoformat(),
+                 *(s.value for s in ACTIVE_STATUSES))
+            )
+            return cursor.rowcount
+
+
+_worker_stores: Dict[str, JobStore] = {}
+
+
+def _run_job(handler: Callable[[Dict[str, Any]], Any], db_path: str, job_id: str, params: Dict[str, Any]) -> Any:
+    """Worker entry point: record that the job has started, then run its handler."""
+    try:
+        store = _worker_stores.get(db_path)
+        if store is None:
+            store = _worker_stores[db_path] = JobStore(db_path)
+        store.mark_running(job_id)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Could not mark job {job_id} running: {e}")
+    return handler(params)
+
+
+class JobQueue:
+    """
+    Submits jobs to a bounded worker pool and tracks them in a JobStore.
+
+    Cancelling a pending job removes it from the pool; cancelling a running job marks it
+    cancelled immediately and its result is discarded when the worker finishes.
+    """
+
+    def __init__(self, store: JobStore, max_workers: int = 2, max_pending: int = 100,
+                 executor: Optional[Executor] = None, initializer: Optional[Callable] = None):
+        """
+        Args:
+            store: Job table the queue records jobs and results in
+            max_workers: Worker processes in the pool
+            max_pending: In-flight jobs accepted before submissions are rejected
+            executor: Pool to run jobs on instead of a new ProcessPoolExecutor
+            initializer: Called once in each worker process before it runs any job
+        """
+        self.store = store
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.logger = logging.getLogger(__name__)
+
+        self._handlers: Dict[str, Tuple[Callable[[Dict[str, Any]], Any], Optional[Type]]] = {}
+        self._executor = executor or ProcessPoolExecutor(max_workers=max_workers, initializer=initializer)
+        self._owns_executor = executor is None
+        self._futures: Dict[str, Future] = {}
+        self._completions: Dict[str, Future] = {}  # Resolved once the outcome is stored
+        self._inflight: Dict[str, str] = {}  # request_key -> job_id
+        self._lock = threading.Lock()
+
+        interrupted = store.fail_interrupted()
+        if interrupted:
+            self.logger.warning(f"Marked {interrupted} jobs interrupted by the previous run as failed")
+
+    def register(self, kind: str, handler: Callable[[Dict[str, Any]], Any], model: Optional[Type] = None) -> None:
+        """
+        Register the handler for a job kind.
+
+        Args:
+            kind: Job kind name used in submissions
+            handler: Picklable module-level function taking the job parameters
+            model: Optional pydantic model used to validate and normalize parameters, so
+                requests that differ only in omitted defaults share a job
+        """
+        self._handlers[kind] = (handler, model)
+
+    @property
+    def kinds(self) -> List[str]:
+        return sorted(self._handlers)
+
+    @staticmethod
+    def request_key(kind: str, params: Dict[str, Any]) -> str:
+        """Stable hash identifying identical requests."""
+        payload = json.dumps({'kind': kind, 'params': params}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def submit(self, kind: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], bool]:
+        """
+        Submit a job, or join the in-flight job for an identical request.
+
+        Returns:
+            (job record, whether an existing in-flight job was reused)
+
+        Raises:
+            UnknownJobKindError: If no handler is registered for kind
+            JobQueueFullError: If max_pending jobs are already in flight
+            pydantic.ValidationError: If the parameters fail the kind's model
+        """
+        if kind not in self._handlers:
+            raise UnknownJobKindError(kind)
+        handler, model = self._handlers[kind]
+        params = dict(params or {})
+        if model is not None:
+            params = model(**params).model_dump()
+        key = self.request_key(kind, params)
+
+        with self._lock:
+            existing = self._inflight.get(key)
+            if existing is not None:
+                return self.get(existing), True
+            if len(self._futures) >= self.max_pending:
+                raise JobQueueFullError(f"{len(self._futures)} jobs already in flight")
+
+            job_id = uuid.uuid4().hex
+            self.store.create(job_id, kind, key, params)
+            future = self._executor.submit(_run_job, handler, self.store.db_path, job_id, params)
+            self._futures[job_id] = future
+            self._completions[job_id] = Future()
+            self._inflight[key] = job_id
+
+        future.add_done_callback(lambda f: self._on_done(job_id, key, f))
+        self.logger.info(f"Submitted {kind} job {job_id}")
+        return self.get(job_id), False
+
+    def _on_done(self, job_id: str, key: str, future: Future) -> None:
+        try:
+            result = future.result()
+        except CancelledError:
+            self.store.finish(job_id, JobStatus.CANCELLED)
+        except Exception as e:
+            self.logger.error(f"Job {job_id} failed: {e}")
+            self.store.finish(job_id, JobStatus.FAILED, error=str(e))
+        else:
+            if not self.store.finish(job_id, JobStatus.SUCCEEDED, result=result):
+                self.logger.info(f"Discarded result of cancelled job {job_id}")
+        finally:
+            with self._lock:
+                self._futures.pop(job_id, None)
+                completion = self._completions.pop(job_id)
+                if self._inflight.get(key) == job_id:
+                    del self._inflight[key]
+            completion.set_result(None)
+
+    def get(self, job_id: str, include_result: bool = False) -> Optional[Dict[str, Any]]:
+        """Current job record, or None if the job does not exist."""
+        return self.store.get(job_id, include_result=include_result)
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a job; finished jobs are returned unchanged.
+
+        Returns:
+            The job record after cancellation, or None if the job does not exist
+        """
+        future = self._futures.get(job_id)
+        if future is not None:
+            # A job already handed to a worker cannot be interrupted; it is marked
+            # cancelled here and the done callback discards its result.
+            self.store.finish(job_id, JobStatus.CANCELLED)
+            with self._lock:
+                self._inflight = {k: j for k, j in self._inflight.items() if j != job_id}
+            future.cancel()
+        return self.store.get(job_id)
+
+    @property
+    def in_flight(self) -> int:
+        """Jobs submitted and not yet finished."""
+        return len(self._futures)
+
+    def future(self, job_id: str) -> Optional[Future]:
+        """
+        Future resolved once an in-flight job's outcome is in the store.
+
+        Returns None when the job is not in flight, in which case its stored status is final.
+        """
+        return self._completions.get(job_id)
+
+    def list_jobs(self, status: Optional[JobStatus] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        return self.store.list_jobs(status, limit)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Cancel jobs still waiting for a worker and stop the pool."""
+        for future in list(self._futures.values()):
+            future.cancel()
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -1,27 +1,65 @@
+import asyncio
 import logging
 import json
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from ..api.fred_client import FREDClient
 from ..data.macro_models import MacroIndicatorRecord
 from ..data.sqlite_helper import CryptoDatabase
+from .collection_engine import CollectionEngine, get_collection_engine
 from ..utils.exceptions import FREDAPIError, MacroDataError
 from config.macro_settings import MACRO_INDICATORS
 
 class MacroDataCollector:
     """Service for collecting macro economic indicators"""
     
-    def __init__(self, database: Optional[CryptoDatabase] = None, fred_client: Optional[FREDClient] = None):
+    def __init__(self, database: Optional[CryptoDatabase] = None, fred_client: Optional[FREDClient] = None,
+                 engine: Optional[CollectionEngine] = None):
         """Initialize the macro data collector"""
         self.fred_client = fred_client  # Initialize later if needed
         self.database = database or CryptoDatabase()
+        self._engine = engine
         self.logger = logging.getLogger(__name__)
     
+    @property
+    def engine(self) -> CollectionEngine:
+        """Collection engine used by collect_all_indicators, resolved on first use"""
+        if self._engine is None or self._engine.closed:
+            self._engine = get_collection_engine()
+        return self._engine
+    
     def _ensure_fred_client(self):
         """Lazy initialization of FRED client"""
         if self.fred_client is None:
             self.fred_client = FREDClient()
     
+    def _date_range(self, days: int) -> Tuple[str, str]:
+        """Start and end date strings (YYYY-MM-DD) covering the last `days` days"""
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        return start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
+    
+    async def _fetch_all_series(self, days: int) -> Dict[str, Any]:
+        """
+        Fetch every configured FRED series concurrently through the collection engine.
+        
+        Indicator keys that alias the same FRED series share one request.
+        
+        Args:
+            days: Number of days of data to fetch
+            
+        Returns:
+            Dictionary mapping series IDs to parsed observations, or to the exception raised
+            while fetching that series
+        """
+        start_date_str, end_date_str = self._date_range(days)
+        series_ids = list(dict.fromkeys(config['fred_series_id'] for config in MACRO_INDICATORS.values()))
+        outcomes = await asyncio.gather(*(
+            self.fred_client.get_series_data_async(series_id, start_date_str, end_date_str, engine=self.engine)
+            for series_id in series_ids
+        ), return_exceptions=True)
+        return dict(zip(series_ids, outcomes))
+    
     def _log_structured_metrics(self, event_type: str, data: Dict) -> None:
         """
         Log structured metrics in JSON format for monitoring and analysis.
@@ -65,13 +103,16 @@ class MacroDataCollector:
             
         return db_records
     
-    def collect_indicator(self, indicator_key: str, days: int = 30) -> List[MacroIndicatorRecord]:
+    def collect_indicator(self, indicator_key: str, days: int = 30,
+                          api_data: Optional[List[Dict]] = None) -> List[MacroIndicatorRecord]:
         """
         Collect single macro indicator data and save to CSV.
         
         Args:
             indicator_key: Macro indicator key (e.g., "VIX", "DXY")  
             days: Number of days of data to collect (default: 30)
+            api_data: Series observations already fetched for this indicator; fetched
+                from the FRED API when omitted
             
         Returns:
             List of MacroIndicatorRecord objects collected
@@ -102,37 +143,34 @@ class MacroDataCollector:
         
         try:
             # Calculate date range
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
-            
-            start_date_str = start_date.strftime('%Y-%m-%d')
-            end_date_str = end_date.strftime('%Y-%m-%d')
-            
-            self.logger.info(f"Fetching {indicator_key} data from {start_date_str} to {end_date_str}")
-            
-            # Log API request start
-            api_start_time = datetime.now()
-            self._log_structured_metrics('fred_api_request_start', {
-                'indicator': indicator_key,
-                'series_id': series_id,
-                'start_date': start_date_str,
-                'end_date': end_date_str
-            })
-            
-            # Ensure FRED client is initialized
-            self._ensure_fred_client()
-            
-            # Fetch data from FRED API
-            api_data = self.fred_client.get_series_data(series_id, start_date_str, end_date_str)
+            start_date_str, end_date_str = self._date_range(days)
             
-            # Log API request completion
-            api_duration = (datetime.now() - api_start_time).total_seconds()
-            self._log_structured_metrics('fred_api_request_complete', {
-                'indicator': indicator_key,
-                'series_id': series_id,
-                'duration_seconds': round(api_duration, 3),
-                'records_returned': len(api_data) if api_data else 0
-            })
+            if api_data is None:
+                self.logger.info(f"Fetching {indicator_key} data from {start_date_str} to {end_date_str}")
+                
+                # Log API request start
+                api_start_time = datetime.now()
+                self._log_structured_metrics('fred_api_request_start', {
+                    'indicator': indicator_key,
+                    'series_id': series_id,
+                    'start_date': start_date_str,
+                    'end_date': end_date_str
+                })
+                
+                # Ensure FRED client is initialized
+                self._ensure_fred_client()
+                
+                # Fetch data from FRED API
+                api_data = self.fred_client.get_series_data(series_id, start_date_str, end_date_str)
+                
+                # Log API request completion
+                api_duration = (datetime.now() - api_start_time).total_seconds()
+                self._log_structured_metrics('fred_api_request_complete', {
+                    'indicator': indicator_key,
+                    'series_id': series_id,
+                    'duration_seconds': round(api_duration, 3),
+                    'records_returned': len(api_data) if api_data else 0
+                })
             
             if not api_data:
                 self.logger.warning(f"No data returned from FRED API for {indicator_key}")
@@ -256,10 +294,21 @@ class MacroDataCollector:
         success_count = 0
         error_count = 0
         
-        for indicator_key in MACRO_INDICATORS.keys():
+        # Fetch all series concurrently, then store them one indicator at a time
+        try:
+            self._ensure_fred_client()
+            fetched = self.engine.wait(self.engine.run(self._fetch_all_series(days)))
+        except Exception as e:
+            self.logger.error(f"Concurrent FRED fetch failed: {e}")
+            fetched = {config['fred_series_id']: e for config in MACRO_INDICATORS.values()}
+        
+        for indicator_key, indicator_config in MACRO_INDICATORS.items():
             try:
                 self.logger.info(f"Collecting {indicator_key}...")
-                records = self.collect_indicator(indicator_key, days)
+                api_data = fetched[indicator_config['fred_series_id']]
+                if isinstance(api_data, Exception):
+                    raise api_data
+                records = self.collect_indicator(indicator_key, days, api_data=api_data)
                 results[indicator_key] = records
                 success_count += 1
                 
@@ -0,0 +1,112 @@
+"""
+Macro Snapshot Service
+
+Loads the latest value and trailing simple moving averages of every macro indicator with a
+single query, and serves that snapshot from cache until macro_indicators changes.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence
+
+import pandas as pd
+
+from src.data.sqlite_helper import CryptoDatabase
+
+
+@dataclass
+class MacroSnapshot:
+    """Latest values and SMAs of all macro indicators at one macro_indicators version."""
+    version: int
+    latest: Dict[str, float] = field(default_factory=dict)
+    latest_dates: Dict[str, str] = field(default_factory=dict)
+    smas: Dict[int, Dict[str, float]] = field(default_factory=dict)
+
+    def get(self, indicator: str) -> Optional[float]:
+        """Latest value of an indicator, or None if it has no data."""
+        return self.latest.get(indicator)
+
+    def sma(self, indicator: str, window: int) -> Optional[float]:
+        """Average of the indicator's last window observations, or None if not loaded."""
+        return self.smas.get(window, {}).get(indicator)
+
+
+class MacroSnapshotService:
+    """
+    Cached macro indicator snapshot.
+
+    Each refresh ranks every indicator's observations by date in one windowed query and
+    aggregates the latest value and all configured SMAs from it. Between refreshes, a lookup of
+    the trigger-maintained macro_indicators version decides whether the cached snapshot is
+    still current.
+    """
+
+    def __init__(self, db: CryptoDatabase, sma_windows: Sequence[int] = (20,)):
+        """
+        Initialize the snapshot service.
+
+        Args:
+            db: Database helper
+            sma_windows: Trailing SMA lengths (in observations) computed for every indicator
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db = db
+        self.sma_windows = sorted({int(w) for w in sma_windows if int(w) > 0})
+        self._snapshot: Optional[MacroSnapshot] = None
+        self._lock = threading.Lock()
+
+    def _snapshot_query(self) -> str:
+        """Latest value, its date and one AVG per SMA window, per indicator."""
+        depth = max(self.sma_windows, default=1)
+        sma_columns = "".join(
+            f",\n                AVG(CASE WHEN rn <= {window} THEN value END) AS sma_{window}"
+            for window in self.sma_windows
+        )
+        return f"""
+            SELECT indicator,
+                MAX(CASE WHEN rn = 1 THEN value END) AS latest_value,
+                MAX(CASE WHEN rn = 1 THEN date END) AS latest_date{sma_columns}
+            FROM (
+                SELECT indicator, date, value,
+                       ROW_NUMBER() OVER (PARTITION BY indicator ORDER BY date DESC) AS rn
+                FROM macro_indicators
+            )
+            WHERE rn <= {depth}
+            GROUP BY indicator
+        """
+
+    def _load(self, version: int) -> MacroSnapshot:
+        df = self.db.query_to_dataframe(self._snapshot_query())
+        snapshot = MacroSnapshot(version=version)
+        if df.empty:
+            return snapshot
+
+        indicators = df['indicator'].tolist()
+        snapshot.latest = {ind: float(v) for ind, v in zip(indicators, df['latest_value']) if pd.notna(v)}
+        snapshot.latest_dates = dict(zip(indicators, df['latest_date']))
+        for window in self.sma_windows:
+            snapshot.smas[window] = {
+                ind: float(v) for ind, v in zip(indicators, df[f'sma_{window}']) if pd.notna(v)
+            }
+        return snapshot
+
+    def get_snapshot(self) -> MacroSnapshot:
+        """
+        Current snapshot, reloaded only when macro_indicators has changed since the last load.
+
+        Returns:
+            MacroSnapshot with latest values and SMAs for every indicator
+        """
+        version = self.db.get_table_version('macro_indicators')
+        with self._lock:
+            if self._snapshot is not None and self._snapshot.version == version:
+                return self._snapshot
+            self._snapshot = self._load(version)
+            self.logger.debug(f"Loaded macro snapshot v{version} with {len(self._snapshot.latest)} indicators")
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot so the next call reloads it."""
+        with self._lock:
+            self._snapshot = None
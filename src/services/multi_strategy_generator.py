@@ -4,11 +4,21 @@ Orchestrates multiple strategies and aggregates results into final trading signa
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+import math
+import multiprocessing
+import os
+import pickle
+import queue
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import json
 from pathlib import Path
 
+import pandas as pd
+
 from src.signals.strategies.strategy_registry import StrategyRegistry
 from src.signals.signal_aggregator import SignalAggregator
 from src.data.signal_models import TradingSignal
@@ -18,6 +28,78 @@ from src.utils.exceptions import ConfigurationError, DataProcessingError
 from src.utils.multi_webhook_discord_manager import MultiWebhookDiscordManager
 
 
+EXECUTION_MODES = ('sequential', 'thread', 'process')
+
+# Strategy instances built inside process-pool workers, keyed by (strategy name, config path)
+_worker_strategies: Dict[Tuple[str, str], Any] = {}
+
+# Process-pool worker state: the start queue from _init_process_worker and the market data
+# snapshot of the current cycle, loaded once per worker and cycle by _load_snapshot
+_worker_state: Dict[str, Any] = {}
+
+# How often the collector checks for newly started strategies and expired deadlines
+_START_POLL_SECONDS = 0.05
+
+
+def _snapshot_view(value: Any) -> Any:
+    """
+    Per-strategy view of the shared market data snapshot.
+
+    Containers are copied and DataFrames/Series are shallow copies, so a strategy adding keys or
+    columns never affects the others; with pandas copy-on-write, in-place writes are isolated too.
+    """
+    if isinstance(value, dict):
+        return {key: _snapshot_view(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_snapshot_view(item) for item in value]
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    return value
+
+
+def _run_strategy(strategy: Any, market_data: Dict[str, Any]) -> Tuple[List[TradingSignal], float]:
+    """Run analyze and generate_signals for one strategy, returning its signals and wall time."""
+    started = time.perf_counter()
+    analysis_results = strategy.analyze(_snapshot_view(market_data))
+    signals = strategy.generate_signals(analysis_results)
+    return signals, time.perf_counter() - started
+
+
+def _run_strategy_in_thread(starts: "queue.Queue", strategy_name: str, strategy: Any,
+                            market_data: Dict[str, Any]) -> Tuple[List[TradingSignal], float]:
+    """Thread-pool entry point: report the start time, then run the strategy."""
+    starts.put((None, strategy_name, time.monotonic()))
+    return _run_strategy(strategy, market_data)
+
+
+def _init_process_worker(starts: Any) -> None:
+    """Process pool initializer: keep the queue workers report strategy start times on."""
+    _worker_state['starts'] = starts
+
+
+def _load_snapshot(snapshot_path: str) -> Dict[str, Any]:
+    """Market data of the cycle that wrote snapshot_path, unpickled once per worker and cycle."""
+    if _worker_state.get('snapshot_path') != snapshot_path:
+        with open(snapshot_path, 'rb') as f:
+            _worker_state['market_data'] = pickle.load(f)
+        _worker_state['snapshot_path'] = snapshot_path
+    return _worker_state['market_data']
+
+
+def _run_strategy_in_worker(strategy_name: str, config_path: str,
+                            snapshot_path: str) -> Tuple[List[TradingSignal], float]:
+    """Process-pool entry point: build the strategy once per worker process, then run it."""
+    _worker_state['starts'].put((snapshot_path, strategy_name, time.monotonic()))
+    key = (strategy_name, config_path)
+    strategy = _worker_strategies.get(key)
+    if strategy is None:
+        registry = StrategyRegistry()
+        registry.load_strategies_from_directory("src/signals/strategies")
+        strategy = registry.get_strategy(strategy_name, config_path)
+        _worker_strategies[key] = strategy
+    return _run_strategy(strategy, _load_snapshot(snapshot_path))
+
+
 class MultiStrategyGenerator:
     """
     Task 9: Multi-Strategy Signal Generator
@@ -25,17 +107,30 @@ class MultiStrategyGenerator:
     Orchestrates multiple signal strategies and aggregates their outputs into
     final trading signals. Handles strategy loading, data management, and
     signal aggregation with conflict resolution.
+    
+    Strategies run sequentially or concurrently on a thread or process pool (see
+    execution_config), each over its own view of one market data snapshot and with a
+    per-strategy timeout; a failing or timed-out strategy contributes no signals.
+    
+    Pools live across signal cycles, so process workers keep the strategies they built. A
+    process pool that had a strategy time out is terminated and rebuilt on the next cycle.
     """
     
-    def __init__(self, strategy_configs: Dict[str, Dict[str, Any]], aggregator_config: Dict[str, Any]):
+    def __init__(self, strategy_configs: Dict[str, Dict[str, Any]], aggregator_config: Dict[str, Any],
+                 execution_config: Optional[Dict[str, Any]] = None):
         """
         Initialize the multi-strategy generator.
         
         Args:
             strategy_configs: Dictionary mapping strategy names to their config parameters
-                             Format: {"strategy_name": {"config_path": "path/to/config.json", ...}}
+                             Format: {"strategy_name": {"config_path": "path/to/config.json",
+                                      "timeout_seconds": 60, ...}}
             aggregator_config: Configuration for signal aggregation including strategy weights
                               Format: {"strategy_weights": {"strategy_name": weight, ...}, ...}
+            execution_config: How strategies are run
+                              Format: {"mode": "sequential" | "thread" | "process",
+                                       "max_workers": 4, "timeout_seconds": 120}
+                              Defaults to a thread pool with one worker per strategy.
         """
         self.logger = logging.getLogger(__name__)
         
@@ -46,9 +141,21 @@ class MultiStrategyGenerator:
         if not aggregator_config or 'strategy_weights' not in aggregator_config:
             raise ConfigurationError("Aggregator config must include 'strategy_weights'")
         
+        execution_config = execution_config or {}
+        self.execution_mode = execution_config.get('mode', 'thread')
+        if self.execution_mode not in EXECUTION_MODES:
+            raise ConfigurationError(f"Unknown strategy execution mode: {self.execution_mode}")
+        self.max_workers = execution_config.get('max_workers') or len(strategy_configs)
+        self.strategy_timeout = execution_config.get('timeout_seconds')
+        
         # Initialize components
         self.strategy_configs = strategy_configs
         self.aggregator_config = aggregator_config
+        self.execution_config = execution_config
+        self._executor = None
+        self._starts = None
+        self._running: Dict[str, Future] = {}
+        self.strategy_timings: Dict[str, Dict[str, Any]] = {}
         
         # Initialize strategy registry
         self.registry = StrategyRegistry()
@@ -187,24 +294,198 @@ class MultiStrategyGenerator:
         """
         strategy_signals = {}
         
-        for strategy_name, strategy in self.strategies.items():
-            try:
-                # Run strategy analysis
-                analysis_results = strategy.analyze(market_data)
-                
-                # Generate signals from analysis
-                signals = strategy.generate_signals(analysis_results)
-                
-                strategy_signals[strategy_name] = signals
-                
-                self.logger.info(f"Strategy {strategy_name} generated {len(signals)} signals")
-                
-            except Exception as e:
-                self.logger.error(f"Strategy {strategy_name} failed to generate signals: {e}")
-                # Continue with other strategies instead of failing completely
-                strategy_signals[strategy_name] = []
+        if self.execution_mode == 'sequential':
+            for strategy_name, strategy in self.strategies.items():
+                started = time.perf_counter()
+                try:
+                    signals, wall_time = _run_strategy(strategy, market_data)
+                    strategy_signals[strategy_name] = signals
+                    self._record_run(strategy_name, 'ok', wall_time, len(signals))
+                    self.logger.info(f"Strategy {strategy_name} generated {len(signals)} signals")
+                except Exception as e:
+                    self.logger.error(f"Strategy {strategy_name} failed to generate signals: {e}")
+                    # Continue with other strategies instead of failing completely
+                    strategy_signals[strategy_name] = []
+                    self._record_run(strategy_name, 'error', time.perf_counter() - started, 0, str(e))
+            return strategy_signals
+        
+        # Workers report when each strategy actually starts, so time spent queued behind other
+        # strategies does not count against its timeout
+        executor = self._get_executor()
+        snapshot_path = None
+        if self.execution_mode == 'process':
+            # The long-lived workers read each cycle's market data from a pickled snapshot file
+            starts = self._starts
+            fd, snapshot_path = tempfile.mkstemp(prefix='market_snapshot_', suffix='.pkl')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(market_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            starts = queue.Queue()
+        
+        futures = {}
+        timed_out = False
+        try:
+            for strategy_name, strategy in self.strategies.items():
+                previous = self._running.get(strategy_name)
+                if previous is not None and not previous.done():
+                    # A timed-out run from an earlier cycle still holds a worker; don't stack another
+                    self.logger.warning(f"Strategy {strategy_name} skipped: previous run still in progress")
+                    strategy_signals[strategy_name] = []
+                    self._record_run(strategy_name, 'skipped', 0.0, 0, 'previous run still in progress')
+                    continue
+                try:
+                    if self.execution_mode == 'process':
+                        future = executor.submit(_run_strategy_in_worker, strategy_name,
+                                                 self.strategy_configs[strategy_name]['config_path'], snapshot_path)
+                    else:
+                        future = executor.submit(_run_strategy_in_thread, starts, strategy_name, strategy, market_data)
+                except Exception as e:
+                    self.logger.error(f"Strategy {strategy_name} could not be scheduled: {e}")
+                    strategy_signals[strategy_name] = []
+                    self._record_run(strategy_name, 'error', 0.0, 0, str(e))
+                    continue
+                futures[strategy_name] = future
+                self._running[strategy_name] = future
+            
+            timed_out = self._collect_results(futures, starts, strategy_signals, cycle=snapshot_path)
+        finally:
+            if snapshot_path is not None:
+                if timed_out:
+                    # A process cannot be interrupted from outside; kill the pool with the hung
+                    # strategies in it and start a fresh one next cycle
+                    self._terminate_process_pool()
+                os.remove(snapshot_path)
+        
+        # Keep the configured strategy order regardless of completion order
+        return {name: strategy_signals[name] for name in self.strategies if name in strategy_signals}
+    
+    def _collect_results(self, futures: Dict[str, Future], starts: Any,
+                         strategy_signals: Dict[str, List[TradingSignal]], cycle: Optional[str] = None) -> bool:
+        """
+        Wait for submitted strategies, applying each timeout from the moment the strategy starts.
+        
+        A strategy that never gets a worker is timed out once every wave of strategies ahead of it
+        could have used its full timeout. Start reports tagged with another cycle are ignored.
         
-        return strategy_signals
+        Returns:
+            True if a strategy that had started timed out and may still be running
+        """
+        timed_out = False
+        submitted = time.monotonic()
+        start_times: Dict[str, float] = {}
+        timeouts = {name: self._strategy_timeout(name) for name in futures}
+        bounded = [t for t in timeouts.values() if t is not None]
+        queue_limit = None
+        if bounded and len(bounded) == len(timeouts):
+            queue_limit = math.ceil(len(futures) / self.max_workers) * max(bounded)
+        
+        pending = dict(futures)
+        while pending:
+            while True:
+                try:
+                    start_cycle, strategy_name, started = starts.get_nowait()
+                except queue.Empty:
+                    break
+                if start_cycle == cycle:
+                    start_times[strategy_name] = started
+            
+            now = time.monotonic()
+            for strategy_name, future in list(pending.items()):
+                timeout = timeouts[strategy_name]
+                started = start_times.get(strategy_name)
+                if future.done():
+                    del pending[strategy_name]
+                    self._record_result(strategy_name, future, started, now, strategy_signals)
+                elif timeout is not None and started is not None and now >= started + timeout:
+                    del pending[strategy_name]
+                    timed_out = True
+                    self.logger.error(f"Strategy {strategy_name} timed out after {timeout}s")
+                    strategy_signals[strategy_name] = []
+                    self._record_run(strategy_name, 'timeout', now - started, 0, f"timed out after {timeout}s")
+                elif started is None and queue_limit is not None and now >= submitted + queue_limit:
+                    del pending[strategy_name]
+                    future.cancel()
+                    self.logger.error(f"Strategy {strategy_name} never started within {queue_limit}s")
+                    strategy_signals[strategy_name] = []
+                    self._record_run(strategy_name, 'timeout', 0.0, 0, f"not started within {queue_limit}s")
+            
+            if pending:
+                wait(list(pending.values()), timeout=_START_POLL_SECONDS, return_when=FIRST_COMPLETED)
+        return timed_out
+    
+    def _record_result(self, strategy_name: str, future: Future, started: Optional[float], now: float,
+                       strategy_signals: Dict[str, List[TradingSignal]]) -> None:
+        """Record the outcome of a finished strategy future."""
+        try:
+            signals, wall_time = future.result()
+            strategy_signals[strategy_name] = signals
+            self._record_run(strategy_name, 'ok', wall_time, len(signals))
+            self.logger.info(f"Strategy {strategy_name} generated {len(signals)} signals in {wall_time:.2f}s")
+        except Exception as e:
+            self.logger.error(f"Strategy {strategy_name} failed to generate signals: {e}")
+            # Continue with other strategies instead of failing completely
+            strategy_signals[strategy_name] = []
+            self._record_run(strategy_name, 'error', now - started if started is not None else 0.0, 0, str(e))
+    
+    def _strategy_timeout(self, strategy_name: str) -> Optional[float]:
+        """Timeout for one strategy: its own timeout_seconds, else the execution default."""
+        return self.strategy_configs.get(strategy_name, {}).get('timeout_seconds', self.strategy_timeout)
+    
+    def _get_executor(self):
+        """Create the worker pool on first use and reuse it across signal cycles."""
+        if self._executor is None:
+            if self.execution_mode == 'process':
+                self._starts = multiprocessing.Queue()
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_process_worker,
+                                                     initargs=(self._starts,))
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='strategy')
+        return self._executor
+    
+    def _terminate_process_pool(self) -> None:
+        """Kill every worker of the process pool, hung strategies included; it is rebuilt on next use."""
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        terminate_workers = getattr(executor, 'terminate_workers', None)  # Python 3.14+
+        processes = list((getattr(executor, '_processes', None) or {}).values())
+        if terminate_workers is not None:
+            terminate_workers()
+        else:
+            for process in processes:
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.join(timeout=5)
+        self._running.clear()
+        self.logger.warning(f"Terminated {len(processes)} strategy worker processes")
+    
+    def _record_run(self, strategy_name: str, status: str, wall_time: float, signal_count: int,
+                    error: Optional[str] = None) -> None:
+        """Update the per-strategy run statistics reported by get_strategy_status."""
+        timing = self.strategy_timings.setdefault(strategy_name, {
+            'runs': 0,
+            'failures': 0,
+            'total_wall_time_seconds': 0.0
+        })
+        timing['runs'] += 1
+        if status != 'ok':
+            timing['failures'] += 1
+        timing['total_wall_time_seconds'] += wall_time
+        timing['last_status'] = status
+        timing['last_wall_time_seconds'] = wall_time
+        timing['last_signal_count'] = signal_count
+        timing['last_error'] = error
+        timing['last_run_at'] = datetime.now().isoformat()
+    
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self.execution_mode == 'process':
+            self._terminate_process_pool()
+        elif self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._running.clear()
     
     def _initialize_multi_webhook_manager(self) -> Optional[MultiWebhookDiscordManager]:
         """Initialize multi-webhook Discord manager from configuration."""
@@ -429,6 +710,12 @@ class MultiStrategyGenerator:
                 strategy_params[name] = {'error': str(e)}
         
         status['strategy_parameters'] = strategy_params
+        status['execution'] = {
+            'mode': self.execution_mode,
+            'max_workers': self.max_workers,
+            'timeout_seconds': self.strategy_timeout
+        }
+        status['strategy_timings'] = {name: dict(timing) for name, timing in self.strategy_timings.items()}
         
         return status
     
@@ -7,6 +7,11 @@ This scheduler handles different collection intervals for different asset types:
 - Macro indicators: Daily intervals
 
 Optimizes API calls while maintaining data freshness requirements.
+
+Due tasks come off a heap keyed on next run time and run on a worker pool per tier, so a
+slow macro or CoinGecko call never delays the high-frequency tier. A daily API budget
+derived from the expected usage defers collections once it is spent, and each completed
+task is journaled incrementally instead of rewriting the whole state file.
 """
 
 import asyncio
@@ -15,13 +20,18 @@ import threading
 import time
 import json
 import os
-from typing import Dict, List, Optional, Set
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Set
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
 
+from config.settings import Config
 from src.services.collector import DataCollector
 from src.services.macro_collector import MacroDataCollector
+from src.services.task_queue import (
+    API_BUDGET_HEADROOM, DEFAULT_TIER_WORKERS, ApiBudgetGovernor, DueTaskQueue, SchedulerStateStore
+)
 from src.api.binance_client import BinanceClient
 from src.utils.exceptions import CryptoDataPipelineError
 
@@ -54,13 +64,28 @@ class MultiTierScheduler:
     - Failure recovery and exponential backoff
     - Real-time monitoring and health checks
     - State persistence across restarts
+    - Per-tier worker pools and a daily API budget
     """
     
     def __init__(self,
                  high_frequency_assets: List[str] = None,
                  daily_assets: List[str] = None,
                  macro_indicators: List[str] = None,
-                 state_file: str = "data/multi_tier_scheduler_state.json"):
+                 state_file: str = "data/multi_tier_scheduler_state.json",
+                 clock: Optional[Callable[[], datetime]] = None,
+                 tier_workers: Optional[Dict[str, int]] = None,
+                 daily_api_budget: Optional[int] = None):
+        """
+        Args:
+            high_frequency_assets: Crypto assets collected every 15 minutes
+            daily_assets: Crypto assets collected hourly
+            macro_indicators: FRED series collected daily
+            state_file: Scheduler state snapshot (journaled alongside)
+            clock: Time source (defaults to datetime.now)
+            tier_workers: Concurrent collections per tier value (defaults to DEFAULT_TIER_WORKERS)
+            daily_api_budget: API calls allowed per day (defaults to SCHEDULER_DAILY_API_BUDGET,
+                or 125% of the expected daily usage when that is 0)
+        """
         
         # Default asset configuration optimized for minimal API calls
         self.high_frequency_assets = high_frequency_assets or [
@@ -90,10 +115,18 @@ class MultiTierScheduler:
         
         # State management
         self.state_file = state_file
+        self.clock = clock or datetime.now
         self.tasks: Dict[str, CollectionTask] = {}
         self._running = False
         self._scheduler_thread: Optional[threading.Thread] = None
         self._shutdown_event = threading.Event()
+        self._state_store = SchedulerStateStore(state_file)
+        self._state_lock = threading.RLock()
+        self._queue = DueTaskQueue()
+        
+        # Worker pool per tier, created on first use
+        self.tier_workers = {**DEFAULT_TIER_WORKERS, **(tier_workers or {})}
+        self._executors: Dict[AssetTier, ThreadPoolExecutor] = {}
         
         # Performance tracking
         self.total_api_calls = 0
@@ -109,7 +142,12 @@ class MultiTierScheduler:
         
         # Initialize tasks
         self._initialize_tasks()
+        daily_api_budget = daily_api_budget or Config().SCHEDULER_DAILY_API_BUDGET
+        self.api_budget = ApiBudgetGovernor(
+            daily_api_budget or int(self._calculate_daily_api_usage() * API_BUDGET_HEADROOM)
+        )
         self._load_state()
+        self._schedule_tasks(self.clock())
         
         self.logger.info(f"MultiTierScheduler initialized with {len(self.tasks)} tasks")
         self.logger.info(f"High frequency assets: {self.high_frequency_assets}")
@@ -146,12 +184,39 @@ class MultiTierScheduler:
                 interval_seconds=self.intervals[AssetTier.MACRO]
             )
     
+    @staticmethod
+    def _task_id(task: CollectionTask) -> str:
+        prefix = 'macro' if task.tier == AssetTier.MACRO else 'crypto'
+        return f"{prefix}_{task.asset_id}"
+    
+    def _task_state(self, task: CollectionTask) -> Dict:
+        return {
+            'last_collection': task.last_collection.isoformat() if task.last_collection else None,
+            'consecutive_failures': task.consecutive_failures,
+            'enabled': task.enabled
+        }
+    
+    def _next_run_time(self, task: CollectionTask, current_time: datetime) -> datetime:
+        """When the task should next be collected"""
+        if task.last_collection is None:
+            return current_time
+        return task.last_collection + timedelta(seconds=task.interval_seconds)
+    
+    def _schedule_task(self, task: CollectionTask, current_time: datetime):
+        """Queue an enabled task for its next run (higher tiers first on ties)"""
+        if task.enabled:
+            self._queue.schedule(self._task_id(task), self._next_run_time(task, current_time),
+                                 list(AssetTier).index(task.tier))
+    
+    def _schedule_tasks(self, current_time: datetime):
+        for task in self.tasks.values():
+            self._schedule_task(task, current_time)
+    
     def _load_state(self):
-        """Load previous scheduler state from disk"""
-        if os.path.exists(self.state_file):
+        """Load previous scheduler state (snapshot plus journal) from disk"""
+        if os.path.exists(self.state_file) or os.path.exists(self._state_store.journal_path):
             try:
-                with open(self.state_file, 'r') as f:
-                    state_data = json.load(f)
+                state_data = self._state_store.load()
                 
                 # Restore last collection times
                 for task_id, task_state in state_data.get('tasks', {}).items():
@@ -166,6 +231,8 @@ class MultiTierScheduler:
                 # Restore stats
                 if 'collection_stats' in state_data:
                     self.collection_stats.update(state_data['collection_stats'])
+                if 'api_budget' in state_data:
+                    self.api_budget.restore(state_data['api_budget'])
                 
                 self.logger.info(f"Loaded scheduler state from {self.state_file}")
                 
@@ -173,34 +240,37 @@ class MultiTierScheduler:
                 self.logger.warning(f"Failed to load scheduler state: {e}")
     
     def _save_state(self):
-        """Save current scheduler state to disk"""
+        """Write a full state snapshot to disk (folds in and clears the journal)"""
         try:
-            # Prepare state data
-            state_data = {
-                'tasks': {},
-                'collection_stats': self.collection_stats,
-                'total_api_calls': self.total_api_calls,
-                'last_save': datetime.now().isoformat()
-            }
-            
-            # Save task states
-            for task_id, task in self.tasks.items():
-                state_data['tasks'][task_id] = {
-                    'last_collection': task.last_collection.isoformat() if task.last_collection else None,
-                    'consecutive_failures': task.consecutive_failures,
-                    'enabled': task.enabled
+            with self._state_lock:
+                state_data = {
+                    'tasks': {task_id: self._task_state(task) for task_id, task in self.tasks.items()},
+                    'collection_stats': self.collection_stats,
+                    'total_api_calls': self.total_api_calls,
+                    'api_budget': self.api_budget.to_dict(),
+                    'last_save': self.clock().isoformat()
                 }
-            
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
-            
-            # Write state file
-            with open(self.state_file, 'w') as f:
-                json.dump(state_data, f, indent=2)
+                self._state_store.write_snapshot(state_data)
                 
         except Exception as e:
             self.logger.error(f"Failed to save scheduler state: {e}")
     
+    def _persist_task(self, task: CollectionTask):
+        """Journal one task's state and the counters it changed"""
+        try:
+            with self._state_lock:
+                self._state_store.append({
+                    'tasks': {self._task_id(task): self._task_state(task)},
+                    'collection_stats': self.collection_stats,
+                    'total_api_calls': self.total_api_calls,
+                    'api_budget': self.api_budget.to_dict()
+                })
+                if self._state_store.needs_compaction:
+                    self._save_state()
+                    
+        except Exception as e:
+            self.logger.error(f"Failed to save scheduler state: {e}")
+    
     def start(self) -> bool:
         """Start the multi-tier scheduler"""
         if self._running:
@@ -223,7 +293,8 @@ class MultiTierScheduler:
             
             # Calculate expected API usage
             daily_api_calls = self._calculate_daily_api_usage()
-            self.logger.info(f"  📡 Estimated daily API calls: {daily_api_calls}")
+            self.logger.info(f"  📡 Estimated daily API calls: {daily_api_calls} "
+                             f"(budget {self.api_budget.daily_limit})")
             
             self._running = True
             self._shutdown_event.clear()
@@ -262,28 +333,58 @@ class MultiTierScheduler:
         if self._scheduler_thread and self._scheduler_thread.is_alive():
             self._scheduler_thread.join(timeout=10)
         
+        # Let in-flight collections finish
+        for executor in self._executors.values():
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._executors.clear()
+        
         # Save final state
         self._save_state()
         
         self.logger.info("✅ Multi-Tier Scheduler stopped")
     
     def _calculate_daily_api_usage(self) -> int:
-        """Calculate expected daily API call usage"""
-        calls_per_day = 0
-        
-        # High frequency assets (every 15 minutes = 96 times per day)
-        hf_assets = len([t for t in self.tasks.values() if t.tier == AssetTier.HIGH_FREQUENCY])
-        calls_per_day += hf_assets * 96
-        
-        # Hourly assets (every 60 minutes = 24 times per day)
-        hourly_assets = len([t for t in self.tasks.values() if t.tier == AssetTier.HOURLY])
-        calls_per_day += hourly_assets * 24
-        
-        # Macro indicators (once per day)
-        macro_indicators = len([t for t in self.tasks.values() if t.tier == AssetTier.MACRO])
-        calls_per_day += macro_indicators * 1
+        """Calculate expected daily API call usage (one call per collection)"""
+        # e.g. 15-minute assets: 96 calls, hourly assets: 24 calls, daily macro indicators: 1 call
+        return sum((24 * 60 * 60) // task.interval_seconds for task in self.tasks.values())
+    
+    def next_due_time(self) -> Optional[datetime]:
+        """Run time of the earliest queued task (None if nothing is queued)"""
+        return self._queue.next_due()
+    
+    def _seconds_until_next_due(self) -> float:
+        next_due = self.next_due_time()
+        if next_due is None:
+            return 60
+        return min(60, max(1, (next_due - self.clock()).total_seconds()))
+    
+    def run_pending(self, current_time: Optional[datetime] = None, wait_for_completion: bool = False) -> List[Future]:
+        """
+        Dispatch every due task to its tier's worker pool.
         
-        return calls_per_day
+        Args:
+            current_time: Scheduling time (defaults to the scheduler clock)
+            wait_for_completion: Block until the dispatched collections have finished
+            
+        Returns:
+            Futures of the dispatched collections (each resolves to success)
+        """
+        current_time = current_time or self.clock()
+        due_tasks = self._get_due_tasks(current_time)
+        futures = []
+        
+        if due_tasks:
+            self.logger.info(f"Found {len(due_tasks)} tasks due for collection")
+            
+            # Group tasks by tier so each tier runs on its own workers
+            tasks_by_tier = self._group_tasks_by_tier(due_tasks)
+            for tier, tier_tasks in tasks_by_tier.items():
+                if tier_tasks:
+                    futures.extend(self._process_tier_tasks(tier, tier_tasks, current_time))
+        
+        if wait_for_completion and futures:
+            wait(futures)
+        return futures
     
     def _scheduler_loop(self):
         """Main scheduler loop"""
@@ -291,29 +392,10 @@ class MultiTierScheduler:
         
         while self._running and not self._shutdown_event.is_set():
             try:
-                current_time = datetime.now()
-                
-                # Check which tasks are due for collection
-                due_tasks = self._get_due_tasks(current_time)
+                self.run_pending()
                 
-                if due_tasks:
-                    self.logger.info(f"Found {len(due_tasks)} tasks due for collection")
-                    
-                    # Group tasks by tier for batch processing
-                    tasks_by_tier = self._group_tasks_by_tier(due_tasks)
-                    
-                    # Process each tier
-                    for tier, tier_tasks in tasks_by_tier.items():
-                        if tier_tasks:
-                            self._process_tier_tasks(tier, tier_tasks, current_time)
-                
-                # Save state periodically
-                self._save_state()
-                
-                # Wait before next check (check every minute)
-                if not self._shutdown_event.wait(timeout=60):
-                    continue
-                else:
+                # Sleep until the next task is due (re-checking at least every minute)
+                if self._shutdown_event.wait(timeout=self._seconds_until_next_due()):
                     break
                     
             except Exception as e:
@@ -323,21 +405,27 @@ class MultiTierScheduler:
         self.logger.info("Scheduler loop ended")
     
     def _get_due_tasks(self, current_time: datetime) -> List[CollectionTask]:
-        """Get tasks that are due for collection"""
+        """Pop the tasks that are due from the queue, deferring those over the API budget"""
         due_tasks = []
+        deferred = 0
         
-        for task in self.tasks.values():
+        for task_id in self._queue.pop_due(current_time):
+            task = self.tasks[task_id]
             if not task.enabled:
                 continue
             
-            # Check if task is due
-            if task.last_collection is None:
-                # First run
-                due_tasks.append(task)
-            else:
-                time_since_last = (current_time - task.last_collection).total_seconds()
-                if time_since_last >= task.interval_seconds:
-                    due_tasks.append(task)
+            if not self.api_budget.try_acquire(current_time):
+                # Budget spent: retry when the next budget day starts
+                self._queue.schedule(task_id, self.api_budget.next_reset(current_time),
+                                     list(AssetTier).index(task.tier))
+                deferred += 1
+                continue
+            
+            due_tasks.append(task)
+        
+        if deferred:
+            self.logger.warning(f"Daily API budget of {self.api_budget.daily_limit} calls spent, "
+                                f"deferred {deferred} tasks to {self.api_budget.next_reset(current_time)}")
         
         return due_tasks
     
@@ -350,41 +438,50 @@ class MultiTierScheduler:
         
         return grouped
     
-    def _process_tier_tasks(self, tier: AssetTier, tasks: List[CollectionTask], current_time: datetime):
-        """Process all tasks for a specific tier"""
+    def _executor(self, tier: AssetTier) -> ThreadPoolExecutor:
+        executor = self._executors.get(tier)
+        if executor is None:
+            executor = self._executors[tier] = ThreadPoolExecutor(
+                max_workers=max(1, self.tier_workers[tier.value]),
+                thread_name_prefix=f"scheduler-{tier.value}"
+            )
+        return executor
+    
+    def _process_tier_tasks(self, tier: AssetTier, tasks: List[CollectionTask], current_time: datetime) -> List[Future]:
+        """Submit all tasks for a specific tier to the tier's worker pool"""
         self.logger.info(f"Processing {len(tasks)} {tier.value} tasks")
+        executor = self._executor(tier)
+        return [executor.submit(self._run_task, task, current_time) for task in tasks]
+    
+    def _run_task(self, task: CollectionTask, current_time: datetime) -> bool:
+        """Collect one task on a tier worker, then record and reschedule it"""
+        try:
+            success = self._execute_collection_task(task, current_time)
+        except Exception as e:
+            self.logger.error(f"Failed to execute task {task.asset_id}: {e}")
+            success = False
         
-        success_count = 0
-        failure_count = 0
-        
-        for task in tasks:
-            try:
-                success = self._execute_collection_task(task, current_time)
-                
-                if success:
-                    success_count += 1
-                    task.consecutive_failures = 0
-                    self.collection_stats[tier.value]['success'] += 1
-                else:
-                    failure_count += 1
-                    task.consecutive_failures += 1
-                    self.collection_stats[tier.value]['failure'] += 1
-                
-                # Update last collection time
-                task.last_collection = current_time
-                
-                # Disable task if too many consecutive failures
-                if task.consecutive_failures >= 3:
-                    task.enabled = False
-                    self.logger.warning(f"Disabled task {task.asset_id} after 3 consecutive failures")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to execute task {task.asset_id}: {e}")
-                failure_count += 1
+        with self._state_lock:
+            if success:
+                task.consecutive_failures = 0
+                self.collection_stats[task.tier.value]['success'] += 1
+            else:
                 task.consecutive_failures += 1
+                self.collection_stats[task.tier.value]['failure'] += 1
+            
+            # Update last collection time
+            task.last_collection = current_time
+            
+            # Disable task if too many consecutive failures
+            if task.consecutive_failures >= 3:
+                task.enabled = False
+                self.logger.warning(f"Disabled task {task.asset_id} after 3 consecutive failures")
+            else:
+                self._schedule_task(task, current_time)
+            
+            self._persist_task(task)
         
-        # Log tier results
-        self.logger.info(f"✅ {tier.value}: {success_count} successful, {failure_count} failed")
+        return success
     
     def _execute_collection_task(self, task: CollectionTask, current_time: datetime) -> bool:
         """Execute a single collection task"""
@@ -393,7 +490,8 @@ class MultiTierScheduler:
             if task.tier in [AssetTier.HIGH_FREQUENCY, AssetTier.HOURLY]:
                 # Crypto asset collection
                 result = self.crypto_collector.collect_crypto_data(task.asset_id, days=1)
-                self.total_api_calls += 1
+                with self._state_lock:
+                    self.total_api_calls += 1
                 
                 success = result.get('success', False)
                 if success:
@@ -406,7 +504,8 @@ class MultiTierScheduler:
             elif task.tier == AssetTier.MACRO:
                 # Macro indicator collection
                 records = self.macro_collector.collect_indicator(task.asset_id, days=1)
-                self.total_api_calls += 1
+                with self._state_lock:
+                    self.total_api_calls += 1
                 
                 success = len(records) > 0
                 if success:
@@ -424,13 +523,13 @@ class MultiTierScheduler:
     
     def get_status(self) -> Dict:
         """Get current scheduler status"""
-        current_time = datetime.now()
+        current_time = self.clock()
         
         # Calculate task statuses
         task_status = {}
         for task_id, task in self.tasks.items():
-            next_collection = None
-            if task.last_collection:
+            next_collection = self._queue.scheduled_time(task_id)
+            if next_collection is None and task.last_collection:
                 next_collection = task.last_collection + timedelta(seconds=task.interval_seconds)
             
             task_status[task_id] = {
@@ -449,6 +548,8 @@ class MultiTierScheduler:
             'total_api_calls': self.total_api_calls,
             'collection_stats': self.collection_stats,
             'expected_daily_calls': self._calculate_daily_api_usage(),
+            'api_budget': {**self.api_budget.to_dict(), 'remaining': self.api_budget.remaining(current_time)},
+            'queued_tasks': len(self._queue),
             'task_status': task_status,
             'last_updated': current_time.isoformat()
         }
@@ -0,0 +1,245 @@
+"""
+Layered response cache for the signal API.
+
+Lookups go to an in-process LRU first and then to an optional shared Redis tier. Entries are
+fresh for their TTL and may then be served stale for a further window while one background
+task recomputes them. Concurrent misses for the same key share a single computation
+(single-flight), so an expiring key does not trigger a recompute per waiting request.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+# Seconds an expired entry may still be served while it is refreshed in the background
+DEFAULT_STALE_SECONDS = 300
+
+
+class CacheEntry:
+    """Cached value with the times it stops being fresh and stops being servable."""
+
+    __slots__ = ('value', 'fresh_until', 'stale_until')
+
+    def __init__(self, value: Any, fresh_until: float, stale_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+    def to_json(self) -> str:
+        return json.dumps({'value': self.value, 'fresh_until': self.fresh_until,
+                           'stale_until': self.stale_until}, default=str)
+
+    @classmethod
+    def from_json(cls, payload: str) -> 'CacheEntry':
+        data = json.loads(payload)
+        return cls(data['value'], data['fresh_until'], data['stale_until'])
+
+
+class LRUTier:
+    """Bounded in-process map of cache entries, evicting the least recently used."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LayeredCache:
+    """
+    In-process LRU in front of an optional async Redis client.
+
+    The remote tier only needs async get(key), set(key, value, ex=seconds) and delete(key),
+    which redis.asyncio clients provide. Remote failures are logged and treated as misses,
+    so the API keeps serving from memory when Redis is unavailable.
+    """
+
+    def __init__(self, remote: Any = None, max_entries: int = 1024,
+                 stale_seconds: float = DEFAULT_STALE_SECONDS,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            remote: Optional async Redis client shared between API processes
+            max_entries: Entries kept in the in-process tier
+            stale_seconds: Default window an expired entry is served while refreshing
+            clock: Wall-clock source (seconds); shared with the remote tier's expiries
+        """
+        self.remote = remote
+        self.local = LRUTier(max_entries)
+        self.stale_seconds = stale_seconds
+        self.clock = clock
+        self.metrics: Counter = Counter()
+        self.logger = logging.getLogger(__name__)
+        # In-flight computations per event loop: key -> task
+        self._inflight: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]' = \
+            weakref.WeakKeyDictionary()
+
+    def _entry(self, value: Any, ttl: float, stale_seconds: Optional[float]) -> CacheEntry:
+        now = self.clock()
+        stale = self.stale_seconds if stale_seconds is None else stale_seconds
+        return CacheEntry(value, now + ttl, now + ttl + stale)
+
+    async def _remote_get(self, key: str) -> Optional[CacheEntry]:
+        if self.remote is None:
+            return None
+        try:
+            payload = await self.remote.get(key)
+            return CacheEntry.from_json(payload) if payload else None
+        except Exception as e:
+            self.metrics['remote_errors'] += 1
+            self.logger.warning(f"Cache get failed for {key}: {e}")
+            return None
+
+    async def _remote_set(self, key: str, entry: CacheEntry) -> None:
+        if self.remote is None:
+            return
+        try:
+            expire = max(1, int(entry.stale_until - self.clock()))
+            await self.remote.set(key, entry.to_json(), ex=expire)
+        except Exception as e:
+            self.metrics['remote_errors'] += 1
+            self.logger.warning(f"Cache set failed for {key}: {e}")
+
+    async def _lookup(self, key: str) -> Tuple[Optional[CacheEntry], str]:
+        """Servable entry for key and the tier it came from ('memory', 'remote' or 'miss')."""
+        now = self.clock()
+        entry = self.local.get(key)
+        if entry is not None and now < entry.stale_until:
+            return entry, 'memory'
+        entry = await self._remote_get(key)
+        if entry is not None and now < entry.stale_until:
+            self.local.put(key, entry)
+            return entry, 'remote'
+        return None, 'miss'
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Cached value for key if it is still fresh."""
+        entry, tier = await self._lookup(key)
+        if entry is None or self.clock() >= entry.fresh_until:
+            self.metrics['misses'] += 1
+            return None
+        self.metrics[f'{tier}_hits'] += 1
+        return entry.value
+
+    async def set(self, key: str, value: Any, ttl: float, stale_seconds: Optional[float] = None) -> None:
+        """Store value in both tiers, fresh for ttl seconds."""
+        entry = self._entry(value, ttl, stale_seconds)
+        self.local.put(key, entry)
+        await self._remote_set(key, entry)
+
+    async def invalidate(self, key: str) -> None:
+        """Drop key from both tiers."""
+        self.local.delete(key)
+        if self.remote is not None:
+            try:
+                await self.remote.delete(key)
+            except Exception as e:
+                self.metrics['remote_errors'] += 1
+                self.logger.warning(f"Cache delete failed for {key}: {e}")
+
+    def _compute(self, key: str, compute: Callable[[], Awaitable[Any]], ttl: float,
+                 stale_seconds: Optional[float], should_cache: Optional[Callable[[Any], bool]]) -> asyncio.Task:
+        """Task computing key, shared by every caller on this event loop until it finishes."""
+        inflight = self._inflight.setdefault(asyncio.get_running_loop(), {})
+        task = inflight.get(key)
+        if task is not None:
+            self.metrics['coalesced'] += 1
+            return task
+
+        async def run() -> Any:
+            value = await compute()
+            if should_cache is None or should_cache(value):
+                await self.set(key, value, ttl, stale_seconds)
+            return value
+
+        task = asyncio.ensure_future(run())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+        return task
+
+    def _on_refreshed(self, key: str, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self.metrics['refresh_errors'] += 1
+            self.logger.warning(f"Background refresh of {key} failed: {task.exception()}")
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]], ttl: float,
+                             stale_seconds: Optional[float] = None,
+                             should_cache: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Cached value for key, computing it on a miss.
+
+        Args:
+            key: Cache key
+            compute: Coroutine function producing the value (JSON-serializable for Redis)
+            ttl: Seconds the computed value is fresh
+            stale_seconds: Seconds past ttl it may be served while refreshing (default stale_seconds)
+            should_cache: Predicate deciding whether a computed value is stored
+
+        Returns:
+            The fresh or stale cached value, or the newly computed one
+        """
+        entry, tier = await self._lookup(key)
+        if entry is not None:
+            if self.clock() < entry.fresh_until:
+                self.metrics[f'{tier}_hits'] += 1
+            else:
+                self.metrics['stale_hits'] += 1
+                if key not in self._inflight.get(asyncio.get_running_loop(), {}):
+                    self.metrics['refreshes'] += 1
+                    task = self._compute(key, compute, ttl, stale_seconds, should_cache)
+                    task.add_done_callback(lambda t: self._on_refreshed(key, t))
+            return entry.value
+
+        self.metrics['misses'] += 1
+        # shield: a cancelled request must not cancel the computation other callers share
+        return await asyncio.shield(self._compute(key, compute, ttl, stale_seconds, should_cache))
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, hit ratio and tier sizes."""
+        counters = {name: self.metrics[name] for name in (
+            'memory_hits', 'remote_hits', 'stale_hits', 'misses', 'coalesced',
+            'refreshes', 'refresh_errors', 'remote_errors')}
+        hits = counters['memory_hits'] + counters['remote_hits'] + counters['stale_hits']
+        lookups = hits + counters['misses']
+        return {
+            **counters,
+            'hit_ratio': round(hits / lookups, 4) if lookups else None,
+            'memory_entries': len(self.local),
+            'memory_max_entries': self.local.max_entries,
+            'remote_enabled': self.remote is not None,
+        }
+
+    async def close(self) -> None:
+        """Close the remote client if there is one."""
+        if self.remote is not None:
+            try:
+                await self.remote.close()
+            except Exception as e:
+                self.logger.warning(f"Failed to close cache remote: {e}")
+            self.remote = None
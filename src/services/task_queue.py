@@ -0,0 +1,230 @@
+"""
+Scheduling primitives shared by the multi-tier schedulers.
+
+- DueTaskQueue: min-heap of task ids keyed on next run time, so each pass pops only the
+  tasks that are due instead of scanning every task
+- ApiBudgetGovernor: daily API call budget; collections beyond it wait for the next day
+- SchedulerStateStore: JSON snapshot plus an append-only journal, so a completed task
+  persists one line instead of rewriting the whole state file
+"""
+
+import heapq
+import itertools
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Concurrent collections per tier (keyed by AssetTier value)
+DEFAULT_TIER_WORKERS = {
+    'high_frequency': 4,
+    'hourly': 2,
+    'macro': 1,
+}
+
+# Headroom over the expected daily usage when no explicit API budget is configured
+API_BUDGET_HEADROOM = 1.25
+
+
+class DueTaskQueue:
+    """
+    Priority queue of task ids ordered by (next run time, priority).
+
+    Rescheduling a task replaces its previous entry; stale heap entries are skipped lazily
+    when they reach the top.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int, int, str]] = []
+        self._entries: Dict[str, Tuple[datetime, int, int]] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def schedule(self, task_id: str, when: datetime, priority: int = 0) -> None:
+        """Queue task_id to run at `when` (lower priority values run first on ties)."""
+        with self._lock:
+            entry = (when, priority, next(self._sequence))
+            self._entries[task_id] = entry
+            heapq.heappush(self._heap, (*entry, task_id))
+
+    def discard(self, task_id: str) -> None:
+        """Remove task_id from the queue if present."""
+        with self._lock:
+            self._entries.pop(task_id, None)
+
+    def _prune(self) -> None:
+        while self._heap:
+            when, priority, sequence, task_id = self._heap[0]
+            if self._entries.get(task_id) == (when, priority, sequence):
+                return
+            heapq.heappop(self._heap)
+
+    def pop_due(self, now: datetime) -> List[str]:
+        """Remove and return the ids of all tasks due at or before now, earliest first."""
+        due = []
+        with self._lock:
+            self._prune()
+            while self._heap and self._heap[0][0] <= now:
+                task_id = heapq.heappop(self._heap)[3]
+                del self._entries[task_id]
+                due.append(task_id)
+                self._prune()
+        return due
+
+    def next_due(self) -> Optional[datetime]:
+        """Run time of the earliest queued task (None if the queue is empty)."""
+        with self._lock:
+            self._prune()
+            return self._heap[0][0] if self._heap else None
+
+    def scheduled_time(self, task_id: str) -> Optional[datetime]:
+        """Run time task_id is queued for (None if it is not queued)."""
+        entry = self._entries.get(task_id)
+        return entry[0] if entry else None
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ApiBudgetGovernor:
+    """
+    Daily API call budget.
+
+    try_acquire() consumes budget for one collection; once the day's budget is spent it
+    refuses until the next midnight of the scheduler clock.
+    """
+
+    def __init__(self, daily_limit: int):
+        """
+        Args:
+            daily_limit: API calls allowed per calendar day
+        """
+        self.daily_limit = daily_limit
+        self.day: Optional[str] = None
+        self.used = 0
+        self.deferred = 0
+        self._lock = threading.Lock()
+
+    def _roll(self, now: datetime) -> None:
+        day = now.date().isoformat()
+        if day != self.day:
+            self.day, self.used, self.deferred = day, 0, 0
+
+    def try_acquire(self, now: datetime, calls: int = 1) -> bool:
+        """Consume `calls` from today's budget; False (and nothing consumed) if it would be exceeded."""
+        with self._lock:
+            self._roll(now)
+            if self.used + calls > self.daily_limit:
+                self.deferred += 1
+                return False
+            self.used += calls
+            return True
+
+    def remaining(self, now: datetime) -> int:
+        """Calls left in today's budget."""
+        with self._lock:
+            self._roll(now)
+            return max(0, self.daily_limit - self.used)
+
+    @staticmethod
+    def next_reset(now: datetime) -> datetime:
+        """Start of the next budget day."""
+        return datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'day': self.day, 'used': self.used, 'deferred': self.deferred, 'daily_limit': self.daily_limit}
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """Resume usage recorded by a previous run (ignored by _roll on a new day)."""
+        self.day = state.get('day')
+        self.used = int(state.get('used', 0))
+        self.deferred = int(state.get('deferred', 0))
+
+
+class SchedulerStateStore:
+    """
+    Scheduler state as a JSON snapshot plus a journal of partial updates.
+
+    Each journal line is a JSON object merged into the snapshot on load: its 'tasks' entries
+    replace the matching task records and every other key replaces the snapshot value.
+    Once the journal reaches compact_threshold lines, the caller writes a new snapshot,
+    which also empties the journal.
+
+    Files (for state_file "data/scheduler_state.json"):
+    - data/scheduler_state.json     snapshot, replaced atomically
+    - data/scheduler_state.journal  JSON lines appended since the snapshot
+    """
+
+    def __init__(self, state_file: str, compact_threshold: int = 500):
+        self.state_path = Path(state_file)
+        self.journal_path = self.state_path.with_suffix('.journal')
+        self.compact_threshold = compact_threshold
+        self.journal_entries = 0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def _merge(state: Dict[str, Any], update: Dict[str, Any]) -> None:
+        for key, value in update.items():
+            if key == 'tasks':
+                state.setdefault('tasks', {}).update(value)
+            else:
+                state[key] = value
+
+    def load(self) -> Dict[str, Any]:
+        """Snapshot merged with every journal update (empty dict if neither exists)."""
+        state: Dict[str, Any] = {}
+        if self.state_path.exists():
+            with open(self.state_path, 'r') as f:
+                state = json.load(f)
+
+        self.journal_entries = 0
+        if self.journal_path.exists():
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    if not line.endswith('\n'):
+                        break  # Torn final line from an interrupted write
+                    try:
+                        self._merge(state, json.loads(line))
+                        self.journal_entries += 1
+                    except json.JSONDecodeError:
+                        self.logger.warning(f"Skipping invalid scheduler journal line in {self.journal_path}")
+        return state
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self.journal_entries >= self.compact_threshold
+
+    def append(self, update: Dict[str, Any]) -> None:
+        """Append one partial state update to the journal."""
+        line = json.dumps(update, separators=(',', ':')) + '\n'
+        with self._lock:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, 'a') as f:
+                f.write(line)
+            self.journal_entries += 1
+
+    def write_snapshot(self, state: Dict[str, Any]) -> None:
+        """Atomically replace the snapshot with the full state and start an empty journal."""
+        with self._lock:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_fd, tmp_path = tempfile.mkstemp(prefix='scheduler_', dir=str(self.state_path.parent))
+            try:
+                with os.fdopen(tmp_fd, 'w') as f:
+                    json.dump(state, f, separators=(',', ':'))
+                os.replace(tmp_path, self.state_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            # Journal entries are all folded into the snapshot just written
+            with open(self.journal_path, 'w'):
+                pass
+            self.journal_entries = 0
@@ -135,7 +135,8 @@ class BacktestInterface:
         self.transaction_cost = transaction_cost
         self.db = CryptoDatabase()
     
-    def backtest_strategy(self, strategy: SignalStrategy, start_date: str, end_date: str) -> BacktestResult:
+    def backtest_strategy(self, strategy: SignalStrategy, start_date: str, end_date: str,
+                          historical_data: Optional[Dict[str, Any]] = None) -> BacktestResult:
         """
         Backtest a single strategy against historical data.
         
@@ -143,6 +144,8 @@ class BacktestInterface:
             strategy: Strategy instance to backtest
             start_date: Start date in 'YYYY-MM-DD' format
             end_date: End date in 'YYYY-MM-DD' format
+            historical_data: Pre-loaded data in the _get_historical_data format; loaded
+                             from the database when not provided
             
         Returns:
             BacktestResult containing performance metrics and detailed results
@@ -163,7 +166,8 @@ class BacktestInterface:
                 raise ConfigurationError("Strategy must specify assets to backtest")
             
             # Get historical data
-            historical_data = self._get_historical_data(assets, start_date, end_date)
+            if historical_data is None:
+                historical_data = self._get_historical_data(assets, start_date, end_date)
             
             # Generate signals over the backtest period
             signals = self._generate_historical_signals(strategy, historical_data, start_date, end_date)
@@ -647,8 +651,11 @@ class BacktestInterface:
                     vix_data.append(record)
             filtered_data['vix_data'] = vix_data
         
-        # Filter crypto data
+        # Filter crypto data (rebuild nested dicts so the full history passed in is left intact)
         if 'crypto_data' in filtered_data:
+            filtered_data['crypto_data'] = {
+                asset: dict(asset_data) for asset, asset_data in filtered_data['crypto_data'].items()
+            }
             for asset in filtered_data['crypto_data']:
                 if 'price_data' in filtered_data['crypto_data'][asset]:
                     price_data = []
@@ -674,28 +681,37 @@ class BacktestInterface:
             'trade_log': []
         }
         
-        # Get price data for all assets
-        price_data = self._prepare_price_data(historical_data)
-        
-        # Process signals day by day
         start_dt = datetime.strptime(start_date, '%Y-%m-%d')
         end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+        n_days = max((end_dt - start_dt).days + 1, 0)
         
-        current_date = start_dt
+        # Day-aligned price matrix (rows = day ordinal, columns = asset) and per-day signal buckets
+        assets, price_matrix = self._build_price_matrix(historical_data, start_dt, n_days)
+        asset_index = {asset: i for i, asset in enumerate(assets)}
+        signal_buckets = self._bucket_signals_by_day(signals, start_dt, n_days)
+        
+        # Share holdings aligned with price_matrix columns for vectorized valuation
+        holdings = np.zeros(len(assets))
         prev_portfolio_value = self.initial_capital
         
-        while current_date <= end_dt:
-            date_str = current_date.strftime('%Y-%m-%d')
-            
-            # Get signals for this date
-            date_signals = [s for s in signals if datetime.fromtimestamp(s.timestamp).date() == current_date.date()]
+        for day in range(n_days):
+            day_prices = price_matrix[day]
+            date_str = (start_dt + timedelta(days=day)).strftime('%Y-%m-%d')
             
             # Execute trades based on signals
-            for signal in date_signals:
-                self._execute_trade(signal, portfolio, price_data, date_str)
+            for signal in signal_buckets[day]:
+                idx = asset_index.get(signal.symbol)
+                if idx is None or np.isnan(day_prices[idx]):
+                    continue  # Skip if no price data
+                
+                portfolio_value = self._value_holdings(portfolio['cash'], holdings, day_prices)
+                self._apply_trade(signal, portfolio, float(day_prices[idx]), portfolio_value, date_str)
+                
+                position = portfolio['positions'].get(signal.symbol)
+                holdings[idx] = position['shares'] if position else 0.0
             
             # Calculate portfolio value
-            portfolio_value = self._calculate_portfolio_value(portfolio, price_data, date_str)
+            portfolio_value = self._value_holdings(portfolio['cash'], holdings, day_prices)
             
             # Calculate daily return
             if prev_portfolio_value > 0:
@@ -707,7 +723,6 @@ class BacktestInterface:
             portfolio['equity_history'].append(portfolio_value)
             
             prev_portfolio_value = portfolio_value
-            current_date += timedelta(days=1)
         
         # Calculate drawdown series
         drawdown_series = self._calculate_drawdown_series(portfolio['equity_history'])
@@ -723,6 +738,53 @@ class BacktestInterface:
             'data_quality': data_quality
         }
     
+    def _build_price_matrix(self, historical_data: Dict[str, Any], start_dt: datetime,
+                            n_days: int) -> Tuple[List[str], np.ndarray]:
+        """
+        Build a (n_days x n_assets) close price matrix indexed by day ordinal from start_dt.
+        
+        Days without a price are NaN. When a date appears more than once the last record wins,
+        matching the dict-based lookup in _prepare_price_data.
+        """
+        assets = list(historical_data.get('crypto_data', {}).keys())
+        price_matrix = np.full((n_days, len(assets)), np.nan)
+        start_ordinal = start_dt.toordinal()
+        
+        for col, asset in enumerate(assets):
+            for record in historical_data['crypto_data'][asset].get('price_data', []):
+                close = record.get('close')
+                if close is None:
+                    continue
+                try:
+                    day = datetime.strptime(record['date'], '%Y-%m-%d').toordinal() - start_ordinal
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if 0 <= day < n_days:
+                    price_matrix[day, col] = close
+        
+        return assets, price_matrix
+    
+    def _bucket_signals_by_day(self, signals: List[TradingSignal], start_dt: datetime,
+                               n_days: int) -> List[List[TradingSignal]]:
+        """Group signals into per-day buckets by day ordinal, preserving signal order within a day."""
+        buckets: List[List[TradingSignal]] = [[] for _ in range(n_days)]
+        start_ordinal = start_dt.toordinal()
+        
+        for signal in signals:
+            timestamp = signal.timestamp
+            signal_dt = timestamp if isinstance(timestamp, datetime) else datetime.fromtimestamp(timestamp)
+            day = signal_dt.toordinal() - start_ordinal
+            if 0 <= day < n_days:
+                buckets[day].append(signal)
+        
+        return buckets
+    
+    def _value_holdings(self, cash: float, holdings: np.ndarray, day_prices: np.ndarray) -> float:
+        """Value cash plus share holdings at the given prices; assets without a price contribute nothing."""
+        if not holdings.size:
+            return cash
+        return cash + float(np.nansum(holdings * day_prices))
+    
     def _prepare_price_data(self, historical_data: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
         """Prepare price data for easy lookup during simulation."""
         price_data = {}
@@ -741,8 +803,6 @@ class BacktestInterface:
         """Execute a trade based on a signal."""
         
         asset = signal.symbol
-        signal_type = signal.signal_type
-        position_size = signal.position_size
         
         # Get current price
         if asset not in price_data or date_str not in price_data[asset]:
@@ -752,6 +812,17 @@ class BacktestInterface:
         
         # Calculate position value
         portfolio_value = self._calculate_portfolio_value(portfolio, price_data, date_str)
+        
+        self._apply_trade(signal, portfolio, current_price, portfolio_value, date_str)
+    
+    def _apply_trade(self, signal: TradingSignal, portfolio: Dict[str, Any],
+                     current_price: float, portfolio_value: float, date_str: str) -> None:
+        """Apply a signal to the portfolio at a known price and portfolio value."""
+        
+        asset = signal.symbol
+        signal_type = signal.signal_type
+        position_size = signal.position_size
+        
         position_value = portfolio_value * position_size
         
         # Handle different signal types
@@ -0,0 +1,337 @@
+"""
+Parameter Sweep Runner
+Fans strategy backtests out across a process pool over historical data that is loaded once
+and shared with workers through a memory-mapped array file.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import random
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+
+import numpy as np
+import pandas as pd
+
+from src.signals.backtest_interface import BacktestInterface
+from src.signals.strategies.base_strategy import SignalStrategy
+
+
+class SharedMarketData:
+    """
+    Historical backtest data packed into one float64 array on disk.
+
+    Each price series (VIX and each asset's price_data) is stored as a block of rows: one row of
+    date ordinals followed by one row per numeric field. Workers memory-map the file read-only and
+    rebuild the dict-of-records structure expected by BacktestInterface.
+    """
+
+    def __init__(self, path: str, layout: List[Dict[str, Any]], passthrough: Dict[str, Any]):
+        self.path = path
+        self.layout = layout
+        self.passthrough = passthrough
+        self._array: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_historical_data(cls, historical_data: Dict[str, Any], directory: str) -> 'SharedMarketData':
+        """Pack historical data into <directory>/market_data.npy."""
+        series = []
+        if 'vix_data' in historical_data:
+            series.append((('vix_data',), historical_data['vix_data'] or []))
+        for asset, asset_data in (historical_data.get('crypto_data') or {}).items():
+            series.append((('crypto_data', asset), (asset_data or {}).get('price_data', [])))
+
+        blocks = []
+        layout = []
+        offset = 0
+        for key, records in series:
+            fields = sorted({k for record in records for k in record if k != 'date'})
+            block = np.full((1 + len(fields), len(records)), np.nan)
+            for col, record in enumerate(records):
+                block[0, col] = datetime.strptime(str(record['date'])[:10], '%Y-%m-%d').toordinal()
+                for row, field in enumerate(fields, 1):
+                    value = record.get(field)
+                    if value is not None:
+                        block[row, col] = float(value)
+            blocks.append(block.ravel())
+            layout.append({
+                'key': key,
+                'fields': fields,
+                'offset': offset,
+                'length': len(records)
+            })
+            offset += block.size
+
+        flat = np.concatenate(blocks) if blocks else np.empty(0)
+        path = os.path.join(directory, 'market_data.npy')
+        np.save(path, flat)
+
+        passthrough = {k: v for k, v in historical_data.items() if k not in ('vix_data', 'crypto_data')}
+        return cls(path, layout, passthrough)
+
+    def to_historical_data(self) -> Dict[str, Any]:
+        """Rebuild a fresh dict-of-records copy (backtests mutate the structure they are given)."""
+        if self._array is None:
+            self._array = np.load(self.path, mmap_mode='r')
+
+        historical_data: Dict[str, Any] = dict(self.passthrough)
+        for entry in self.layout:
+            fields = entry['fields']
+            length = entry['length']
+            block = np.asarray(
+                self._array[entry['offset']:entry['offset'] + (1 + len(fields)) * length]
+            ).reshape(1 + len(fields), length)
+
+            records = []
+            for col in range(length):
+                record = {'date': date.fromordinal(int(block[0, col])).strftime('%Y-%m-%d')}
+                for row, field in enumerate(fields, 1):
+                    value = block[row, col]
+                    record[field] = None if np.isnan(value) else float(value)
+                records.append(record)
+
+            if entry['key'][0] == 'vix_data':
+                historical_data['vix_data'] = records
+            else:
+                historical_data.setdefault('crypto_data', {})[entry['key'][1]] = {'price_data': records}
+
+        return historical_data
+
+
+def _set_attributes(strategy: SignalStrategy, params: Dict[str, Any]) -> None:
+    """Default parameter setter: assign each parameter as a strategy attribute."""
+    for name, value in params.items():
+        setattr(strategy, name, value)
+
+
+# Per-worker state populated by _init_worker
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(market_data: SharedMarketData, strategy_class: Type[SignalStrategy], config_path: str,
+                 start_date: str, end_date: str, initial_capital: float, transaction_cost: float,
+                 param_setter: Callable[[SignalStrategy, Dict[str, Any]], None]) -> None:
+    """Process pool initializer: attach the shared market data and build one backtester per worker."""
+    logging.getLogger().setLevel(logging.WARNING)
+    _worker_state.update({
+        'market_data': market_data,
+        'strategy_class': strategy_class,
+        'config_path': config_path,
+        'start_date': start_date,
+        'end_date': end_date,
+        'param_setter': param_setter,
+        'backtester': BacktestInterface(initial_capital=initial_capital, transaction_cost=transaction_cost)
+    })
+
+
+def _run_task(run_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one backtest in a worker and return a flat results-table row."""
+    state = _worker_state
+    row: Dict[str, Any] = {'run_id': run_id, 'params': params}
+    try:
+        strategy = state['strategy_class'](state['config_path'])
+        state['param_setter'](strategy, params)
+        result = state['backtester'].backtest_strategy(
+            strategy, state['start_date'], state['end_date'],
+            historical_data=state['market_data'].to_historical_data()
+        )
+        result_dict = result.to_dict()
+        row['status'] = result_dict['status']
+        row.update(result_dict.get('performance_metrics', {}))
+        row.update(result_dict.get('trading_statistics', {}))
+        row.update(result_dict.get('signal_statistics', {}))
+        row['execution_time'] = result_dict.get('execution_time', 0.0)
+    except Exception as e:
+        row['status'] = 'failed'
+        row['error'] = str(e)
+    return row
+
+
+class ParameterSweep:
+    """
+    Parallel parameter sweep over BacktestInterface.
+
+    Runs are keyed by a hash of their parameters and streamed to a JSON-lines checkpoint as they
+    complete, so an interrupted sweep resumes by skipping runs already in the checkpoint. Runs
+    checkpointed as failed are run again unless retry_failed is False.
+    """
+
+    def __init__(self, strategy_class: Type[SignalStrategy], config_path: str,
+                 start_date: str, end_date: str,
+                 initial_capital: float = 100000.0, transaction_cost: float = 0.001,
+                 max_workers: Optional[int] = None,
+                 checkpoint_path: Optional[str] = None,
+                 param_setter: Optional[Callable[[SignalStrategy, Dict[str, Any]], None]] = None,
+                 retry_failed: bool = True):
+        """
+        Initialize the sweep.
+
+        Args:
+            strategy_class: SignalStrategy subclass constructed as strategy_class(config_path)
+            config_path: Base strategy configuration file
+            start_date: Backtest start date in 'YYYY-MM-DD' format
+            end_date: Backtest end date in 'YYYY-MM-DD' format
+            initial_capital: Starting capital for each backtest
+            transaction_cost: Transaction cost as percentage (0.001 = 0.1%)
+            max_workers: Process pool size (defaults to os.cpu_count())
+            checkpoint_path: JSON-lines file results are appended to and resumed from
+            param_setter: Module-level callable applying a parameter dict to a strategy;
+                          defaults to setting each parameter as an attribute
+            retry_failed: Re-run checkpointed runs whose status is 'failed' when resuming
+        """
+        self.logger = logging.getLogger(__name__)
+        self.strategy_class = strategy_class
+        self.config_path = config_path
+        self.start_date = start_date
+        self.end_date = end_date
+        self.initial_capital = initial_capital
+        self.transaction_cost = transaction_cost
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.checkpoint_path = checkpoint_path
+        self.param_setter = param_setter or _set_attributes
+        self.retry_failed = retry_failed
+        self.results: List[Dict[str, Any]] = []
+
+    @staticmethod
+    def grid(param_grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """Expand a {name: [values]} grid into the cartesian product of parameter sets."""
+        names = list(param_grid.keys())
+        return [dict(zip(names, values)) for values in itertools.product(*(param_grid[n] for n in names))]
+
+    @staticmethod
+    def random_search(param_space: Dict[str, Any], n_iter: int, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Sample parameter sets from a search space.
+
+        Lists are sampled uniformly by element; (low, high) tuples are sampled uniformly in range,
+        as integers when both bounds are integers.
+        """
+        rng = random.Random(seed)
+        samples = []
+        for _ in range(n_iter):
+            params = {}
+            for name, space in param_space.items():
+                if isinstance(space, tuple) and len(space) == 2:
+                    low, high = space
+                    if isinstance(low, int) and isinstance(high, int):
+                        params[name] = rng.randint(low, high)
+                    else:
+                        params[name] = rng.uniform(low, high)
+                else:
+                    params[name] = rng.choice(list(space))
+            samples.append(params)
+        return samples
+
+    @staticmethod
+    def run_id(params: Dict[str, Any]) -> str:
+        """Stable identifier for a parameter set."""
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+    def load_checkpoint(self) -> Dict[str, Dict[str, Any]]:
+        """Load completed rows from the checkpoint file, keyed by run id (the latest row wins)."""
+        completed: Dict[str, Dict[str, Any]] = {}
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return completed
+        with open(self.checkpoint_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    # Partially written last line from an interrupted run
+                    continue
+                completed[row['run_id']] = row
+        return completed
+
+    def iter_run(self, param_sets: List[Dict[str, Any]],
+                 historical_data: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Run the sweep, yielding result rows as they complete.
+
+        Args:
+            param_sets: Parameter dicts from grid(), random_search() or hand-built
+            historical_data: Pre-loaded backtest data; loaded once from the database when not provided
+
+        Yields:
+            One results-table row per newly completed run
+        """
+        completed = self.load_checkpoint()
+        if self.retry_failed:
+            completed = {run_id: row for run_id, row in completed.items() if row.get('status') != 'failed'}
+        self.results = list(completed.values())
+
+        pending = {}
+        for params in param_sets:
+            run_id = self.run_id(params)
+            if run_id not in completed:
+                pending[run_id] = params
+        if not pending:
+            return
+
+        if historical_data is None:
+            historical_data = self._load_historical_data()
+
+        self.logger.info(f"Parameter sweep: {len(pending)} runs pending, {len(completed)} resumed, "
+                         f"{self.max_workers} workers")
+
+        temp_dir = tempfile.mkdtemp(prefix='param_sweep_')
+        try:
+            market_data = SharedMarketData.from_historical_data(historical_data, temp_dir)
+            init_args = (market_data, self.strategy_class, self.config_path, self.start_date, self.end_date,
+                         self.initial_capital, self.transaction_cost, self.param_setter)
+
+            with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                     initargs=init_args) as executor:
+                futures = [executor.submit(_run_task, run_id, params) for run_id, params in pending.items()]
+                for future in as_completed(futures):
+                    row = future.result()
+                    self._append_checkpoint(row)
+                    self.results.append(row)
+                    yield row
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def run(self, param_sets: List[Dict[str, Any]],
+            historical_data: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """Run the sweep to completion and return the results table (including resumed rows)."""
+        for _ in self.iter_run(param_sets, historical_data):
+            pass
+        return self.to_dataframe()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Results table with one row per run and parameters expanded into columns."""
+        if not self.results:
+            return pd.DataFrame()
+        rows = []
+        for row in self.results:
+            flat = {k: v for k, v in row.items() if k != 'params'}
+            flat.update({f'param_{k}': v for k, v in row['params'].items()})
+            rows.append(flat)
+        return pd.DataFrame(rows)
+
+    def _load_historical_data(self) -> Dict[str, Any]:
+        """Load historical data once for every run in the sweep."""
+        strategy = self.strategy_class(self.config_path)
+        assets = strategy.get_parameters().get('assets', [])
+        backtester = BacktestInterface(initial_capital=self.initial_capital, transaction_cost=self.transaction_cost)
+        return backtester._get_historical_data(assets, self.start_date, self.end_date)
+
+    def _append_checkpoint(self, row: Dict[str, Any]) -> None:
+        """Append one completed row to the checkpoint file."""
+        if not self.checkpoint_path:
+            return
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.checkpoint_path, 'a') as f:
+            f.write(json.dumps(row, default=str) + '\n')
+            f.flush()
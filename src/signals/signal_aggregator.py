@@ -4,11 +4,10 @@ Handles weighted combination, conflict resolution, and position size optimizatio
 """
 
 import logging
-import asyncio
 import threading
 import os
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Any, Optional
+from concurrent.futures import Future, wait
+from typing import Dict, List, Any, Optional, Set
 from collections import defaultdict
 from datetime import datetime
 import numpy as np
@@ -70,7 +69,8 @@ class SignalAggregator:
         
         # Initialize Discord alert manager if configured
         self.discord_manager = None
-        self._discord_executor = None
+        self._discord_futures: Set[Future] = set()
+        self._discord_lock = threading.Lock()
         
         discord_enabled = self.config.get('discord_alerts', False)
         
@@ -85,32 +85,11 @@ class SignalAggregator:
                         discord_config['webhook_url'],
                         discord_config
                     )
-                    # Initialize thread pool executor for Discord alerts
-                    self._discord_executor = ThreadPoolExecutor(
-                        max_workers=2, 
-                        thread_name_prefix="discord-alerts"
-                    )
-                    self.logger.info("Discord alert manager initialized with thread pool")
+                    self.logger.info("Discord alert manager initialized")
                 except Exception as e:
                     self.logger.error(f"Failed to initialize Discord alert manager: {e}")
-                    # Still initialize executor for consistency
-                    self._discord_executor = ThreadPoolExecutor(
-                        max_workers=2, 
-                        thread_name_prefix="discord-alerts"
-                    )
             else:
-                # Initialize thread pool executor even without Discord for consistency
-                self._discord_executor = ThreadPoolExecutor(
-                    max_workers=2, 
-                    thread_name_prefix="discord-alerts"
-                )
                 self.logger.warning("Discord alerts enabled but configuration is invalid. Check DISCORD_WEBHOOK_URL in .env file.")
-        else:
-            # Initialize thread pool executor even without Discord for consistency
-            self._discord_executor = ThreadPoolExecutor(
-                max_workers=2, 
-                thread_name_prefix="discord-alerts"
-            )
         
         self.logger.info(f"Signal Aggregator initialized with {len(self.strategy_weights)} strategies")
         self.logger.debug(f"Strategy weights: {self.strategy_weights}")
@@ -833,7 +812,7 @@ class SignalAggregator:
     
     def _schedule_discord_alerts(self, signals: List[TradingSignal]) -> None:
         """
-        Schedule Discord alerts without blocking the main thread.
+        Schedule Discord alerts on the shared delivery loop without blocking the caller.
         
         Args:
             signals: List of aggregated TradingSignal objects
@@ -842,68 +821,14 @@ class SignalAggregator:
             return
         
         try:
-            # Primary: Use thread pool executor for reliable async execution
-            if self._discord_executor:
-                future = self._discord_executor.submit(self._send_discord_alerts_sync, signals)
-                # Add callback for error handling
-                future.add_done_callback(self._handle_discord_task_completion)
-                self.logger.debug("Scheduled Discord alerts via thread pool executor")
-            else:
-                # Fallback to direct async execution
-                self._schedule_discord_alerts_fallback(signals)
-                
+            future = self.discord_manager.webhook.delivery.run(self._send_discord_alerts(signals))
+            with self._discord_lock:
+                self._discord_futures.add(future)
+            future.add_done_callback(self._handle_discord_task_completion)
+            self.logger.debug("Scheduled Discord alerts on delivery service")
         except Exception as e:
             self.logger.error(f"Failed to schedule Discord alerts: {e}")
     
-    def _send_discord_alerts_sync(self, signals: List[TradingSignal]) -> None:
-        """
-        Send Discord alerts in a synchronous context (runs in thread pool).
-        
-        Args:
-            signals: List of aggregated TradingSignal objects
-        """
-        try:
-            # Create new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                loop.run_until_complete(self._send_discord_alerts(signals))
-            finally:
-                loop.close()
-                
-        except Exception as e:
-            self.logger.error(f"Failed to send Discord alerts in thread: {e}")
-    
-    def _schedule_discord_alerts_fallback(self, signals: List[TradingSignal]) -> None:
-        """
-        Fallback method for scheduling Discord alerts when thread pool is not available.
-        
-        Args:
-            signals: List of aggregated TradingSignal objects
-        """
-        try:
-            # Try to get running loop
-            try:
-                loop = asyncio.get_running_loop()
-                loop.create_task(self._send_discord_alerts(signals))
-                self.logger.debug("Scheduled Discord alerts in async context")
-            except RuntimeError:
-                # No running loop, create new one in thread
-                import threading
-                def run_in_thread():
-                    try:
-                        asyncio.run(self._send_discord_alerts(signals))
-                    except Exception as e:
-                        self.logger.error(f"Failed to send Discord alerts in fallback thread: {e}")
-                
-                thread = threading.Thread(target=run_in_thread, daemon=True)
-                thread.start()
-                self.logger.debug("Scheduled Discord alerts in new thread")
-                
-        except Exception as e:
-            self.logger.error(f"Failed to schedule Discord alerts (fallback): {e}")
-    
     async def _send_discord_alerts(self, signals: List[TradingSignal]) -> None:
         """
         Send Discord alerts for aggregated signals.
@@ -925,8 +850,10 @@ class SignalAggregator:
         Handle completion of Discord alert task.
         
         Args:
-            future: Future object from thread pool executor
+            future: Future of the scheduled alert coroutine
         """
+        with self._discord_lock:
+            self._discord_futures.discard(future)
         try:
             future.result()  # This will raise exception if task failed
             self.logger.debug("Discord alert task completed successfully")
@@ -950,20 +877,17 @@ class SignalAggregator:
             self.logger.error(f"Failed to send test Discord alert: {e}")
             return False
     
-    def cleanup(self):
-        """
-        Clean up resources, especially the thread pool executor.
-        Call this when shutting down the aggregator.
+    def cleanup(self, timeout: float = 30.0):
         """
-        if hasattr(self, '_discord_executor') and self._discord_executor:
-            try:
-                self._discord_executor.shutdown(wait=True)
-                self.logger.info("Discord alert thread pool executor shut down")
-            except Exception as e:
-                self.logger.error(f"Error shutting down Discord executor: {e}")
-    
-    def __del__(self):
-        """
-        Destructor to ensure thread pool is cleaned up.
-        """
-        self.cleanup() 
\ No newline at end of file
+        Wait for scheduled Discord alerts to finish.
+        Call this when shutting down the aggregator; the shared delivery service stays up.
+        
+        Args:
+            timeout: Maximum seconds to wait for outstanding alerts
+        """
+        with self._discord_lock:
+            pending = list(self._discord_futures)
+        if pending:
+            done, not_done = wait(pending, timeout=timeout)
+            if not_done:
+                self.logger.warning(f"{len(not_done)} Discord alert batches still pending at cleanup")
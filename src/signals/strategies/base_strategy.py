@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 import json
 from src.data.signal_models import TradingSignal
+from src.analytics.indicators import get_indicator_engine
 
 
 class SignalStrategy(ABC):
@@ -12,6 +13,8 @@ class SignalStrategy(ABC):
         self.config = self.load_config(config_path)
         # Default name if not provided in config
         self._name = self.config.get('name', self.__class__.__name__)
+        # Shared, memoized technical indicators (RSI, MACD, Bollinger Bands, moving averages)
+        self.indicators = get_indicator_engine()
     
     def load_config(self, config_path: str) -> Dict[str, Any]:
         """Load strategy configuration from JSON file"""
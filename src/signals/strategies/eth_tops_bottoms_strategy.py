@@ -17,8 +17,10 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any
 import logging
+import warnings
 
 from src.data.sqlite_helper import CryptoDatabase
+from src.analytics.percentile_rank import rolling_percentile_rank
 from .base_strategy import SignalStrategy
 from src.data.signal_models import TradingSignal, SignalType, SignalDirection, SignalStrength
 
@@ -181,10 +183,10 @@ class ETHTopBottomStrategy(SignalStrategy):
             df['williams_r'] = self._calculate_williams_r(df)
             
             # Moving Averages
-            df['sma_20'] = df['close'].rolling(window=20).mean()
-            df['sma_50'] = df['close'].rolling(window=50).mean()
-            df['ema_12'] = df['close'].ewm(span=12).mean()
-            df['ema_26'] = df['close'].ewm(span=26).mean()
+            df['sma_20'] = self.indicators.sma(df['close'], 20)
+            df['sma_50'] = self.indicators.sma(df['close'], 50)
+            df['ema_12'] = self.indicators.ema(df['close'], 12)
+            df['ema_26'] = self.indicators.ema(df['close'], 26)
             
             # Bollinger Bands
             bb_data = self._calculate_bollinger_bands(df['close'])
@@ -212,7 +214,7 @@ class ETHTopBottomStrategy(SignalStrategy):
             for window in self.config['volatility_windows']:
                 vol_col = f'volatility_{window}m'
                 if vol_col in df.columns:
-                    df[f'{vol_col}_percentile'] = df[vol_col].rolling(window=252).rank(pct=True) * 100
+                    df[f'{vol_col}_percentile'] = rolling_percentile_rank(df[vol_col], 252) * 100
             
             return df
             
@@ -221,7 +223,12 @@ class ETHTopBottomStrategy(SignalStrategy):
             return df
     
     def identify_patterns(self, df: pd.DataFrame) -> Dict[str, List]:
-        """Identify potential top and bottom patterns."""
+        """
+        Identify potential top and bottom patterns.
+
+        The per-bar checks (_is_potential_top/_is_potential_bottom and the confidence scores) are
+        evaluated for every bar at once as boolean/score columns; only matching bars are emitted.
+        """
         patterns = {
             'tops': [],
             'bottoms': [],
@@ -229,25 +236,30 @@ class ETHTopBottomStrategy(SignalStrategy):
         }
         
         try:
+            bars = self._scan_range(df)
+            close = df['close'].to_numpy(dtype=float)
+            
             # Identify potential tops
-            for i in range(50, len(df) - 10):
-                if self._is_potential_top(df, i):
-                    patterns['tops'].append({
-                        'index': i,
-                        'timestamp': df.index[i],
-                        'price': df['close'].iloc[i],
-                        'confidence': self._calculate_top_confidence(df, i)
-                    })
+            tops = bars[self._scan_tops(df)[bars]]
+            top_confidence = self._scan_top_confidence(df, tops)
+            for i, confidence in zip(tops, top_confidence):
+                patterns['tops'].append({
+                    'index': int(i),
+                    'timestamp': df.index[i],
+                    'price': close[i],
+                    'confidence': confidence
+                })
             
             # Identify potential bottoms
-            for i in range(50, len(df) - 10):
-                if self._is_potential_bottom(df, i):
-                    patterns['bottoms'].append({
-                        'index': i,
-                        'timestamp': df.index[i],
-                        'price': df['close'].iloc[i],
-                        'confidence': self._calculate_bottom_confidence(df, i)
-                    })
+            bottoms = bars[self._scan_bottoms(df)[bars]]
+            bottom_confidence = self._scan_bottom_confidence(df, bottoms)
+            for i, confidence in zip(bottoms, bottom_confidence):
+                patterns['bottoms'].append({
+                    'index': int(i),
+                    'timestamp': df.index[i],
+                    'price': close[i],
+                    'confidence': confidence
+                })
             
             # Identify divergences
             patterns['divergences'] = self._identify_divergences(df)
@@ -258,6 +270,150 @@ class ETHTopBottomStrategy(SignalStrategy):
             self.logger.error(f"Error identifying patterns: {e}")
             return patterns
     
+    # Vectorized pattern scan. Bars from 50 (indicator warm-up) to len(df) - 10 are scanned; the
+    # support/resistance windows of the per-bar checks span bars i-20..i+9.
+    @staticmethod
+    def _scan_range(df: pd.DataFrame) -> np.ndarray:
+        """Indices of the bars scanned for patterns."""
+        return np.arange(50, max(len(df) - 10, 50))
+    
+    @staticmethod
+    def _column(df: pd.DataFrame, name: str) -> np.ndarray:
+        return df[name].to_numpy(dtype=float)
+    
+    @staticmethod
+    def _shift(values: np.ndarray, periods: int) -> np.ndarray:
+        """values[i - periods] at position i (NaN outside the array)."""
+        out = np.full(len(values), np.nan)
+        if periods >= 0:
+            out[periods:] = values[:len(values) - periods]
+        else:
+            out[:periods] = values[-periods:]
+        return out
+    
+    @staticmethod
+    def _window_mean(values: np.ndarray, offset: int, length: int) -> np.ndarray:
+        """
+        Mean of values[i + offset : i + offset + length] at each position i, skipping NaN like
+        Series.mean(); NaN where the window runs outside the array.
+        """
+        n = len(values)
+        out = np.full(n, np.nan)
+        if n < length:
+            return out
+        valid = ~np.isnan(values)
+        windows = np.lib.stride_tricks.sliding_window_view(np.where(valid, values, 0.0), length)
+        counts = np.lib.stride_tricks.sliding_window_view(valid, length).sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = windows.sum(axis=1) / counts
+        positions = np.arange(n) + offset
+        inside = (positions >= 0) & (positions < len(means))
+        out[inside] = means[positions[inside]]
+        return out
+    
+    @staticmethod
+    def _window_extreme(values: np.ndarray, offset: int, length: int, func: str) -> np.ndarray:
+        """Rolling max/min over values[i + offset : i + offset + length], skipping NaN."""
+        rolled = getattr(pd.Series(values).rolling(length, min_periods=1), func)().to_numpy()
+        return ETHTopBottomStrategy._shift(rolled, -(offset + length - 1))
+    
+    def _scan_tops(self, df: pd.DataFrame) -> np.ndarray:
+        """_is_potential_top evaluated for every bar."""
+        try:
+            close, high, volume = (self._column(df, c) for c in ('close', 'high', 'volume'))
+            rsi, macd, macd_signal = (self._column(df, c) for c in ('rsi', 'macd', 'macd_signal'))
+            sma_20, sma_50 = self._column(df, 'sma_20'), self._column(df, 'sma_50')
+            
+            with np.errstate(invalid='ignore'):
+                price_at_resistance = close >= self._window_extreme(high, -20, 30, 'max') * 0.98
+                rsi_overbought = rsi > self.config['signal_thresholds']['rsi_overbought']
+                macd_bearish = (macd < macd_signal) & (self._shift(macd, 1) > self._shift(macd_signal, 1))
+                volume_declining = volume < self._window_mean(volume, -20, 30)
+                above_ma = (close > sma_20) & (sma_20 > sma_50)
+                momentum_weakening = rsi < self._window_extreme(rsi, -5, 5, 'max')
+            
+            return (price_at_resistance & rsi_overbought & (macd_bearish | volume_declining) &
+                    above_ma & momentum_weakening)
+            
+        except Exception as e:
+            self.logger.error(f"Error in _scan_tops: {e}")
+            return np.zeros(len(df), dtype=bool)
+    
+    def _scan_bottoms(self, df: pd.DataFrame) -> np.ndarray:
+        """_is_potential_bottom evaluated for every bar."""
+        try:
+            close, low, volume = (self._column(df, c) for c in ('close', 'low', 'volume'))
+            rsi, macd, macd_signal = (self._column(df, c) for c in ('rsi', 'macd', 'macd_signal'))
+            sma_20, sma_50 = self._column(df, 'sma_20'), self._column(df, 'sma_50')
+            
+            with np.errstate(invalid='ignore'):
+                price_at_support = close <= self._window_extreme(low, -20, 30, 'min') * 1.02
+                rsi_oversold = rsi < self.config['signal_thresholds']['rsi_oversold']
+                macd_bullish = (macd > macd_signal) & (self._shift(macd, 1) < self._shift(macd_signal, 1))
+                volume_increasing = volume > self._window_mean(volume, -20, 30)
+                below_ma = (close < sma_20) & (sma_20 < sma_50)
+                momentum_strengthening = rsi > self._window_extreme(rsi, -5, 5, 'min')
+            
+            return (price_at_support & rsi_oversold & (macd_bullish | volume_increasing) &
+                    below_ma & momentum_strengthening)
+            
+        except Exception as e:
+            self.logger.error(f"Error in _scan_bottoms: {e}")
+            return np.zeros(len(df), dtype=bool)
+    
+    def _scan_confidence(self, df: pd.DataFrame, indices: np.ndarray, top: bool) -> List[float]:
+        """_calculate_top_confidence/_calculate_bottom_confidence for the given bars."""
+        if len(indices) == 0:
+            return []
+        try:
+            rsi = self._column(df, 'rsi')[indices]
+            macd = self._column(df, 'macd')[indices]
+            macd_signal = self._column(df, 'macd_signal')[indices]
+            volume = self._column(df, 'volume')
+            volume_mean = self._window_mean(volume, -20, 20)[indices]
+            volume = volume[indices]
+            close = self._column(df, 'close')[indices]
+            
+            # Increments are added in the same order as the per-bar scores
+            confidence = np.zeros(len(indices))
+            with np.errstate(invalid='ignore'):
+                if top:
+                    confidence += np.where(rsi > 75, 0.2, np.where(rsi > 70, 0.15, 0.0))
+                    confidence += np.where(macd < macd_signal, 0.15, 0.0)
+                    confidence += np.where(volume < volume_mean, 0.1, 0.0)
+                    confidence += np.where(close > self._column(df, 'bb_upper')[indices], 0.1, 0.0)
+                else:
+                    confidence += np.where(rsi < 25, 0.2, np.where(rsi < 30, 0.15, 0.0))
+                    confidence += np.where(macd > macd_signal, 0.15, 0.0)
+                    confidence += np.where(volume > volume_mean, 0.1, 0.0)
+                    confidence += np.where(close < self._column(df, 'bb_lower')[indices], 0.1, 0.0)
+                
+                if 'volatility_60m' in df.columns:
+                    volatility = self._column(df, 'volatility_60m')
+                    recent = np.lib.stride_tricks.sliding_window_view(volatility, 20)[indices - 20]
+                    # Same percentile call Series.quantile makes, so ties resolve identically
+                    with warnings.catch_warnings():
+                        # All-NaN windows give NaN, which never scores, as in the per-bar check
+                        warnings.simplefilter('ignore', RuntimeWarning)
+                        quantile = np.nanpercentile(recent, (0.2 if top else 0.8) * 100, axis=1)
+                    current = volatility[indices]
+                    hit = current < quantile if top else current > quantile
+                    confidence += np.where(hit, 0.1, 0.0)
+            
+            pattern = self._is_head_and_shoulders if top else self._is_double_bottom
+            return [min(1.0, float(c) + (0.2 if pattern(df, int(i)) else 0.0))
+                    for i, c in zip(indices, confidence)]
+            
+        except Exception as e:
+            self.logger.error(f"Error calculating {'top' if top else 'bottom'} confidence: {e}")
+            return [0.0] * len(indices)
+    
+    def _scan_top_confidence(self, df: pd.DataFrame, indices: np.ndarray) -> List[float]:
+        return self._scan_confidence(df, indices, top=True)
+    
+    def _scan_bottom_confidence(self, df: pd.DataFrame, indices: np.ndarray) -> List[float]:
+        return self._scan_confidence(df, indices, top=False)
+    
     def _is_potential_top(self, df: pd.DataFrame, index: int) -> bool:
         """Check if current point is a potential top."""
         try:
@@ -397,28 +553,37 @@ class ETHTopBottomStrategy(SignalStrategy):
             return 0.0
     
     def _identify_divergences(self, df: pd.DataFrame) -> List[Dict]:
-        """Identify price vs indicator divergences."""
+        """Identify price vs indicator divergences (see _is_rsi_divergence/_is_macd_divergence)."""
         divergences = []
         
         try:
-            for i in range(50, len(df) - 10):
-                # RSI divergence
-                if self._is_rsi_divergence(df, i):
-                    divergences.append({
-                        'index': i,
-                        'timestamp': df.index[i],
-                        'type': 'RSI_DIVERGENCE',
-                        'direction': 'BEARISH' if df.iloc[i]['rsi'] < df.iloc[i-10]['rsi'] else 'BULLISH'
-                    })
-                    
-                # MACD divergence
-                if self._is_macd_divergence(df, i):
-                    divergences.append({
-                        'index': i,
-                        'timestamp': df.index[i],
-                        'type': 'MACD_DIVERGENCE',
-                        'direction': 'BEARISH' if df.iloc[i]['macd'] < df.iloc[i-10]['macd'] else 'BULLISH'
-                    })
+            bars = self._scan_range(df)
+            if len(bars) == 0:
+                return divergences
+            close = self._column(df, 'close')
+            price_higher = close[bars] > close[bars - 9]
+            price_lower = close[bars] < close[bars - 9]
+            
+            found = []
+            for order, name in enumerate(('rsi', 'macd')):
+                if name not in df.columns:
+                    self.logger.error(f"Error checking {name.upper()} divergence: missing '{name}' column")
+                    continue
+                values = self._column(df, name)
+                diverging = ((price_higher & (values[bars] < values[bars - 9])) |
+                             (price_lower & (values[bars] > values[bars - 9])))
+                bearish = values[bars] < values[bars - 10]
+                for position in np.flatnonzero(diverging):
+                    found.append((bars[position], order, name, bearish[position]))
+            
+            # Same order as a bar-by-bar scan: by bar, RSI before MACD
+            for i, _, name, bearish in sorted(found, key=lambda item: (item[0], item[1])):
+                divergences.append({
+                    'index': int(i),
+                    'timestamp': df.index[i],
+                    'type': f'{name.upper()}_DIVERGENCE',
+                    'direction': 'BEARISH' if bearish else 'BULLISH'
+                })
                     
         except Exception as e:
             self.logger.error(f"Error identifying divergences: {e}")
@@ -476,22 +641,13 @@ class ETHTopBottomStrategy(SignalStrategy):
     # Technical indicator calculation methods
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
         """Calculate RSI indicator."""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        return self.indicators.rsi(prices, period)
     
     def _calculate_macd(self, prices: pd.Series) -> Dict[str, pd.Series]:
         """Calculate MACD indicator."""
-        fast_ema = prices.ewm(span=self.config['technical_indicators']['macd_fast']).mean()
-        slow_ema = prices.ewm(span=self.config['technical_indicators']['macd_slow']).mean()
-        macd = fast_ema - slow_ema
-        signal = macd.ewm(span=self.config['technical_indicators']['macd_signal']).mean()
-        histogram = macd - signal
-        
-        return {'macd': macd, 'signal': signal, 'histogram': histogram}
+        indicators = self.config['technical_indicators']
+        return self.indicators.macd(prices, indicators['macd_fast'], indicators['macd_slow'],
+                                    indicators['macd_signal'])
     
     def _calculate_stochastic(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
         """Calculate Stochastic Oscillator."""
@@ -517,12 +673,7 @@ class ETHTopBottomStrategy(SignalStrategy):
     
     def _calculate_bollinger_bands(self, prices: pd.Series, period: int = 20, std_dev: int = 2) -> Dict[str, pd.Series]:
         """Calculate Bollinger Bands."""
-        middle = prices.rolling(window=period).mean()
-        std = prices.rolling(window=period).std()
-        upper = middle + (std * std_dev)
-        lower = middle - (std * std_dev)
-        
-        return {'upper': upper, 'middle': middle, 'lower': lower}
+        return self.indicators.bollinger_bands(prices, period, std_dev)
     
     def analyze_market(self, days: int = 365) -> Dict:
         """Perform comprehensive market analysis."""
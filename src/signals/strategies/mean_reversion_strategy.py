@@ -158,20 +158,7 @@ class MeanReversionStrategy(SignalStrategy):
         if len(price_series) < period + 1:
             return 50.0  # Default to neutral RSI
         
-        # Calculate price changes
-        delta = price_series.diff()
-        
-        # Separate gains and losses
-        gains = delta.where(delta > 0, 0)
-        losses = -delta.where(delta < 0, 0)
-        
-        # Calculate average gains and losses
-        avg_gains = gains.rolling(window=period, min_periods=1).mean()
-        avg_losses = losses.rolling(window=period, min_periods=1).mean()
-        
-        # Calculate RSI
-        rs = avg_gains / avg_losses
-        rsi = 100 - (100 / (1 + rs))
+        rsi = self.indicators.rsi(price_series, period, min_periods=1)
         
         return rsi.iloc[-1] if not rsi.empty else 50.0
     
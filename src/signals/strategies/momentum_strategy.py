@@ -110,15 +110,11 @@ class MomentumStrategy(SignalStrategy):
         """
         try:
             # Calculate moving averages
-            short_ma = df['close'].rolling(window=self.short_window).mean()
-            long_ma = df['close'].rolling(window=self.long_window).mean()
+            short_ma = self.indicators.sma(df['close'], self.short_window)
+            long_ma = self.indicators.sma(df['close'], self.long_window)
             
             # Calculate RSI
-            delta = df['close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=self.rsi_window).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=self.rsi_window).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
+            rsi = self.indicators.rsi(df['close'], self.rsi_window)
             
             # Calculate momentum strength
             momentum_strength = (short_ma.iloc[-1] - long_ma.iloc[-1]) / long_ma.iloc[-1]
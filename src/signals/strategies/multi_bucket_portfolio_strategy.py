@@ -11,11 +11,10 @@ Systematic multi-bucket crypto portfolio exploiting:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import logging
 from scipy import stats
-from sklearn.linear_model import LinearRegression
 import warnings
 
 from src.signals.strategies.base_strategy import SignalStrategy
@@ -75,16 +74,19 @@ class MultiBucketPortfolioStrategy(SignalStrategy):
         }
         
         try:
+            # Daily returns of the whole universe, aligned on date, shared by the analyses below
+            returns = self._build_returns_matrix(market_data)
+            
             # 1. Momentum Analysis
             momentum_analysis = self._analyze_momentum(market_data)
             analysis_results['momentum_analysis'] = momentum_analysis
             
             # 2. Residual Analysis
-            residual_analysis = self._analyze_residual_momentum(market_data)
+            residual_analysis = self._analyze_residual_momentum(market_data, returns)
             analysis_results['residual_analysis'] = residual_analysis
             
             # 3. Correlation Analysis
-            correlation_analysis = self._analyze_correlations(market_data)
+            correlation_analysis = self._analyze_correlations(market_data, returns)
             analysis_results['correlation_analysis'] = correlation_analysis
             
             # 4. Pair Trading Analysis
@@ -154,106 +156,110 @@ class MultiBucketPortfolioStrategy(SignalStrategy):
     def _analyze_momentum(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze cross-sectional momentum across multiple horizons."""
         momentum_analysis = {}
+        horizons = self.momentum_params['horizons']
         
-        for asset in self.assets['universe']:
-            if asset not in market_data:
-                continue
-                
-            df = market_data[asset]
-            if df.empty or len(df) < max(self.momentum_params['horizons']):
-                continue
-            
-            # Calculate momentum returns for each horizon
-            momentum_returns = {}
-            z_scores = {}
-            
-            for horizon in self.momentum_params['horizons']:
-                if len(df) > horizon:
-                    # Calculate momentum return
-                    momentum_return = (df['close'].iloc[-1] / df['close'].iloc[-horizon-1]) - 1
-                    momentum_returns[f'M{horizon}'] = momentum_return
-                    
-                    # Calculate z-score over rolling window
-                    z_score = self._calculate_momentum_zscore(df, horizon)
-                    z_scores[f'Z{horizon}'] = z_score
+        assets = [asset for asset in self.assets['universe']
+                  if asset in market_data and not market_data[asset].empty
+                  and len(market_data[asset]) >= max(horizons)]
+        if not assets:
+            return momentum_analysis
+        
+        closes, lengths = self._build_close_matrix(market_data, assets)
+        
+        # Momentum returns and z-scores for every asset at once, one array per horizon
+        momentum_returns = {}
+        z_scores = {}
+        for horizon in horizons:
+            momentum_returns[horizon] = self._current_momentum(closes, horizon)
+            z_scores[horizon] = self._calculate_momentum_zscores(closes, lengths, horizon)
+        momentum_strength = self._calculate_momentum_strengths(closes, lengths)
+        
+        for column, asset in enumerate(assets):
+            asset_momentum = {}
+            asset_z_scores = {}
+            for horizon in horizons:
+                if lengths[column] > horizon:
+                    asset_momentum[f'M{horizon}'] = momentum_returns[horizon][column]
+                    asset_z_scores[f'Z{horizon}'] = z_scores[horizon][column]
             
             # Composite momentum score
-            if z_scores:
-                composite_momentum = self._calculate_composite_momentum(z_scores)
-                acceleration = momentum_returns.get('M7', 0) - momentum_returns.get('M14', 0)
-                momentum_strength = self._calculate_momentum_strength(df, asset)
-                
+            if asset_z_scores:
                 momentum_analysis[asset] = {
-                    'momentum_returns': momentum_returns,
-                    'z_scores': z_scores,
-                    'composite_momentum': composite_momentum,
-                    'acceleration': acceleration,
-                    'momentum_strength': momentum_strength,
-                    'trend_alignment': self._check_trend_alignment(momentum_returns),
-                    'current_price': df['close'].iloc[-1] if not df.empty else None
+                    'momentum_returns': asset_momentum,
+                    'z_scores': asset_z_scores,
+                    'composite_momentum': self._calculate_composite_momentum(asset_z_scores),
+                    'acceleration': asset_momentum.get('M7', 0) - asset_momentum.get('M14', 0),
+                    'momentum_strength': momentum_strength[column],
+                    'trend_alignment': self._check_trend_alignment(asset_momentum),
+                    'current_price': closes[-1, column]
                 }
         
         return momentum_analysis
     
-    def _analyze_residual_momentum(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_residual_momentum(self, market_data: Dict[str, Any],
+                                   returns: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """Analyze residual momentum after removing BTC/ETH beta."""
         residual_analysis = {}
+        regression_window = self.residual_params['regression_window']
+        residual_window = self.residual_params['residual_window']
         
         # Get factor asset returns (BTC as primary factor)
         btc_returns = self._calculate_returns(market_data.get('bitcoin', pd.DataFrame()))
         if btc_returns.empty:
             return residual_analysis
         
-        for asset in self.assets['universe']:
-            if asset in self.assets['factor_assets'] or asset not in market_data:
-                continue
-                
-            asset_returns = self._calculate_returns(market_data[asset])
-            if asset_returns.empty or len(asset_returns) < self.residual_params['regression_window']:
+        if returns is None:
+            returns = self._build_returns_matrix(market_data)
+        assets = [asset for asset in self.assets['universe']
+                  if asset not in self.assets['factor_assets'] and asset in returns.columns
+                  and returns[asset].count() >= regression_window]
+        if not assets:
+            return residual_analysis
+        
+        aligned = pd.concat([returns[assets], btc_returns.rename('__factor__')], axis=1, sort=True)
+        y = aligned[assets].to_numpy(dtype=float)
+        x = aligned['__factor__'].to_numpy(dtype=float)
+        
+        # Each asset regresses on its last regression_window dates where both returns exist
+        valid = ~np.isnan(y) & ~np.isnan(x)[:, None]
+        from_end = np.cumsum(valid[::-1], axis=0)[::-1]
+        window_mask = valid & (from_end <= regression_window)
+        # _calculate_beta_residuals needs at least 10 aligned observations
+        usable = (valid.sum(axis=0) >= regression_window) & (regression_window >= 10)
+        
+        betas, fitted_residuals = self._batch_beta_residuals(y, x, window_mask)
+        
+        for column, asset in enumerate(assets):
+            if not usable[column]:
                 continue
-            
-            # Align returns
-            aligned_returns = pd.concat([asset_returns, btc_returns], axis=1).dropna()
-            if len(aligned_returns) < self.residual_params['regression_window']:
+            residuals = fitted_residuals[window_mask[:, column], column]
+            if len(residuals) < residual_window:
                 continue
-            
-            # Calculate beta and residuals
-            beta, residuals = self._calculate_beta_residuals(
-                aligned_returns.iloc[:, 0],  # Asset returns
-                aligned_returns.iloc[:, 1]   # BTC returns
-            )
-            
-            if residuals is not None and len(residuals) >= self.residual_params['residual_window']:
-                residual_zscore = self._calculate_residual_zscore(residuals)
-                
-                residual_analysis[asset] = {
-                    'beta': beta,
-                    'residuals': residuals[-self.residual_params['residual_window']:],
-                    'residual_zscore': residual_zscore,
-                    'residual_mean': np.mean(residuals[-self.residual_params['residual_window']:]),
-                    'residual_std': np.std(residuals[-self.residual_params['residual_window']:])
-                }
+            recent = residuals[-residual_window:]
+            residual_analysis[asset] = {
+                'beta': betas[column],
+                'residuals': recent,
+                'residual_zscore': self._calculate_residual_zscore(residuals),
+                'residual_mean': np.mean(recent),
+                'residual_std': np.std(recent)
+            }
         
         return residual_analysis
     
-    def _analyze_correlations(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_correlations(self, market_data: Dict[str, Any],
+                              returns: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """Analyze correlations across multiple timeframes."""
         correlation_analysis = {}
         
-        # Calculate returns for all assets
-        returns_data = {}
-        for asset in self.assets['universe']:
-            if asset in market_data:
-                returns = self._calculate_returns(market_data[asset])
-                if not returns.empty:
-                    returns_data[asset] = returns
-        
-        if len(returns_data) < 2:
+        if returns is None:
+            returns = self._build_returns_matrix(market_data)
+        if returns.shape[1] < 2:
             return correlation_analysis
         
         # Calculate correlation matrix for each window
+        aligned_returns = returns.dropna()
         for window in self.correlation_params['correlation_windows']:
-            correlation_matrix = self._calculate_correlation_matrix(returns_data, window)
+            correlation_matrix = self._calculate_correlation_matrix(aligned_returns, window)
             correlation_analysis[f'{window}d'] = correlation_matrix
         
         # Calculate average correlation
@@ -576,34 +582,82 @@ class MultiBucketPortfolioStrategy(SignalStrategy):
         """Calculate daily returns from price data."""
         if df.empty or 'close' not in df.columns:
             return pd.Series()
-        returns = df['close'].pct_change().dropna()
-        return returns
+        closes = df['close'].to_numpy(dtype=float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            returns = closes[1:] / closes[:-1] - 1
+        valid = ~np.isnan(returns)
+        return pd.Series(returns[valid], index=df.index[1:][valid], name='close')
+    
+    def _build_returns_matrix(self, market_data: Dict[str, Any]) -> pd.DataFrame:
+        """Daily returns of every universe asset, aligned on date (NaN where an asset has no bar)."""
+        returns_data = {}
+        for asset in self.assets['universe']:
+            if asset in market_data:
+                returns = self._calculate_returns(market_data[asset])
+                if not returns.empty:
+                    returns_data[asset] = returns
+        return pd.DataFrame(returns_data)
+    
+    def _build_close_matrix(self, market_data: Dict[str, Any], assets: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Close prices as a (bars, assets) matrix aligned on each asset's latest bar.
+        
+        Momentum is measured in bars of each asset's own history, so series are aligned by
+        position from the end rather than by date; shorter histories are NaN-padded at the start.
+        
+        Returns:
+            Tuple of (close matrix, number of bars per asset)
+        """
+        lengths = np.array([len(market_data[asset]) for asset in assets])
+        closes = np.full((int(lengths.max()), len(assets)), np.nan)
+        for column, asset in enumerate(assets):
+            closes[len(closes) - lengths[column]:, column] = market_data[asset]['close'].to_numpy(dtype=float)
+        return closes, lengths
+    
+    @staticmethod
+    def _current_momentum(closes: np.ndarray, horizon: int) -> np.ndarray:
+        """Latest horizon-bar return per column (NaN where the history is too short)."""
+        if len(closes) <= horizon:
+            return np.full(closes.shape[1], np.nan)
+        return closes[-1] / closes[-horizon - 1] - 1
+    
+    def _calculate_momentum_zscores(self, closes: np.ndarray, lengths: np.ndarray, horizon: int) -> np.ndarray:
+        """
+        Z-score of the current horizon momentum against each asset's momentum history.
+        
+        The history covers bars horizon .. len - zscore_window of each asset, computed from
+        shifted close arrays; z-scores are 0.0 where history is insufficient or flat.
+        """
+        zscore_window = self.momentum_params['zscore_window']
+        n_bars = len(closes)
+        z_scores = np.zeros(closes.shape[1])
+        
+        end = n_bars - zscore_window
+        if end <= horizon:
+            return z_scores
+        with np.errstate(invalid='ignore', divide='ignore'):
+            momentum = closes[horizon:end] / closes[:end - horizon] - 1
+        
+        counts = np.sum(~np.isnan(momentum), axis=0)
+        eligible = (lengths >= zscore_window) & (counts >= 10)
+        if not eligible.any():
+            return z_scores
+        
+        momentum = momentum[:, eligible]
+        mean_momentum = np.nanmean(momentum, axis=0)
+        std_momentum = np.nanstd(momentum, axis=0)
+        current = self._current_momentum(closes[:, eligible], horizon)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scores = np.where(std_momentum == 0, 0.0, (current - mean_momentum) / std_momentum)
+        z_scores[eligible] = scores
+        return z_scores
     
     def _calculate_momentum_zscore(self, df: pd.DataFrame, horizon: int) -> float:
         """Calculate z-score for momentum over rolling window."""
         if len(df) < self.momentum_params['zscore_window']:
             return 0.0
-        
-        # Calculate momentum series
-        momentum_series = []
-        for i in range(horizon, len(df) - self.momentum_params['zscore_window']):
-            momentum = (df['close'].iloc[i] / df['close'].iloc[i-horizon]) - 1
-            momentum_series.append(momentum)
-        
-        if len(momentum_series) < 10:
-            return 0.0
-        
-        # Calculate z-score
-        mean_momentum = np.mean(momentum_series)
-        std_momentum = np.std(momentum_series)
-        
-        if std_momentum == 0:
-            return 0.0
-        
-        current_momentum = (df['close'].iloc[-1] / df['close'].iloc[-horizon-1]) - 1
-        zscore = (current_momentum - mean_momentum) / std_momentum
-        
-        return zscore
+        closes = df['close'].to_numpy(dtype=float).reshape(-1, 1)
+        return float(self._calculate_momentum_zscores(closes, np.array([len(df)]), horizon)[0])
     
     def _calculate_composite_momentum(self, z_scores: Dict[str, float]) -> float:
         """Calculate composite momentum score using weighted z-scores."""
@@ -630,6 +684,18 @@ class MultiBucketPortfolioStrategy(SignalStrategy):
         
         return momentum_strength
     
+    @staticmethod
+    def _calculate_momentum_strengths(closes: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """_calculate_momentum_strength for every column of a close matrix."""
+        strengths = np.zeros(closes.shape[1])
+        if len(closes) < 14:
+            return strengths
+        previous = np.vstack([np.full((1, closes.shape[1]), np.nan), closes[:-1]])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            recent_returns = closes[-14:] / previous[-14:] - 1
+            positive_days = np.sum(recent_returns > 0, axis=0)
+        return np.where(lengths >= 14, positive_days / 14 - 0.5, 0.0)
+    
     def _check_trend_alignment(self, momentum_returns: Dict[str, float]) -> bool:
         """Check if momentum is aligned across timeframes."""
         m7 = momentum_returns.get('M7', 0)
@@ -638,6 +704,34 @@ class MultiBucketPortfolioStrategy(SignalStrategy):
         
         return m7 > 0 and m14 > 0 and m30 > 0
     
+    @staticmethod
+    def _batch_beta_residuals(y: np.ndarray, x: np.ndarray, mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ordinary least squares of each column of y on x (with intercept) over the masked rows.
+        
+        Args:
+            y: (rows, assets) asset returns
+            x: (rows,) factor returns
+            mask: (rows, assets) rows included in each asset's regression
+            
+        Returns:
+            Tuple of (beta per asset, residual matrix; NaN outside the mask)
+        """
+        weights = mask.astype(float)
+        x_full = np.where(np.isnan(x), 0.0, x)[:, None]
+        y_full = np.where(mask, y, 0.0)
+        n = weights.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x_mean = (weights * x_full).sum(axis=0) / n
+            y_mean = y_full.sum(axis=0) / n
+            dx = (x_full - x_mean) * weights
+            dy = (y_full - y_mean) * weights
+            sxx = (dx * dx).sum(axis=0)
+            betas = np.where(sxx > 0, (dx * dy).sum(axis=0) / sxx, 0.0)
+        intercepts = y_mean - betas * x_mean
+        residuals = np.where(mask, y - (intercepts + betas * x_full), np.nan)
+        return betas, residuals
+    
     def _calculate_beta_residuals(self, asset_returns: pd.Series, factor_returns: pd.Series) -> Tuple[float, Optional[np.ndarray]]:
         """Calculate beta and residuals from linear regression."""
         if len(asset_returns) < self.residual_params['regression_window']:
@@ -652,19 +746,10 @@ class MultiBucketPortfolioStrategy(SignalStrategy):
         if len(aligned_data) < 10:
             return 0.0, None
         
-        # Linear regression
-        X = aligned_data.iloc[:, 1].values.reshape(-1, 1)  # Factor returns
-        y = aligned_data.iloc[:, 0].values  # Asset returns
-        
-        try:
-            model = LinearRegression()
-            model.fit(X, y)
-            beta = model.coef_[0]
-            residuals = y - model.predict(X)
-            return beta, residuals
-        except Exception as e:
-            self.logger.warning(f"Error in beta calculation: {e}")
-            return 0.0, None
+        y = aligned_data.iloc[:, 0].to_numpy(dtype=float).reshape(-1, 1)  # Asset returns
+        x = aligned_data.iloc[:, 1].to_numpy(dtype=float)  # Factor returns
+        betas, residuals = self._batch_beta_residuals(y, x, np.ones_like(y, dtype=bool))
+        return float(betas[0]), residuals[:, 0]
     
     def _calculate_residual_zscore(self, residuals: np.ndarray) -> float:
         """Calculate z-score of recent residuals."""
@@ -683,7 +768,8 @@ class MultiBucketPortfolioStrategy(SignalStrategy):
         
         return zscore
     
-    def _calculate_correlation_matrix(self, returns_data: Dict[str, pd.Series], window: int) -> pd.DataFrame:
+    def _calculate_correlation_matrix(self, returns_data: Union[Dict[str, pd.Series], pd.DataFrame],
+                                      window: int) -> pd.DataFrame:
         """Calculate correlation matrix for given window."""
         # Align all return series
         aligned_returns = pd.DataFrame(returns_data)
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional
 import pandas as pd
 
 from src.data.sqlite_helper import CryptoDatabase
+from src.services.macro_snapshot_service import MacroSnapshotService
 from src.signals.strategies.base_strategy import SignalStrategy
 from src.data.signal_models import TradingSignal, SignalType, SignalDirection
 
@@ -24,6 +25,8 @@ class MultiFactorStrategy(SignalStrategy):
         self.thresholds = self.config.get('alert_thresholds', {'strong_long': 0.6, 'lean_long': 0.3, 'lean_short': -0.3, 'strong_short': -0.6})
         self.betas = self.config.get('asset_betas', {})
         self.windows = self.config.get('indicator_windows', {'sma_short': 20, 'sma_long': 50, 'sma_200': 200, 'rsi': 14})
+        self.macro_sma_window = self.windows.get('macro_sma', 20)
+        self.macro = MacroSnapshotService(self.db, sma_windows=[self.macro_sma_window])
         self.logger = logging.getLogger(__name__)
         
     def analyze(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -38,6 +41,7 @@ class MultiFactorStrategy(SignalStrategy):
         
         # Assets to analyze
         assets = [a for a in self._get_assets() if a.lower() not in [x.lower() for x in self.excluded]]
+        score_rows = []
         
         for asset in assets:
             data = market_data.get(asset, {}).get('dataframe')
@@ -67,8 +71,9 @@ class MultiFactorStrategy(SignalStrategy):
                 if sig:
                     results['signals'].append(sig)
             
-            self._log_to_db(asset, adj_macro, trend, rev, composite, direction, gate, macro_details)
+            score_rows.append(self._score_row(asset, adj_macro, trend, rev, composite, direction, gate))
         
+        self._log_to_db(score_rows)
         self.logger.info(f"Multi-Factor complete: {len(results['signals'])} signals")
         return results
     
@@ -76,8 +81,8 @@ class MultiFactorStrategy(SignalStrategy):
         details = {}
         scores = []
         
-        # Get latest macro data
-        macro = self._get_macro_latest()
+        # Latest values and SMAs for all indicators, cached until macro_indicators changes
+        macro = self.macro.get_snapshot()
         vix = macro.get('VIXCLS')
         
         if vix:
@@ -90,7 +95,7 @@ class MultiFactorStrategy(SignalStrategy):
         # DXY
         dxy = macro.get('DTWEXBGS')
         if dxy:
-            dxy_ma = self._get_sma('DTWEXBGS', 20)
+            dxy_ma = macro.sma('DTWEXBGS', self.macro_sma_window)
             if dxy_ma and dxy < dxy_ma:
                 scores.append(1.0)
             elif dxy_ma and dxy > dxy_ma:
@@ -123,15 +128,15 @@ class MultiFactorStrategy(SignalStrategy):
         scores = []
         
         # SMA cross
-        sma20 = close.rolling(w.get('sma_short', 20)).mean()
-        sma50 = close.rolling(w.get('sma_long', 50)).mean()
+        sma20 = self.indicators.sma(close, w.get('sma_short', 20))
+        sma50 = self.indicators.sma(close, w.get('sma_long', 50))
         if sma20.iloc[-1] > sma50.iloc[-1]:
             scores.append(1.0)
         elif sma20.iloc[-1] < sma50.iloc[-1]:
             scores.append(-1.0)
         
         # Price vs SMA200
-        sma200 = close.rolling(w.get('sma_200', 200)).mean()
+        sma200 = self.indicators.sma(close, w.get('sma_200', 200))
         if close.iloc[-1] > sma200.iloc[-1]:
             scores.append(0.5)
         elif close.iloc[-1] < sma200.iloc[-1]:
@@ -159,11 +164,7 @@ class MultiFactorStrategy(SignalStrategy):
         
         # RSI
         rsi_period = w.get('rsi', 14)
-        delta = close.diff()
-        gain = delta.where(delta > 0, 0).rolling(rsi_period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(rsi_period).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+        rsi = self.indicators.rsi(close, rsi_period)
         
         if rsi.iloc[-1] < 30:
             scores.append(1.0)
@@ -212,30 +213,22 @@ class MultiFactorStrategy(SignalStrategy):
         except:
             return None
     
-    def _get_macro_latest(self) -> Dict:
-        q = "SELECT indicator, value FROM macro_indicators WHERE (indicator, date) IN (SELECT indicator, MAX(date) FROM macro_indicators GROUP BY indicator)"
-        df = self.db.query_to_dataframe(q)
-        return dict(zip(df['indicator'], df['value']))
-    
-    def _get_sma(self, indicator, days) -> Optional[float]:
-        q = f"SELECT AVG(value) as sma FROM (SELECT value FROM macro_indicators WHERE indicator = ? ORDER BY date DESC LIMIT ?)"
-        df = self.db.query_to_dataframe(q, (indicator, days))
-        return float(df['sma'].iloc[0]) if not df.empty and df['sma'].iloc[0] else None
-    
     def _get_assets(self) -> List[str]:
-        df = self.db.query_to_dataframe("SELECT DISTINCT cryptocurrency FROM crypto_ohlcv")
-        return df['cryptocurrency'].tolist()
+        return self.db.get_tracked_assets()
+    
+    def _score_row(self, asset, macro, trend, rev, comp, direction, gate) -> tuple:
+        return (int(datetime.now().timestamp()*1000), asset, macro, trend, rev, comp, direction, 1 if gate else 0)
     
-    def _log_to_db(self, asset, macro, trend, rev, comp, direction, gate, macro_details):
+    def _log_to_db(self, rows: List[tuple]):
+        """Write all per-asset scores of a run in one transaction."""
+        if not rows:
+            return
         try:
-            import sqlite3
-            conn = sqlite3.connect('data/crypto_data.db')
-            conn.execute("""INSERT INTO multi_factor_signals 
-                (timestamp, asset, macro_score, trend_score, reversion_score, composite_score, signal_direction, confirmation_gate_passed)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (int(datetime.now().timestamp()*1000), asset, macro, trend, rev, comp, direction, 1 if gate else 0))
-            conn.commit()
-            conn.close()
+            with self.db.db_connection.get_connection() as conn:
+                conn.executemany("""INSERT INTO multi_factor_signals 
+                    (timestamp, asset, macro_score, trend_score, reversion_score, composite_score, signal_direction, confirmation_gate_passed)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)""", rows)
+                conn.commit()
         except Exception as e:
             self.logger.error(f"DB log error: {e}")
     
@@ -578,7 +578,7 @@ class RippleStrategy(SignalStrategy):
         df['bb_lower'] = bb_data['lower']
         
         # Volume MA
-        df['volume_ma'] = df['volume'].rolling(window=self.technical_indicators.get('volume_ma_period', 20)).mean()
+        df['volume_ma'] = self.indicators.sma(df['volume'], self.technical_indicators.get('volume_ma_period', 20))
         
         return df
 
@@ -587,13 +587,7 @@ class RippleStrategy(SignalStrategy):
         if period is None:
             period = self.technical_indicators.get('rsi_period', 14)
         
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        return self.indicators.rsi(prices, period)
 
     def _calculate_macd(self, prices: pd.Series) -> Dict[str, pd.Series]:
         """Calculate MACD indicator."""
@@ -601,34 +595,14 @@ class RippleStrategy(SignalStrategy):
         slow = self.technical_indicators.get('macd_slow', 26)
         signal = self.technical_indicators.get('macd_signal', 9)
         
-        ema_fast = prices.ewm(span=fast).mean()
-        ema_slow = prices.ewm(span=slow).mean()
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal).mean()
-        histogram = macd_line - signal_line
-        
-        return {
-            'macd': macd_line,
-            'signal': signal_line,
-            'histogram': histogram
-        }
+        return self.indicators.macd(prices, fast, slow, signal)
 
     def _calculate_bollinger_bands(self, prices: pd.Series) -> Dict[str, pd.Series]:
         """Calculate Bollinger Bands."""
         period = self.technical_indicators.get('bollinger_period', 20)
         std_mult = self.technical_indicators.get('bollinger_std', 2)
         
-        sma = prices.rolling(window=period).mean()
-        std = prices.rolling(window=period).std()
-        
-        upper = sma + (std * std_mult)
-        lower = sma - (std * std_mult)
-        
-        return {
-            'upper': upper,
-            'middle': sma,
-            'lower': lower
-        }
+        return self.indicators.bollinger_bands(prices, period, std_mult)
 
     # Additional helper methods would continue here...
     # (Truncated for length - the full implementation would include all helper methods)
@@ -6,6 +6,8 @@ import logging
 
 from src.signals.strategies.base_strategy import SignalStrategy
 from src.data.signal_models import TradingSignal, SignalType, SignalStrength, SignalDirection
+from src.analytics.correlation_surface import CorrelationSurface, RollingQuantileCache, rolling_correlation_quantiles
+from src.analytics.percentile_rank import percentile_rank
 from src.data.sqlite_helper import CryptoDatabase
 from src.data.realtime_price_service import RealtimePriceService
 
@@ -241,13 +243,21 @@ class VIXCorrelationStrategy(SignalStrategy):
         dynamic_neg_threshold = None
         dynamic_pos_threshold = None
 
-        for window in self.correlation_windows:
+        # All (window, lag) correlations at the latest row come from one cumulative-sum surface;
+        # full rolling series are only built (and cached) for dynamic threshold quantiles
+        price_returns = clean_df['price_return'].to_numpy(dtype=float)
+        vix_returns = clean_df['vix_return'].to_numpy(dtype=float)
+        surface = CorrelationSurface(price_returns, vix_returns, self.lag_range)
+        latest = surface.latest(self.correlation_windows)
+        data_version = RollingQuantileCache.data_version(price_returns, vix_returns) if self.use_dynamic_thresholds else None
+        quantiles = (self.dynamic_threshold_quantiles.get('negative', 0.2),
+                     self.dynamic_threshold_quantiles.get('positive', 0.8))
+
+        for i, window in enumerate(self.correlation_windows):
             if len(clean_df) >= window + max(0, max(self.lag_range)):
-                for lag in self.lag_range:
-                    vix_series = clean_df['vix_return'].shift(lag)
-                    rolling_corr_series = clean_df['price_return'].rolling(window=window).corr(vix_series)
-                    corr_value = rolling_corr_series.iloc[-1]
-                    if corr_value is not None and not np.isnan(corr_value):
+                for j, lag in enumerate(self.lag_range):
+                    corr_value = latest[i, j]
+                    if not np.isnan(corr_value):
                         correlations[f'{window}d_lag{lag}'] = float(corr_value)
                         if best_abs_corr is None or abs(corr_value) > best_abs_corr:
                             best_abs_corr = abs(corr_value)
@@ -255,13 +265,13 @@ class VIXCorrelationStrategy(SignalStrategy):
                             best_window = window
                             best_lag = lag
 
-                    if self.use_dynamic_thresholds and rolling_corr_series.dropna().shape[0] > 20:
-                        neg_q = self.dynamic_threshold_quantiles.get('negative', 0.2)
-                        pos_q = self.dynamic_threshold_quantiles.get('positive', 0.8)
-                        current_neg = float(np.nanquantile(rolling_corr_series.values, neg_q))
-                        current_pos = float(np.nanquantile(rolling_corr_series.values, pos_q))
-                        dynamic_neg_threshold = current_neg if dynamic_neg_threshold is None else min(dynamic_neg_threshold, current_neg)
-                        dynamic_pos_threshold = current_pos if dynamic_pos_threshold is None else max(dynamic_pos_threshold, current_pos)
+                    if self.use_dynamic_thresholds:
+                        valid_count, current_neg, current_pos = rolling_correlation_quantiles(
+                            surface, data_version, window, lag, quantiles
+                        )
+                        if valid_count > 20:
+                            dynamic_neg_threshold = current_neg if dynamic_neg_threshold is None else min(dynamic_neg_threshold, current_neg)
+                            dynamic_pos_threshold = current_pos if dynamic_pos_threshold is None else max(dynamic_pos_threshold, current_pos)
 
         # Fallback to simple correlation if enhanced calc failed
         if best_corr_value is None:
@@ -286,10 +296,9 @@ class VIXCorrelationStrategy(SignalStrategy):
 
         # VIX percentile within lookback
         try:
-            vix_series = clean_df['vix_value'].astype(float)
-            vix_rank_pct = vix_series.rank(pct=True)
-            # Use the latest non-null percentile rather than the last row blindly
-            vix_percentile = float(vix_rank_pct.dropna().iloc[-1] * 100.0) if not vix_rank_pct.dropna().empty else None
+            vix_series = clean_df['vix_value'].astype(float).dropna()
+            # Use the latest non-null value rather than the last row blindly
+            vix_percentile = percentile_rank(vix_series, vix_series.iloc[-1]) if not vix_series.empty else None
         except Exception:
             vix_percentile = None
 
@@ -403,14 +412,9 @@ class VIXCorrelationStrategy(SignalStrategy):
     def _calculate_rsi_series(self, price_series: pd.Series, period: int = 14) -> pd.Series:
         if len(price_series) < period + 1:
             return pd.Series([50.0] * len(price_series), index=price_series.index)
-        delta = price_series.diff()
-        gains = delta.where(delta > 0, 0.0)
-        losses = -delta.where(delta < 0, 0.0)
-        avg_gain = gains.rolling(window=period, min_periods=1).mean()
-        avg_loss = losses.rolling(window=period, min_periods=1).mean()
-        rs = avg_gain / avg_loss.replace({0.0: np.nan})
-        rsi = 100 - (100 / (1 + rs))
-        return rsi.fillna(50.0)
+        rsi = self.indicators.rsi(price_series, period, min_periods=1)
+        # Windows without losses (RSI of exactly 100) are treated as neutral
+        return rsi.mask(rsi >= 100.0).fillna(50.0)
     
     def _evaluate_signal_opportunity(self, asset: str, correlation_data: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate if current correlation presents a trading opportunity with filters and regimes"""
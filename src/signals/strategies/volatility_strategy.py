@@ -7,6 +7,7 @@ import logging
 from src.signals.strategies.base_strategy import SignalStrategy
 from src.data.signal_models import TradingSignal, SignalType, SignalStrength, SignalDirection
 from src.data.sqlite_helper import CryptoDatabase
+from src.analytics.percentile_rank import PercentileRanker
 
 
 class VolatilityStrategy(SignalStrategy):
@@ -130,15 +131,16 @@ class VolatilityStrategy(SignalStrategy):
                 'extreme_threshold': 0.0
             }
         
-        historical_threshold = np.percentile(historical_volatility, self.volatility_threshold_percentile)
-        extreme_threshold = np.percentile(historical_volatility, self.extreme_volatility_percentile)
+        # Sort the history once for both thresholds and the rank of the current value
+        ranker = PercentileRanker(historical_volatility)
+        historical_threshold = ranker.percentile(self.volatility_threshold_percentile)
+        extreme_threshold = ranker.percentile(self.extreme_volatility_percentile)
         
         # Current volatility
         current_volatility = df['volatility'].iloc[-1] if not df['volatility'].isna().iloc[-1] else 0.0
         
-        # Calculate percentile of current volatility
-        volatility_percentile = np.percentile(historical_volatility, 
-                                           [p for p in range(101) if np.percentile(historical_volatility, p) >= current_volatility][0])
+        # Percentile rank (0-100) of current volatility within its history
+        volatility_percentile = ranker.rank(current_volatility)
         
         return {
             'current_volatility': current_volatility,
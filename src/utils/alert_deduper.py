@@ -7,47 +7,151 @@ coordinate and prevent duplicate Discord alerts from being posted.
 
 Design goals:
 - Minimal dependencies, works without Redis
-- Atomic updates using rename for crash safety
-- TTL-based eviction to avoid unbounded file growth
+- O(log n) TTL eviction from an expiry-ordered heap instead of full scans
+- Append-only journal per mark, compacted into the JSON snapshot periodically
+- Journal entries written by other processes are picked up before every check
+
+Files (for state_file "data/alert_dedupe_state.json"):
+- data/alert_dedupe_state.json     snapshot {key: sent_ts}, replaced atomically on compaction
+- data/alert_dedupe_state.journal  JSON lines [key, sent_ts] appended since the snapshot ([key, null] unmarks)
+- data/alert_dedupe_state.lock     flock guarding appends, compaction and full reloads
 
 Usage:
     deduper = AlertDeduper("data/alert_dedupe_state.json", ttl_seconds=3600)
-    if deduper.should_send(unique_key):
-        # send alert
-        deduper.mark_sent(unique_key)
+    if deduper.try_mark(unique_key):
+        # send alert; deduper.unmark(unique_key) if it could not be delivered
 """
 
 from __future__ import annotations
 
+import fcntl
+import heapq
 import json
 import os
-import time
 import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
 class AlertDeduper:
-    def __init__(self, state_file: str = "data/alert_dedupe_state.json", ttl_seconds: int = 3600) -> None:
+    def __init__(self, state_file: str = "data/alert_dedupe_state.json", ttl_seconds: int = 3600,
+                 compact_threshold: int = 1000) -> None:
         self.state_path = Path(state_file)
+        self.journal_path = self.state_path.with_suffix(".journal")
+        self.lock_path = self.state_path.with_suffix(".lock")
         self.ttl_seconds = ttl_seconds
+        # Compact once the journal holds this many entries and more entries than live keys
+        self.compact_threshold = compact_threshold
         self._state: Dict[str, float] = {}
+        self._expiry: List[Tuple[float, str]] = []
+        self._journal_id: Optional[Tuple[int, int]] = None
+        self._journal_offset = 0
+        self._journal_entries = 0
+        self._lock = threading.Lock()
         self._ensure_parent_dir()
         self._load_state()
 
     def _ensure_parent_dir(self) -> None:
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
 
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        with self.lock_path.open("a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _apply(self, key: str, ts: Optional[float]) -> None:
+        if ts is None:
+            # Unmark; the key's heap entry is skipped as stale when it comes due
+            self._state.pop(key, None)
+        elif ts > self._state.get(key, float("-inf")):
+            self._state[key] = ts
+            heapq.heappush(self._expiry, (ts + self.ttl_seconds, key))
+
+    def _journal_stat(self) -> Optional[os.stat_result]:
+        try:
+            return os.stat(self.journal_path)
+        except FileNotFoundError:
+            return None
+
     def _load_state(self) -> None:
+        with self._file_lock(exclusive=False):
+            self._reload()
+
+    def _reload(self) -> None:
+        """Rebuild the in-memory index from the snapshot and the full journal (file lock held)."""
+        self._state, self._expiry = {}, []
         try:
             if self.state_path.exists():
                 with self.state_path.open("r", encoding="utf-8") as f:
-                    self._state = json.load(f)
-            else:
-                self._state = {}
+                    for key, ts in json.load(f).items():
+                        self._apply(key, float(ts))
         except Exception:
             # Corrupt state; reset
-            self._state = {}
+            self._state, self._expiry = {}, []
+        self._journal_id, self._journal_offset, self._journal_entries = None, 0, 0
+        self._read_journal(self._journal_stat())
+
+    def _read_journal(self, stat: Optional[os.stat_result]) -> bool:
+        """
+        Apply journal lines appended since the last read (complete lines only).
+
+        Returns False if the journal was replaced between stat() and open(), in which case
+        nothing was applied and the caller must reload.
+        """
+        if stat is None:
+            return True
+        self._journal_id = (stat.st_dev, stat.st_ino)
+        if stat.st_size <= self._journal_offset:
+            return True
+        try:
+            with self.journal_path.open("rb") as f:
+                opened = os.fstat(f.fileno())
+                if (opened.st_dev, opened.st_ino) != self._journal_id:
+                    return False
+                f.seek(self._journal_offset)
+                chunk = f.read(stat.st_size - self._journal_offset)
+        except FileNotFoundError:
+            return False
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        self._journal_offset += len(complete)
+        for line in complete.splitlines():
+            try:
+                key, ts = json.loads(line)
+                self._apply(key, None if ts is None else float(ts))
+                self._journal_entries += 1
+            except Exception:
+                continue
+        return True
+
+    def _refresh(self, file_locked: bool = False) -> None:
+        """Pick up marks from other processes; reload fully if the journal was compacted."""
+        stat = self._journal_stat()
+        replaced = (
+            self._journal_id is not None if stat is None
+            else (stat.st_dev, stat.st_ino) != self._journal_id or stat.st_size < self._journal_offset
+        )
+        if not replaced and self._read_journal(stat):
+            return
+        if file_locked:
+            self._reload()
+        else:
+            self._load_state()
+
+    def _sweep_expired(self) -> None:
+        now_ts = time.time()
+        while self._expiry and self._expiry[0][0] < now_ts:
+            expires_at, key = heapq.heappop(self._expiry)
+            # Entries superseded by a later mark of the same key are stale
+            ts = self._state.get(key)
+            if ts is not None and ts + self.ttl_seconds == expires_at:
+                del self._state[key]
 
     def _persist_state(self) -> None:
         tmp_fd, tmp_path = tempfile.mkstemp(prefix="dedupe_", dir=str(self.state_path.parent))
@@ -62,13 +166,19 @@ class AlertDeduper:
                 except Exception:
                     pass
 
-    def _sweep_expired(self) -> None:
-        now_ts = time.time()
-        expired_keys = [k for k, ts in self._state.items() if now_ts - ts > self.ttl_seconds]
-        if expired_keys:
-            for key in expired_keys:
-                self._state.pop(key, None)
+    def compact(self) -> None:
+        """Fold the journal into a fresh snapshot of unexpired keys and start a new journal."""
+        with self._lock, self._file_lock(exclusive=True):
+            self._refresh(file_locked=True)
+            self._sweep_expired()
             self._persist_state()
+            tmp_fd, tmp_path = tempfile.mkstemp(prefix="dedupe_", dir=str(self.state_path.parent))
+            os.close(tmp_fd)
+            os.replace(tmp_path, self.journal_path)
+            self._expiry = [(ts + self.ttl_seconds, key) for key, ts in self._state.items()]
+            heapq.heapify(self._expiry)
+            self._journal_id, self._journal_offset, self._journal_entries = None, 0, 0
+            self._read_journal(self._journal_stat())
 
     def make_key(self, *, source: str, strategy: str | None, symbol: str, signal_type: str | None, price: float | None) -> str:
         parts = [
@@ -81,8 +191,10 @@ class AlertDeduper:
         return "|".join(parts)
 
     def should_send(self, unique_key: str) -> bool:
-        self._sweep_expired()
-        ts = self._state.get(unique_key)
+        with self._lock:
+            self._refresh()
+            self._sweep_expired()
+            ts = self._state.get(unique_key)
         if ts is None:
             return True
         # If within TTL, do not resend
@@ -92,8 +204,60 @@ class AlertDeduper:
         # If expired, allow resending
         return True
 
+    def _append_journal(self, unique_key: str, ts: Optional[float]) -> None:
+        """Append one journal entry and apply it (file lock held)."""
+        with self.journal_path.open("ab") as f:
+            f.write((json.dumps([unique_key, ts]) + "\n").encode("utf-8"))
+        self._refresh(file_locked=True)
+
+    def _needs_compaction(self) -> bool:
+        return self._journal_entries >= max(self.compact_threshold, len(self._state))
+
     def mark_sent(self, unique_key: str) -> None:
-        self._state[unique_key] = time.time()
-        self._persist_state()
+        with self._lock:
+            with self._file_lock(exclusive=True):
+                self._append_journal(unique_key, time.time())
+            needs_compaction = self._needs_compaction()
+        if needs_compaction:
+            self.compact()
+
+    def try_mark(self, unique_key: str) -> bool:
+        """
+        Claim a key if it has not been sent within the TTL.
+
+        The check and the journal append happen under one exclusive file lock, so when several
+        processes race on the same key exactly one of them gets True. Separate should_send() and
+        mark_sent() calls leave a gap in which both can decide to send.
+
+        Returns:
+            True if the caller should send the alert (the key is now marked), False if it is a duplicate
+        """
+        with self._lock:
+            with self._file_lock(exclusive=True):
+                self._refresh(file_locked=True)
+                self._sweep_expired()
+                now_ts = time.time()
+                ts = self._state.get(unique_key)
+                if ts is not None and now_ts - ts < self.ttl_seconds:
+                    return False
+                self._append_journal(unique_key, now_ts)
+            needs_compaction = self._needs_compaction()
+        if needs_compaction:
+            self.compact()
+        return True
 
+    def unmark(self, unique_key: str) -> None:
+        """Release a key claimed with try_mark() whose alert could not be delivered."""
+        with self._lock:
+            with self._file_lock(exclusive=True):
+                self._append_journal(unique_key, None)
+            needs_compaction = self._needs_compaction()
+        if needs_compaction:
+            self.compact()
 
+    def active_entries(self) -> Dict[str, float]:
+        """Unexpired keys and their sent timestamps, including marks from other processes."""
+        with self._lock:
+            self._refresh()
+            self._sweep_expired()
+            return dict(self._state)
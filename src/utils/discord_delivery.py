@@ -0,0 +1,334 @@
+"""
+Discord Delivery Service
+Long-lived asyncio delivery of Discord webhook messages.
+
+One background event loop owns a pooled HTTP session per webhook host, a token bucket per
+webhook and a bounded outbound queue. Embeds queued for the same webhook are combined into a
+single request (Discord accepts up to 10 embeds per message), and 429 responses pause the
+webhook for the advertised Retry-After before the batch is retried. Rate-limit retries are
+bounded by the total time spent waiting on them rather than by the retry count.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from src.utils.rate_limiter import TokenBucket
+
+MAX_EMBEDS_PER_MESSAGE = 10
+
+
+@dataclass
+class _Delivery:
+    """One queued message: its embeds, the non-embed payload fields and the caller's future."""
+    embeds: List[Dict[str, Any]]
+    extras: Dict[str, Any]
+    future: Future = field(default_factory=Future)
+
+    @property
+    def batch_key(self) -> tuple:
+        return tuple(sorted(self.extras.items()))
+
+
+class DiscordDeliveryService:
+    """
+    Shared Discord webhook delivery on a dedicated event loop thread.
+
+    Callers in any thread submit payloads with submit() (returns a concurrent Future of the
+    delivery result) or, from inside an event loop, await deliver(). Coroutines that need the
+    shared sessions can be scheduled onto the service loop with run(). Synchronous callers
+    block on either Future with wait(), which is bounded and refuses to run on the loop thread.
+    """
+
+    def __init__(self, max_queue_size: int = 1000, rate_per_second: float = 0.5,
+                 burst: int = 5, batch_window: float = 0.05, max_retries: int = 3,
+                 retry_delay: float = 1.0, request_timeout: float = 10.0,
+                 max_rate_limit_wait: float = 60.0, result_timeout: float = 60.0):
+        """
+        Initialize the delivery service.
+
+        Args:
+            max_queue_size: Maximum undelivered messages across all webhooks; submissions
+                beyond it are rejected
+            rate_per_second: Sustained requests per second per webhook
+            burst: Requests a webhook may send back to back
+            batch_window: Seconds to wait for more embeds after the first one is queued
+            max_retries: Attempts per request on connection errors and 5xx responses
+            retry_delay: Base delay for retries without a Retry-After, doubled per attempt
+            request_timeout: Total timeout of a single HTTP request
+            max_rate_limit_wait: Total Retry-After seconds a request may wait across 429
+                responses before it is given up
+            result_timeout: Default seconds wait() blocks for a result
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_queue_size = max_queue_size
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.batch_window = batch_window
+        self.max_retries = max(1, max_retries)
+        self.retry_delay = retry_delay
+        self.request_timeout = request_timeout
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.result_timeout = result_timeout
+
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self.stats = defaultdict(int)
+        self._closed = False
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="discord-delivery", daemon=True)
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @property
+    def pending(self) -> int:
+        """Messages submitted but not yet delivered or failed."""
+        return self._pending
+
+    def submit(self, webhook_url: str, payload: Dict[str, Any]) -> Future:
+        """
+        Queue a webhook payload for delivery from any thread.
+
+        Args:
+            webhook_url: Discord webhook URL
+            payload: Webhook payload; its embeds may be sent together with other payloads for
+                the same webhook that carry identical non-embed fields
+
+        Returns:
+            Future resolving to True when Discord accepted the message, False otherwise
+            (already False if the outbound queue is full or the service is closed)
+        """
+        payload = dict(payload)
+        embeds = payload.pop('embeds', None) or []
+        delivery = _Delivery(embeds=list(embeds), extras=payload)
+
+        with self._pending_lock:
+            accepted = not self._closed and self._pending < self.max_queue_size
+            if accepted:
+                self._pending += 1
+        if not accepted:
+            self._count('rejected')
+            reason = "closed" if self._closed else f"queue full ({self.max_queue_size})"
+            self.logger.warning(f"Discord delivery {reason}, dropping message")
+            delivery.future.set_result(False)
+            return delivery.future
+
+        delivery.future.add_done_callback(self._release)
+        self._loop.call_soon_threadsafe(self._enqueue, webhook_url, delivery)
+        return delivery.future
+
+    async def deliver(self, webhook_url: str, payload: Dict[str, Any]) -> bool:
+        """Awaitable submit() for callers running in any event loop."""
+        return await asyncio.wrap_future(self.submit(webhook_url, payload))
+
+    def run(self, coro: Awaitable) -> Future:
+        """Schedule a coroutine on the service loop; returns its concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def wait(self, future: Future, timeout: Optional[float] = None) -> Any:
+        """
+        Block the calling thread on a Future from submit() or run().
+
+        Args:
+            future: Future returned by this service
+            timeout: Seconds to wait (defaults to result_timeout)
+
+        Returns:
+            The future's result
+
+        Raises:
+            RuntimeError: If called on the delivery loop thread, where it would deadlock
+            concurrent.futures.TimeoutError: If the result is not ready in time; the delivery
+                itself carries on in the background
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("DiscordDeliveryService.wait() called on the delivery loop thread; await the result instead")
+        timeout = self.result_timeout if timeout is None else timeout
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            self._count('wait_timeouts')
+            self.logger.warning(f"Timed out after {timeout:.1f}s waiting for Discord delivery")
+            raise
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        """Update a stats counter; stats are touched from caller threads and the loop."""
+        with self._pending_lock:
+            self.stats[name] += amount
+
+    def _release(self, _future: Future) -> None:
+        with self._pending_lock:
+            self._pending -= 1
+
+    def _enqueue(self, webhook_url: str, delivery: _Delivery) -> None:
+        queue = self._queues.get(webhook_url)
+        if queue is None:
+            queue = self._queues[webhook_url] = asyncio.Queue()
+            self._buckets[webhook_url] = TokenBucket(self.rate_per_second, self.burst)
+            self._workers[webhook_url] = self._loop.create_task(self._worker(webhook_url, queue))
+        queue.put_nowait(delivery)
+
+    async def _worker(self, webhook_url: str, queue: asyncio.Queue) -> None:
+        """Drain one webhook's queue, combining compatible messages into batched requests."""
+        carry: Optional[_Delivery] = None
+        while True:
+            first = carry or await queue.get()
+            carry = None
+            batchable = 0 < len(first.embeds) < MAX_EMBEDS_PER_MESSAGE
+            if batchable and self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)
+
+            batch = [first]
+            embed_count = len(first.embeds)
+            while batchable and not queue.empty():
+                candidate = queue.get_nowait()
+                fits = embed_count + len(candidate.embeds) <= MAX_EMBEDS_PER_MESSAGE
+                if candidate.batch_key != first.batch_key or not fits or not candidate.embeds:
+                    carry = candidate
+                    break
+                batch.append(candidate)
+                embed_count += len(candidate.embeds)
+
+            payload = dict(first.extras)
+            if embed_count:
+                payload['embeds'] = [embed for delivery in batch for embed in delivery.embeds]
+            try:
+                success = await self._post(webhook_url, payload)
+            except Exception as e:
+                self.logger.error(f"Discord delivery error: {e}")
+                success = False
+            self._count('requests')
+            self._count('delivered' if success else 'failed', len(batch))
+            for delivery in batch:
+                if not delivery.future.done():
+                    delivery.future.set_result(success)
+
+    def _session(self, webhook_url: str) -> aiohttp.ClientSession:
+        """Pooled session for the webhook's host, created on first use."""
+        parts = urlsplit(webhook_url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        session = self._sessions.get(host)
+        if session is None or session.closed:
+            session = self._sessions[host] = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            )
+        return session
+
+    async def _post(self, webhook_url: str, payload: Dict[str, Any]) -> bool:
+        """
+        POST one payload, honoring the webhook's token bucket and Discord rate limits.
+
+        Connection errors and 5xx responses use up one of max_retries attempts; 429 responses
+        do not, and are retried until their Retry-After delays add up to max_rate_limit_wait.
+        """
+        bucket = self._buckets[webhook_url]
+        attempt = 0
+        rate_limit_wait = 0.0
+        while attempt < self.max_retries:
+            await bucket.acquire()
+            try:
+                async with self._session(webhook_url).post(webhook_url, json=payload) as response:
+                    if response.headers.get('X-RateLimit-Remaining') == '0':
+                        bucket.pause(_seconds(response.headers.get('X-RateLimit-Reset-After')) or 0.0)
+
+                    if response.status in (200, 204):
+                        return True
+                    if response.status == 429:
+                        retry_after = await _retry_after(response)
+                        self._count('rate_limited')
+                        rate_limit_wait += retry_after
+                        if rate_limit_wait > self.max_rate_limit_wait:
+                            self.logger.warning(f"Discord rate limited webhook beyond {self.max_rate_limit_wait:.1f}s of waiting, giving up")
+                            return False
+                        self.logger.warning(f"Discord rate limited webhook, retrying after {retry_after:.2f}s")
+                        bucket.pause(retry_after)
+                        continue
+                    if response.status < 500:
+                        self.logger.warning(f"Discord webhook returned status {response.status}")
+                        return False
+                    self.logger.warning(f"Discord webhook returned status {response.status} (attempt {attempt + 1})")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning(f"Discord webhook attempt {attempt + 1} failed: {e}")
+
+            attempt += 1
+            if attempt < self.max_retries:
+                bucket.pause(self.retry_delay * (2 ** (attempt - 1)))
+        return False
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Stop accepting messages, wait for queued ones, close sessions and stop the loop."""
+        with self._pending_lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        async def shutdown():
+            deadline = time.monotonic() + timeout
+            while self._pending and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            for task in self._workers.values():
+                task.cancel()
+            await asyncio.gather(*self._workers.values(), return_exceptions=True)
+            for session in self._sessions.values():
+                await session.close()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout + 5)
+        except Exception as e:
+            self.logger.error(f"Error shutting down Discord delivery: {e}")
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+
+
+def _seconds(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+async def _retry_after(response: aiohttp.ClientResponse) -> float:
+    """Retry-After of a 429 in seconds, from the header or Discord's JSON body."""
+    retry_after = _seconds(response.headers.get('Retry-After'))
+    if retry_after is None:
+        try:
+            retry_after = _seconds(str((await response.json(content_type=None)).get('retry_after')))
+        except Exception:
+            retry_after = None
+    return retry_after if retry_after is not None else 1.0
+
+
+_service: Optional[DiscordDeliveryService] = None
+_service_lock = threading.Lock()
+
+
+def get_delivery_service() -> DiscordDeliveryService:
+    """Process-wide delivery service, started on first use."""
+    global _service
+    with _service_lock:
+        if _service is None or _service._closed:
+            _service = DiscordDeliveryService(
+                max_queue_size=int(os.getenv('DISCORD_DELIVERY_QUEUE_SIZE', '1000')),
+                rate_per_second=float(os.getenv('DISCORD_WEBHOOK_RATE_PER_SECOND', '0.5')),
+                burst=int(os.getenv('DISCORD_WEBHOOK_BURST', '5')),
+            )
+        return _service
@@ -6,7 +6,6 @@ Sends trading signal alerts to Discord channels via webhooks.
 import logging
 import json
 import asyncio
-import aiohttp
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import os
@@ -14,6 +13,7 @@ import os
 from src.data.signal_models import TradingSignal
 from src.utils.alert_deduper import AlertDeduper
 from src.utils.discord_alert_logger import DiscordAlertLogger
+from src.utils.discord_delivery import DiscordDeliveryService, get_delivery_service
 
 
 class DiscordWebhook:
@@ -21,21 +21,24 @@ class DiscordWebhook:
     Discord webhook client for sending trading signal alerts.
     
     Features:
-    - Async webhook sending
+    - Async webhook sending through the shared DiscordDeliveryService
     - Rich embed formatting for signals
     - Configurable alert settings
     - Error handling and retry logic
     """
     
-    def __init__(self, webhook_url: str, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, webhook_url: str, config: Optional[Dict[str, Any]] = None,
+                 delivery: Optional[DiscordDeliveryService] = None):
         """
         Initialize Discord webhook client.
         
         Args:
             webhook_url: Discord webhook URL
             config: Optional configuration for webhook behavior
+            delivery: Delivery service to send through (defaults to the process-wide one)
         """
         self.webhook_url = webhook_url
+        self._delivery = delivery
         self.logger = logging.getLogger(__name__)
         
         # Default configuration
@@ -54,6 +57,13 @@ class DiscordWebhook:
         
         self.logger.info("Discord webhook initialized")
     
+    @property
+    def delivery(self) -> DiscordDeliveryService:
+        """Delivery service used for all requests of this webhook."""
+        if self._delivery is None:
+            self._delivery = get_delivery_service()
+        return self._delivery
+    
     async def send_signal_alert(self, signal: TradingSignal) -> bool:
         """
         Send a single signal alert to Discord.
@@ -110,12 +120,10 @@ class DiscordWebhook:
             'failed': 0
         }
         
-        for signal in signals:
-            success = await self.send_signal_alert(signal)
-            if success:
-                results['success'] += 1
-            else:
-                results['failed'] += 1
+        # Queue all alerts at once so the delivery service can batch their embeds
+        outcomes = await asyncio.gather(*(self.send_signal_alert(signal) for signal in signals))
+        results['success'] = sum(1 for success in outcomes if success)
+        results['failed'] = len(outcomes) - results['success']
         
         self.logger.info(f"Bulk signal alerts sent: {results['success']}/{results['total']} successful")
         return results
@@ -269,36 +277,15 @@ class DiscordWebhook:
         """
         Send webhook payload to Discord.
         
+        Rate limiting, batching and retries are handled by the delivery service.
+        
         Args:
             payload: Webhook payload dictionary
             
         Returns:
             bool: True if successful, False otherwise
         """
-        max_retries = self.config.get('max_retries', 3)
-        retry_delay = self.config.get('retry_delay', 1.0)
-        
-        for attempt in range(max_retries):
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        self.webhook_url,
-                        json=payload,
-                        headers={'Content-Type': 'application/json'},
-                        timeout=aiohttp.ClientTimeout(total=10)
-                    ) as response:
-                        if response.status == 204:
-                            return True
-                        else:
-                            self.logger.warning(f"Discord webhook returned status {response.status}")
-                            return False
-                            
-            except Exception as e:
-                self.logger.warning(f"Discord webhook attempt {attempt + 1} failed: {e}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delay)
-        
-        return False
+        return await self.delivery.deliver(self.webhook_url, payload)
     
     async def send_test_message(self) -> bool:
         """
@@ -331,15 +318,8 @@ class DiscordWebhook:
             bool: True if successful, False otherwise
         """
         try:
-            # Create event loop if none exists
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            # Run async send_embed_async
-            return loop.run_until_complete(self.send_embed_async(embed))
+            payload = self._create_webhook_payload(embed)
+            return self.delivery.wait(self.delivery.submit(self.webhook_url, payload))
             
         except Exception as e:
             self.logger.error(f"Error in send_embed: {e}")
@@ -425,17 +405,15 @@ class DiscordAlertManager:
             deduped: List[TradingSignal] = []
             for s in filtered_signals:
                 key = self._make_dedupe_key(s)
-                if self._deduper.should_send(key):
+                if self._deduper.try_mark(key):
                     deduped.append(s)
-                    self._deduper.mark_sent(key)
             results = await self.webhook.send_bulk_signals(deduped)
         else:
             results = {'total': len(filtered_signals), 'success': 0, 'failed': 0}
             for signal in filtered_signals:
                 key = self._make_dedupe_key(signal)
-                if not self._deduper.should_send(key):
+                if not self._deduper.try_mark(key):
                     continue
-                self._deduper.mark_sent(key)
                 success = await self.webhook.send_signal_alert(signal)
                 if success:
                     results['success'] += 1
@@ -3,8 +3,10 @@ JSON Alert System for Volatility Signals
 Generates timestamped JSON alerts when volatility spikes above thresholds.
 """
 
+import fcntl
 import json
 import logging
+import os
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from pathlib import Path
@@ -20,6 +22,7 @@ class JSONAlertSystem:
     - Timestamped JSON alerts
     - Configurable alert thresholds
     - File-based alert storage
+    - Append-only signal journal for event-driven consumers
     - Real-time alert generation
     """
     
@@ -40,13 +43,21 @@ class JSONAlertSystem:
             'enabled_assets': ['bitcoin', 'ethereum'],
             'alert_format': 'json',
             'include_momentum': True,
-            'position_direction_logic': 'momentum_based'
+            'position_direction_logic': 'momentum_based',
+            'signal_journal': 'signal_journal.jsonl',
+            'signal_journal_max_bytes': 64 * 1024 * 1024
         }
         
         # Ensure alert directory exists
         self.alert_dir = Path(self.config['alert_directory'])
         self.alert_dir.mkdir(parents=True, exist_ok=True)
         
+        # Every saved alert is also appended to this journal (one JSON object per line)
+        journal_name = self.config.get('signal_journal', 'signal_journal.jsonl')
+        self.journal_path = self.alert_dir / journal_name if journal_name else None
+        # Past this size the journal is rotated to <journal>.1, which readers finish first
+        self.journal_max_bytes = self.config.get('signal_journal_max_bytes', 64 * 1024 * 1024)
+        
         self.logger.info(f"JSON Alert System initialized with {self.config['volatility_threshold_percentile']}th percentile threshold")
     
     def generate_volatility_alert(self, 
@@ -205,11 +216,58 @@ class JSONAlertSystem:
                 json.dump(alert, f, indent=2)
             
             self.logger.info(f"Alert saved to {filepath}")
-            return str(filepath)
             
         except Exception as e:
             self.logger.error(f"Failed to save alert: {e}")
             raise
+        
+        if self.journal_path:
+            try:
+                self.append_to_journal(alert, filename)
+            except Exception as e:
+                self.logger.error(f"Failed to append alert to signal journal: {e}")
+        
+        return str(filepath)
+    
+    def append_to_journal(self, alert: Dict[str, Any], alert_file: Optional[str] = None) -> None:
+        """
+        Append an alert to the signal journal.
+        
+        The line is written with a single O_APPEND write, so concurrent writers never
+        interleave and readers only ever see whole lines or a trailing partial line.
+        Once the journal reaches signal_journal_max_bytes it is renamed to <journal>.1
+        (replacing the previous generation) and a new journal is started. Appends hold a
+        shared lock and rotation an exclusive one, so nothing is written to a journal after
+        it has been rotated.
+        
+        Args:
+            alert: Alert dictionary
+            alert_file: Name of the alert's JSON file, recorded as 'alert_file'
+        """
+        entry = {**alert, 'alert_file': alert_file} if alert_file else alert
+        line = (json.dumps(self._clean_for_json_serialization(entry)) + "\n").encode('utf-8')
+        lock_path = self.journal_path.with_name(self.journal_path.name + '.lock')
+        with open(lock_path, 'a') as lock_file:
+            if self.journal_max_bytes and self._journal_size() >= self.journal_max_bytes:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                # Another writer may have rotated while we waited for the lock
+                if self._journal_size() >= self.journal_max_bytes:
+                    os.replace(self.journal_path, self.journal_path.with_name(self.journal_path.name + '.1'))
+                    self.logger.info(f"Rotated signal journal {self.journal_path}")
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH)
+            
+            fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+    
+    def _journal_size(self) -> int:
+        try:
+            return os.path.getsize(self.journal_path)
+        except FileNotFoundError:
+            return 0
     
     def save_bulk_alerts(self, alerts: List[Dict[str, Any]]) -> List[str]:
         """
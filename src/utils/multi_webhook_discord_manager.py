@@ -4,13 +4,11 @@ Sends signals from different strategies to different Discord webhooks.
 """
 
 import logging
-import asyncio
 from typing import Dict, List, Any, Optional
-from concurrent.futures import ThreadPoolExecutor
-import threading
 
 from src.data.signal_models import TradingSignal
 from src.utils.discord_webhook import DiscordAlertManager
+from src.utils.discord_delivery import get_delivery_service
 
 
 class MultiWebhookDiscordManager:
@@ -37,10 +35,6 @@ class MultiWebhookDiscordManager:
         self.logger = logging.getLogger(__name__)
         self.strategy_webhook_config = strategy_webhook_config
         self.discord_managers: Dict[str, DiscordAlertManager] = {}
-        self._discord_executor = ThreadPoolExecutor(
-            max_workers=4, 
-            thread_name_prefix="multi-discord-alerts"
-        )
         
         # Initialize Discord managers for each strategy
         self._initialize_discord_managers()
@@ -128,17 +122,12 @@ class MultiWebhookDiscordManager:
             
         Returns:
             Dict with results per strategy
+            
+        Raises:
+            concurrent.futures.TimeoutError: If delivery does not finish within the service's result_timeout
         """
-        def run_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(self.send_strategy_signals(strategy_signals))
-            finally:
-                loop.close()
-        
-        future = self._discord_executor.submit(run_async)
-        return future.result()
+        delivery = get_delivery_service()
+        return delivery.wait(delivery.run(self.send_strategy_signals(strategy_signals)))
     
     def get_configured_strategies(self) -> List[str]:
         """Get list of strategies with configured Discord webhooks."""
@@ -177,6 +166,4 @@ class MultiWebhookDiscordManager:
     
     def shutdown(self):
         """Shutdown the multi-webhook Discord manager."""
-        if self._discord_executor:
-            self._discord_executor.shutdown(wait=True)
         self.logger.info("MultiWebhookDiscordManager shutdown complete")
@@ -0,0 +1,54 @@
+"""
+Token bucket rate limiting shared by the asyncio HTTP clients.
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter for one webhook or API key.
+
+    Tokens refill continuously at rate per second up to capacity; pause() blocks all
+    acquisitions until a point in time, which is how Retry-After and exhausted rate-limit
+    headers are honored.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self) -> float:
+        """Seconds until a token can be taken (0 if one is available now)."""
+        now = time.monotonic()
+        self._refill(now)
+        wait = max(0.0, self.paused_until - now)
+        if self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) / self.rate)
+        return wait
+
+    async def acquire(self) -> None:
+        """Wait for and take one token."""
+        while True:
+            wait = self.delay()
+            if wait <= 0:
+                self.tokens -= 1
+                return
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Block acquisitions for the given number of seconds."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
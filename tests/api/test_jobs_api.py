@@ -0,0 +1,192 @@
+"""
+API tests for the background job endpoints, driven through the FastAPI TestClient.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.api.endpoints.jobs import get_job_queue, router
+from src.services.job_queue import JobQueue, JobStore
+
+
+class SquareRequest(BaseModel):
+    x: int
+    label: Optional[str] = None
+
+
+def square(params):
+    """Module-level so worker processes can unpickle it"""
+    time.sleep(0.05)
+    return {'square': params['x'] ** 2}
+
+
+def explode(params):
+    raise ValueError("bad input")
+
+
+class _GatedHandler:
+    """Thread-pool handler that blocks until released and counts its calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+
+    def __call__(self, params):
+        with self.lock:
+            self.calls += 1
+        self.started.set()
+        self.release.wait(10)
+        return {'x': params['x']}
+
+
+def make_client(queue):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_job_queue] = lambda: queue
+    return TestClient(app)
+
+
+def wait_for(client, job_id, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f'/jobs/{job_id}').json()
+        if job['status'] not in ('pending', 'running'):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+@pytest.fixture
+def gated(tmp_path):
+    handler = _GatedHandler()
+    executor = ThreadPoolExecutor(max_workers=1)
+    queue = JobQueue(JobStore(str(tmp_path / 'jobs.db')), max_pending=3, executor=executor)
+    queue.register('gated', handler, SquareRequest)
+    queue.register('explode', explode)
+    yield queue, handler, make_client(queue)
+    handler.release.set()
+    executor.shutdown(wait=True)
+
+
+def test_identical_inflight_requests_share_one_job(gated):
+    queue, handler, client = gated
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        responses = list(pool.map(lambda _: client.post('/jobs/gated', json={'x': 3}), range(40)))
+    assert {r.status_code for r in responses} == {202}
+    assert len({r.json()['job_id'] for r in responses}) == 1
+    assert sum(r.json()['deduplicated'] for r in responses) == 39
+
+    # Omitted defaults normalize to the same request
+    job_id = responses[0].json()['job_id']
+    assert client.post('/jobs/gated', json={'x': 3, 'label': None}).json()['job_id'] == job_id
+    assert client.get(f'/jobs/{job_id}/result').status_code == 409
+
+    handler.release.set()
+    assert wait_for(client, job_id)['status'] == 'succeeded'
+    assert client.get(f'/jobs/{job_id}/result').json()['result'] == {'x': 3}
+    assert handler.calls == 1
+
+    # Once finished, the same request starts a new job
+    assert client.post('/jobs/gated', json={'x': 3}).json()['job_id'] != job_id
+
+
+def test_cancel_pending_and_running_jobs(gated):
+    queue, handler, client = gated
+    running = client.post('/jobs/gated', json={'x': 1}).json()['job_id']
+    pending = client.post('/jobs/gated', json={'x': 2}).json()['job_id']
+    assert handler.started.wait(5)
+    assert client.get(f'/jobs/{running}').json()['status'] == 'running'
+    worker = queue.future(running)
+
+    assert client.delete(f'/jobs/{pending}').json()['status'] == 'cancelled'
+    assert client.delete(f'/jobs/{running}').json()['status'] == 'cancelled'
+    handler.release.set()
+    worker.result(5)
+
+    assert handler.calls == 1  # The pending job never reached a worker
+    assert client.get(f'/jobs/{running}').json()['status'] == 'cancelled'
+    assert client.get(f'/jobs/{running}/result').status_code == 410
+    assert client.delete('/jobs/missing').status_code == 404
+
+
+def test_job_is_marked_running_by_its_worker(gated):
+    queue, handler, client = gated
+    job_id = client.post('/jobs/gated', json={'x': 5}).json()['job_id']
+    assert handler.started.wait(5)
+
+    # Recorded when the worker started, not when the job was next polled through the queue
+    assert queue.store.get(job_id)['status'] == 'running'
+    assert queue.store.get(job_id)['started_at'] is not None
+
+    handler.release.set()
+    queue.future(job_id).result(5)
+    # The completion future resolves only after the outcome is stored
+    assert queue.store.get(job_id, include_result=True)['result'] == {'x': 5}
+
+
+def test_submission_errors(gated):
+    queue, handler, client = gated
+    assert client.post('/jobs/unknown', json={}).status_code == 404
+    assert client.post('/jobs/gated', json={'x': 'not a number'}).status_code == 422
+
+    accepted = [client.post('/jobs/gated', json={'x': x}) for x in range(3)]
+    assert [r.status_code for r in accepted] == [202] * 3
+    assert client.post('/jobs/gated', json={'x': 99}).status_code == 503
+
+    handler.release.set()
+    deadline = time.monotonic() + 10
+    while queue.in_flight and time.monotonic() < deadline:
+        time.sleep(0.01)
+    failed = client.post('/jobs/explode', json={}).json()['job_id']
+    job = wait_for(client, failed)
+    assert (job['status'], job['error']) == ('failed', 'bad input')
+    assert client.get(f'/jobs/{failed}/result').status_code == 500
+
+
+def test_results_persist_across_restarts(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    executor = ThreadPoolExecutor(max_workers=1)
+    queue = JobQueue(store, executor=executor)
+    queue.register('square', square)
+    done, _ = queue.submit('square', {'x': 4})
+    queue.future(done['job_id']).result(5)
+    store.create('stale', 'square', 'key', {'x': 5})  # Left pending by a crashed process
+    executor.shutdown(wait=True)
+
+    client = make_client(JobQueue(JobStore(str(tmp_path / 'jobs.db')), executor=ThreadPoolExecutor(1)))
+    assert client.get(f"/jobs/{done['job_id']}/result").json()['result'] == {'square': 16}
+    assert client.get('/jobs/stale').json()['status'] == 'failed'
+    assert [job['job_id'] for job in client.get('/jobs', params={'status': 'succeeded'}).json()] == [done['job_id']]
+
+
+def test_load_on_process_pool(tmp_path):
+    queue = JobQueue(JobStore(str(tmp_path / 'jobs.db')), max_workers=2)
+    queue.register('square', square, SquareRequest)
+    client = make_client(queue)
+
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            responses = list(pool.map(lambda i: client.post('/jobs/square', json={'x': i % 8}), range(64)))
+        submit_time = time.perf_counter() - started
+
+        assert {r.status_code for r in responses} == {202}
+        for response in responses:
+            job = wait_for(client, response.json()['job_id'])
+            assert job['status'] == 'succeeded'
+            x = job['params']['x']
+            assert client.get(f"/jobs/{job['job_id']}/result").json()['result'] == {'square': x * x}
+        # Submissions return immediately instead of waiting on the workers
+        assert submit_time < 64 * 0.05
+    finally:
+        queue.shutdown()
@@ -0,0 +1,21 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+
+class FakeClock:
+    """Stand-in for an injected clock callable; tests move it by assigning or adding to `now`."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def make_clock():
+    """Factory for fake clocks starting at a given time (a POSIX float or a datetime)."""
+    return FakeClock
@@ -0,0 +1,155 @@
+import json
+import multiprocessing
+
+import pytest
+
+from src.utils.alert_deduper import AlertDeduper
+
+
+@pytest.fixture
+def clock(monkeypatch, make_clock):
+    clock = make_clock()
+    monkeypatch.setattr('src.utils.alert_deduper.time.time', clock)
+    return clock
+
+
+def _mark_keys(state_file, keys):
+    deduper = AlertDeduper(state_file, ttl_seconds=3600, compact_threshold=3)
+    for key in keys:
+        deduper.mark_sent(key)
+
+
+def test_keys_are_suppressed_until_ttl_expires(tmp_path, clock):
+    deduper = AlertDeduper(str(tmp_path / 'state.json'), ttl_seconds=60)
+    assert deduper.should_send('a')
+    deduper.mark_sent('a')
+    assert not deduper.should_send('a')
+
+    clock.now += 59
+    assert not deduper.should_send('a')
+    clock.now += 2
+    assert deduper.should_send('a')
+    assert deduper.active_entries() == {}
+
+
+def test_remarking_a_key_extends_its_ttl(tmp_path, clock):
+    deduper = AlertDeduper(str(tmp_path / 'state.json'), ttl_seconds=60)
+    deduper.mark_sent('a')
+    clock.now += 50
+    deduper.mark_sent('a')
+    clock.now += 20  # first mark expired, second still active
+    assert not deduper.should_send('a')
+    assert list(deduper.active_entries()) == ['a']
+
+
+def test_marks_append_to_journal_without_rewriting_snapshot(tmp_path, clock):
+    state_file = tmp_path / 'state.json'
+    deduper = AlertDeduper(str(state_file), ttl_seconds=60, compact_threshold=100)
+    for n in range(10):
+        deduper.mark_sent(f'key-{n}')
+
+    assert not state_file.exists()
+    lines = (tmp_path / 'state.journal').read_text().splitlines()
+    assert [json.loads(line)[0] for line in lines] == [f'key-{n}' for n in range(10)]
+
+
+def test_compaction_folds_journal_into_snapshot(tmp_path, clock):
+    state_file = tmp_path / 'state.json'
+    deduper = AlertDeduper(str(state_file), ttl_seconds=60, compact_threshold=5)
+    deduper.mark_sent('old')
+    clock.now += 61
+    for n in range(4):
+        deduper.mark_sent(f'key-{n}')
+
+    snapshot = json.loads(state_file.read_text())
+    assert sorted(snapshot) == [f'key-{n}' for n in range(4)]
+    assert (tmp_path / 'state.journal').read_text() == ''
+    assert not deduper.should_send('key-0')
+
+
+def test_instances_share_marks_across_compactions(tmp_path, clock):
+    state_file = str(tmp_path / 'state.json')
+    first = AlertDeduper(state_file, ttl_seconds=60, compact_threshold=3)
+    second = AlertDeduper(state_file, ttl_seconds=60, compact_threshold=3)
+
+    first.mark_sent('a')
+    assert not second.should_send('a')
+    for key in ['b', 'c', 'd']:  # triggers compaction in the first instance
+        first.mark_sent(key)
+    assert all(not second.should_send(key) for key in 'abcd')
+    second.mark_sent('e')
+    assert not first.should_send('e')
+
+
+def test_loads_legacy_snapshot(tmp_path, clock):
+    state_file = tmp_path / 'state.json'
+    state_file.write_text(json.dumps({'fresh': clock.now - 10, 'stale': clock.now - 7200}))
+    deduper = AlertDeduper(str(state_file), ttl_seconds=3600)
+    assert not deduper.should_send('fresh')
+    assert deduper.should_send('stale')
+
+
+def test_marks_from_other_processes_are_seen(tmp_path):
+    state_file = str(tmp_path / 'state.json')
+    deduper = AlertDeduper(state_file, ttl_seconds=3600, compact_threshold=3)
+    deduper.mark_sent('parent')
+
+    context = multiprocessing.get_context('fork')
+    workers = [context.Process(target=_mark_keys, args=(state_file, [f'child-{w}-{n}' for n in range(5)]))
+               for w in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+
+    expected = {'parent'} | {f'child-{w}-{n}' for w in range(2) for n in range(5)}
+    assert set(deduper.active_entries()) == expected
+    assert set(AlertDeduper(state_file, ttl_seconds=3600).active_entries()) == expected
+
+
+def _claim_key(state_file, key, results):
+    results.put(AlertDeduper(state_file, ttl_seconds=3600).try_mark(key))
+
+
+def test_try_mark_claims_a_key_once_per_ttl(tmp_path, clock):
+    state_file = str(tmp_path / 'state.json')
+    first = AlertDeduper(state_file, ttl_seconds=60)
+    second = AlertDeduper(state_file, ttl_seconds=60)
+
+    assert first.try_mark('a')
+    assert not second.try_mark('a')
+    assert not first.try_mark('a')
+    clock.now += 61
+    assert second.try_mark('a')
+    assert not first.should_send('a')
+
+
+def test_unmark_releases_a_claim(tmp_path, clock):
+    state_file = str(tmp_path / 'state.json')
+    first = AlertDeduper(state_file, ttl_seconds=60, compact_threshold=4)
+    second = AlertDeduper(state_file, ttl_seconds=60, compact_threshold=4)
+
+    assert first.try_mark('a')
+    first.unmark('a')
+    assert second.try_mark('a')
+    assert first.active_entries() == {'a': clock.now}
+
+    second.unmark('a')  # fourth journal entry compacts
+    assert json.loads((tmp_path / 'state.json').read_text()) == {}
+    assert AlertDeduper(state_file, ttl_seconds=60).try_mark('a')
+
+
+def test_racing_processes_claim_a_key_once(tmp_path):
+    state_file = str(tmp_path / 'state.json')
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+    workers = [context.Process(target=_claim_key, args=(state_file, 'shared', results)) for _ in range(8)]
+    for worker in workers:
+        worker.start()
+    claims = [results.get(timeout=30) for _ in workers]
+    for worker in workers:
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+
+    assert sorted(claims) == [False] * 7 + [True]
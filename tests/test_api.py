@@ -10,7 +10,7 @@ def test_coingecko_client_initialization():
     assert client.timeout == 30
 
 
-@patch('src.api.coingecko_client.requests.get')
+@patch('src.api.coingecko_client.requests.Session.get')
 def test_ping_success(mock_get):
     """Test successful ping response."""
     # Mock successful response
@@ -29,7 +29,7 @@ def test_ping_success(mock_get):
     )
 
 
-@patch('src.api.coingecko_client.requests.get')
+@patch('src.api.coingecko_client.requests.Session.get')
 def test_ping_network_error(mock_get):
     """Test ping with network error."""
     import requests
@@ -44,7 +44,7 @@ def test_ping_network_error(mock_get):
     assert "API request failed" in str(exc_info.value)
 
 
-@patch('src.api.coingecko_client.requests.get')
+@patch('src.api.coingecko_client.requests.Session.get')
 def test_get_top_cryptos_success(mock_get):
     """Test successful get_top_cryptos response."""
     # Mock successful response
@@ -78,7 +78,7 @@ def test_get_top_cryptos_success(mock_get):
     )
 
 
-@patch('src.api.coingecko_client.requests.get')
+@patch('src.api.coingecko_client.requests.Session.get')
 def test_get_top_cryptos_api_error(mock_get):
     """Test get_top_cryptos with API error."""
     import requests
@@ -93,7 +93,7 @@ def test_get_top_cryptos_api_error(mock_get):
     assert "API request failed" in str(exc_info.value)
 
 
-@patch('src.api.coingecko_client.requests.get')
+@patch('src.api.coingecko_client.requests.Session.get')
 def test_get_ohlc_data_success(mock_get):
     """Test successful get_ohlc_data response."""
     # Mock successful OHLC response (timestamp, open, high, low, close)
@@ -124,7 +124,7 @@ def test_get_ohlc_data_success(mock_get):
     )
 
 
-@patch('src.api.coingecko_client.requests.get')
+@patch('src.api.coingecko_client.requests.Session.get')
 def test_get_ohlc_data_missing_data(mock_get):
     """Test get_ohlc_data with empty response."""
     # Mock empty response
@@ -139,7 +139,7 @@ def test_get_ohlc_data_missing_data(mock_get):
     assert len(data) == 0
 
 
-@patch('src.api.coingecko_client.requests.get')
+@patch('src.api.coingecko_client.requests.Session.get')
 def test_get_ohlc_data_api_error(mock_get):
     """Test get_ohlc_data with API error."""
     import requests
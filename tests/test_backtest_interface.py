@@ -118,6 +118,9 @@ class TestBacktestInterface:
         # Check crypto data
         assert len(filtered_data['crypto_data']['bitcoin']['price_data']) == 3
         assert filtered_data['crypto_data']['bitcoin']['price_data'][-1]['date'] == '2024-01-03'
+        
+        # Full history is left intact for later days
+        assert len(self.mock_historical_data['crypto_data']['bitcoin']['price_data']) == 5
 
     def test_prepare_price_data(self):
         """Test preparing price data for simulation."""
@@ -352,6 +355,60 @@ class TestBacktestInterface:
         assert result_dict['trading_statistics']['total_trades'] == 10
         assert result_dict['signal_statistics']['total_signals'] == 15
 
+    def test_execute_backtest_simulation_matches_dict_lookup(self):
+        """Indexed simulation produces the same output as the per-day dict-based reference loop."""
+        from src.data.signal_models import SignalDirection
+
+        def make_signal(asset, signal_type, date_str, price, position_size):
+            signal_dt = datetime.strptime(date_str, '%Y-%m-%d')
+            signal = TradingSignal(
+                symbol=asset,
+                signal_type=signal_type,
+                direction=SignalDirection.BUY if signal_type == SignalType.LONG else SignalDirection.SELL,
+                timestamp=signal_dt,
+                price=price,
+                strategy_name='test_strategy',
+                signal_strength=SignalStrength.STRONG,
+                confidence=0.7,
+                position_size=position_size
+            )
+            # Historical signal generation stamps signals with epoch seconds
+            signal.timestamp = signal_dt.timestamp()
+            return signal
+
+        signals = [
+            make_signal('bitcoin', SignalType.LONG, '2024-01-01', 45000.0, 0.3),
+            make_signal('ethereum', SignalType.LONG, '2024-01-02', 2950.0, 0.2),
+            make_signal('bitcoin', SignalType.LONG, '2024-01-03', 42000.0, 0.1),
+            make_signal('solana', SignalType.LONG, '2024-01-03', 100.0, 0.1),
+            make_signal('ethereum', SignalType.SHORT, '2024-01-04', 2900.0, 0.2),
+            make_signal('bitcoin', SignalType.SHORT, '2024-01-05', 46000.0, 0.3),
+            make_signal('bitcoin', SignalType.LONG, '2024-02-01', 50000.0, 0.3),
+        ]
+
+        results = self.backtest_interface._execute_backtest_simulation(
+            signals, self.mock_historical_data, '2024-01-01', '2024-01-05'
+        )
+
+        # Reference: original O(days x signals) loop over date-keyed price dicts
+        portfolio = {'cash': 100000.0, 'positions': {}, 'trade_log': []}
+        price_data = self.backtest_interface._prepare_price_data(self.mock_historical_data)
+        expected_equity = []
+        current_date = datetime(2024, 1, 1)
+        while current_date <= datetime(2024, 1, 5):
+            date_str = current_date.strftime('%Y-%m-%d')
+            for signal in [s for s in signals if datetime.fromtimestamp(s.timestamp).date() == current_date.date()]:
+                self.backtest_interface._execute_trade(signal, portfolio, price_data, date_str)
+            expected_equity.append(
+                self.backtest_interface._calculate_portfolio_value(portfolio, price_data, date_str)
+            )
+            current_date += timedelta(days=1)
+
+        assert results['equity_curve'] == pytest.approx(expected_equity, rel=1e-12)
+        assert results['trade_log'] == portfolio['trade_log']
+        assert len(results['daily_returns']) == 5
+        assert [t['action'] for t in results['trade_log']] == ['BUY', 'BUY', 'BUY', 'SELL', 'SELL']
+
 
 class TestBacktestTask10Requirements:
     """Test specific Task 10 requirements."""
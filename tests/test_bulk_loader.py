@@ -0,0 +1,121 @@
+"""
+Tests for the streaming bulk loader and the CSV migration built on it.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.bulk_loader import BulkLoader
+from src.data.sqlite_helper import CryptoDatabase
+
+
+HOUR_MS = 3_600_000
+START_MS = 1_704_067_200_000  # 2024-01-01 00:00 UTC
+
+
+def _frame(hours, offset=0, price=1.0):
+    timestamps = START_MS + (offset + np.arange(hours, dtype=np.int64)) * HOUR_MS
+    return pd.DataFrame({'timestamp': timestamps, 'open': price, 'high': price, 'low': price,
+                         'close': price, 'volume': 1.0})
+
+
+def _schema_objects(db):
+    with sqlite3.connect(db.db_path) as conn:
+        return sorted(conn.execute("SELECT type, name, sql FROM sqlite_master").fetchall())
+
+
+def _rows(db, sql):
+    with sqlite3.connect(db.db_path) as conn:
+        return conn.execute(sql).fetchall()
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = CryptoDatabase(str(tmp_path / 'crypto.db'))
+    database.insert_crypto_data([{'cryptocurrency': 'bitcoin', 'timestamp': START_MS, 'date_str': '2024-01-01',
+                                  'open': 5.0, 'high': 5.0, 'low': 5.0, 'close': 5.0, 'volume': 5.0}])
+    return database
+
+
+@pytest.mark.parametrize('index_rebuild_rows', [None, 10])
+def test_load_merges_and_maintains_derived_tables(db, index_rebuild_rows):
+    schema = _schema_objects(db)
+    progress = []
+    loader = BulkLoader(db.db_path, index_rebuild_rows=index_rebuild_rows, progress_every=20,
+                        on_progress=lambda rows, rate: progress.append(rows))
+
+    chunks = [_frame(24, price=2.0), _frame(24, offset=12, price=3.0),  # Overlaps the stored row and itself
+              _frame(10).assign(cryptocurrency='ethereum')]
+    result = loader.load_crypto(chunks, cryptocurrency='bitcoin')
+
+    assert (result['staged'], result['inserted'], result['duplicates']) == (58, 45, 13)
+    assert result['rebuilt_indexes'] is (index_rebuild_rows is not None)
+    assert progress == [24, 48]  # After the chunks that cross each multiple of progress_every
+    # The stored row and the first staged copy of each timestamp win
+    closes = [row[0] for row in _rows(db, "SELECT close FROM crypto_ohlcv WHERE cryptocurrency = 'bitcoin' "
+                                          "ORDER BY timestamp")]
+    assert closes == [5.0] + [2.0] * 23 + [3.0] * 12
+    assert _rows(db, "SELECT DISTINCT date_str FROM crypto_ohlcv ORDER BY 1") == [('2024-01-01',), ('2024-01-02',)]
+
+    # Suspended triggers and dropped indexes are back, and their effect was applied set-wise
+    assert _schema_objects(db) == schema
+    assert db.get_tracked_assets() == ['bitcoin', 'ethereum']
+    assert {s['series']: s['row_count'] for s in db.get_series_stats('crypto')} == {'bitcoin': 36, 'ethereum': 10}
+    assert db.rebuild_series_stats()['corrected'] == 0
+
+    assert loader.load_crypto([_frame(36)], cryptocurrency='bitcoin')['inserted'] == 0
+
+
+def test_failed_load_writes_nothing(db):
+    schema = _schema_objects(db)
+
+    def chunks():
+        yield _frame(24, offset=1).assign(cryptocurrency='bitcoin')
+        yield [{'cryptocurrency': 'bitcoin', 'timestamp': START_MS}]
+
+    with pytest.raises(ValueError, match='Missing required field'):
+        BulkLoader(db.db_path, index_rebuild_rows=1).load_crypto(chunks())
+
+    assert _rows(db, "SELECT COUNT(*) FROM crypto_ohlcv") == [(1,)]
+    assert _schema_objects(db) == schema
+
+
+def test_macro_load_bumps_table_version(db):
+    version = db.get_table_version('macro_indicators')
+    records = [{'indicator': 'VIXCLS', 'date': f'2024-01-{day:02d}', 'value': 15.0} for day in (2, 3)]
+    frame = pd.DataFrame({'date': ['2024-01-03', '2024-01-04'], 'value': [16.0, 17.0],
+                          'is_forward_filled': [False, True]})
+
+    result = BulkLoader(db.db_path).load_macro([records, frame], indicator='VIXCLS')
+
+    assert (result['inserted'], result['duplicates']) == (3, 1)
+    assert db.get_table_version('macro_indicators') == version + 3
+    assert _rows(db, "SELECT date, value, is_interpolated, is_forward_filled FROM macro_indicators ORDER BY date") == [
+        ('2024-01-02', 15.0, 0, 0), ('2024-01-03', 15.0, 0, 0), ('2024-01-04', 17.0, 0, 1)]
+    assert db.get_series_stats('macro')[0]['row_count'] == 3
+    assert BulkLoader(db.db_path).load_macro([])['staged'] == 0
+
+
+def test_migration_streams_csv_in_chunks(db, tmp_path, monkeypatch):
+    frame = _frame(30)
+    frame.loc[3, 'volume'] = -1.0  # Fails validation
+    frame.loc[4, 'high'] = None  # Defaults to 0.0, below open: fails validation
+    frame['timestamp'] = frame['timestamp'].astype(object)
+    frame.loc[5, 'timestamp'] = 'not-a-timestamp'
+    csv_path = tmp_path / 'solana_2024.csv'
+    frame.to_csv(csv_path, index=False)
+
+    monkeypatch.syspath_prepend(str(Path(__file__).resolve().parents[1] / 'scripts'))
+    import migrate_csv_to_sqlite
+
+    assert migrate_csv_to_sqlite.process_csv_file(str(csv_path), db, chunksize=7) == 27
+    assert migrate_csv_to_sqlite.process_csv_file(str(csv_path), db, chunksize=7) == 0
+    assert db.get_series_stats('crypto')[-1]['row_count'] == 27
+
+    (tmp_path / 'bad_2024.csv').write_text("timestamp,open\n1,2\n")
+    with pytest.raises(ValueError, match='Missing required columns'):
+        migrate_csv_to_sqlite.process_csv_file(str(tmp_path / 'bad_2024.csv'), db)
@@ -0,0 +1,346 @@
+"""
+Tests for the async collection engine against a local fake provider serving recorded responses.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from src.api.coingecko_client import CoinGeckoClient
+from src.api.fred_client import FREDClient
+from src.data.models import Cryptocurrency
+from src.data.sqlite_helper import CryptoDatabase
+from src.services.collection_engine import CollectionEngine, ProviderSpec
+from src.services.collector import DataCollector
+from src.services.macro_collector import MacroDataCollector
+from src.utils.exceptions import APIError, FREDAPIError
+from config.settings import Config
+from config.macro_settings import FRED_API_CONFIG, MACRO_INDICATORS
+
+NOW_MS = int(time.time() // 3600 * 3600 * 1000)
+
+# Recorded provider responses, trimmed to a few points
+RECORDED_MARKET_CHART = {
+    'prices': [[NOW_MS - 7200000, 97010.5], [NOW_MS - 3600000, 97455.1], [NOW_MS, 97120.8]],
+    'market_caps': [[NOW_MS - 7200000, 1.92e12], [NOW_MS - 3600000, 1.93e12], [NOW_MS, 1.92e12]],
+    'total_volumes': [[NOW_MS - 7200000, 3.1e10], [NOW_MS - 3600000, 3.2e10], [NOW_MS, 3.0e10]],
+}
+RECORDED_MARKETS = [
+    {'id': 'bitcoin', 'symbol': 'btc', 'name': 'Bitcoin', 'current_price': 97120.8,
+     'market_cap': 1.92e12, 'market_cap_rank': 1, 'total_volume': 3.0e10},
+    {'id': 'ethereum', 'symbol': 'eth', 'name': 'Ethereum', 'current_price': 3350.2,
+     'market_cap': 4.0e11, 'market_cap_rank': 2, 'total_volume': 1.5e10},
+    {'id': 'solana', 'symbol': 'sol', 'name': 'Solana', 'current_price': 190.4,
+     'market_cap': 9.1e10, 'market_cap_rank': 3, 'total_volume': 4.0e9},
+]
+RECORDED_OBSERVATIONS = {
+    'observations': [
+        {'date': '2025-01-02', 'value': '17.93'},
+        {'date': '2025-01-03', 'value': '.'},
+        {'date': '2025-01-06', 'value': '16.13'},
+    ]
+}
+
+
+class _FakeProvider:
+    """Local HTTP provider replaying recorded JSON with configurable latency and failures."""
+
+    def __init__(self):
+        self.latency = 0.0
+        self.requests = []
+        self.failures = {}  # path -> [(status, headers)] served before the recorded response
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        provider = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                with provider._lock:
+                    provider.requests.append((time.monotonic(), parts.path, parse_qs(parts.query),
+                                              self.client_address))
+                    provider.in_flight += 1
+                    provider.max_in_flight = max(provider.max_in_flight, provider.in_flight)
+                    queued = provider.failures.get(parts.path)
+                    status, headers = queued.pop(0) if queued else (200, {})
+                try:
+                    time.sleep(provider.latency)
+                    body = json.dumps(provider.recorded(parts.path) if status == 200 else {}).encode()
+                    self.send_response(status)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with provider._lock:
+                        provider.in_flight -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+
+    @staticmethod
+    def recorded(path):
+        if path.endswith('/market_chart'):
+            return RECORDED_MARKET_CHART
+        if path == '/coins/markets':
+            return RECORDED_MARKETS
+        if path == '/series/observations':
+            return RECORDED_OBSERVATIONS
+        return {'ok': True}
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def provider():
+    server = _FakeProvider()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def make_engine():
+    engines = []
+
+    def make(**kwargs):
+        options = {'max_concurrency': 8, 'request_timeout': 5.0, 'max_retries': 2, 'base_delay': 0.01}
+        engine = CollectionEngine(**{**options, **kwargs})
+        engines.append(engine)
+        return engine
+
+    yield make
+    for engine in engines:
+        engine.close()
+
+
+def _spec(provider, **kwargs):
+    return ProviderSpec(**{'name': 'fake', 'base_url': provider.url, 'rate_per_minute': 60000, 'burst': 100,
+                           **kwargs})
+
+
+def _coingecko_client(provider):
+    client = CoinGeckoClient(api_key='')
+    client.base_url = provider.url
+    client.config.RATE_LIMIT_REQUESTS_PER_MINUTE = 6000
+    return client
+
+
+def _fetch_all(engine, spec, paths):
+    async def fetch():
+        return await asyncio.gather(*(engine.get_json(spec, path) for path in paths), return_exceptions=True)
+    return engine.run(fetch()).result(timeout=30)
+
+
+def test_requests_share_a_keep_alive_session(provider, make_engine):
+    engine = make_engine(max_concurrency=1)
+    results = _fetch_all(engine, _spec(provider), [f'/item/{n}' for n in range(5)])
+
+    assert results == [{'ok': True}] * 5
+    assert len({address for *_, address in provider.requests}) == 1
+
+
+def test_concurrency_is_bounded_per_provider(provider, make_engine):
+    provider.latency = 0.1
+    engine = make_engine(max_concurrency=3)
+    _fetch_all(engine, _spec(provider), [f'/item/{n}' for n in range(9)])
+
+    assert len(provider.requests) == 9
+    assert provider.max_in_flight <= 3
+
+
+def test_token_bucket_matches_quota(provider, make_engine):
+    engine = make_engine()
+    _fetch_all(engine, _spec(provider, rate_per_minute=1200, burst=1), [f'/item/{n}' for n in range(5)])
+
+    times = [t for t, *_ in provider.requests]
+    assert times[-1] - times[0] >= 0.18  # 20 requests per second
+
+
+def test_quota_is_shared_per_api_key(provider, make_engine):
+    engine = make_engine()
+    spec = _spec(provider, rate_per_minute=60, burst=1, api_key='key-a')
+    _fetch_all(engine, spec, ['/item/0'])
+
+    assert engine._bucket(_spec(provider, rate_per_minute=60, burst=1, api_key='key-a')).delay() > 0.5
+    assert engine._bucket(_spec(provider, rate_per_minute=60, burst=1, api_key='key-b')).delay() == 0
+
+
+def test_rate_limit_retry_after_is_honored(provider, make_engine):
+    provider.failures['/item/0'] = [(429, {'Retry-After': '0.3'})]
+    engine = make_engine()
+    results = _fetch_all(engine, _spec(provider), ['/item/0'])
+
+    assert results == [{'ok': True}]
+    assert provider.requests[1][0] - provider.requests[0][0] >= 0.3
+    assert engine.stats['rate_limited'] == 1
+
+
+def test_server_errors_are_retried_and_client_errors_are_not(provider, make_engine):
+    provider.failures['/flaky'] = [(502, {}), (503, {})]
+    provider.failures['/missing'] = [(404, {})]
+    engine = make_engine()
+    flaky, missing = _fetch_all(engine, _spec(provider), ['/flaky', '/missing'])
+
+    assert flaky == {'ok': True}
+    assert isinstance(missing, APIError) and missing.status_code == 404
+    assert [path for _, path, *_ in provider.requests].count('/flaky') == 3
+    assert [path for _, path, *_ in provider.requests].count('/missing') == 1
+
+
+def test_backoff_of_one_asset_does_not_block_others(provider, make_engine):
+    provider.failures['/slow'] = [(503, {})] * 2
+    engine = make_engine(base_delay=0.4, max_delay=0.4)
+    engine.backoff = lambda attempt: 0.4
+    started = time.monotonic()
+    results = _fetch_all(engine, _spec(provider), ['/slow'] + [f'/item/{n}' for n in range(5)])
+
+    assert results == [{'ok': True}] * 6
+    finished = {path: t - started for t, path, *_ in provider.requests}
+    assert max(finished[f'/item/{n}'] for n in range(5)) < 0.3
+    assert finished['/slow'] >= 0.8
+
+
+def test_unreachable_provider_falls_back(provider, make_engine):
+    engine = make_engine(max_retries=0)
+    spec = ProviderSpec(name='primary', base_url='http://127.0.0.1:1', rate_per_minute=60000, burst=100,
+                        fallback=_spec(provider))
+    assert _fetch_all(engine, spec, ['/item/0']) == [{'ok': True}]
+    assert engine.stats['fallbacks'] == 1
+
+
+def test_coingecko_quota_follows_api_tier():
+    config = Config()
+    pro = CoinGeckoClient(api_key='CG-test').provider_spec()
+    assert pro.rate_per_minute == config.COINGECKO_PRO_RATE_LIMIT_RPM and pro.headers == {'x-cg-pro-api-key': 'CG-test'}
+    assert pro.fallback.name == 'coingecko' and pro.fallback.headers == {}
+    assert pro.fallback.rate_per_minute == config.RATE_LIMIT_REQUESTS_PER_MINUTE
+
+    free = CoinGeckoClient(api_key='').provider_spec()
+    assert free.rate_per_minute == config.RATE_LIMIT_REQUESTS_PER_MINUTE and free.fallback is None
+
+
+def test_coingecko_sync_requests_reuse_pooled_session(provider):
+    client = _coingecko_client(provider)
+    for _ in range(3):
+        assert client.get_top_cryptos(3) == RECORDED_MARKETS
+
+    assert len({address for *_, address in provider.requests}) == 1
+
+
+def test_collect_all_data_fetches_assets_concurrently(provider, make_engine, tmp_path):
+    provider.latency = 0.3
+    engine = make_engine()
+    client = _coingecko_client(provider)
+    collector = DataCollector(api_client=client, database=CryptoDatabase(str(tmp_path / 'crypto.db')),
+                              engine=engine)
+
+    started = time.monotonic()
+    results = collector.collect_all_data(days=1)
+    elapsed = time.monotonic() - started
+
+    assert results['successful_cryptos'] == ['bitcoin', 'ethereum', 'solana']
+    assert results['total_records_collected'] > 0
+    # One markets request, then three chart requests in parallel rather than back to back
+    assert elapsed < 0.3 * 4 - 0.2
+    chart_params = [query for _, path, query, _ in provider.requests if path.endswith('/market_chart')]
+    assert chart_params and all(query['vs_currency'] == ['usd'] for query in chart_params)
+
+
+def test_collect_all_data_retries_failed_asset_independently(provider, make_engine, tmp_path):
+    provider.failures['/coins/ethereum/market_chart'] = [(429, {'Retry-After': '0'})] * 3
+    engine = make_engine(max_retries=1)
+    client = _coingecko_client(provider)
+    collector = DataCollector(api_client=client, database=CryptoDatabase(str(tmp_path / 'crypto.db')),
+                              engine=engine)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(collector, 'get_top_cryptocurrencies', lambda limit=3: [
+            Cryptocurrency(id='bitcoin', symbol='btc', name='Bitcoin'),
+            Cryptocurrency(id='ethereum', symbol='eth', name='Ethereum'),
+        ])
+        results = collector.collect_all_data(days=1, max_retries_per_crypto=1)
+
+    assert results['successful'] == 2
+    assert results['retries_used'] == 1
+    assert [detail['attempts'] for detail in results['details']] == [1, 2]
+
+
+def test_collect_all_indicators_fetches_each_series_once(provider, make_engine, tmp_path, monkeypatch):
+    monkeypatch.setitem(FRED_API_CONFIG, 'rate_limit_per_minute', 6000)
+    provider.latency = 0.05
+    fred_client = FREDClient(api_key='test-key')
+    fred_client.base_url = provider.url
+    collector = MacroDataCollector(database=CryptoDatabase(str(tmp_path / 'crypto.db')),
+                                   fred_client=fred_client, engine=make_engine())
+
+    results = collector.collect_all_indicators(days=30)
+
+    assert set(results) == set(MACRO_INDICATORS)
+    assert all(len(records) == 3 for records in results.values())
+    requested = [query['series_id'][0] for _, _, query, _ in provider.requests]
+    assert sorted(requested) == sorted({config['fred_series_id'] for config in MACRO_INDICATORS.values()})
+    assert all(query['api_key'] == ['test-key'] and query['file_type'] == ['json']
+               for _, _, query, _ in provider.requests)
+
+
+def test_fred_http_errors_surface_as_fred_errors(provider, make_engine):
+    provider.failures['/series/observations'] = [(400, {})]
+    engine = make_engine()
+    fred_client = FREDClient(api_key='test-key')
+    fred_client.base_url = provider.url
+
+    future = engine.run(fred_client.get_series_data_async('BADSERIES', '2025-01-01', '2025-01-31', engine=engine))
+    with pytest.raises(FREDAPIError):
+        future.result(timeout=10)
+
+
+def test_wait_cancels_the_coroutine_after_its_timeout(make_engine):
+    engine = make_engine(result_timeout=0.1)
+    cancelled = threading.Event()
+
+    async def hang():
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        engine.wait(engine.run(hang()))
+    assert cancelled.wait(5)
+    assert engine.stats['wait_timeouts'] == 1
+    assert engine.wait(engine.run(asyncio.sleep(0, result='done'))) == 'done'
+
+
+def test_collected_data_is_stored_off_the_engine_loop(provider, make_engine, tmp_path, monkeypatch):
+    engine = make_engine()
+    collector = DataCollector(api_client=_coingecko_client(provider),
+                              database=CryptoDatabase(str(tmp_path / 'crypto.db')), engine=engine)
+    threads = []
+    store = collector.collect_crypto_data
+
+    def record_thread(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return store(*args, **kwargs)
+
+    monkeypatch.setattr(collector, 'collect_crypto_data', record_thread)
+    result = engine.wait(engine.run(collector.collect_crypto_data_async('bitcoin', days=1)))
+
+    assert result['success'] and result['records_collected'] > 0
+    assert threads and engine._thread not in threads
@@ -425,7 +425,7 @@ def test_collect_all_data_task_example():
     
     # Use mocks to avoid hitting real API
     with patch.object(collector, 'get_top_cryptocurrencies') as mock_get_top, \
-         patch.object(collector, 'collect_crypto_data') as mock_collect:
+         patch.object(collector, 'collect_crypto_data_async') as mock_collect:
         
         mock_get_top.return_value = [
             Cryptocurrency(id='bitcoin', symbol='btc', name='Bitcoin'),
@@ -508,7 +508,7 @@ def test_collect_all_data_collection_returns_false(data_collector):
     mock_cryptos = [Cryptocurrency(id='bitcoin', symbol='btc', name='Bitcoin')]
     
     with patch.object(data_collector, 'get_top_cryptocurrencies') as mock_get_top, \
-         patch.object(data_collector, 'collect_crypto_data') as mock_collect:
+         patch.object(data_collector, 'collect_crypto_data_async') as mock_collect:
         
         mock_get_top.return_value = mock_cryptos
         mock_collect.return_value = {'success': False, 'error': 'Collection failed'}  # Simulate collection failure
@@ -530,7 +530,7 @@ def test_collect_all_data_custom_days(data_collector):
     mock_cryptos = [Cryptocurrency(id='bitcoin', symbol='btc', name='Bitcoin')]
     
     with patch.object(data_collector, 'get_top_cryptocurrencies') as mock_get_top, \
-         patch.object(data_collector, 'collect_crypto_data') as mock_collect:
+         patch.object(data_collector, 'collect_crypto_data_async') as mock_collect:
         
         mock_get_top.return_value = mock_cryptos
         mock_collect.return_value = True
@@ -549,7 +549,7 @@ def test_collect_all_data_results_structure(data_collector):
     ]
     
     with patch.object(data_collector, 'get_top_cryptocurrencies') as mock_get_top, \
-         patch.object(data_collector, 'collect_crypto_data') as mock_collect:
+         patch.object(data_collector, 'collect_crypto_data_async') as mock_collect:
         
         mock_get_top.return_value = mock_cryptos
         mock_collect.return_value = True
@@ -577,7 +577,7 @@ def test_collect_all_data_logging(mock_logger, data_collector):
     ]
     
     with patch.object(data_collector, 'get_top_cryptocurrencies') as mock_get_top, \
-         patch.object(data_collector, 'collect_crypto_data') as mock_collect:
+         patch.object(data_collector, 'collect_crypto_data_async') as mock_collect:
         
         mock_get_top.return_value = mock_cryptos
         mock_collect.return_value = {'success': True, 'records_collected': 5, 'duration_seconds': 1.0}
@@ -681,7 +681,7 @@ class TestEnhancedErrorRecovery:
         mock_cryptos = [Cryptocurrency(id='bitcoin', symbol='btc', name='Bitcoin')]
         
         with patch.object(data_collector, 'get_top_cryptocurrencies') as mock_get_top, \
-             patch.object(data_collector, 'collect_crypto_data') as mock_collect:
+             patch.object(data_collector, 'collect_crypto_data_async') as mock_collect:
             
             mock_get_top.return_value = mock_cryptos
             # Fail first attempt, succeed on second
@@ -703,7 +703,7 @@ class TestEnhancedErrorRecovery:
         mock_cryptos = [Cryptocurrency(id='bitcoin', symbol='btc', name='Bitcoin')]
         
         with patch.object(data_collector, 'get_top_cryptocurrencies') as mock_get_top, \
-             patch.object(data_collector, 'collect_crypto_data') as mock_collect:
+             patch.object(data_collector, 'collect_crypto_data_async') as mock_collect:
             
             mock_get_top.return_value = mock_cryptos
             # Always fail
@@ -727,7 +727,7 @@ class TestEnhancedErrorRecovery:
         mock_cryptos = [Cryptocurrency(id='bitcoin', symbol='btc', name='Bitcoin')]
         
         with patch.object(data_collector, 'get_top_cryptocurrencies') as mock_get_top, \
-             patch.object(data_collector, 'collect_crypto_data') as mock_collect:
+             patch.object(data_collector, 'collect_crypto_data_async') as mock_collect:
             
             mock_get_top.return_value = mock_cryptos
             # First call raises retryable error, second succeeds
@@ -747,7 +747,7 @@ class TestEnhancedErrorRecovery:
         mock_cryptos = [Cryptocurrency(id='bitcoin', symbol='btc', name='Bitcoin')]
         
         with patch.object(data_collector, 'get_top_cryptocurrencies') as mock_get_top, \
-             patch.object(data_collector, 'collect_crypto_data') as mock_collect:
+             patch.object(data_collector, 'collect_crypto_data_async') as mock_collect:
             
             mock_get_top.return_value = mock_cryptos
             # Non-retryable error
@@ -773,7 +773,7 @@ class TestEnhancedErrorRecovery:
         ]
         
         with patch.object(data_collector, 'get_top_cryptocurrencies') as mock_get_top, \
-             patch.object(data_collector, 'collect_crypto_data') as mock_collect:
+             patch.object(data_collector, 'collect_crypto_data_async') as mock_collect:
             
             mock_get_top.return_value = mock_cryptos
             # One success, one failure
@@ -812,7 +812,7 @@ class TestEnhancedErrorRecovery:
         ]
         
         with patch.object(data_collector, 'get_top_cryptocurrencies') as mock_get_top, \
-             patch.object(data_collector, 'collect_crypto_data') as mock_collect:
+             patch.object(data_collector, 'collect_crypto_data_async') as mock_collect:
             
             mock_get_top.return_value = mock_cryptos
             # Different error types
@@ -893,7 +893,7 @@ class TestEnhancedErrorRecovery:
         mock_cryptos = [Cryptocurrency(id='bitcoin', symbol='btc', name='Bitcoin')]
         
         with patch.object(data_collector, 'get_top_cryptocurrencies') as mock_get_top, \
-             patch.object(data_collector, 'collect_crypto_data') as mock_collect, \
+             patch.object(data_collector, 'collect_crypto_data_async') as mock_collect, \
              patch('time.sleep'):  # Mock sleep to avoid actual delays
             
             mock_get_top.return_value = mock_cryptos
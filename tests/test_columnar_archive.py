@@ -0,0 +1,108 @@
+"""
+Tests for the per-month columnar OHLCV archive and its CSV conversion tool.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.columnar_archive import OHLCV_COLUMNS, ColumnarArchive
+from src.data.models import OHLCVData
+from src.data.storage import CSVStorage
+
+
+HOUR_MS = 3_600_000
+
+
+def _frame(start, hours, price=1.0):
+    timestamps = pd.date_range(start, periods=hours, freq='h', tz='UTC').as_unit('ms').asi8
+    return pd.DataFrame({'timestamp': timestamps, 'open': price, 'high': price, 'low': price,
+                         'close': price, 'volume': np.arange(hours, dtype=float)})
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return ColumnarArchive(str(tmp_path / 'archive'))
+
+
+def test_write_partitions_sorts_and_deduplicates(archive):
+    frame = _frame('2024-01-31 22:00', 4)  # Straddles January and February
+    assert archive.write('bitcoin', frame.iloc[::-1]) == 4
+    assert archive.months('bitcoin') == ['2024-01', '2024-02']
+
+    # Overlapping rows keep the archived values; only the new hour is added
+    assert archive.write('bitcoin', _frame('2024-02-01 01:00', 2, price=9.0)) == 1
+    stored = archive.read('bitcoin')
+    assert stored['timestamp'].is_monotonic_increasing and stored['timestamp'].is_unique
+    assert stored['close'].tolist() == [1.0, 1.0, 1.0, 1.0, 9.0]
+    pd.testing.assert_frame_equal(stored.iloc[:4], frame[list(OHLCV_COLUMNS)], check_dtype=False)
+
+    assert archive.write('bitcoin', frame) == 0
+    assert archive.symbols() == ['bitcoin']
+
+
+def test_range_reads_only_open_overlapping_months(archive):
+    archive.write('ethereum', _frame('2023-01-01', 24 * 365))
+    loaded = []
+    original = archive._load_month
+    with patch.object(archive, '_load_month', side_effect=lambda path: loaded.append(path.name) or original(path)):
+        result = archive.read('ethereum', datetime(2023, 3, 31, 23), datetime(2023, 4, 1, 2))
+
+    assert loaded == ['2023-03.npy', '2023-04.npy']
+    assert len(result) == 4  # Both bounds are inclusive
+    assert result['timestamp'].iloc[0] == int(pd.Timestamp('2023-03-31 23:00', tz='UTC').timestamp() * 1000)
+    assert len(archive.read('ethereum', end=datetime(2022, 12, 31))) == 0
+    assert len(archive.read('missing')) == 0
+
+    records = archive.load_ohlcv_data('ethereum', start=result['timestamp'].iloc[0], end=result['timestamp'].iloc[1])
+    assert [r.timestamp for r in records] == result['timestamp'].iloc[:2].tolist()
+
+
+def test_csv_storage_mirrors_to_archive_without_rereading(tmp_path, archive):
+    storage = CSVStorage(data_dir=str(tmp_path / 'raw'), archive=archive)
+    now = int(datetime.now().timestamp() * 1000)
+    batch = [OHLCVData(timestamp=now + i * HOUR_MS, open=1, high=1, low=1, close=1, volume=1) for i in range(3)]
+
+    with patch.object(storage, '_get_existing_timestamps', wraps=storage._get_existing_timestamps) as reread:
+        storage.save_ohlcv_data('bitcoin', batch[:2])
+        storage.save_ohlcv_data('bitcoin', batch[1:])
+        assert reread.call_count == 1
+
+        path = tmp_path / 'raw' / f'bitcoin_{datetime.now().year}.csv'
+        with open(path, 'a') as f:
+            f.write(f"{now + 10 * HOUR_MS},1,1,1,1,1\n")
+        storage.save_ohlcv_data('bitcoin', batch)
+        assert reread.call_count == 2
+
+    assert len(path.read_text().splitlines()) == 1 + 4
+    assert archive.read('bitcoin')['timestamp'].tolist() == [r.timestamp for r in batch]
+
+
+def test_convert_csv_tree(tmp_path, monkeypatch, capsys):
+    raw = tmp_path / 'raw'
+    (raw / 'macro').mkdir(parents=True)
+    for year in (2022, 2023):
+        _frame(f'{year}-12-31', 24).to_csv(raw / f'bitcoin_{year}.csv', index=False)
+    with open(raw / 'bitcoin_2023.csv', 'a') as f:
+        f.write("not-a-number,1,1,1,1,1\n")
+    (raw / 'macro' / 'vixcls_2023.csv').write_text("date,value\n2023-01-03,21.0\n")
+
+    monkeypatch.syspath_prepend(str(Path(__file__).resolve().parents[1] / 'scripts'))
+    import convert_csv_to_archive
+
+    argv = ['convert_csv_to_archive.py', '--csv-dir', str(raw), '--archive-dir', str(tmp_path / 'archive')]
+    monkeypatch.setattr(sys, 'argv', argv)
+    assert convert_csv_to_archive.main() == 0
+    assert convert_csv_to_archive.main() == 0  # Re-running adds nothing
+    output = capsys.readouterr().out
+    assert '48 new rows' in output and '0 new rows' in output
+
+    archive = ColumnarArchive(str(tmp_path / 'archive'))
+    assert archive.symbols() == ['bitcoin']
+    assert archive.months('bitcoin') == ['2022-12', '2023-12']
+    assert len(archive.read('bitcoin')) == 48
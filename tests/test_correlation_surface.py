@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from src.analytics.correlation_surface import CorrelationSurface, correlation_surface
+from src.signals.strategies.vix_correlation_strategy import VIXCorrelationStrategy
+
+
+def _returns(n=200, seed=4):
+    rng = np.random.default_rng(seed)
+    vix = 20 * np.exp(np.cumsum(rng.normal(0, 0.05, n)))
+    # A flat stretch gives zero-variance windows
+    vix[60:80] = vix[60]
+    price = 40000 * np.exp(np.cumsum(rng.normal(0, 0.02, n) - 0.1 * np.diff(np.log(vix), prepend=np.log(vix[0]))))
+    return pd.Series(price).pct_change(), pd.Series(vix).pct_change()
+
+
+@pytest.mark.parametrize('window', [5, 14, 30])
+def test_series_matches_pandas_rolling_corr(window):
+    x, y = _returns()
+    lags = [-3, 0, 2]
+    surface = CorrelationSurface(x, y, lags)
+    for lag in lags:
+        expected = x.rolling(window=window).corr(y.shift(lag))
+        # pandas leaves zero-variance windows as +/-inf or NaN; both are undefined correlations
+        expected = expected.where(np.isfinite(expected))
+        np.testing.assert_allclose(surface.series(window, lag), expected, atol=1e-9, equal_nan=True)
+
+
+def test_latest_matches_series_tail():
+    x, y = _returns()
+    windows = [3, 10, 21, 250]
+    lags = list(range(-5, 6))
+    surface = CorrelationSurface(x, y, lags)
+    latest = surface.latest(windows)
+    assert latest.shape == (len(windows), len(lags))
+    for i, window in enumerate(windows):
+        for j, lag in enumerate(lags):
+            expected = surface.series(window, lag)[-1]
+            assert latest[i, j] == pytest.approx(expected, nan_ok=True)
+    # Negative lags have no pairing for the latest row and the window longer than the data is empty
+    assert np.isnan(latest[:, :5]).all() and np.isnan(latest[3]).all()
+
+    cells = correlation_surface(x, y, windows, lags)
+    assert set(cells) == {(w, lag) for w in (3, 10, 21) for lag in range(0, 6)}
+
+
+def _reference_correlations(strategy, clean_df):
+    """Per-(window, lag) pandas loop the strategy used before the surface kernel."""
+    correlations, dyn_neg, dyn_pos = {}, None, None
+    for window in strategy.correlation_windows:
+        if len(clean_df) >= window + max(0, max(strategy.lag_range)):
+            for lag in strategy.lag_range:
+                series = clean_df['price_return'].rolling(window=window).corr(clean_df['vix_return'].shift(lag))
+                if not np.isnan(series.iloc[-1]):
+                    correlations[f'{window}d_lag{lag}'] = float(series.iloc[-1])
+                if series.dropna().shape[0] > 20:
+                    neg = float(np.nanquantile(series.values, 0.2))
+                    pos = float(np.nanquantile(series.values, 0.8))
+                    dyn_neg = neg if dyn_neg is None else min(dyn_neg, neg)
+                    dyn_pos = pos if dyn_pos is None else max(dyn_pos, pos)
+    return correlations, dyn_neg, dyn_pos
+
+
+@patch('src.signals.strategies.vix_correlation_strategy.RealtimePriceService')
+@patch('src.signals.strategies.vix_correlation_strategy.CryptoDatabase')
+def test_strategy_correlations_match_rolling_loop(mock_db, mock_prices):
+    strategy = VIXCorrelationStrategy('config/strategies/vix_correlation.json')
+    strategy.use_dynamic_thresholds = True
+    strategy.dynamic_threshold_quantiles = {'negative': 0.2, 'positive': 0.8}
+    strategy.lag_range = [-2, -1, 0, 1, 2]
+
+    rng = np.random.default_rng(9)
+    n = 120
+    vix = 20 * np.exp(np.cumsum(rng.normal(0, 0.05, n)))
+    close = 40000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    df = pd.DataFrame({
+        'date_str': pd.date_range('2024-01-01', periods=n, freq='D').strftime('%Y-%m-%d'),
+        'close': close, 'high': close * 1.01, 'low': close * 0.99, 'vix_value': vix,
+    })
+    result = strategy._calculate_correlations(df.copy(), 'bitcoin')
+
+    clean_df = df.copy()
+    clean_df['price_return'] = clean_df['close'].pct_change()
+    clean_df['vix_return'] = clean_df['vix_value'].pct_change()
+    correlations, dyn_neg, dyn_pos = _reference_correlations(strategy, clean_df)
+
+    assert result['correlations_by_window'].keys() == correlations.keys()
+    for key, value in correlations.items():
+        assert result['correlations_by_window'][key] == pytest.approx(value, abs=1e-9)
+    assert result['dynamic_thresholds']['negative'] == pytest.approx(dyn_neg, abs=1e-9)
+    assert result['dynamic_thresholds']['positive'] == pytest.approx(dyn_pos, abs=1e-9)
+    best = max(correlations.items(), key=lambda item: abs(item[1]))
+    assert f"{result['best_window']}d_lag{result['best_lag']}" == best[0]
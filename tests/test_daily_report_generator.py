@@ -0,0 +1,84 @@
+"""
+Tests for the single-read DailyReportGenerator.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.daily_report_generator import (
+    BOND_YIELD_SERIES, CHANGE_PERIODS, MACRO_INDICATOR_LIST, DailyReportGenerator
+)
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    generator = DailyReportGenerator(str(tmp_path / 'crypto.db'))
+    rng = np.random.default_rng(11)
+    rows = []
+    business_days = pd.bdate_range('2024-01-01', '2024-06-28')
+    for n, indicator in enumerate(MACRO_INDICATOR_LIST + BOND_YIELD_SERIES):
+        if indicator == 'SOFR':
+            continue  # No data at all
+        dates = business_days
+        if indicator == 'DFF':
+            dates = business_days[-20:]  # Shorter than the 30-day lookback
+        if indicator == 'DGS20':
+            dates = business_days[:-3]  # Stale: ends before the other series
+        if indicator == 'RRPONTSYD':
+            dates = dates[(dates < '2024-05-01') | (dates > '2024-05-31')]  # Month-long gap
+        values = 1 + n + rng.normal(0, 0.1, len(dates)).cumsum()
+        rows.extend({'indicator': indicator, 'date': d.strftime('%Y-%m-%d'), 'value': float(v)}
+                    for d, v in zip(dates, values))
+    generator.db.insert_macro_data(rows)
+    return generator
+
+
+def _reference_changes(generator, indicator):
+    """Changes computed with one on-or-before query per lookback"""
+    latest = generator.get_latest_value(indicator)
+    current = datetime.strptime(latest['date'], '%Y-%m-%d')
+    changes = {}
+    for days in CHANGE_PERIODS:
+        past = generator.get_value_on_or_before(indicator, (current - timedelta(days=days)).strftime('%Y-%m-%d'))
+        change = generator.calculate_percentage_change(latest['value'], past)
+        changes[f'change_{days}d_pct'] = round(change, 2) if change is not None else None
+    return latest, changes
+
+
+def test_report_matches_per_point_queries(generator):
+    report = generator.generate_report()
+
+    macro = {row['indicator']: row for row in report['macro_indicators']}
+    assert 'SOFR' not in macro
+    for indicator in set(MACRO_INDICATOR_LIST) - {'SOFR'}:
+        latest, changes = _reference_changes(generator, indicator)
+        row = macro[indicator]
+        assert (row['date'], row['value']) == (latest['date'], round(latest['value'], 4))
+        assert {key: row[key] for key in changes} == changes
+    assert macro['DFF']['change_30d_pct'] is None
+
+    bonds = {row['indicator']: row for row in report['bond_yields']}
+    assert [row['maturity'] for row in report['bond_yields']] == ['1Y', '2Y', '5Y', '10Y', '20Y', '30Y']
+    for series in BOND_YIELD_SERIES:
+        latest, changes = _reference_changes(generator, series)
+        assert bonds[series]['yield'] == round(latest['value'], 4)
+        assert {key: bonds[series][key] for key in changes} == changes
+    assert bonds['DGS20']['date'] < bonds['DGS10']['date']
+
+
+def test_report_is_built_from_one_query(generator):
+    with patch.object(generator.db, 'query_to_dataframe', wraps=generator.db.query_to_dataframe) as query:
+        report = generator.generate_report()
+    assert query.call_count == 1
+    assert len(report['macro_indicators']) == len(MACRO_INDICATOR_LIST) - 1
+
+
+def test_empty_database_produces_empty_report(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    report = DailyReportGenerator(str(tmp_path / 'empty.db')).generate_report()
+    assert report['macro_indicators'] == [] and report['bond_yields'] == []
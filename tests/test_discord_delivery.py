@@ -0,0 +1,227 @@
+"""
+Tests for the Discord delivery service against a local HTTP stand-in for the webhook API.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.data.signal_models import TradingSignal, SignalType, SignalDirection, SignalStrength
+from src.utils.discord_delivery import DiscordDeliveryService, TokenBucket
+from src.utils.discord_webhook import DiscordWebhook
+
+
+class _StandIn:
+    """Local webhook endpoint recording requests and replaying scripted responses."""
+
+    def __init__(self):
+        self.requests = []
+        self.responses = []  # (status, headers) consumed in order, then 204
+        self.delay = 0.0
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                stand_in.requests.append((time.monotonic(), self.path, body, self.client_address))
+                time.sleep(stand_in.delay)
+                status, headers = stand_in.responses.pop(0) if stand_in.responses else (204, {})
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/api/webhooks"
+        threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stand_in():
+    server = _StandIn()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def make_service():
+    services = []
+
+    def make(**kwargs):
+        options = {'rate_per_second': 100.0, 'burst': 100, 'batch_window': 0.05, 'retry_delay': 0.01}
+        service = DiscordDeliveryService(**{**options, **kwargs})
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        service.close()
+
+
+def _payload(n):
+    return {'username': 'MTS Signal Bot', 'embeds': [{'title': f'signal {n}'}]}
+
+
+def test_embeds_for_same_webhook_are_batched(stand_in, make_service):
+    service = make_service(batch_window=0.2)
+    futures = [service.submit(f"{stand_in.url}/1", _payload(n)) for n in range(12)]
+
+    assert all(future.result(timeout=5) for future in futures)
+    sizes = [len(body['embeds']) for _, _, body, _ in stand_in.requests]
+    assert sizes == [10, 2]
+    titles = [embed['title'] for _, _, body, _ in stand_in.requests for embed in body['embeds']]
+    assert titles == [f'signal {n}' for n in range(12)]
+    assert stand_in.requests[0][2]['username'] == 'MTS Signal Bot'
+
+
+def test_different_payload_fields_are_not_batched(stand_in, make_service):
+    service = make_service(batch_window=0.2)
+    first = service.submit(f"{stand_in.url}/1", _payload(0))
+    second = service.submit(f"{stand_in.url}/1", {**_payload(1), 'username': 'Other Bot'})
+
+    assert first.result(timeout=5) and second.result(timeout=5)
+    assert [body['username'] for _, _, body, _ in stand_in.requests] == ['MTS Signal Bot', 'Other Bot']
+
+
+def test_retry_after_is_honored(stand_in, make_service):
+    stand_in.responses = [(429, {'Retry-After': '0.3'})]
+    service = make_service()
+
+    assert service.submit(f"{stand_in.url}/1", _payload(0)).result(timeout=5)
+    assert len(stand_in.requests) == 2
+    assert stand_in.requests[1][0] - stand_in.requests[0][0] >= 0.3
+    assert service.stats['rate_limited'] == 1
+
+
+def test_rate_limits_do_not_use_up_retries(stand_in, make_service):
+    stand_in.responses = [(429, {'Retry-After': '0.05'})] * 4
+    service = make_service(max_retries=2)
+
+    assert service.submit(f"{stand_in.url}/1", _payload(0)).result(timeout=5)
+    assert len(stand_in.requests) == 5
+    assert service.stats['rate_limited'] == 4
+
+
+def test_rate_limit_wait_is_bounded(stand_in, make_service):
+    stand_in.responses = [(429, {'Retry-After': '0.2'})] * 10
+    service = make_service(max_rate_limit_wait=0.5)
+
+    assert service.submit(f"{stand_in.url}/1", _payload(0)).result(timeout=5) is False
+    assert len(stand_in.requests) == 3
+    assert service.stats['failed'] == 1
+
+
+def test_client_errors_are_not_retried(stand_in, make_service):
+    stand_in.responses = [(400, {})]
+    service = make_service()
+
+    assert service.submit(f"{stand_in.url}/1", _payload(0)).result(timeout=5) is False
+    assert len(stand_in.requests) == 1
+
+
+def test_server_errors_are_retried(stand_in, make_service):
+    stand_in.responses = [(502, {}), (503, {})]
+    service = make_service()
+
+    assert service.submit(f"{stand_in.url}/1", _payload(0)).result(timeout=5)
+    assert len(stand_in.requests) == 3
+
+
+def test_token_bucket_limits_each_webhook(stand_in, make_service):
+    service = make_service(rate_per_second=10.0, burst=1, batch_window=0)
+    futures = [service.submit(f"{stand_in.url}/1", {'content': f'message {n}'}) for n in range(3)]
+
+    assert all(future.result(timeout=5) for future in futures)
+    times = [t for t, *_ in stand_in.requests]
+    assert times[-1] - times[0] >= 0.18
+
+
+def test_token_bucket_pause():
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    assert bucket.delay() == 0
+    bucket.pause(0.5)
+    assert 0.4 < bucket.delay() <= 0.5
+
+
+def test_outbound_queue_is_bounded(stand_in, make_service):
+    stand_in.delay = 0.3
+    service = make_service(max_queue_size=2, batch_window=0)
+    futures = [service.submit(f"{stand_in.url}/1", {'content': f'message {n}'}) for n in range(3)]
+
+    assert futures[2].done() and futures[2].result() is False
+    assert futures[0].result(timeout=5) and futures[1].result(timeout=5)
+    assert service.stats['rejected'] == 1
+    assert service.pending == 0
+
+
+def test_wait_is_bounded_and_refuses_the_loop_thread(make_service):
+    service = make_service()
+
+    with pytest.raises(FutureTimeoutError):
+        service.wait(Future(), timeout=0.05)
+    assert service.stats['wait_timeouts'] == 1
+
+    async def wait_on_loop():
+        service.wait(Future(), timeout=5)
+
+    with pytest.raises(RuntimeError, match="delivery loop thread"):
+        service.wait(service.run(wait_on_loop()), timeout=5)
+
+
+def test_webhooks_on_one_host_share_a_session(stand_in, make_service):
+    service = make_service()
+    futures = [service.submit(f"{stand_in.url}/{n}", _payload(n)) for n in range(3)]
+
+    assert all(future.result(timeout=5) for future in futures)
+    assert len(service._sessions) == 1
+    assert len({path for _, path, _, _ in stand_in.requests}) == 3
+
+
+def test_closed_service_rejects_messages(stand_in, make_service):
+    service = make_service()
+    service.close()
+    assert service.submit(f"{stand_in.url}/1", _payload(0)).result(timeout=1) is False
+
+
+def test_discord_webhook_sends_through_service(stand_in, make_service, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = make_service()
+    webhook = DiscordWebhook(f"{stand_in.url}/1", delivery=service)
+
+    assert webhook.send_embed({'title': 'sync'})
+    assert len(stand_in.requests) == 1
+    assert stand_in.requests[0][2]['embeds'] == [{'title': 'sync'}]
+
+
+def test_bulk_signal_alerts_share_requests(stand_in, make_service, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = make_service(batch_window=0.2)
+    webhook = DiscordWebhook(f"{stand_in.url}/1", delivery=service)
+    signals = [
+        TradingSignal(symbol=symbol, signal_type=SignalType.LONG, direction=SignalDirection.BUY,
+                      timestamp=datetime(2025, 1, 1), price=100.0, strategy_name="Test_Strategy",
+                      signal_strength=SignalStrength.STRONG, confidence=0.9, position_size=0.02)
+        for symbol in ['bitcoin', 'ethereum', 'solana']
+    ]
+
+    results = asyncio.run(webhook.send_bulk_signals(signals))
+
+    assert results == {'total': 3, 'success': 3, 'failed': 0}
+    assert len(stand_in.requests) == 1
+    assert len(stand_in.requests[0][2]['embeds']) == 3
@@ -0,0 +1,71 @@
+"""Equivalence of the vectorized ETH top/bottom scanner with the per-bar checks."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.signals.strategies.eth_tops_bottoms_strategy as eth_module
+from src.signals.strategies.eth_tops_bottoms_strategy import ETHTopBottomStrategy
+
+
+@pytest.fixture
+def strategy(monkeypatch):
+    monkeypatch.setattr(eth_module, 'CryptoDatabase', lambda *args, **kwargs: None)
+    return ETHTopBottomStrategy('config/strategies/eth_tops_bottoms.json')
+
+
+def _market_frame(strategy, n=3000, seed=3):
+    rng = np.random.default_rng(seed)
+    t = np.arange(n)
+    close = 2000 + 150 * np.sin(t / 40) + np.cumsum(rng.normal(0, 4, n))
+    df = pd.DataFrame({
+        'open': close + rng.normal(0, 2, n),
+        'high': close + np.abs(rng.normal(0, 6, n)),
+        'low': close - np.abs(rng.normal(0, 6, n)),
+        'close': close,
+        # Repeated volumes make volume-vs-mean ties likely
+        'volume': np.round(rng.uniform(1, 5, n)) * 0.1,
+    }, index=pd.date_range('2024-01-01', periods=n, freq='min'))
+    df = strategy.calculate_technical_indicators(df)
+    return strategy.calculate_volatility_metrics(df)
+
+
+def _reference_patterns(strategy, df):
+    """The original bar-by-bar scan."""
+    patterns = {'tops': [], 'bottoms': [], 'divergences': []}
+    for i in range(50, len(df) - 10):
+        if strategy._is_potential_top(df, i):
+            patterns['tops'].append({'index': i, 'timestamp': df.index[i], 'price': df['close'].iloc[i],
+                                     'confidence': strategy._calculate_top_confidence(df, i)})
+    for i in range(50, len(df) - 10):
+        if strategy._is_potential_bottom(df, i):
+            patterns['bottoms'].append({'index': i, 'timestamp': df.index[i], 'price': df['close'].iloc[i],
+                                        'confidence': strategy._calculate_bottom_confidence(df, i)})
+    for i in range(50, len(df) - 10):
+        if strategy._is_rsi_divergence(df, i):
+            patterns['divergences'].append({
+                'index': i, 'timestamp': df.index[i], 'type': 'RSI_DIVERGENCE',
+                'direction': 'BEARISH' if df.iloc[i]['rsi'] < df.iloc[i - 10]['rsi'] else 'BULLISH'})
+        if strategy._is_macd_divergence(df, i):
+            patterns['divergences'].append({
+                'index': i, 'timestamp': df.index[i], 'type': 'MACD_DIVERGENCE',
+                'direction': 'BEARISH' if df.iloc[i]['macd'] < df.iloc[i - 10]['macd'] else 'BULLISH'})
+    return patterns
+
+
+@pytest.mark.parametrize('seed', [3, 11])
+def test_vectorized_scan_matches_per_bar_checks(strategy, seed):
+    df = _market_frame(strategy, seed=seed)
+    expected = _reference_patterns(strategy, df)
+    result = strategy.identify_patterns(df)
+
+    assert expected['tops'] and expected['bottoms'] and expected['divergences']
+    assert result == expected
+
+
+def test_scan_without_volatility_column_and_short_frames(strategy):
+    df = _market_frame(strategy, n=600).drop(columns=['volatility_60m'])
+    assert strategy.identify_patterns(df) == _reference_patterns(strategy, df)
+
+    short = _market_frame(strategy, n=55)
+    assert strategy.identify_patterns(short) == {'tops': [], 'bottoms': [], 'divergences': []}
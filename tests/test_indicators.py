@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics.indicators import (
+    IndicatorEngine, bollinger_bands, ema, macd, rolling_mean, rolling_std, rsi
+)
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(7)
+    return pd.Series(100 + np.cumsum(rng.normal(0, 1, 500)))
+
+
+def _pandas_rsi(prices, period, min_periods=None):
+    delta = prices.diff()
+    gain = delta.where(delta > 0, 0).rolling(period, min_periods=min_periods).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(period, min_periods=min_periods).mean()
+    return 100 - (100 / (1 + gain / loss))
+
+
+def test_rolling_statistics_match_pandas(prices):
+    prices = prices.copy()
+    prices.iloc[40] = np.nan
+    np.testing.assert_allclose(rolling_mean(prices, 20), prices.rolling(20).mean(), equal_nan=True)
+    np.testing.assert_allclose(rolling_mean(prices, 20, min_periods=1),
+                               prices.rolling(20, min_periods=1).mean(), equal_nan=True)
+    np.testing.assert_allclose(rolling_std(prices, 20), prices.rolling(20).std(), equal_nan=True)
+
+
+def test_ema_and_macd_match_pandas(prices):
+    np.testing.assert_allclose(ema(prices, span=12), prices.ewm(span=12).mean())
+    np.testing.assert_allclose(ema(prices, span=12, adjust=False), prices.ewm(span=12, adjust=False).mean())
+
+    result = macd(prices, 12, 26, 9)
+    expected = prices.ewm(span=12).mean() - prices.ewm(span=26).mean()
+    np.testing.assert_allclose(result['macd'], expected)
+    np.testing.assert_allclose(result['signal'], expected.ewm(span=9).mean())
+
+
+def test_rsi_matches_rolling_definition(prices):
+    np.testing.assert_allclose(rsi(prices, 14), _pandas_rsi(prices, 14), equal_nan=True)
+    np.testing.assert_allclose(rsi(prices, 14, min_periods=1), _pandas_rsi(prices, 14, 1), equal_nan=True)
+
+
+def test_wilder_rsi():
+    closes = np.array([44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42, 45.84, 46.08,
+                       45.89, 46.03, 45.61, 46.28, 46.28, 46.00, 46.03, 46.41, 46.22, 45.64])
+    values = rsi(closes, 14, method='wilder')
+    assert np.isnan(values[:14]).all()
+    # Reference values from Wilder's worked example
+    assert values[14] == pytest.approx(70.46, abs=0.01)
+    assert values[15] == pytest.approx(66.25, abs=0.01)
+
+
+def test_bollinger_bands(prices):
+    bands = bollinger_bands(prices, 20, 2)
+    middle = prices.rolling(20).mean()
+    std = prices.rolling(20).std()
+    np.testing.assert_allclose(bands['upper'], middle + 2 * std, equal_nan=True)
+    np.testing.assert_allclose(bands['lower'], middle - 2 * std, equal_nan=True)
+
+
+def test_engine_memoizes_per_data_version(prices):
+    engine = IndicatorEngine()
+    first = engine.rsi(prices, 14)
+    second = engine.rsi(prices.copy(), 14)
+    assert isinstance(first, pd.Series) and first.index.equals(prices.index)
+    assert engine.hits == 1 and engine.misses == 1
+    pd.testing.assert_series_equal(first, second)
+
+    # Mutating a returned result must not leak into the cache
+    first.iloc[-1] = -1.0
+    assert engine.rsi(prices, 14).iloc[-1] != -1.0
+
+    updated = pd.concat([prices, pd.Series([prices.iloc[-1] + 1.0])], ignore_index=True)
+    engine.rsi(updated, 14)
+    engine.rsi(prices, 21)
+    assert engine.misses == 3
+
+
+def test_engine_evicts_least_recently_used(prices):
+    engine = IndicatorEngine(max_entries=2)
+    engine.sma(prices, 5)
+    engine.sma(prices, 10)
+    engine.sma(prices, 5)
+    engine.sma(prices, 20)
+    engine.sma(prices, 5)
+    assert engine.hits == 2
+    engine.sma(prices, 10)
+    assert engine.misses == 4
@@ -0,0 +1,97 @@
+"""
+Tests for the macro snapshot service and MultiFactorStrategy's use of it.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.sqlite_helper import CryptoDatabase
+from src.services.macro_snapshot_service import MacroSnapshotService
+from src.signals.strategies.multi_factor_strategy import MultiFactorStrategy
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = CryptoDatabase(str(tmp_path / 'crypto.db'))
+    rng = np.random.default_rng(7)
+    dates = pd.date_range('2024-01-01', periods=60, freq='D').strftime('%Y-%m-%d')
+    rows = []
+    for indicator, level in [('VIXCLS', 18.0), ('DTWEXBGS', 120.0), ('DGS10', 4.2), ('DGS2', 4.6)]:
+        # Indicators have different histories, including one shorter than the SMA window
+        n = 12 if indicator == 'DGS2' else len(dates)
+        for date, value in zip(dates[:n], level + rng.normal(0, 1, n)):
+            rows.append({'indicator': indicator, 'date': date, 'value': float(value)})
+    database.insert_macro_data(rows)
+    return database
+
+
+def _reference_latest(db):
+    q = ("SELECT indicator, value FROM macro_indicators WHERE (indicator, date) IN "
+         "(SELECT indicator, MAX(date) FROM macro_indicators GROUP BY indicator)")
+    df = db.query_to_dataframe(q)
+    return dict(zip(df['indicator'], df['value']))
+
+
+def _reference_sma(db, indicator, days):
+    q = "SELECT AVG(value) as sma FROM (SELECT value FROM macro_indicators WHERE indicator = ? ORDER BY date DESC LIMIT ?)"
+    return float(db.query_to_dataframe(q, (indicator, days))['sma'].iloc[0])
+
+
+def test_snapshot_matches_per_indicator_queries(db):
+    snapshot = MacroSnapshotService(db, sma_windows=[5, 20]).get_snapshot()
+
+    assert snapshot.latest == pytest.approx(_reference_latest(db))
+    for indicator in snapshot.latest:
+        for window in (5, 20):
+            assert snapshot.sma(indicator, window) == pytest.approx(_reference_sma(db, indicator, window))
+    assert snapshot.latest_dates['DGS2'] == '2024-01-12'
+    assert snapshot.sma('VIXCLS', 50) is None
+
+
+def test_snapshot_cached_until_macro_indicators_changes(db):
+    service = MacroSnapshotService(db, sma_windows=[20])
+    with patch.object(db, 'query_to_dataframe', wraps=db.query_to_dataframe) as query:
+        first = service.get_snapshot()
+        assert service.get_snapshot() is first
+        assert query.call_count == 1
+
+        db.insert_macro_data([{'indicator': 'VIXCLS', 'date': '2024-12-31', 'value': 40.0}])
+        refreshed = service.get_snapshot()
+        assert query.call_count == 2
+    assert refreshed.version > first.version
+    assert refreshed.get('VIXCLS') == 40.0
+
+
+def test_tracked_assets_follow_ohlcv_inserts(db):
+    rows = [
+        {'cryptocurrency': asset, 'timestamp': ts, 'date_str': '2024-01-01',
+         'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0, 'volume': 1.0}
+        for asset in ('solana', 'bitcoin') for ts in (1, 2)
+    ]
+    db.insert_crypto_data(rows)
+    assert db.get_tracked_assets() == ['bitcoin', 'solana']
+
+
+def test_multi_factor_logs_scores_in_one_batch(db, tmp_path, monkeypatch):
+    monkeypatch.setattr('src.signals.strategies.multi_factor_strategy.CryptoDatabase', lambda path: db)
+    db.insert_crypto_data([
+        {'cryptocurrency': asset, 'timestamp': 1, 'date_str': '2024-01-01',
+         'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0, 'volume': 1.0}
+        for asset in ('bitcoin', 'ethereum', 'tether')
+    ])
+    strategy = MultiFactorStrategy('config/strategies/multi_factor.json')
+
+    rng = np.random.default_rng(1)
+    market_data = {
+        asset: {'dataframe': pd.DataFrame({'close': 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 250)))})}
+        for asset in ('bitcoin', 'ethereum', 'tether')
+    }
+    results = strategy.analyze(market_data)
+
+    assert set(results['asset_analysis']) == {'bitcoin', 'ethereum'}
+    logged = db.query_to_dataframe("SELECT asset, timestamp FROM multi_factor_signals ORDER BY asset")
+    assert logged['asset'].tolist() == ['bitcoin', 'ethereum']
+    assert results['macro_analysis']['vix'] == pytest.approx(_reference_latest(db)['VIXCLS'])
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.signals.strategies.multi_bucket_portfolio_strategy as multi_bucket_module
+from src.signals.strategies.multi_bucket_portfolio_strategy import MultiBucketPortfolioStrategy
+
+
+@pytest.fixture
+def strategy(monkeypatch):
+    monkeypatch.setattr(multi_bucket_module, 'CryptoDatabase', lambda *args, **kwargs: None)
+    return MultiBucketPortfolioStrategy('config/strategies/multi_bucket_portfolio.json')
+
+
+@pytest.fixture
+def market_data(strategy):
+    """Daily closes driven by a common BTC factor, with histories of different lengths."""
+    rng = np.random.default_rng(5)
+    n = 400
+    index = pd.date_range('2023-01-01', periods=n, freq='D')
+    factor = np.cumsum(rng.normal(0, 0.02, n))
+    data = {}
+    for k, asset in enumerate(strategy.assets['universe']):
+        length = n - (k * 37) % 150
+        log_price = 0.8 * factor + np.cumsum(rng.normal(0, 0.01, n))
+        data[asset] = pd.DataFrame({'close': 100 * np.exp(log_price[-length:])}, index=index[-length:])
+    return data
+
+
+def _reference_zscore(closes, horizon, zscore_window):
+    """Per-bar momentum loop the strategy used before vectorization."""
+    if len(closes) < zscore_window:
+        return 0.0
+    series = [closes[i] / closes[i - horizon] - 1 for i in range(horizon, len(closes) - zscore_window)]
+    if len(series) < 10 or np.std(series) == 0:
+        return 0.0
+    return (closes[-1] / closes[-horizon - 1] - 1 - np.mean(series)) / np.std(series)
+
+
+def test_momentum_matches_per_asset_loop(strategy, market_data):
+    analysis = strategy._analyze_momentum(market_data)
+    window = strategy.momentum_params['zscore_window']
+
+    assert set(analysis) == set(strategy.assets['universe'])
+    for asset, result in analysis.items():
+        closes = market_data[asset]['close'].to_numpy()
+        for horizon in strategy.momentum_params['horizons']:
+            assert result['momentum_returns'][f'M{horizon}'] == pytest.approx(closes[-1] / closes[-horizon - 1] - 1)
+            assert result['z_scores'][f'Z{horizon}'] == pytest.approx(_reference_zscore(closes, horizon, window))
+        positive = (market_data[asset]['close'].pct_change().tail(14) > 0).sum()
+        assert result['momentum_strength'] == pytest.approx(positive / 14 - 0.5)
+        assert result['current_price'] == closes[-1]
+
+
+def test_single_asset_zscore_matches_batched(strategy, market_data):
+    df = market_data['solana']
+    for horizon in strategy.momentum_params['horizons']:
+        expected = _reference_zscore(df['close'].to_numpy(), horizon, strategy.momentum_params['zscore_window'])
+        assert strategy._calculate_momentum_zscore(df, horizon) == pytest.approx(expected)
+
+
+def test_residual_momentum_matches_pairwise_regression(strategy, market_data):
+    analysis = strategy._analyze_residual_momentum(market_data)
+    window = strategy.residual_params['regression_window']
+    btc = market_data['bitcoin']['close'].pct_change().dropna()
+
+    expected_assets = [a for a in strategy.assets['universe'] if a not in strategy.assets['factor_assets']]
+    assert set(analysis) == set(expected_assets)
+    for asset, result in analysis.items():
+        returns = market_data[asset]['close'].pct_change().dropna()
+        aligned = pd.concat([returns, btc], axis=1, sort=True).dropna().tail(window)
+        beta, intercept = np.polyfit(aligned.iloc[:, 1], aligned.iloc[:, 0], 1)
+        residuals = aligned.iloc[:, 0] - (intercept + beta * aligned.iloc[:, 1])
+        recent = residuals.to_numpy()[-strategy.residual_params['residual_window']:]
+
+        assert result['beta'] == pytest.approx(beta)
+        np.testing.assert_allclose(result['residuals'], recent, atol=1e-12)
+        assert result['residual_zscore'] == pytest.approx((recent[-1] - recent.mean()) / recent.std())
+
+    beta, residuals = strategy._calculate_beta_residuals(
+        market_data['solana']['close'].pct_change().dropna(), btc
+    )
+    assert beta == pytest.approx(analysis['solana']['beta'])
+    assert len(residuals) == window
+
+
+def test_correlations_use_date_aligned_returns(strategy, market_data):
+    analysis = strategy._analyze_correlations(market_data)
+    aligned = pd.DataFrame({a: df['close'].pct_change().dropna() for a, df in market_data.items()}).dropna()
+
+    for window in strategy.correlation_params['correlation_windows']:
+        pd.testing.assert_frame_equal(analysis[f'{window}d'], aligned.tail(window).corr())
+    assert -1.0 <= analysis['average_correlation'] <= 1.0
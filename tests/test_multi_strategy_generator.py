@@ -6,13 +6,19 @@ Tests orchestration of multiple strategies and signal aggregation.
 import pytest
 import json
 import tempfile
+import multiprocessing
 import os
+import time
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 from typing import List, Dict, Any
 
-from src.services.multi_strategy_generator import MultiStrategyGenerator, create_default_multi_strategy_generator
-from src.data.signal_models import TradingSignal, SignalType, SignalStrength
+import pandas as pd
+
+from src.services.multi_strategy_generator import (
+    MultiStrategyGenerator, _worker_strategies, create_default_multi_strategy_generator
+)
+from src.data.signal_models import TradingSignal, SignalType, SignalStrength, SignalDirection
 from src.utils.exceptions import ConfigurationError, DataProcessingError
 
 
@@ -306,6 +312,172 @@ class TestMultiStrategyGenerator:
             assert generator.aggregator_config["strategy_weights"]["Mean_Reversion_Strategy"] == 0.4
             assert generator.aggregator_config["aggregation_config"]["conflict_resolution"] == "weighted_average"
 
+    
+    @staticmethod
+    def _generator_with(strategies, execution_config, timeouts=None):
+        """Build a generator around the given strategy objects with external services patched out."""
+        timeouts = timeouts or {}
+        strategy_configs = {
+            name: {'config_path': f'config/strategies/{name}.json', **({'timeout_seconds': timeouts[name]} if name in timeouts else {})}
+            for name in strategies
+        }
+        aggregator_config = {'strategy_weights': {name: 1.0 / len(strategies) for name in strategies}}
+        with patch('src.services.multi_strategy_generator.StrategyRegistry') as mock_registry_class, \
+             patch('src.services.multi_strategy_generator.SignalAggregator'), \
+             patch('src.services.multi_strategy_generator.CryptoDatabase'), \
+             patch('src.services.multi_strategy_generator.RealtimePriceService'), \
+             patch.object(MultiStrategyGenerator, '_initialize_multi_webhook_manager', return_value=None):
+            mock_registry_class.return_value.get_strategy.side_effect = lambda name, path: strategies[name]
+            return MultiStrategyGenerator(strategy_configs, aggregator_config, execution_config)
+    
+    @staticmethod
+    def _strategy(name, delay=0.0, error=None, mutate=False):
+        """Strategy stub that optionally sleeps, fails or writes to its market data."""
+        def analyze(market_data):
+            time.sleep(delay)
+            if error:
+                raise error
+            if mutate:
+                market_data['bitcoin']['injected'] = 1.0
+                market_data['extra'] = True
+            return {'columns': list(market_data['bitcoin'].columns), 'keys': sorted(market_data)}
+        
+        strategy = Mock()
+        strategy.get_parameters.return_value = {'assets': ['bitcoin']}
+        strategy.analyze.side_effect = analyze
+        strategy.generate_signals.side_effect = lambda analysis: [
+            TradingSignal(symbol='bitcoin', signal_type=SignalType.LONG, direction=SignalDirection.BUY,
+                          timestamp=datetime(2024, 1, 1), price=50000.0, strategy_name=name, signal_strength=SignalStrength.WEAK, confidence=0.5,
+                          position_size=0.01, analysis_data=analysis)
+        ]
+        return strategy
+    
+    def test_thread_mode_runs_strategies_concurrently_and_reports_timings(self):
+        """Strategies overlap on the thread pool and their wall times appear in get_strategy_status."""
+        strategies = {name: self._strategy(name, delay=0.3) for name in ('a', 'b', 'c')}
+        generator = self._generator_with(strategies, {'mode': 'thread'})
+        market_data = {'bitcoin': pd.DataFrame({'close': [1.0, 2.0]})}
+        
+        started = time.perf_counter()
+        result = generator._generate_individual_signals(market_data)
+        elapsed = time.perf_counter() - started
+        generator.close()
+        
+        assert list(result) == ['a', 'b', 'c']
+        assert all(len(signals) == 1 for signals in result.values())
+        assert elapsed < 0.6
+        status_timings = generator.get_strategy_status()['strategy_timings']
+        for name in strategies:
+            assert status_timings[name]['last_status'] == 'ok'
+            assert status_timings[name]['runs'] == 1
+            assert status_timings[name]['last_wall_time_seconds'] >= 0.3
+    
+    def test_timeout_and_failure_are_isolated(self):
+        """A slow or failing strategy yields no signals without affecting the others."""
+        strategies = {
+            'slow': self._strategy('slow', delay=1.0),
+            'broken': self._strategy('broken', error=ValueError('bad data')),
+            'fine': self._strategy('fine')
+        }
+        generator = self._generator_with(strategies, {'mode': 'thread', 'timeout_seconds': 5},
+                                         timeouts={'slow': 0.2})
+        market_data = {'bitcoin': pd.DataFrame({'close': [1.0, 2.0]})}
+        
+        result = generator._generate_individual_signals(market_data)
+        assert result['slow'] == [] and result['broken'] == []
+        assert len(result['fine']) == 1
+        timings = generator.strategy_timings
+        assert timings['slow']['last_status'] == 'timeout'
+        assert timings['broken']['last_status'] == 'error'
+        assert timings['broken']['last_error'] == 'bad data'
+        
+        # The timed-out run still occupies its worker, so the next cycle skips that strategy
+        result = generator._generate_individual_signals(market_data)
+        assert timings['slow']['last_status'] == 'skipped'
+        assert strategies['slow'].analyze.call_count == 1
+        generator.close()
+    
+    def test_timeout_starts_when_the_strategy_starts(self):
+        """Strategies queued behind others on a one-worker pool still get their full timeout."""
+        strategies = {name: self._strategy(name, delay=0.3) for name in ('a', 'b', 'c')}
+        generator = self._generator_with(strategies, {'mode': 'thread', 'max_workers': 1, 'timeout_seconds': 0.5})
+        market_data = {'bitcoin': pd.DataFrame({'close': [1.0, 2.0]})}
+        
+        result = generator._generate_individual_signals(market_data)
+        generator.close()
+        
+        assert all(len(signals) == 1 for signals in result.values())
+        assert all(t['last_status'] == 'ok' for t in generator.strategy_timings.values())
+    
+    @pytest.mark.skipif(multiprocessing.get_start_method() != 'fork', reason="workers inherit the strategy cache")
+    def test_process_pool_persists_and_is_replaced_after_a_timeout(self):
+        """Process workers keep their strategies across cycles; a hung worker is killed with its pool."""
+        strategies = {name: self._strategy(name) for name in ('fast', 'slow')}
+        generator = self._generator_with(strategies, {'mode': 'process', 'max_workers': 1},
+                                         timeouts={'fast': 5, 'slow': 0.3})
+        for name in strategies:
+            _worker_strategies[(name, generator.strategy_configs[name]['config_path'])] = _SleepyStrategy(name)
+        market_data = {'bitcoin': pd.DataFrame({'close': [1.0, 2.0]})}
+        
+        try:
+            first = generator._generate_individual_signals(market_data)
+            second = generator._generate_individual_signals(market_data)
+            hung = generator._generate_individual_signals({**market_data, 'hang': True})
+            after = generator._generate_individual_signals(market_data)
+        finally:
+            generator.close()
+            _worker_strategies.clear()
+        
+        worker = first['fast'][0].analysis_data['pid']
+        assert first['fast'][0].analysis_data == {'rows': 2, 'runs': 1, 'pid': worker}
+        assert second['fast'][0].analysis_data == {'rows': 2, 'runs': 2, 'pid': worker}
+        assert hung['slow'] == [] and len(hung['fast']) == 1
+        assert generator.strategy_timings['slow']['failures'] == 1
+        with pytest.raises(ProcessLookupError):
+            os.kill(worker, 0)
+        assert after['fast'][0].analysis_data['runs'] == 1
+        assert after['fast'][0].analysis_data['pid'] != worker
+        assert generator.strategy_timings['slow']['last_status'] == 'ok'
+    
+    @pytest.mark.parametrize('mode', ['sequential', 'thread'])
+    def test_strategies_share_read_only_snapshot(self, mode):
+        """Columns or keys added by one strategy are invisible to the others and the caller."""
+        strategies = {'writer': self._strategy('writer', mutate=True), 'reader': self._strategy('reader')}
+        generator = self._generator_with(strategies, {'mode': mode})
+        market_data = {'bitcoin': pd.DataFrame({'close': [1.0, 2.0]})}
+        
+        result = generator._generate_individual_signals(market_data)
+        generator.close()
+        
+        assert result['reader'][0].analysis_data == {'columns': ['close'], 'keys': ['bitcoin']}
+        assert list(market_data['bitcoin'].columns) == ['close']
+        assert list(market_data) == ['bitcoin']
+    
+    def test_invalid_execution_mode(self):
+        """Unknown execution modes are rejected at construction."""
+        with pytest.raises(ConfigurationError, match="Unknown strategy execution mode"):
+            self._generator_with({'a': self._strategy('a')}, {'mode': 'gpu'})
+
+
+class _SleepyStrategy:
+    """Process-mode strategy: 'slow' hangs when asked to, others report what they saw and where."""
+    
+    def __init__(self, name):
+        self.name = name
+        self.runs = 0
+    
+    def analyze(self, market_data):
+        if self.name == 'slow' and market_data.get('hang'):
+            time.sleep(30)
+        self.runs += 1
+        return {'rows': len(market_data['bitcoin']), 'runs': self.runs, 'pid': os.getpid()}
+    
+    def generate_signals(self, analysis):
+        return [TradingSignal(symbol='bitcoin', signal_type=SignalType.LONG, direction=SignalDirection.BUY,
+                              timestamp=datetime(2024, 1, 1), price=50000.0, strategy_name=self.name,
+                              signal_strength=SignalStrength.WEAK, confidence=0.5, position_size=0.01,
+                              analysis_data=analysis)]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,179 @@
+import json
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.services import enhanced_multi_tier_scheduler, multi_tier_scheduler
+from src.services.enhanced_multi_tier_scheduler import EnhancedMultiTierScheduler
+from src.services.multi_tier_scheduler import MultiTierScheduler
+from src.services.task_queue import DueTaskQueue
+
+
+START = datetime(2024, 3, 1)
+
+
+class _FakeCryptoCollector:
+    def __init__(self):
+        self.calls = Counter()
+        self.lock = threading.Lock()
+
+    def collect_crypto_data(self, asset_id, days=1):
+        with self.lock:
+            self.calls[asset_id] += 1
+        return {'success': True}
+
+
+class _FakeMacroCollector:
+    def __init__(self):
+        self.calls = Counter()
+        self.release = threading.Event()
+        self.release.set()
+
+    def collect_indicator(self, indicator, days=1):
+        self.release.wait(10)
+        self.calls[indicator] += 1
+        return [{'indicator': indicator}]
+
+
+@pytest.fixture(autouse=True)
+def fake_collectors(monkeypatch):
+    for module in (multi_tier_scheduler, enhanced_multi_tier_scheduler):
+        monkeypatch.setattr(module, 'DataCollector', _FakeCryptoCollector)
+        monkeypatch.setattr(module, 'MacroDataCollector', _FakeMacroCollector)
+        monkeypatch.setattr(module, 'BinanceClient', lambda: None)
+
+
+def make_scheduler(tmp_path, clock, **kwargs):
+    return MultiTierScheduler(
+        high_frequency_assets=['bitcoin', 'ethereum'],
+        daily_assets=['tether'],
+        macro_indicators=['VIXCLS'],
+        state_file=str(tmp_path / 'state.json'),
+        clock=clock,
+        **kwargs
+    )
+
+
+def simulate(scheduler, clock, until):
+    """Run every pass the scheduler would make up to `until`, jumping the clock between them"""
+    while clock.now < until:
+        scheduler.run_pending(wait_for_completion=True)
+        next_due = scheduler.next_due_time()
+        if next_due is None:
+            break
+        clock.now = max(clock.now, next_due)
+
+
+def test_due_task_queue_orders_by_time_then_priority():
+    queue = DueTaskQueue()
+    queue.schedule('hourly', START, priority=1)
+    queue.schedule('macro', START + timedelta(hours=1))
+    queue.schedule('hf', START, priority=0)
+    queue.schedule('hourly', START + timedelta(minutes=5), priority=1)  # replaces the first entry
+
+    assert queue.pop_due(START) == ['hf']
+    assert queue.next_due() == START + timedelta(minutes=5)
+    assert queue.pop_due(START + timedelta(hours=1)) == ['hourly', 'macro']
+    assert len(queue) == 0
+
+
+def test_simulated_day_collects_each_tier_at_its_interval(tmp_path, make_clock):
+    clock = make_clock(START)
+    scheduler = make_scheduler(tmp_path, clock)
+
+    started = time.perf_counter()
+    simulate(scheduler, clock, START + timedelta(days=1))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.0
+    assert scheduler.crypto_collector.calls == {'bitcoin': 96, 'ethereum': 96, 'tether': 24}
+    assert scheduler.macro_collector.calls == {'VIXCLS': 1}
+    assert scheduler.total_api_calls == scheduler._calculate_daily_api_usage() == 217
+    assert scheduler.collection_stats['high_frequency'] == {'success': 192, 'failure': 0}
+
+
+def test_slow_macro_collection_does_not_delay_high_frequency_tier(tmp_path, make_clock):
+    clock = make_clock(START)
+    scheduler = make_scheduler(tmp_path, clock)
+    scheduler.macro_collector.release.clear()
+
+    try:
+        futures = scheduler.run_pending()
+        crypto = [f for f, task in zip(futures, ['bitcoin', 'ethereum', 'tether', 'VIXCLS']) if task != 'VIXCLS']
+        assert all(f.result(timeout=5) for f in crypto)
+        assert scheduler.macro_collector.calls == {}
+        assert scheduler.tasks['crypto_bitcoin'].last_collection == START
+    finally:
+        scheduler.macro_collector.release.set()
+    assert all(f.result(timeout=5) for f in futures)
+
+
+def test_api_budget_defers_collections_to_next_day(tmp_path, make_clock):
+    clock = make_clock(START)
+    scheduler = make_scheduler(tmp_path, clock, daily_api_budget=50)
+
+    simulate(scheduler, clock, START + timedelta(days=1))
+    assert scheduler.total_api_calls == 50
+    assert scheduler.next_due_time() == START + timedelta(days=1)
+    assert scheduler.api_budget.used == 50 and scheduler.api_budget.deferred == 3
+
+    scheduler.run_pending(wait_for_completion=True)
+    assert scheduler.total_api_calls == 54  # Every deferred task runs once the budget resets
+    assert scheduler.get_status()['api_budget']['remaining'] == 46
+
+
+def test_state_is_journaled_and_restored(tmp_path, make_clock):
+    clock = make_clock(START)
+    scheduler = make_scheduler(tmp_path, clock)
+    scheduler.run_pending(wait_for_completion=True)
+
+    assert not (tmp_path / 'state.json').exists()
+    lines = (tmp_path / 'state.journal').read_text().splitlines()
+    assert len(lines) == 4
+    assert all(len(json.loads(line)['tasks']) == 1 for line in lines)
+
+    clock.now += timedelta(minutes=5)
+    restored = make_scheduler(tmp_path, clock)
+    assert restored.tasks['crypto_bitcoin'].last_collection == START
+    assert restored.api_budget.used == 4
+    assert restored.next_due_time() == START + timedelta(minutes=15)
+
+
+def test_journal_is_compacted_into_snapshot(tmp_path, make_clock):
+    clock = make_clock(START)
+    scheduler = make_scheduler(tmp_path, clock)
+    scheduler._state_store.compact_threshold = 10
+    simulate(scheduler, clock, START + timedelta(hours=2))
+
+    snapshot = json.loads((tmp_path / 'state.json').read_text())
+    assert set(snapshot['tasks']) == set(scheduler.tasks)
+    assert len((tmp_path / 'state.journal').read_text().splitlines()) < 10
+
+    restored = make_scheduler(tmp_path, clock)
+    assert restored.tasks['crypto_bitcoin'].last_collection == scheduler.tasks['crypto_bitcoin'].last_collection
+
+
+def test_enhanced_scheduler_collects_macro_at_scheduled_time(tmp_path, make_clock):
+    clock = make_clock(START)
+    scheduler = EnhancedMultiTierScheduler(
+        high_frequency_assets=['bitcoin'],
+        hourly_assets=['tether'],
+        macro_indicators=['VIXCLS', 'DFF'],
+        enable_signal_generation=False,
+        enable_alert_generation=False,
+        enable_discord_alerts=False,
+        macro_collection_time="23:00",
+        state_file=str(tmp_path / 'enhanced_state.json'),
+        clock=clock
+    )
+    assert scheduler.get_status()['task_status']['macro_VIXCLS']['next_collection'] == \
+        (START + timedelta(hours=23)).isoformat()
+
+    simulate(scheduler, clock, START + timedelta(days=2))
+
+    assert scheduler.tasks['macro_VIXCLS'].last_collection == START + timedelta(days=1, hours=23)
+    assert scheduler.macro_collector.calls == {'VIXCLS': 2, 'DFF': 2}
+    assert scheduler.crypto_collector.calls == {'bitcoin': 192, 'tether': 48}
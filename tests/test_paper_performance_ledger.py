@@ -0,0 +1,98 @@
+"""
+Tests for the paper trading PerformanceLedger against the full trade-history recomputation.
+"""
+
+import math
+import random
+from dataclasses import asdict
+from datetime import datetime, timedelta
+
+import pytest
+
+from paper_trading_engine.src.core.enums import OrderSide
+from paper_trading_engine.src.core.models import ExecutionResult, Trade
+from paper_trading_engine.src.portfolio.portfolio_manager import PortfolioManager
+from shared.equity_ledger import EquityLedger
+
+
+START = datetime(2024, 1, 1, 9)
+
+
+def _trade(side, pnl, timestamp):
+    return Trade(asset='BTC', side=side, quantity=1.0, entry_price=100.0, exit_price=None, pnl=pnl, fees=0.0,
+                 timestamp=timestamp, signal_id='', order_id='', execution_id='')
+
+
+def _assert_metrics_match(manager):
+    incremental = asdict(manager.get_performance_metrics())
+    recomputed = asdict(manager.performance_calculator.calculate_metrics(manager, recompute=True))
+    assert incremental.keys() == recomputed.keys()
+    for name, value in recomputed.items():
+        if isinstance(value, float) and math.isnan(value):
+            assert math.isnan(incremental[name]), name
+        else:
+            assert incremental[name] == pytest.approx(value, rel=1e-9, abs=1e-12), name
+
+
+@pytest.fixture
+def manager(capsys):
+    return PortfolioManager(initial_capital=10000.0)
+
+
+def test_ledger_matches_recompute_as_trades_arrive(manager):
+    rng = random.Random(11)
+    timestamp = START
+    for n in range(400):
+        timestamp += timedelta(hours=rng.choice([0, 1, 7, 30]))
+        side = rng.choice([OrderSide.BUY, OrderSide.SELL, OrderSide.SELL])
+        pnl = 0.0 if side == OrderSide.BUY else rng.choice([0.0, rng.gauss(5, 60)])
+        trade = _trade(side, pnl, timestamp)
+        manager.trade_history.append(trade)
+        manager.performance_ledger.record_trade(trade)
+        if n % 37 == 0:
+            _assert_metrics_match(manager)
+    _assert_metrics_match(manager)
+    assert manager.performance_ledger.daily_in_order
+
+
+def test_process_execution_feeds_the_ledger(manager):
+    for n, (side, price) in enumerate([(OrderSide.BUY, 100.0), (OrderSide.SELL, 110.0),
+                                       (OrderSide.BUY, 100.0), (OrderSide.SELL, 90.0)]):
+        manager.process_execution(ExecutionResult(order_id=str(n), asset='BTC', side=side, quantity=5.0,
+                                                  execution_price=price, fees=0.0, slippage=0.0,
+                                                  timestamp=START + timedelta(days=n), success=True))
+
+    metrics = manager.get_performance_metrics()
+    assert (metrics.total_trades, metrics.winning_trades, metrics.losing_trades) == (2, 1, 1)
+    assert metrics.max_drawdown == pytest.approx(50.0)
+    _assert_metrics_match(manager)
+
+    # One snapshot per execution, marked to market
+    assert manager.performance_ledger.equity.values.tolist() == [10000.0, 10050.0, 10050.0, 10000.0]
+    equity = manager.get_equity_curve_metrics()
+    assert equity['snapshots'] == 4 and equity['total_return'] == 0.0
+    assert equity['max_drawdown_percent'] == pytest.approx(50 / 10050 * 100)
+
+
+def test_ledger_rebuilds_from_replaced_history_and_out_of_order_days(manager):
+    trades = [_trade(OrderSide.SELL, pnl, START + timedelta(days=day))
+              for pnl, day in [(10.0, 2), (-25.0, 0), (40.0, 1), (-5.0, 2)]]
+    manager.trade_history = trades  # Not recorded through the ledger
+
+    _assert_metrics_match(manager)
+    ledger = manager.performance_ledger
+    assert ledger.is_current(trades) and not ledger.daily_in_order
+
+
+def test_equity_ledger_matches_recompute():
+    rng = random.Random(5)
+    ledger = EquityLedger(capacity=4)
+    for n in range(1000):
+        ledger.append(START + timedelta(minutes=n), 100 * math.exp(rng.gauss(0, 0.2)))
+
+    full = ledger.recompute()
+    assert ledger.returns.mean == pytest.approx(full['return_mean'], rel=1e-9)
+    assert ledger.returns.std() == pytest.approx(full['return_std'], rel=1e-9)
+    assert (ledger.peak, ledger.max_drawdown, ledger.max_drawdown_amount) == pytest.approx(
+        (full['peak'], full['max_drawdown'], full['max_drawdown_amount']), rel=1e-12)
+    assert ledger.timestamps[1] - ledger.timestamps[0] == 60.0
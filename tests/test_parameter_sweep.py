@@ -0,0 +1,153 @@
+"""
+Tests for ParameterSweep
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.signals.parameter_sweep import ParameterSweep, SharedMarketData
+from src.signals.strategies.base_strategy import SignalStrategy
+from src.data.signal_models import TradingSignal, SignalType, SignalDirection, SignalStrength
+
+
+class ThresholdStrategy(SignalStrategy):
+    """Buys bitcoin when the latest close is below `buy_below` and sells above `sell_above`."""
+
+    def __init__(self, config_path: str):
+        super().__init__(config_path)
+        self.buy_below = 0.0
+        self.sell_above = float('inf')
+
+    def analyze(self, market_data):
+        prices = market_data['crypto_data']['bitcoin']['price_data']
+        return {'close': prices[-1]['close'] if prices else None}
+
+    def generate_signals(self, analysis_results):
+        close = analysis_results['close']
+        if close is None:
+            return []
+        if close < self.buy_below:
+            signal_type, direction = SignalType.LONG, SignalDirection.BUY
+        elif close > self.sell_above:
+            signal_type, direction = SignalType.SHORT, SignalDirection.SELL
+        else:
+            return []
+        return [TradingSignal(
+            symbol='bitcoin', signal_type=signal_type, direction=direction, timestamp=datetime.now(),
+            price=close, strategy_name='threshold', signal_strength=SignalStrength.MODERATE,
+            confidence=0.6, position_size=0.1
+        )]
+
+    def get_parameters(self):
+        return {'assets': ['bitcoin']}
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / 'threshold.json'
+    path.write_text(json.dumps({'name': 'threshold'}))
+    return str(path)
+
+
+@pytest.fixture
+def historical_data():
+    start = datetime(2024, 1, 1)
+    closes = [100, 95, 90, 92, 105, 110, 98, 94, 101, 108]
+    return {
+        'vix_data': [
+            {'date': (start + timedelta(days=i)).strftime('%Y-%m-%d'), 'vix_value': 20.0 + i}
+            for i in range(len(closes))
+        ],
+        'crypto_data': {
+            'bitcoin': {
+                'price_data': [
+                    {'date': (start + timedelta(days=i)).strftime('%Y-%m-%d'), 'close': float(c)}
+                    for i, c in enumerate(closes)
+                ]
+            }
+        }
+    }
+
+
+def test_grid_expands_cartesian_product():
+    param_sets = ParameterSweep.grid({'buy_below': [90, 95], 'sell_above': [100, 105, 110]})
+
+    assert len(param_sets) == 6
+    assert {'buy_below': 95, 'sell_above': 110} in param_sets
+
+
+def test_random_search_is_seeded():
+    space = {'buy_below': (80, 100), 'sell_above': (100.0, 120.0), 'mode': ['a', 'b']}
+
+    first = ParameterSweep.random_search(space, n_iter=5, seed=7)
+    second = ParameterSweep.random_search(space, n_iter=5, seed=7)
+
+    assert first == second
+    assert all(isinstance(p['buy_below'], int) and 80 <= p['buy_below'] <= 100 for p in first)
+    assert all(100.0 <= p['sell_above'] <= 120.0 for p in first)
+
+
+def test_shared_market_data_round_trip(tmp_path, historical_data):
+    shared = SharedMarketData.from_historical_data(historical_data, str(tmp_path))
+
+    assert shared.to_historical_data() == historical_data
+
+
+def test_sweep_matches_serial_backtests_and_resumes(tmp_path, config_path, historical_data):
+    from src.signals.backtest_interface import BacktestInterface
+
+    checkpoint = tmp_path / 'sweep.jsonl'
+    param_sets = ParameterSweep.grid({'buy_below': [93.0, 96.0], 'sell_above': [100.0, 107.0]})
+    sweep = ParameterSweep(ThresholdStrategy, config_path, '2024-01-01', '2024-01-10',
+                           max_workers=2, checkpoint_path=str(checkpoint))
+
+    table = sweep.run(param_sets, historical_data=historical_data)
+
+    assert len(table) == 4
+    assert set(table['status']) == {'success'}
+    assert (table['total_trades'] > 0).all()
+
+    backtester = BacktestInterface()
+    for params in param_sets:
+        strategy = ThresholdStrategy(config_path)
+        strategy.buy_below = params['buy_below']
+        strategy.sell_above = params['sell_above']
+        expected = backtester.backtest_strategy(
+            strategy, '2024-01-01', '2024-01-10',
+            historical_data=SharedMarketData.from_historical_data(historical_data, str(tmp_path)).to_historical_data()
+        )
+        row = table[table['run_id'] == ParameterSweep.run_id(params)].iloc[0]
+        assert row['total_return'] == pytest.approx(expected.total_return)
+        assert row['total_trades'] == expected.total_trades
+
+    # A second sweep over a superset only runs the new parameter set
+    resumed = ParameterSweep(ThresholdStrategy, config_path, '2024-01-01', '2024-01-10',
+                             max_workers=2, checkpoint_path=str(checkpoint))
+    new_rows = list(resumed.iter_run(param_sets + [{'buy_below': 99.0, 'sell_above': 107.0}],
+                                     historical_data=historical_data))
+
+    assert len(new_rows) == 1
+    assert new_rows[0]['params'] == {'buy_below': 99.0, 'sell_above': 107.0}
+    assert len(resumed.to_dataframe()) == 5
+
+
+def test_resume_retries_failed_runs(tmp_path, config_path, historical_data):
+    checkpoint = tmp_path / 'sweep.jsonl'
+    params = {'buy_below': 93.0, 'sell_above': 107.0}
+    run_id = ParameterSweep.run_id(params)
+    checkpoint.write_text(json.dumps({'run_id': run_id, 'params': params, 'status': 'failed',
+                                      'error': 'database is locked'}) + '\n')
+
+    kept = ParameterSweep(ThresholdStrategy, config_path, '2024-01-01', '2024-01-10', max_workers=1,
+                          checkpoint_path=str(checkpoint), retry_failed=False)
+    assert list(kept.iter_run([params], historical_data=historical_data)) == []
+    assert kept.results[0]['status'] == 'failed'
+
+    sweep = ParameterSweep(ThresholdStrategy, config_path, '2024-01-01', '2024-01-10', max_workers=1,
+                           checkpoint_path=str(checkpoint))
+    [row] = sweep.iter_run([params], historical_data=historical_data)
+    assert row['status'] == 'success'
+    assert sweep.load_checkpoint()[run_id]['status'] == 'success'
+    assert list(sweep.iter_run([params], historical_data=historical_data)) == []
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics.percentile_rank import PercentileRanker, percentile_rank, rolling_percentile_rank
+from src.signals.strategies.volatility_strategy import VolatilityStrategy
+
+
+def _values(n=400, seed=11):
+    rng = np.random.default_rng(seed)
+    values = np.round(rng.lognormal(0, 0.5, n), 2)  # rounding produces ties
+    values[[5, 90, 91, 300]] = np.nan
+    return pd.Series(values)
+
+
+@pytest.mark.parametrize('window,min_periods', [(30, None), (252, None), (20, 5)])
+def test_rolling_rank_matches_pandas(window, min_periods):
+    values = _values()
+    expected = values.rolling(window=window, min_periods=min_periods).rank(pct=True)
+    np.testing.assert_allclose(rolling_percentile_rank(values, window, min_periods), expected,
+                               rtol=1e-12, equal_nan=True)
+
+
+def test_rank_matches_pandas_for_sample_members():
+    values = _values().dropna()
+    expected = values.rank(pct=True) * 100
+    ranker = PercentileRanker(values)
+    for value, rank in zip(values.iloc[::17], expected.iloc[::17]):
+        assert ranker.rank(value) == pytest.approx(rank)
+
+
+def test_rank_outside_sample_and_percentiles():
+    values = _values()
+    ranker = PercentileRanker(values)
+    assert ranker.rank(values.max() * 10) == 100.0
+    assert 0.0 < ranker.rank(values.min() / 10) < 1.0
+    assert np.isnan(percentile_rank([], 1.0))
+    q = [0, 12.5, 50, 90, 95, 100]
+    np.testing.assert_allclose(ranker.percentile(q), np.percentile(values.dropna(), q), rtol=1e-12)
+    assert ranker.percentile(90) == pytest.approx(np.percentile(values.dropna(), 90))
+
+
+def test_volatility_strategy_percentile_for_new_high(tmp_path, monkeypatch):
+    monkeypatch.setattr('src.signals.strategies.volatility_strategy.CryptoDatabase', lambda: None)
+    config = tmp_path / 'volatility.json'
+    config.write_text('{}')
+    strategy = VolatilityStrategy(str(config))
+
+    rng = np.random.default_rng(3)
+    returns = rng.normal(0, 0.01, 200)
+    returns[-3:] = [0.15, -0.2, 0.25]  # current volatility above all of its history
+    df = pd.DataFrame({'timestamp': np.arange(200), 'close': 100 * np.exp(np.cumsum(returns))})
+
+    metrics = strategy._calculate_volatility_metrics(df, 'bitcoin')
+    assert metrics['volatility_percentile'] == 100.0
+    assert metrics['current_volatility'] > metrics['extreme_threshold'] > metrics['historical_threshold']
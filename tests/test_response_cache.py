@@ -0,0 +1,163 @@
+"""
+Tests for the layered response cache used by the signal API.
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.services.response_cache import LayeredCache
+
+
+class FakeAsyncRedis:
+    """In-memory stand-in for the redis.asyncio client methods the cache uses"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.data = {}
+        self.fail = False
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        value, expires = self.data.get(key, (None, 0))
+        return value if self.clock() < expires else None
+
+    async def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = (value, self.clock() + ex)
+        return True
+
+    async def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+    async def close(self):
+        pass
+
+
+class _Computation:
+    """Counts calls and lets the test decide when the computation finishes"""
+
+    def __init__(self, value='v1'):
+        self.calls = 0
+        self.value = value
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        return self.value
+
+
+def test_concurrent_misses_share_one_computation(make_clock):
+    cache = LayeredCache(clock=make_clock())
+
+    async def scenario():
+        compute = _Computation()
+        waiters = [asyncio.ensure_future(cache.get_or_compute('k', compute, ttl=60)) for _ in range(50)]
+        await asyncio.sleep(0)
+        compute.release.set()
+        return compute, await asyncio.gather(*waiters)
+
+    compute, results = asyncio.run(scenario())
+    assert compute.calls == 1
+    assert results == ['v1'] * 50
+    stats = cache.stats()
+    assert (stats['misses'], stats['coalesced'], stats['memory_entries']) == (50, 49, 1)
+
+
+def test_stale_entry_is_served_while_one_refresh_runs(make_clock):
+    clock = make_clock()
+    cache = LayeredCache(stale_seconds=30, clock=clock)
+
+    async def scenario():
+        await cache.set('k', 'old', ttl=60)
+        clock.now += 70  # Expired, inside the stale window
+        compute = _Computation('new')
+        served = [await cache.get_or_compute('k', compute, ttl=60) for _ in range(10)]
+        await asyncio.sleep(0)
+        assert served == ['old'] * 10 and compute.calls == 1
+        compute.release.set()
+        await asyncio.sleep(0.01)
+        return compute, await cache.get_or_compute('k', compute, ttl=60)
+
+    compute, refreshed = asyncio.run(scenario())
+    assert refreshed == 'new' and compute.calls == 1
+    stats = cache.stats()
+    assert (stats['stale_hits'], stats['refreshes'], stats['memory_hits']) == (10, 1, 1)
+
+    async def expired():
+        clock.now += 60 + 31  # Past the stale window: callers wait for a recompute
+        compute = _Computation('newest')
+        compute.release.set()
+        return await cache.get_or_compute('k', compute, ttl=60)
+
+    assert asyncio.run(expired()) == 'newest'
+
+
+def test_remote_tier_is_shared_and_failures_fall_back_to_memory(make_clock):
+    clock = make_clock()
+    redis = FakeAsyncRedis(clock)
+    first = LayeredCache(remote=redis, clock=clock)
+    second = LayeredCache(remote=redis, clock=clock)
+
+    async def scenario():
+        await first.set('k', {'signals': [1, 2]}, ttl=60)
+        assert await second.get('k') == {'signals': [1, 2]}
+        assert await second.get('k') == {'signals': [1, 2]}
+
+        redis.fail = True
+        compute = _Computation('computed')
+        compute.release.set()
+        assert await second.get_or_compute('other', compute, ttl=60) == 'computed'
+        assert await second.get_or_compute('other', compute, ttl=60) == 'computed'
+        assert compute.calls == 1
+
+    asyncio.run(scenario())
+    stats = second.stats()
+    assert (stats['remote_hits'], stats['memory_hits'], stats['remote_errors']) == (1, 2, 2)
+
+
+def test_should_cache_and_lru_bound(make_clock):
+    cache = LayeredCache(max_entries=2, clock=make_clock())
+
+    async def failed_backtest():
+        return {'status': 'failed'}
+
+    async def scenario():
+        for _ in range(2):
+            await cache.get_or_compute('bt', failed_backtest, ttl=60, should_cache=lambda r: r['status'] == 'success')
+        for key in ('a', 'b', 'c'):
+            await cache.set(key, key, ttl=60)
+        return [await cache.get(key) for key in ('a', 'b', 'c')]
+
+    assert asyncio.run(scenario()) == [None, 'b', 'c']
+    assert cache.stats()['misses'] == 3  # Both backtests recomputed, 'a' evicted
+
+
+def test_endpoint_serves_from_memory_under_load(make_clock):
+    cache = LayeredCache(clock=make_clock())
+    calls = []
+    app = FastAPI()
+
+    @app.get('/strategies')
+    async def strategies():
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return ['mean_reversion', 'vix_correlation']
+        return await cache.get_or_compute('strategies', load, ttl=3600)
+
+    with TestClient(app) as client:
+        started = time.perf_counter()
+        responses = [client.get('/strategies') for _ in range(500)]
+        elapsed = time.perf_counter() - started
+
+    assert {r.status_code for r in responses} == {200}
+    assert len(calls) == 1
+    assert cache.stats()['hit_ratio'] == pytest.approx(499 / 500)
+    assert elapsed < 500 * 0.01
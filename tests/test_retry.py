@@ -220,7 +220,7 @@ class TestCalculateBackoffDelay:
 class TestAPIClientRetryIntegration:
     """Test retry integration with API client methods."""
     
-    @patch('src.api.coingecko_client.requests.get')
+    @patch('src.api.coingecko_client.requests.Session.get')
     def test_ping_retry_on_connection_error(self, mock_get):
         """Test ping method retries on connection error."""
         from src.api.coingecko_client import CoinGeckoClient
@@ -238,7 +238,7 @@ class TestAPIClientRetryIntegration:
             assert result == {"gecko_says": "Success!"}
             assert mock_get.call_count == 2
     
-    @patch('src.api.coingecko_client.requests.get')
+    @patch('src.api.coingecko_client.requests.Session.get')
     def test_get_top_cryptos_retry_on_timeout(self, mock_get):
         """Test get_top_cryptos retries on timeout."""
         from src.api.coingecko_client import CoinGeckoClient
@@ -256,7 +256,7 @@ class TestAPIClientRetryIntegration:
             assert result == [{"id": "bitcoin"}]
             assert mock_get.call_count == 2
     
-    @patch('src.api.coingecko_client.requests.get')
+    @patch('src.api.coingecko_client.requests.Session.get')
     def test_rate_limit_retry_after(self, mock_get):
         """Test API respects retry-after header for rate limits."""
         from src.api.coingecko_client import CoinGeckoClient
@@ -282,7 +282,7 @@ class TestAPIClientRetryIntegration:
             mock_sleep.assert_called_once()
             assert mock_sleep.call_args[0][0] >= 10
     
-    @patch('src.api.coingecko_client.requests.get')
+    @patch('src.api.coingecko_client.requests.Session.get')
     def test_non_retryable_http_error(self, mock_get):
         """Test non-retryable HTTP errors are not retried."""
         from src.api.coingecko_client import CoinGeckoClient
@@ -0,0 +1,162 @@
+"""
+Parity tests for RiskOrchestrator.assess_trade_risk_batch against the single-signal path.
+"""
+
+import random
+from dataclasses import asdict, replace
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.risk_management.calculators.position_calculator import PositionCalculator
+from src.risk_management.core.risk_orchestrator import RiskOrchestrator
+from src.risk_management.models.risk_models import PortfolioState, SignalType, TradingSignal
+
+
+TIMESTAMP = datetime(2024, 1, 1)
+
+
+def _signal(n, price=50000.0, confidence=0.8, signal_type=SignalType.LONG, take_profit_price=None):
+    return TradingSignal(f"sig-{n}", 'BTC', signal_type, price, confidence, timestamp=TIMESTAMP,
+                         take_profit_price=take_profit_price)
+
+
+def _portfolio(**overrides):
+    state = PortfolioState(total_equity=100000.0, current_drawdown=0.05, daily_pnl=0.0, timestamp=TIMESTAMP)
+    return replace(state, **overrides)
+
+
+def _comparable(assessment):
+    result = asdict(assessment)
+    result.pop('processing_time_ms')
+    return result
+
+
+def _sequential(orchestrator, signals, portfolio):
+    """Single-signal assessments, booking each approval's stop-loss risk before the next signal."""
+    drawdown, daily_pnl = portfolio.current_drawdown, portfolio.daily_pnl
+    assessments = []
+    for signal in signals:
+        assessment = orchestrator.assess_trade_risk(
+            signal, replace(portfolio, current_drawdown=drawdown, daily_pnl=daily_pnl))
+        if assessment.is_approved and assessment.recommended_position_size > 0:
+            loss = assessment.recommended_position_size * orchestrator.trade_validator.per_trade_stop_loss
+            drawdown += loss / portfolio.total_equity
+            daily_pnl -= loss
+        assessments.append(assessment)
+    return assessments
+
+
+@pytest.fixture
+def orchestrator():
+    return RiskOrchestrator()
+
+
+def test_batch_matches_sequential_single_path(orchestrator):
+    rng = random.Random(7)
+    signals = [_signal(n, price=rng.uniform(1, 60000), confidence=rng.uniform(0, 1),
+                       signal_type=rng.choice(list(SignalType)),
+                       take_profit_price=rng.choice([None, rng.uniform(1, 70000)]))
+               for n in range(200)]
+    signals[3].price = 50000  # Not a float: takes the single-signal fallback
+    signals[4].confidence = 1.5  # Invalid: rejected by the single-signal path
+    portfolio = _portfolio(current_drawdown=0.12, daily_pnl=-1500.0)
+
+    batch = orchestrator.assess_trade_risk_batch(signals, portfolio)
+    expected = _sequential(orchestrator, signals, portfolio)
+
+    assert [_comparable(a) for a in batch] == [_comparable(a) for a in expected]
+    assert 0 < sum(a.is_approved for a in batch) < len(signals)
+
+
+def test_batch_of_one_equals_single_assessment(orchestrator):
+    signal, portfolio = _signal(0), _portfolio()
+    [assessment] = orchestrator.assess_trade_risk_batch([signal], portfolio)
+
+    assert _comparable(assessment) == _comparable(orchestrator.assess_trade_risk(signal, portfolio))
+    assert orchestrator.assess_trade_risk_batch([], portfolio) == []
+
+
+def test_approvals_consume_the_daily_loss_budget(orchestrator):
+    signals = [_signal(n) for n in range(3)]
+    trade_loss = (orchestrator.assess_trade_risk(signals[0], _portfolio()).recommended_position_size
+                  * orchestrator.trade_validator.per_trade_stop_loss)
+    # Each signal alone fits the remaining daily loss budget; two together do not
+    daily_pnl = -(100000.0 * orchestrator.trade_validator.daily_loss_limit - 1.5 * trade_loss)
+    portfolio = _portfolio(current_drawdown=0.0, daily_pnl=daily_pnl)
+    assert orchestrator.assess_trade_risk(signals[1], portfolio).is_approved
+
+    first, second, third = orchestrator.assess_trade_risk_batch(signals, portfolio)
+
+    assert first.is_approved
+    assert not second.is_approved and 'daily loss' in second.rejection_reason.lower()
+    assert not third.is_approved
+    assert portfolio.daily_pnl == daily_pnl  # The caller's snapshot is not modified
+
+
+def test_invalid_portfolio_rejects_every_signal_like_the_single_path(orchestrator):
+    portfolio = _portfolio(total_equity=0.0)
+    signals = [_signal(n) for n in range(3)]
+
+    batch = orchestrator.assess_trade_risk_batch(signals, portfolio)
+
+    assert [_comparable(a) for a in batch] == [
+        _comparable(orchestrator.assess_trade_risk(s, portfolio)) for s in signals]
+    assert not any(a.is_approved for a in batch)
+
+
+def test_vectorized_calculators_match_scalar_versions():
+    positions = PositionCalculator()
+    confidences = np.linspace(0.0, 1.0, 101)
+    portfolio = _portfolio(total_equity=25000.0)
+    assert positions.calculate_position_sizes(25000.0, confidences).tolist() == [
+        positions.calculate_position_size(_signal(0, confidence=float(c)), portfolio) for c in confidences]
+
+    levels = RiskOrchestrator().risk_level_calculator
+    rng = np.random.default_rng(3)
+    metrics = rng.uniform(-0.2, 1.2, size=(5, 500))
+    names = ('position_risk_percent', 'portfolio_heat', 'current_drawdown', 'market_volatility', 'correlation_risk')
+    assert levels.calculate_risk_levels(*metrics) == [
+        levels.calculate_risk_level(SimpleNamespace(**dict(zip(names, map(float, column)))))
+        for column in metrics.T]
+
+
+@pytest.fixture
+def risk_api():
+    pytest.importorskip('flask')
+    from src.risk_management.api import risk_api
+    return risk_api
+
+
+def test_api_parses_signals_and_portfolio_state(risk_api):
+    signal = risk_api.parse_signal({'signal_id': 'a', 'asset': 'ETH', 'signal_type': 'SHORT', 'price': '3000',
+                                    'timestamp': '2024-01-01T12:00:00Z'})
+    assert (signal.signal_id, signal.asset, signal.signal_type, signal.price, signal.confidence) == \
+        ('a', 'ETH', SignalType.SHORT, 3000.0, 0.5)
+    portfolio = risk_api.parse_portfolio_state({'total_equity': 10000, 'current_drawdown': 0.05, 'daily_pnl': 100})
+    assert (portfolio.total_equity, portfolio.cash, portfolio.positions) == (10000.0, 0.0, {})
+
+    with pytest.raises(ValueError, match='price'):
+        risk_api.parse_signal({'price': 'abc'})
+
+
+def test_batch_endpoint_assesses_every_signal(risk_api):
+    client = risk_api.app.test_client()
+    signals = [{'signal_id': f'sig-{n}', 'asset': 'BTC', 'signal_type': 'LONG', 'price': 50000.0 + n,
+                'confidence': 0.8} for n in range(3)]
+    portfolio = {'total_equity': 100000.0, 'current_drawdown': 0.05, 'daily_pnl': 0.0}
+
+    response = client.post('/assess-risk/batch', json={'signals': signals, 'portfolio_state': portfolio})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [assessment['signal_id'] for assessment in data['assessments']] == ['sig-0', 'sig-1', 'sig-2']
+    assert data['approved'] == sum(assessment['is_approved'] for assessment in data['assessments'])
+
+    response = client.post('/assess-risk', json={'signal': signals[0], 'portfolio_state': portfolio})
+    assert response.status_code == 200
+    assert response.get_json()['assessment']['signal_id'] == 'sig-0'
+
+    response = client.post('/assess-risk/batch', json={'signals': [{'price': 'abc'}], 'portfolio_state': portfolio})
+    assert response.status_code == 400
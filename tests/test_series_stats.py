@@ -0,0 +1,101 @@
+"""
+Tests for the trigger-maintained series_stats table and the health status built on it.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.data.sqlite_helper import CryptoDatabase
+from src.services.monitor import HealthChecker
+
+
+DAY_MS = 86_400_000
+
+
+def _ohlcv(asset, day):
+    return {'cryptocurrency': asset, 'timestamp': 1_704_067_200_000 + day * DAY_MS,
+            'date_str': f'2024-01-{day + 1:02d}', 'open': 1.0, 'high': 1.0, 'low': 1.0,
+            'close': 1.0, 'volume': 1.0}
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = CryptoDatabase(str(tmp_path / 'crypto.db'))
+    database.insert_crypto_data([_ohlcv('bitcoin', day) for day in range(5)] +
+                                [_ohlcv('ethereum', day) for day in range(2, 4)])
+    database.insert_macro_data([{'indicator': 'VIXCLS', 'date': f'2024-01-{day:02d}', 'value': 15.0}
+                                for day in (2, 3, 5)])
+    return database
+
+
+def _aggregate_stats(db):
+    """The stats computed the slow way, straight from the data tables"""
+    with sqlite3.connect(db.db_path) as conn:
+        crypto = conn.execute("""
+            SELECT 'crypto', cryptocurrency, COUNT(*), MIN(timestamp), MAX(timestamp), MIN(date_str), MAX(date_str)
+            FROM crypto_ohlcv GROUP BY cryptocurrency
+        """).fetchall()
+        macro = conn.execute("""
+            SELECT 'macro', indicator, COUNT(*), NULL, NULL, MIN(date), MAX(date)
+            FROM macro_indicators GROUP BY indicator
+        """).fetchall()
+    return sorted(crypto + macro)
+
+
+def _table_stats(db):
+    keys = ('source', 'series', 'row_count', 'min_timestamp', 'max_timestamp', 'first_date', 'latest_date')
+    return sorted(tuple(row[key] for key in keys) for row in db.get_series_stats())
+
+
+def test_inserts_keep_stats_in_step_with_data(db):
+    assert _table_stats(db) == _aggregate_stats(db)
+
+    # Duplicates are ignored and must not be counted
+    assert db.insert_crypto_data([_ohlcv('bitcoin', 4), _ohlcv('bitcoin', 9)]) == 1
+    assert _table_stats(db) == _aggregate_stats(db)
+    bitcoin = db.get_series_stats('crypto')[0]
+    assert (bitcoin['row_count'], bitcoin['latest_date']) == (6, '2024-01-10')
+    assert bitcoin['last_ingest'] is not None
+
+
+def test_deletes_recompute_bounds(db):
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute("DELETE FROM crypto_ohlcv WHERE cryptocurrency = 'bitcoin' AND date_str IN ('2024-01-01', '2024-01-05')")
+        conn.execute("DELETE FROM crypto_ohlcv WHERE cryptocurrency = 'ethereum'")
+        conn.execute("DELETE FROM macro_indicators WHERE date = '2024-01-05'")
+
+    assert _table_stats(db) == _aggregate_stats(db)
+    assert [row['series'] for row in db.get_series_stats('crypto')] == ['bitcoin']
+
+
+def test_rebuild_repairs_drift(db):
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute("UPDATE series_stats SET row_count = 99 WHERE series = 'bitcoin'")
+        conn.execute("DELETE FROM series_stats WHERE series = 'VIXCLS'")
+
+    assert db.rebuild_series_stats() == {'series': 3, 'corrected': 2}
+    assert _table_stats(db) == _aggregate_stats(db)
+    assert db.rebuild_series_stats() == {'series': 3, 'corrected': 0}
+
+
+def test_existing_database_is_backfilled(tmp_path):
+    db = CryptoDatabase(str(tmp_path / 'crypto.db'))
+    db.insert_crypto_data([_ohlcv('bitcoin', day) for day in range(3)])
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute("DROP TABLE series_stats")
+
+    reopened = CryptoDatabase(str(tmp_path / 'crypto.db'))
+    assert _table_stats(reopened) == _aggregate_stats(reopened)
+
+
+def test_health_status_reads_series_stats(db):
+    health = db.get_health_status()
+    assert [(c['symbol'], c['total_records'], c['latest_date']) for c in health['crypto_data']] == \
+        [('bitcoin', 5, '2024-01-05'), ('ethereum', 2, '2024-01-04')]
+    assert health['macro_data'][0]['indicator'] == 'VIXCLS'
+    assert health['macro_data'][0]['first_date'] == '2024-01-02'
+
+    system = HealthChecker(database=db).get_system_health_status()
+    assert system['database']['total_crypto_records'] == 7
+    assert system['components']['macro_data']['total_indicators'] == 1
@@ -0,0 +1,190 @@
+"""
+Tests for the paper trading signal intake and how the main loop commits and dead-letters signals.
+"""
+
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from paper_trading_engine.src.core.main_loop import MainExecutionLoop
+from paper_trading_engine.src.signal_consumer.signal_intake import SignalIntake
+from src.utils.json_alert_system import JSONAlertSystem
+
+
+def _append(journal, *alerts, raw=b''):
+    with open(journal, 'ab') as f:
+        for alert in alerts:
+            f.write((json.dumps(alert) + "\n").encode())
+        f.write(raw)
+
+
+def _alerts(start, stop):
+    return [{'asset': 'BTC', 'signal_type': 'LONG', 'price': 100.0 + n, 'n': n} for n in range(start, stop)]
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return tmp_path / 'alerts' / 'signal_journal.jsonl'
+
+
+def _intake(journal, **kwargs):
+    return SignalIntake(journal_path=str(journal), cursor_path=str(journal.parent.parent / 'cursor.json'),
+                        dead_letter_path=str(journal.parent.parent / 'dead_letter.jsonl'), **kwargs)
+
+
+def _drain(intake):
+    """Read and commit batches until the journal is exhausted; returns the alert numbers read"""
+    read = []
+    while True:
+        alerts, inode, offset = intake.read_batch()
+        read += [alert['n'] for alert in alerts]
+        if (inode, offset) != intake.position:
+            intake.commit(inode, offset)
+        if not alerts:
+            return read
+
+
+def test_reads_in_batches_without_advancing_the_cursor(journal):
+    intake = _intake(journal, max_batch_size=4)
+    _append(journal, *_alerts(0, 10))
+
+    alerts, inode, offset = intake.read_batch()
+    assert [a['n'] for a in alerts] == [0, 1, 2, 3]
+    assert intake.position == (None, 0)
+    assert [a['n'] for a in intake.read_batch()[0]] == [0, 1, 2, 3]  # Not committed: read again
+
+    intake.commit(inode, offset)
+    assert [a['n'] for a in intake.read_batch()[0]] == [4, 5, 6, 7]
+    entries, _, end = intake.read_entries()
+    assert entries[-1][1] == end
+
+
+def test_restart_resumes_from_the_committed_cursor(journal):
+    intake = _intake(journal, max_batch_size=3)
+    _append(journal, *_alerts(0, 5))
+    intake.commit(*intake.read_batch()[1:])
+
+    restarted = _intake(journal)
+    assert restarted.position == intake.position
+    assert json.loads((journal.parent.parent / 'cursor.json').read_text())['offset'] == intake.position[1]
+    _append(journal, *_alerts(5, 7))
+    assert _drain(restarted) == [3, 4, 5, 6]
+    assert restarted.pending_bytes() == 0
+
+
+def test_partial_trailing_line_waits_for_its_newline(journal):
+    intake = _intake(journal)
+    line = json.dumps(_alerts(1, 2)[0]).encode()
+    _append(journal, *_alerts(0, 1), raw=line[:10])
+
+    alerts, inode, offset = intake.read_batch()
+    assert [a['n'] for a in alerts] == [0]
+    assert offset == len(json.dumps(alerts[0])) + 1
+    intake.commit(inode, offset)
+
+    _append(journal, raw=line[10:] + b"\n")
+    assert _drain(intake) == [1]
+
+
+def test_invalid_and_blank_lines_are_skipped(journal):
+    intake = _intake(journal)
+    _append(journal, *_alerts(0, 1), raw=b"not json\n\n")
+    _append(journal, *_alerts(1, 2))
+
+    assert _drain(intake) == [0, 1]
+    assert intake.stats['invalid_lines'] == 1
+
+
+def test_replaced_journal_is_read_from_the_start(journal):
+    intake = _intake(journal)
+    _append(journal, *_alerts(0, 3))
+    assert _drain(intake) == [0, 1, 2]
+
+    replacement = journal.with_name('replacement.jsonl')
+    _append(replacement, *_alerts(3, 4))
+    os.replace(replacement, journal)
+    assert _drain(intake) == [3]
+
+
+def test_rotated_journal_is_finished_before_its_successor(journal):
+    intake = _intake(journal, max_batch_size=2)
+    alert_system = JSONAlertSystem({'alert_directory': str(journal.parent), 'volatility_threshold_percentile': 90,
+                                    'signal_journal': journal.name, 'signal_journal_max_bytes': 400})
+    for alert in _alerts(0, 3):
+        alert_system.append_to_journal(alert)
+    intake.commit(*intake.read_batch()[1:])  # Consumed 0 and 1
+
+    for alert in _alerts(3, 12):
+        alert_system.append_to_journal(alert)
+    rotated = journal.with_name(journal.name + '.1')
+    assert rotated.exists() and journal.stat().st_size < 400
+
+    assert _drain(intake) == list(range(2, 12))
+
+
+def _loop(tmp_path, journal, engine, monkeypatch, **kwargs):
+    monkeypatch.chdir(tmp_path)
+    # Keep the loop's market data service from probing the CoinGecko API
+    monkeypatch.setattr('paper_trading_engine.src.core.main_loop.MarketDataService',
+                        lambda use_real_time: SimpleNamespace(use_real_time=False))
+    return MainExecutionLoop(signal_directory=str(journal.parent), execution_engine=engine,
+                             report_directory=str(tmp_path / 'reports'), signal_journal=str(journal),
+                             cursor_file=str(tmp_path / 'cursor.json'),
+                             dead_letter_file=str(tmp_path / 'dead_letter.jsonl'), **kwargs)
+
+
+class _Engine:
+    """Execution engine stand-in that raises on chosen signals"""
+
+    def __init__(self, fail_on=()):
+        self.fail_on = set(fail_on)
+        self.executed = []
+
+    def process_signals(self, signals, on_result=None):
+        results = []
+        for signal in signals:
+            n = signal.metadata['n']
+            if n in self.fail_on:
+                raise RuntimeError(f"signal {n} failed")
+            self.executed.append(n)
+            result = SimpleNamespace(success=True)
+            on_result(signal, result)
+            results.append(result)
+        return results
+
+
+def test_failure_mid_batch_replays_only_unexecuted_signals(tmp_path, journal, monkeypatch):
+    engine = _Engine(fail_on={2})
+    loop = _loop(tmp_path, journal, engine, monkeypatch)
+    _append(journal, *_alerts(0, 5))
+
+    loop._process_signals()
+    assert engine.executed == [0, 1]
+
+    engine.fail_on.clear()
+    loop._process_signals()
+    assert engine.executed == [0, 1, 2, 3, 4]
+    assert loop.stats['trades_executed'] == 5
+    assert loop.intake.pending_bytes() == 0
+
+
+def test_poison_signal_is_dead_lettered_after_repeated_failures(tmp_path, journal, monkeypatch):
+    engine = _Engine(fail_on={1})
+    loop = _loop(tmp_path, journal, engine, monkeypatch, max_signal_failures=3)
+    _append(journal, *_alerts(0, 4))
+
+    for _ in range(2):
+        loop._process_signals()
+    assert engine.executed == [0]
+    assert not (tmp_path / 'dead_letter.jsonl').exists()
+
+    loop._process_signals()  # Third failure sets signal 1 aside and the cursor moves past it
+    [dead] = [json.loads(line) for line in (tmp_path / 'dead_letter.jsonl').read_text().splitlines()]
+    assert dead['alert']['n'] == 1 and 'signal 1 failed' in dead['reason']
+
+    loop._process_signals()
+    assert engine.executed == [0, 2, 3]
+    assert loop.intake.pending_bytes() == 0
+    assert loop.intake.stats['dead_lettered'] == 1